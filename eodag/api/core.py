@@ -19,14 +19,17 @@ from __future__ import annotations
 
 import datetime as dt
 import itertools
+import json
 import logging
 import os
 import re
 import shutil
 import tempfile
+import time
 import warnings
 from collections import deque
 from copy import deepcopy
+from functools import partial
 from importlib.metadata import version
 from importlib.resources import files as res_files
 from operator import attrgetter, itemgetter
@@ -35,6 +38,7 @@ from typing import TYPE_CHECKING, Any, Iterator, Optional, Union, cast
 
 import geojson
 import yaml
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pydantic import AliasChoices
 
 from eodag.api.collection import Collection, CollectionsDict, CollectionsList
@@ -53,16 +57,18 @@ from eodag.config import (
 )
 from eodag.plugins.manager import PluginManager
 from eodag.plugins.search import PreparedSearch
-from eodag.plugins.search.build_search_result import MeteoblueSearch
-from eodag.plugins.search.qssearch import PostJsonSearch
 from eodag.types import model_fields_to_annotated
 from eodag.types.queryables import CommonQueryables, Queryables, QueryablesDict
+from eodag.types.stac_metadata import clear_stac_metadata_models_cache
 from eodag.utils import (
+    DEFAULT_DISCOVER_MAX_WORKERS,
     DEFAULT_DOWNLOAD_TIMEOUT,
     DEFAULT_DOWNLOAD_WAIT,
     DEFAULT_LIMIT,
     DEFAULT_MAX_LIMIT,
     DEFAULT_PAGE,
+    DEFAULT_QUERYABLES_CACHE_STALE_TTL,
+    DEFAULT_QUERYABLES_CACHE_TTL,
     GENERIC_COLLECTION,
     GENERIC_STAC_PROVIDER,
     _deprecated,
@@ -72,6 +78,7 @@ from eodag.utils import (
     string_to_jsonpath,
     uri_to_path,
 )
+from eodag.utils.cache import TTLCache
 from eodag.utils.dates import get_datetime, rfc3339_str_to_datetime
 from eodag.utils.env import is_env_var_true
 from eodag.utils.exceptions import (
@@ -85,7 +92,6 @@ from eodag.utils.exceptions import (
 from eodag.utils.free_text_search import compile_free_text_query
 
 if TYPE_CHECKING:
-    from concurrent.futures import ThreadPoolExecutor
     from shapely.geometry.base import BaseGeometry
 
     from eodag.plugins.apis.base import Api
@@ -94,6 +100,7 @@ if TYPE_CHECKING:
     from eodag.types import ProviderSortables
     from eodag.types.download_args import DownloadConf
     from eodag.utils import DownloadedCallback, ProgressCallback, Unpack
+    from eodag.utils.download_journal import DownloadJournal
 
 logger = logging.getLogger("eodag.core")
 
@@ -144,6 +151,16 @@ class EODataAccessGateway:
         self._plugins_manager = PluginManager(self._providers)
         self._providers = self._plugins_manager.providers
 
+        # queryables cache shared by search plugins, optionally persisted on disk
+        self._queryables_cache = TTLCache(
+            ttl=float(
+                os.getenv("EODAG_QUERYABLES_CACHE_TTL", DEFAULT_QUERYABLES_CACHE_TTL)
+            ),
+            stale_ttl=DEFAULT_QUERYABLES_CACHE_STALE_TTL,
+            cache_dir=os.getenv("EODAG_QUERYABLES_CACHE_DIR"),
+        )
+        self._plugins_manager.queryables_cache = self._queryables_cache
+
         # First level override: From a user configuration file
         if user_conf_file_path is None:
             env_var_name = "EODAG_CFG_FILE"
@@ -273,6 +290,14 @@ class EODataAccessGateway:
 
         self._providers.update_from_configs(conf_update)
 
+        # cached queryables of updated providers may be outdated
+        for name in conf_update:
+            self._queryables_cache.invalidate(name)
+        if conf_update:
+            # as well as the models created from them, also cleared for add_provider()
+            QueryablesDict.clear_models_cache()
+            clear_stac_metadata_models_cache()
+
         # re-create _plugins_manager using up-to-date providers_config
         self._plugins_manager.build_collection_to_provider_config_map()
 
@@ -585,6 +610,7 @@ class EODataAccessGateway:
 
         # get ext_collections conf for user modified providers
         default_providers = ProvidersDict.from_configs(load_default_config())
+        user_modified_providers: list[Provider] = []
         for (
             provider,
             user_discovery_conf,
@@ -654,36 +680,64 @@ class EODataAccessGateway:
                 # or not in ext_collections_conf (if eodag system conf != eodag conf used for ext_collections_conf)
 
             if not already_fetched:
-                # discover collections for user configured provider
-                provider_ext_collections_conf = (
-                    self.discover_collections(provider=provider) or {}
-                )
-                # update eodag collections list with new conf
-                self.update_collections_list(provider_ext_collections_conf)
+                user_modified_providers.append(self._providers[provider])
+
+        if user_modified_providers:
+            # discover collections for user configured providers, concurrently
+            providers_ext_collections_conf = (
+                self._discover_providers_collections(user_modified_providers) or {}
+            )
+            # update eodag collections list with new conf
+            self.update_collections_list(providers_ext_collections_conf)
 
     def discover_collections(
-        self, provider: Optional[str] = None
+        self,
+        provider: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        timeout: Optional[float] = None,
     ) -> Optional[dict[str, Any]]:
         """Fetch providers for collections
 
+        Providers are fetched concurrently, the total duration being the one of the
+        slowest provider. Providers for which discovery failed or timed out are
+        reported with a ``None`` value in the returned configuration.
+
         :param provider: The name of a provider or provider-group to fetch. Defaults to
                          all providers (None value).
+        :param max_workers: (optional) Maximum number of providers fetched concurrently.
+                            Defaults to :data:`~eodag.utils.DEFAULT_DISCOVER_MAX_WORKERS`
+        :param timeout: (optional) Maximum duration in seconds allowed to each provider
+                        collections discovery. Defaults to no time limit
         :returns: external collections configuration
         """
 
-        providers_iter, providers_check = itertools.tee(
-            self.providers.filter_by_name_or_group(provider)
-        )
+        providers = list(self.providers.filter_by_name_or_group(provider))
 
-        if provider and not any(providers_check):
+        if provider and not providers:
             raise UnsupportedProvider(
                 f"The requested provider is not (yet) supported: {provider}"
             )
 
+        return self._discover_providers_collections(providers, max_workers, timeout)
+
+    def _discover_providers_collections(
+        self,
+        providers: list[Provider],
+        max_workers: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> Optional[dict[str, Any]]:
+        """Fetch the given providers for collections, concurrently
+
+        :param providers: Providers to fetch
+        :param max_workers: (optional) Maximum number of providers fetched concurrently
+        :param timeout: (optional) Maximum duration in seconds allowed to each provider
+        :returns: external collections configuration
+        """
         ext_collections_conf: dict[str, Any] = {}
 
-        kwargs: dict[str, Any] = {}
-        for p in providers_iter:
+        # plugins and auth are prepared sequentially, only fetch requests run concurrently
+        discoveries: dict[str, tuple[Union[Search, Api], dict[str, Any]]] = {}
+        for p in providers:
             if not p.search_config:
                 return None
 
@@ -698,6 +752,7 @@ class EODataAccessGateway:
                 ):
                     continue
 
+                kwargs: dict[str, Any] = {}
                 # append auth to search plugin if needed
                 if getattr(search_plugin.config, "need_auth", False):
                     if auth := self._plugins_manager.get_auth(
@@ -713,12 +768,97 @@ class EODataAccessGateway:
                         ext_collections_conf[p.name] = None
                         continue
 
-                ext_collections_conf[p.name] = search_plugin.discover_collections(
-                    **kwargs
-                )
+                discoveries[p.name] = (search_plugin, kwargs)
+
+        ext_collections_conf.update(
+            self._run_collections_discoveries(discoveries, max_workers, timeout)
+        )
 
         return sort_dict(ext_collections_conf)
 
+    def _run_collections_discoveries(
+        self,
+        discoveries: dict[str, tuple[Union[Search, Api], dict[str, Any]]],
+        max_workers: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> dict[str, Optional[dict[str, Any]]]:
+        """Run providers collections discoveries in a bounded thread pool
+
+        :param discoveries: search plugin and its discovery kwargs, per provider name
+        :param max_workers: (optional) Maximum number of providers fetched concurrently
+        :param timeout: (optional) Maximum duration in seconds allowed to each provider
+        :returns: external collections configuration per provider, ``None`` for failed
+                  or timed out providers
+        """
+        results: dict[str, Optional[dict[str, Any]]] = {}
+        if not discoveries:
+            return results
+
+        started_at: dict[str, float] = {}
+
+        def discover(name: str) -> Optional[dict[str, Any]]:
+            started_at[name] = time.monotonic()
+            search_plugin, kwargs = discoveries[name]
+            return search_plugin.discover_collections(**kwargs)
+
+        executor = ThreadPoolExecutor(
+            max_workers=min(
+                max_workers or DEFAULT_DISCOVER_MAX_WORKERS, len(discoveries)
+            ),
+            thread_name_prefix="eodag-discover",
+        )
+        futures = {executor.submit(discover, name): name for name in discoveries}
+        pending = set(futures)
+        try:
+            while pending:
+                wait_timeout: Optional[float] = None
+                if timeout is not None:
+                    # wait until the earliest deadline of already started discoveries
+                    now = time.monotonic()
+                    deadlines = [
+                        started_at[futures[f]] + timeout
+                        for f in pending
+                        if futures[f] in started_at
+                    ]
+                    wait_timeout = max(0.0, min(deadlines) - now) if deadlines else 0.1
+                done, pending = wait(
+                    pending, timeout=wait_timeout, return_when=FIRST_COMPLETED
+                )
+                for future in done:
+                    name = futures[future]
+                    try:
+                        results[name] = future.result()
+                    except Exception as e:
+                        logger.warning(
+                            "Collections discovery failed for %s: %s: %s",
+                            name,
+                            type(e).__name__,
+                            e,
+                        )
+                        results[name] = None
+                if timeout is not None:
+                    now = time.monotonic()
+                    for future in list(pending):
+                        name = futures[future]
+                        if name in started_at and now - started_at[name] >= timeout:
+                            logger.warning(
+                                "Collections discovery timed out for %s after %ss",
+                                name,
+                                timeout,
+                            )
+                            results[name] = None
+                            pending.discard(future)
+        finally:
+            # do not wait for timed out discoveries, their results will be ignored
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        if failed := sorted(name for name, conf in results.items() if conf is None):
+            logger.info(
+                "Collections discovery returned partial results, no result for: %s",
+                ", ".join(failed),
+            )
+        return results
+
     def update_collections_list(
         self, ext_collections_conf: dict[str, Optional[dict[str, dict[str, Any]]]]
     ) -> None:
@@ -1520,6 +1660,9 @@ class EODataAccessGateway:
 
         results = SearchResult([])
 
+        # search plugins are imported lazily, when first built
+        from eodag.plugins.search.qssearch import PostJsonSearch
+
         for plugin in search_plugins:
             logger.info(
                 "Searching product with id '%s' on provider: %s", uid, plugin.provider
@@ -1742,6 +1885,8 @@ class EODataAccessGateway:
 
         preferred_provider = self.get_preferred_provider()[0]
 
+        from eodag.plugins.search.build_search_result import MeteoblueSearch
+
         search_plugins: list[Union[Search, Api]] = []
         for plugin in self._plugins_manager.get_search_plugins(
             collection=collection, provider=provider
@@ -1977,10 +2122,20 @@ class EODataAccessGateway:
         executor: Optional[ThreadPoolExecutor] = None,
         wait: float = DEFAULT_DOWNLOAD_WAIT,
         timeout: float = DEFAULT_DOWNLOAD_TIMEOUT,
+        journal: Optional[Union[str, DownloadJournal]] = None,
+        target: Optional[str] = None,
         **kwargs: Unpack[DownloadConf],
     ) -> list[str]:
         """Download all products resulting from a search.
 
+        A download journal can be used to resume an interrupted batch of downloads, or to
+        split it between several processes sharing the same journal (see
+        :class:`~eodag.utils.download_journal.DownloadJournal`).
+
+        Products can also be transferred directly to an object storage without being
+        written on the local disk, by giving a ``s3://bucket/prefix`` ``target`` (see
+        :meth:`~eodag.api.product._product.EOProduct.transfer_to`).
+
         :param search_result: A set of EO products resulting from a search
         :param downloaded_callback: (optional) A method or a callable object which takes
                                     as parameter the ``product``. You can use the base class
@@ -1998,6 +2153,8 @@ class EODataAccessGateway:
                      two download tries of the same product
         :param timeout: (optional) If download fails, maximum time in minutes
                         before stop retrying to download
+        :param journal: (optional) A download journal, or the path of its SQLite database file
+        :param target: (optional) A ``s3://bucket/prefix`` URL where products are transferred
         :param kwargs: Additional keyword arguments from the download plugin configuration class that can
                        be provided to override any other values defined in a configuration file
                        or with environment variables:
@@ -2008,8 +2165,15 @@ class EODataAccessGateway:
                        * ``extract`` - whether to extract the downloaded products, only applies to archived products
                        * ``dl_url_params`` - additional parameters to pass over to the download url as an url parameter
                        * ``delete_archive`` - whether to delete the downloaded archives
-                       * ``asset`` - regex filter to identify assets to download
-        :returns: A collection of the absolute paths to the downloaded products
+                       * ``stream_extract`` - whether to extract archives while they are downloaded, without
+                         writing them to disk
+                       * ``asset`` - regex filter to identify assets to download, or archive members to extract
+
+                       Transfers to a ``target`` also accept the ``s3_client``, ``part_size`` and
+                       ``max_concurrency`` parameters of
+                       :meth:`~eodag.api.product._product.EOProduct.transfer_to`.
+        :returns: A collection of the absolute paths to the downloaded products, or of the
+                  ``s3://`` URLs of the transferred products if a ``target`` is given
         """
         paths = []
         if search_result:
@@ -2025,6 +2189,8 @@ class EODataAccessGateway:
                 executor=executor,
                 wait=wait,
                 timeout=timeout,
+                journal=journal,
+                target=target,
                 **kwargs,
             )
         else:
@@ -2159,7 +2325,9 @@ class EODataAccessGateway:
                        * ``extract`` - whether to extract the downloaded products, only applies to archived products
                        * ``dl_url_params`` - additional parameters to pass over to the download url as an url parameter
                        * ``delete_archive`` - whether to delete the downloaded archives
-                       * ``asset`` - regex filter to identify assets to download
+                       * ``stream_extract`` - whether to extract archives while they are downloaded, without
+                         writing them to disk
+                       * ``asset`` - regex filter to identify assets to download, or archive members to extract
         :returns: The absolute path to the downloaded product in the local filesystem
         :raises: :class:`~eodag.utils.exceptions.PluginImplementationError`
         :raises: :class:`RuntimeError`
@@ -2282,12 +2450,23 @@ class EODataAccessGateway:
                     else:
                         kwargs_alias[field_info.alias] = kwargs_alias.pop(search_param)
 
-            plugin_queryables = plugin.list_queryables(
-                kwargs_alias,
-                available_collections,
-                collection_configs,
-                collection,
-                coll_alias,
+            plugin_queryables = self._queryables_cache.get_or_set(
+                (
+                    plugin.provider,
+                    "list_queryables",
+                    collection,
+                    coll_alias,
+                    None if collection else tuple(available_collections),
+                    json.dumps(kwargs_alias, sort_keys=True, default=str),
+                ),
+                partial(
+                    plugin.list_queryables,
+                    kwargs_alias,
+                    available_collections,
+                    collection_configs,
+                    collection,
+                    coll_alias,
+                ),
             )
 
             if plugin_queryables.additional_information:
@@ -19,10 +19,13 @@ from __future__ import annotations
 
 import base64
 import datetime as dt
+import hashlib
+import io
 import logging
 import os
 import re
 import tempfile
+import time
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -37,8 +40,6 @@ from typing import (
 import geojson
 import orjson
 import requests
-from boto3 import Session
-from boto3.resources.base import ServiceResource
 from pystac import Item
 from requests import PreparedRequest, RequestException
 from requests.auth import AuthBase
@@ -46,7 +47,6 @@ from requests.structures import CaseInsensitiveDict
 from shapely import geometry
 from shapely.errors import ShapelyError
 
-from eodag.plugins.authentication.aws_auth import AwsAuth
 from eodag.types.queryables import CommonStacMetadata
 from eodag.types.stac_metadata import create_stac_metadata_model
 
@@ -73,15 +73,17 @@ from eodag.utils import (
     DEFAULT_DOWNLOAD_WAIT,
     DEFAULT_SHAPELY_GEOMETRY,
     DEFAULT_STREAM_REQUESTS_TIMEOUT,
+    DEFAULT_UPLOAD_MAX_CONCURRENCY,
+    DEFAULT_UPLOAD_PART_SIZE,
     GENERIC_STAC_PROVIDER,
     STAC_VERSION,
     USER_AGENT,
-    ProgressCallback,
     StreamResponse,
     _deprecated,
     deepcopy,
     format_string,
     get_geometry_from_various,
+    path_to_uri,
 )
 from eodag.utils.deserialize import (
     _import_stac_item_from_eodag_server,
@@ -94,10 +96,14 @@ from eodag.utils.exceptions import (
     MisconfiguredError,
     ValidationError,
 )
+from eodag.utils.files import link_or_copy
+from eodag.utils.product_cache import get_product_cache
 from eodag.utils.repr import dict_to_html_table
 
 if TYPE_CHECKING:
+    from boto3 import Session
     from concurrent.futures import ThreadPoolExecutor
+    from mypy_boto3_s3.client import S3Client
     from shapely.geometry.base import BaseGeometry
 
     from eodag import EODataAccessGateway
@@ -107,11 +113,42 @@ if TYPE_CHECKING:
     from eodag.plugins.download.base import Download
     from eodag.plugins.manager import PluginManager
     from eodag.types.download_args import DownloadConf
-    from eodag.utils import Unpack
+    from eodag.utils import ProgressCallback, Unpack
 
 logger = logging.getLogger("eodag.product")
 
 
+def _downsize_image(path: str, max_size: int) -> None:
+    """Downsize in place an image whose width or height exceeds ``max_size`` pixels,
+    keeping its aspect ratio and format. The image is kept as is if it cannot be
+    downsized."""
+    try:
+        from PIL import Image
+    except ImportError:
+        logger.warning(
+            "Pillow is needed to downsize quicklooks, install it using "
+            "'pip install eodag[quicklooks]'. %s kept as is",
+            path,
+        )
+        return
+
+    with open(path, "rb") as fd:
+        content = io.BytesIO(fd.read())
+    downsized = io.BytesIO()
+    try:
+        with Image.open(content) as image:
+            if max(image.size) <= max_size:
+                return
+            image_format = image.format
+            image.thumbnail((max_size, max_size))
+            image.save(downsized, format=image_format)
+    except (OSError, ValueError, Image.DecompressionBombError) as e:
+        logger.warning("Could not downsize %s, kept as is: %s", path, e)
+        return
+    with open(path, "wb") as fd_out:
+        fd_out.write(downsized.getvalue())
+
+
 class EOProduct:
     """A wrapper around an Earth Observation Product originating from a search.
 
@@ -159,6 +196,8 @@ class EOProduct:
     search_kwargs: Any
     #: Datetime for download next try
     next_try: dt.datetime
+    #: Delay in seconds before the next order status check, requested by the provider
+    retry_after: Optional[float] = None
     #: Stream for requests
     _stream: requests.Response
     #: HTTP response headers, stored during streamed download
@@ -554,6 +593,11 @@ class EOProduct:
         method. A side effect of this method is that it changes the ``location``
         attribute of an EOProduct, from its remote address to the local address.
 
+        If the products cache is enabled using the ``EODAG_PRODUCTS_CACHE_DIR``
+        environment variable, a product already downloaded in another output directory
+        is materialized from the cache instead of being downloaded again (see
+        :class:`~eodag.utils.product_cache.ProductCache`).
+
         :param progress_callback: (optional) A method or a callable object
                                   which takes a current size and a maximum
                                   size as inputs and handle progress bar
@@ -588,8 +632,7 @@ class EOProduct:
             progress_callback, executor
         )
 
-        fs_path = self.downloader.download(
-            self,
+        fs_path = self._download_with_cache(
             auth=auth,
             progress_callback=progress_callback,
             executor=executor,
@@ -625,6 +668,55 @@ class EOProduct:
 
         return fs_path
 
+    def _download_with_cache(self, **kwargs: Any) -> Optional[str]:
+        """Download the product through the products cache if it is enabled, materializing
+        it from the cache if it was already downloaded, or storing it in the cache once
+        downloaded otherwise"""
+        downloader = cast("Download", self.downloader)
+        cache = get_product_cache()
+        # partial downloads and products already available locally are not cached
+        if (
+            cache is None
+            or kwargs.get("asset")
+            or self.location != self.remote_location
+        ):
+            return downloader.download(self, **kwargs)
+
+        extract = kwargs.get("extract")
+        if extract is None:
+            extract = getattr(downloader.config, "extract", True)
+        output_dir = os.path.abspath(
+            kwargs.get("output_dir")
+            or getattr(downloader.config, "output_dir", None)
+            or tempfile.gettempdir()
+        )
+        key = cache.product_key(self, extract)
+        with cache.lock(key):
+            try:
+                fs_path = cache.materialize(key, output_dir)
+            except OSError as e:
+                logger.warning("Could not get %s from products cache: %s", self, e)
+                fs_path = None
+            if fs_path is not None:
+                logger.info("Product materialized from products cache: %s", fs_path)
+                records_dir = os.path.join(output_dir, ".downloaded")
+                os.makedirs(records_dir, exist_ok=True)
+                with open(
+                    os.path.join(records_dir, downloader.generate_record_hash(self)),
+                    "w",
+                ) as fh:
+                    fh.write(self.remote_location)
+                self.location = path_to_uri(fs_path)
+                return fs_path
+
+            fs_path = downloader.download(self, **kwargs)
+            if fs_path and os.path.exists(fs_path):
+                try:
+                    cache.store(key, fs_path)
+                except OSError as e:
+                    logger.warning("Could not store %s in products cache: %s", self, e)
+            return fs_path
+
     def stream_download(
         self,
         byte_range: tuple[Optional[int], Optional[int]] = (None, None),
@@ -669,6 +761,90 @@ class EOProduct:
             **kwargs,
         )
 
+    def transfer_to(
+        self,
+        url: str,
+        compress: Literal["zip", "raw", "auto"] = "auto",
+        s3_client: Optional[S3Client] = None,
+        part_size: int = DEFAULT_UPLOAD_PART_SIZE,
+        max_concurrency: int = DEFAULT_UPLOAD_MAX_CONCURRENCY,
+        progress_callback: Optional[ProgressCallback] = None,
+        executor: Optional[ThreadPoolExecutor] = None,
+        wait: float = DEFAULT_DOWNLOAD_WAIT,
+        timeout: float = DEFAULT_DOWNLOAD_TIMEOUT,
+        **kwargs: Unpack[DownloadConf],
+    ) -> str:
+        """Transfer the EO product to an object storage, without writing it on the local disk.
+
+        The product is downloaded using :meth:`stream_download`, as a single file or as a
+        zip archive of its assets built on the fly, and uploaded to S3 while it is
+        downloaded using a multipart upload whose parts are uploaded concurrently (see
+        :func:`~eodag.utils.s3.upload_stream_to_s3`). An interrupted transfer is resumed,
+        without uploading again the parts that were already uploaded.
+
+        :param url: Destination of the product, as a ``s3://bucket/key`` URL. If the key is
+                    empty or ends with ``/``, it is used as a prefix for the file name of
+                    the product
+        :param compress: (optional) "zip", "raw", "auto", see :meth:`stream_download`
+        :param s3_client: (optional) S3 client used to upload the product. If ``None``, a
+                          client configured from the environment is created
+        :param part_size: (optional) Size in bytes of the uploaded parts, enlarged for
+                          products of known size having more than 10,000 parts
+        :param max_concurrency: (optional) Maximum number of parts uploaded concurrently,
+                                the memory used being bounded by
+                                ``(max_concurrency + 1) * part_size``
+        :param progress_callback: (optional) A progress callback
+        :param executor: (optional) Executor of the products transferred in parallel, only
+                         used to position the progress bar
+        :param wait: (optional) If download fails, wait time in minutes between
+                     two download tries
+        :param timeout: (optional) If download fails, maximum time in minutes
+                        before stop retrying to download
+        :param kwargs: additional kwargs like `dl_url_params` (dict) can be provided
+                        and will override any other values defined in a configuration
+                        file or with environment variables.
+        :returns: The ``s3://`` URL of the transferred product
+        :raises: :class:`ValueError` if ``url`` is not a S3 URL
+        :raises: :class:`RuntimeError`
+        """
+        # boto3 is only imported for transfers to S3
+        from eodag.utils.s3 import parse_s3_url, upload_stream_to_s3
+
+        bucket, key = parse_s3_url(url)
+        stream = self.stream_download(
+            compress=compress, wait=wait, timeout=timeout, **kwargs
+        )
+        if not key or key.endswith("/"):
+            key += stream.filename or str(self.properties["id"])
+        if s3_client is None:
+            import boto3
+
+            s3_client = boto3.client("s3")
+
+        progress_callback, close_progress_callback = self._init_progress_bar(
+            progress_callback, executor
+        )
+        progress_callback.reset(total=stream.size)
+        try:
+            upload_stream_to_s3(
+                stream.content,
+                bucket,
+                key,
+                s3_client,
+                part_size=part_size,
+                max_concurrency=max_concurrency,
+                content_type=stream.media_type,
+                progress_callback=progress_callback,
+                size=stream.size,
+            )
+        finally:
+            if close_progress_callback:
+                progress_callback.close()
+
+        transferred_url = f"s3://{bucket}/{key}"
+        logger.info("Product transferred to %s", transferred_url)
+        return transferred_url
+
     def get_storage_options(
         self,
         asset_key: Optional[str] = None,
@@ -715,28 +891,6 @@ class EOProduct:
             raise AddressNotFound(f"{asset_key} not found in {self} assets") from e
         headers = {**USER_AGENT}
 
-        if isinstance(auth, ServiceResource) and isinstance(
-            self.downloader_auth, AwsAuth
-        ):
-            auth_kwargs: dict[str, Any] = dict()
-            # AwsAuth
-            if s3_endpoint := getattr(self.downloader_auth.config, "s3_endpoint", None):
-                auth_kwargs["client_kwargs"] = {"endpoint_url": s3_endpoint}
-            if creds := cast(
-                Session, self.downloader_auth.s3_session
-            ).get_credentials():
-                auth_kwargs["key"] = creds.access_key
-                auth_kwargs["secret"] = creds.secret_key
-                if creds.token:
-                    auth_kwargs["token"] = creds.token
-                if requester_pays := getattr(
-                    self.downloader_auth.config, "requester_pays", False
-                ):
-                    auth_kwargs["requester_pays"] = requester_pays
-            else:
-                auth_kwargs["anon"] = True
-            return {"path": url, **auth_kwargs}
-
         if isinstance(auth, AuthBase):
             # update url and headers with auth
             req = PreparedRequest()
@@ -746,6 +900,36 @@ class EOProduct:
                 auth(req)
             return {"path": req.url, "headers": dict(req.headers)}
 
+        if auth is not None:
+            # boto3 is only imported for s3 auth
+            from boto3.resources.base import ServiceResource
+
+            from eodag.plugins.authentication.aws_auth import AwsAuth
+
+            if isinstance(auth, ServiceResource) and isinstance(
+                self.downloader_auth, AwsAuth
+            ):
+                auth_kwargs: dict[str, Any] = dict()
+                # AwsAuth
+                if s3_endpoint := getattr(
+                    self.downloader_auth.config, "s3_endpoint", None
+                ):
+                    auth_kwargs["client_kwargs"] = {"endpoint_url": s3_endpoint}
+                if creds := cast(
+                    "Session", self.downloader_auth.s3_session
+                ).get_credentials():
+                    auth_kwargs["key"] = creds.access_key
+                    auth_kwargs["secret"] = creds.secret_key
+                    if creds.token:
+                        auth_kwargs["token"] = creds.token
+                    if requester_pays := getattr(
+                        self.downloader_auth.config, "requester_pays", False
+                    ):
+                        auth_kwargs["requester_pays"] = requester_pays
+                else:
+                    auth_kwargs["anon"] = True
+                return {"path": url, **auth_kwargs}
+
         return {"path": url}
 
     def _init_progress_bar(
@@ -759,7 +943,10 @@ class EOProduct:
 
         # progress bar init
         if progress_callback is None:
-            progress_callback = ProgressCallback(position=count)
+            from eodag.utils import AggregatedProgressCallback
+
+            # per-chunk updates of downloads are aggregated, the bar is updated at a fixed rate
+            progress_callback = AggregatedProgressCallback(position=count)
             # one shot progress callback to close after download
             close_progress_callback = True
         else:
@@ -778,7 +965,9 @@ class EOProduct:
         progress_callback: ProgressCallback,
         ssl_verify: Optional[bool] = None,
         auth: Optional[AuthBase] = None,
-    ):
+        session: Optional[requests.Session] = None,
+        headers: Optional[dict[str, str]] = None,
+    ) -> requests.Response:
         """Download the quicklook image from the EOProduct's quicklook URL.
 
         This method performs an HTTP GET request to retrieve the quicklook image and saves it
@@ -792,16 +981,22 @@ class EOProduct:
         :param ssl_verify: (optional) Whether to verify SSL certificates. Defaults to True.
         :param auth: (optional) Authentication credentials (e.g., tuple or object) used for the
                         HTTP request if the resource requires authentication.
+        :param session: (optional) A session whose pooled connections are used for the request.
+        :param headers: (optional) Additional request headers, e.g. conditional request validators.
+        :returns: The response, with a ``304`` status code if the quicklook was not modified
+                  since the validators of ``headers`` were issued.
         :raises HTTPError: If the HTTP request to the quicklook URL fails.
         """
-        with requests.get(
+        with (session or requests).get(
             self.properties["eodag:quicklook"],
             stream=True,
             auth=auth,
-            headers=USER_AGENT,
+            headers=dict(USER_AGENT, **(headers or {})),
             timeout=DEFAULT_STREAM_REQUESTS_TIMEOUT,
             verify=ssl_verify,
         ) as stream:
+            if stream.status_code == 304:
+                return stream
             stream.raise_for_status()
             stream_size = int(stream.headers.get("Content-Length", 0))
             progress_callback.reset(stream_size)
@@ -811,12 +1006,84 @@ class EOProduct:
                         fhandle.write(chunk)
                         progress_callback(len(chunk))
             logger.info("Download recorded in %s", quicklook_file)
+            return stream
+
+    def _get_cached_quicklook(
+        self,
+        cache_dir: str,
+        download: Callable[[str, dict[str, str]], requests.Response],
+        max_size: Optional[int] = None,
+    ) -> str:
+        """Get the quicklook of the product from a cache directory, only downloading it if it
+        is not cached, or if its cached validators (``ETag``, ``Last-Modified``) are expired
+        and the server tells it was modified.
+
+        :param cache_dir: The quicklooks cache directory.
+        :param download: Downloads the quicklook into a file using additional request headers,
+                         and returns the response, with a ``304`` status code if it was not modified.
+        :param max_size: (optional) Maximum width and height of the cached quicklook.
+        :returns: The path of the cached quicklook
+        """
+        url = self.properties["eodag:quicklook"]
+        cached_file = os.path.join(
+            cache_dir,
+            hashlib.sha256(f"{url} {max_size or ''}".encode("utf-8")).hexdigest(),
+        )
+        metadata_file = f"{cached_file}.json"
+        metadata: dict[str, Any] = {}
+        if os.path.isfile(cached_file):
+            try:
+                with open(metadata_file, "rb") as fd:
+                    metadata = orjson.loads(fd.read())
+            except (OSError, ValueError):
+                pass
+            # without validators, a cached quicklook is kept as is
+            if not (metadata.get("etag") or metadata.get("last_modified")) or (
+                metadata.get("expires", 0) > time.time()
+            ):
+                return cached_file
+
+        validators = {
+            header: metadata[key]
+            for header, key in (
+                ("If-None-Match", "etag"),
+                ("If-Modified-Since", "last_modified"),
+            )
+            if metadata.get(key)
+        }
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_fd, tmp_file = tempfile.mkstemp(dir=cache_dir, suffix=".part")
+        os.close(tmp_fd)
+        try:
+            response = download(tmp_file, validators)
+            if response.status_code != 304:
+                if max_size:
+                    _downsize_image(tmp_file, max_size)
+                os.replace(tmp_file, cached_file)
+                metadata = {
+                    "url": url,
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                }
+            max_age = re.search(
+                r"max-age=(\d+)", response.headers.get("Cache-Control", "")
+            )
+            metadata["expires"] = time.time() + int(max_age.group(1)) if max_age else 0
+            with open(metadata_file, "wb") as fd_meta:
+                fd_meta.write(orjson.dumps(metadata))
+        finally:
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+        return cached_file
 
     def get_quicklook(
         self,
         filename: Optional[str] = None,
         output_dir: Optional[str] = None,
         progress_callback: Optional[ProgressCallback] = None,
+        cache_dir: Optional[str] = None,
+        max_size: Optional[int] = None,
+        session: Optional[requests.Session] = None,
     ) -> str:
         """Download the quicklook image of a given EOProduct from its provider if it
         exists.
@@ -833,6 +1100,13 @@ class EOProduct:
         :param progress_callback: (optional) A method or a callable object which takes
                                    a current size and a maximum size as inputs and handle progress bar
                                    creation and update to give the user a feedback on the download progress
+        :param cache_dir: (optional) A directory where quicklooks are cached with their ``ETag`` and
+                          ``Last-Modified`` validators. A cached quicklook is only downloaded again if
+                          the server tells it was modified, and is then linked to the output directory.
+        :param max_size: (optional) Maximum width and height in pixels of the quicklook, which is
+                         downsized keeping its aspect ratio if it is larger. Requires ``Pillow``.
+        :param session: (optional) A session whose pooled connections are used to download the
+                        quicklook, e.g. shared between the quicklooks of many products.
         :returns: The absolute path of the downloaded quicklook
         """
 
@@ -871,15 +1145,18 @@ class EOProduct:
             )
             quicklooks_output_dir = os.path.join(downloader_output_dir, "quicklooks")
         if not os.path.isdir(quicklooks_output_dir):
-            os.makedirs(quicklooks_output_dir)
+            os.makedirs(quicklooks_output_dir, exist_ok=True)
         quicklook_file = os.path.join(
             quicklooks_output_dir,
             filename if filename is not None else self.properties["id"],
         )
 
-        if not os.path.isfile(quicklook_file):
+        is_http = self.properties["eodag:quicklook"].startswith("http")
+        if not os.path.isfile(quicklook_file) or (cache_dir is not None and is_http):
             # progress bar init
             if progress_callback is None:
+                from eodag.utils import ProgressCallback
+
                 progress_callback = ProgressCallback()
                 # one shot progress callback to close after download
                 close_progress_callback = True
@@ -892,13 +1169,12 @@ class EOProduct:
             # VERY SPECIAL CASE (introduced by the onda provider): first check if
             # it is a HTTP URL. If not, we assume it is a base64 string, in which case
             # we just decode the content, write it into the quicklook_file and return it.
-            if not (
-                self.properties["eodag:quicklook"].startswith("http")
-                or self.properties["eodag:quicklook"].startswith("https")
-            ):
+            if not is_http:
                 with open(quicklook_file, "wb") as fd:
                     img = self.properties["eodag:quicklook"].encode("ascii")
                     fd.write(base64.b64decode(img))
+                if max_size:
+                    _downsize_image(quicklook_file, max_size)
                 return quicklook_file
 
             auth = (
@@ -915,28 +1191,45 @@ class EOProduct:
                 if self.downloader
                 else True
             )
-            try:
-                self._download_quicklook(
-                    quicklook_file, progress_callback, ssl_verify, auth
-                )
-            except RequestException as e:
-                logger.debug(
-                    f"Error while getting resource with authentication. {e} \nTrying without authentication..."
-                )
+
+            def download(
+                file: str, headers: Optional[dict[str, str]] = None
+            ) -> requests.Response:
                 try:
-                    self._download_quicklook(
-                        quicklook_file, progress_callback, ssl_verify, None
+                    return self._download_quicklook(
+                        file, progress_callback, ssl_verify, auth, session, headers
                     )
-                except RequestException as e_no_auth:
-                    logger.error(
-                        f"Failed to get resource with authentication: {e} \n \
-                        Failed to get resource even without authentication. {e_no_auth}"
+                except RequestException as e:
+                    logger.debug(
+                        f"Error while getting resource with authentication. {e} \nTrying without authentication..."
                     )
-                    return ""
+                    try:
+                        return self._download_quicklook(
+                            file, progress_callback, ssl_verify, None, session, headers
+                        )
+                    except RequestException as e_no_auth:
+                        logger.error(
+                            f"Failed to get resource with authentication: {e} \n \
+                            Failed to get resource even without authentication. {e_no_auth}"
+                        )
+                        raise
 
-            # close progress bar if needed
-            if close_progress_callback:
-                progress_callback.close()
+            try:
+                if cache_dir is not None:
+                    cached_file = self._get_cached_quicklook(
+                        cache_dir, download, max_size
+                    )
+                    link_or_copy(cached_file, quicklook_file)
+                else:
+                    download(quicklook_file)
+                    if max_size:
+                        _downsize_image(quicklook_file, max_size)
+            except RequestException:
+                return ""
+            finally:
+                # close progress bar if needed
+                if close_progress_callback:
+                    progress_callback.close()
 
         return quicklook_file
 
@@ -19,7 +19,9 @@ from __future__ import annotations
 
 import logging
 import os
+import threading
 import traceback
+import weakref
 from collections import UserDict
 from inspect import isclass
 from textwrap import shorten
@@ -67,6 +69,48 @@ logger = logging.getLogger("eodag.provider")
 AUTH_TOPIC_KEYS = ("auth", "search_auth", "download_auth")
 PLUGINS_TOPICS_KEYS = ("api", "search", "download") + AUTH_TOPIC_KEYS
 
+#: module and name of the topic class of the plugins configured under each provider config key
+_PLUGINS_TOPICS_CLASSES: dict[str, tuple[str, str]] = {
+    "search": ("eodag.plugins.search.base", "Search"),
+    "api": ("eodag.plugins.apis.base", "Api"),
+    "download": ("eodag.plugins.download.base", "Download"),
+    "auth": ("eodag.plugins.authentication.base", "Authentication"),
+    "search_auth": ("eodag.plugins.authentication.base", "Authentication"),
+    "download_auth": ("eodag.plugins.authentication.base", "Authentication"),
+}
+
+#: plugins configurations already normalized by their plugin class
+_normalized_plugins_confs: weakref.WeakSet[PluginConfig] = weakref.WeakSet()
+_normalize_lock = threading.Lock()
+
+
+def normalize_plugin_config(
+    provider: str, plugin_conf: PluginConfig, plugin_cls: Any
+) -> PluginConfig:
+    """Apply the defaults of its plugin class to a plugin configuration, once until the
+    configuration is updated through its :class:`~eodag.api.provider.ProviderConfig`.
+
+    :param provider: The provider name
+    :param plugin_conf: The plugin configuration, normalized in place
+    :param plugin_cls: The plugin class
+    :returns: The plugin configuration
+    """
+    if plugin_conf in _normalized_plugins_confs:
+        return plugin_conf
+    with _normalize_lock:
+        if plugin_conf not in _normalized_plugins_confs:
+            if normalize_config := getattr(plugin_cls, "normalize_config", None):
+                try:
+                    normalize_config(provider, plugin_conf)
+                except Exception:
+                    logger.debug(
+                        "Could not normalize %s config for provider %s",
+                        getattr(plugin_conf, "type", None),
+                        provider,
+                    )
+            _normalized_plugins_confs.add(plugin_conf)
+    return plugin_conf
+
 
 class ProviderConfig(yaml.YAMLObject):
     """EODAG configuration for a provider.
@@ -229,46 +273,45 @@ class ProviderConfig(yaml.YAMLObject):
         return self.__class__.from_mapping(config_dict)
 
     def _apply_defaults(self: Self) -> None:
-        """Applies some default values to provider config."""
-        plugin_topics: tuple[tuple[str, str], ...] = (
-            ("search", "eodag.plugins.search.base"),
-            ("api", "eodag.plugins.apis.base"),
-            ("download", "eodag.plugins.download.base"),
-            ("auth", "eodag.plugins.authentication.base"),
-            ("search_auth", "eodag.plugins.authentication.base"),
-            ("download_auth", "eodag.plugins.authentication.base"),
-        )
-        topic_class_names = {
-            "search": "Search",
-            "api": "Api",
-            "download": "Download",
-            "auth": "Authentication",
-            "search_auth": "Authentication",
-            "download_auth": "Authentication",
-        }
+        """Applies some default values to provider config.
 
-        for plugin_key, topic_module in plugin_topics:
-            plugin_conf = getattr(self, plugin_key, None)
-            plugin_type = getattr(plugin_conf, "type", None)
-            if plugin_conf is None or not plugin_type:
-                continue
+        Plugins configurations are normalized by their plugin class when first needed,
+        see :meth:`normalize_plugin_config`, so that plugins modules are not loaded here.
+        """
+        for plugin_key in PLUGINS_TOPICS_KEYS:
+            if (plugin_conf := getattr(self, plugin_key, None)) is not None:
+                # updated configurations must be normalized again
+                _normalized_plugins_confs.discard(plugin_conf)
 
-            try:
-                topic_class_name = topic_class_names[plugin_key]
-                topic_class = getattr(
-                    __import__(topic_module, fromlist=[topic_class_name]),
-                    topic_class_name,
-                )
-                topic_class.ensure_plugins_loaded()
-                plugin_cls = topic_class.get_plugin_by_class_name(plugin_type)
-                if normalize_config := getattr(plugin_cls, "normalize_config", None):
-                    normalize_config(self.name, plugin_conf)
-            except Exception:
-                logger.debug(
-                    "Could not normalize %s config for provider %s",
-                    plugin_key,
-                    getattr(self, "name", None),
-                )
+    def normalize_plugin_config(self, plugin_key: str) -> Optional[PluginConfig]:
+        """Normalize the configuration of a plugin of this provider, loading the plugin
+        if needed.
+
+        :param plugin_key: The provider config key of the plugin (e.g. ``search``)
+        :returns: The normalized plugin configuration, if any
+        """
+        plugin_conf: Optional[PluginConfig] = getattr(self, plugin_key, None)
+        plugin_type = getattr(plugin_conf, "type", None)
+        if plugin_conf is None or not plugin_type:
+            return plugin_conf
+        if plugin_conf in _normalized_plugins_confs:
+            return plugin_conf
+
+        topic_module, topic_class_name = _PLUGINS_TOPICS_CLASSES[plugin_key]
+        try:
+            topic_class = getattr(
+                __import__(topic_module, fromlist=[topic_class_name]),
+                topic_class_name,
+            )
+            plugin_cls = topic_class.load_plugin(plugin_type)
+        except Exception:
+            logger.debug(
+                "Could not normalize %s config for provider %s",
+                plugin_key,
+                getattr(self, "name", None),
+            )
+            return plugin_conf
+        return normalize_plugin_config(self.name, plugin_conf, plugin_cls)
 
 
 class Provider:
@@ -412,7 +455,9 @@ class Provider:
     @property
     def search_config(self) -> Optional[PluginConfig]:
         """Return the search plugin config, if any."""
-        return getattr(self.config, "search", None) or getattr(self.config, "api", None)
+        return self.config.normalize_plugin_config(
+            "search"
+        ) or self.config.normalize_plugin_config("api")
 
     @property
     def fetchable(self) -> bool:
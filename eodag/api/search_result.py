@@ -18,22 +18,21 @@
 from __future__ import annotations
 
 import logging
+import os
 from collections import UserList
 from typing import TYPE_CHECKING, Annotated, Any, Iterable, Iterator, Optional, Union
 
 import geojson
+import requests
+from concurrent.futures import ThreadPoolExecutor
 from pystac import ItemCollection
+from requests.adapters import HTTPAdapter
 from shapely.geometry import GeometryCollection
 from shapely.geometry import mapping as shapely_mapping
 from shapely.geometry import shape
 from typing_extensions import Doc
 
 from eodag.api.product import EOProduct
-from eodag.plugins.crunch.filter_date import FilterDate
-from eodag.plugins.crunch.filter_latest_intersect import FilterLatestIntersect
-from eodag.plugins.crunch.filter_latest_tpl_name import FilterLatestByName
-from eodag.plugins.crunch.filter_overlap import FilterOverlap
-from eodag.plugins.crunch.filter_property import FilterProperty
 from eodag.utils import STAC_VERSION, _deprecated
 
 if TYPE_CHECKING:
@@ -41,6 +40,7 @@ if TYPE_CHECKING:
 
     from eodag.api.core import EODataAccessGateway
     from eodag.plugins.crunch.base import Crunch
+    from eodag.utils import ProgressCallback
 
 
 logger = logging.getLogger("eodag.search_result")
@@ -108,6 +108,8 @@ class SearchResult(UserList[EOProduct]):
         :param end: end sensing time in iso format
         :returns: The result of the application of the crunching method to the EO products
         """
+        from eodag.plugins.crunch.filter_date import FilterDate
+
         return self.crunch(FilterDate(dict(start=start, end=end)))
 
     def filter_latest_intersect(
@@ -120,6 +122,8 @@ class SearchResult(UserList[EOProduct]):
         :param geometry: geometry used as search extent.
         :returns: The result of the application of the crunching method to the EO products
         """
+        from eodag.plugins.crunch.filter_latest_intersect import FilterLatestIntersect
+
         return self.crunch(FilterLatestIntersect({}), geometry=geometry)
 
     def filter_latest_by_name(self, name_pattern: str) -> SearchResult:
@@ -130,6 +134,8 @@ class SearchResult(UserList[EOProduct]):
         :param name_pattern: 6 digits product name pattern (tile id)
         :returns: The result of the application of the crunching method to the EO products
         """
+        from eodag.plugins.crunch.filter_latest_tpl_name import FilterLatestByName
+
         return self.crunch(FilterLatestByName(dict(name_pattern=name_pattern)))
 
     def filter_overlap(
@@ -151,6 +157,8 @@ class SearchResult(UserList[EOProduct]):
         :param within: ``True`` if product geometry is within the search area
         :returns: The result of the application of the crunching method to the EO products
         """
+        from eodag.plugins.crunch.filter_overlap import FilterOverlap
+
         return self.crunch(
             FilterOverlap(
                 dict(
@@ -173,6 +181,8 @@ class SearchResult(UserList[EOProduct]):
         :param operator: Operator used for filtering (one of :mod:`python:operator` functions ``lt,le,eq,ne,ge,...``)
         :param search_property: property key from ``product.properties``, associated to its filter value
         """
+        from eodag.plugins.crunch.filter_property import FilterProperty
+
         return self.crunch(FilterProperty(dict(operator=operator, **search_property)))
 
     def filter_online(self) -> SearchResult:
@@ -184,6 +194,74 @@ class SearchResult(UserList[EOProduct]):
         """
         return self.filter_property(**{"order:status": "succeeded"})
 
+    def get_quicklooks(
+        self,
+        output_dir: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        cache_dir: Optional[str] = None,
+        max_size: Optional[int] = None,
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> list[str]:
+        """Download the quicklooks of the products concurrently.
+
+        Quicklooks are fetched in parallel by ``max_workers`` threads over the pooled
+        connections of a shared session. See :meth:`~eodag.api.product._product.EOProduct.get_quicklook`.
+
+        :param output_dir: (optional) The directory where to store the quicklooks, defaulting
+                           to the ``quicklooks`` directory under each product downloader's
+                           ``output_dir``.
+        :param max_workers: (optional) The number of threads fetching the quicklooks in
+                            parallel, defaulting to the one of
+                            :class:`~concurrent.futures.ThreadPoolExecutor`.
+        :param cache_dir: (optional) A directory where quicklooks are cached with their validators,
+                          to only download again the ones that were modified.
+        :param max_size: (optional) Maximum width and height in pixels of the quicklooks, which
+                         are downsized if they are larger. Requires ``Pillow``.
+        :param progress_callback: (optional) A progress callback updated for each quicklook.
+        :returns: The paths of the quicklooks, in the order of the products, and empty for the
+                  products whose quicklook could not be retrieved.
+        """
+        from eodag.utils import ProgressCallback
+
+        if max_workers is None:
+            # default of ThreadPoolExecutor
+            max_workers = min(32, (os.cpu_count() or 1) + 4)
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=max_workers)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
+        if progress_callback is None:
+            progress_callback = ProgressCallback(
+                total=len(self), unit="quicklook", unit_scale=False, desc="quicklooks"
+            )
+            close_progress_callback = True
+        else:
+            close_progress_callback = False
+            progress_callback.reset(total=len(self))
+
+        def get_quicklook(product: EOProduct) -> str:
+            try:
+                return product.get_quicklook(
+                    output_dir=output_dir,
+                    progress_callback=ProgressCallback(disable=True),
+                    cache_dir=cache_dir,
+                    max_size=max_size,
+                    session=session,
+                )
+            finally:
+                progress_callback(1)
+
+        try:
+            with ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="eodag-quicklooks"
+            ) as executor:
+                return list(executor.map(get_quicklook, self))
+        finally:
+            session.close()
+            if close_progress_callback:
+                progress_callback.close()
+
     @classmethod
     def from_dict(
         cls,
@@ -518,6 +518,17 @@ def list_col(ctx: Context, **kwargs: Any) -> None:
     "(.json extension will be automatically appended to the filename). "
     "[default: ext_collections.json]",
 )
+@click.option(
+    "--max-workers",
+    type=int,
+    help="The maximum number of providers to fetch in parallel",
+)
+@click.option(
+    "--timeout",
+    type=float,
+    help="Maximum duration in seconds allowed to each provider, "
+    "providers exceeding it are skipped",
+)
 @click.pass_context
 def discover_col(ctx: Context, **kwargs: Any) -> None:
     """Fetch external collections configuration and save result"""
@@ -527,11 +538,14 @@ def discover_col(ctx: Context, **kwargs: Any) -> None:
     setup_logging(verbose=ctx.obj["verbosity"])
     dag = EODataAccessGateway()
     provider = kwargs.pop("provider")
+    discover_kwargs = {
+        k: v for k in ("max_workers", "timeout") if (v := kwargs.pop(k)) is not None
+    }
 
     ext_collections_conf = (
-        dag.discover_collections(provider=provider)
+        dag.discover_collections(provider=provider, **discover_kwargs)
         if provider
-        else dag.discover_collections()
+        else dag.discover_collections(**discover_kwargs)
     )
 
     storage_filepath = kwargs.pop("storage")
@@ -584,6 +598,12 @@ Examples:
     type=int,
     help="The maximum number of workers to use for downloading products and assets in parallel",
 )
+@click.option(
+    "--journal",
+    type=click.Path(dir_okay=False),
+    help="SQLite download journal file, used to resume interrupted downloads and to share them "
+    "between several processes",
+)
 @click.pass_context
 def download(ctx: Context, **kwargs: Any) -> None:
     """Download a bunch of products from a serialized search result"""
@@ -624,8 +644,11 @@ def download(ctx: Context, **kwargs: Any) -> None:
             "Flag 'quicklooks' specified, downloading only quicklooks of products"
         )
 
-        for idx, product in enumerate(search_results):
-            downloaded_file = product.get_quicklook(output_dir=output_dir)
+        downloaded_files = search_results.get_quicklooks(
+            output_dir=output_dir,
+            max_workers=kwargs.pop("max_workers"),
+        )
+        for downloaded_file in downloaded_files:
             if not downloaded_file:
                 click.echo(
                     "A quicklook may have been downloaded but we cannot locate it. "
@@ -636,10 +659,13 @@ def download(ctx: Context, **kwargs: Any) -> None:
 
     else:
         # Download products
-        executor = ThreadPoolExecutor(max_workers=kwargs.pop("max_workers"))
-        downloaded_files = satim_api.download_all(
-            search_results, output_dir=output_dir, executor=executor
-        )
+        with ThreadPoolExecutor(max_workers=kwargs.pop("max_workers")) as executor:
+            downloaded_files = satim_api.download_all(
+                search_results,
+                output_dir=output_dir,
+                executor=executor,
+                journal=kwargs.pop("journal"),
+            )
         if downloaded_files and len(downloaded_files) > 0:
             for downloaded_file in downloaded_files:
                 if downloaded_file is None:
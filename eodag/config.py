@@ -184,6 +184,8 @@ class PluginConfig(yaml.YAMLObject):
         next_page_url_tpl: str
         #: Index of the starting page for pagination requests.
         start_page: int
+        #: Number of pages requested concurrently for pagination requests (defaults to 1)
+        concurrent_pages: int
         #: Type of the provider result
         result_type: str
         #: JsonPath to the list of collections
@@ -441,6 +443,22 @@ class PluginConfig(yaml.YAMLObject):
     products: dict[str, dict[str, Any]]
     #: :class:`~eodag.plugins.download.base.Download` Number of maximum workers allowed for parallel downloads
     max_workers: int
+    #: :class:`~eodag.plugins.download.base.Download`
+    #: Maximum rate in bytes per second shared by the parallel downloads of the provider
+    max_bandwidth: int
+    #: :class:`~eodag.plugins.download.base.Download` Number of maximum threads used to extract a zip archive
+    extract_max_workers: int
+    #: :class:`~eodag.plugins.download.base.Download`
+    #: Whether downloaded data should be verified against its expected checksum, when known
+    verify_checksum: bool
+    #: :class:`~eodag.plugins.download.base.Download`
+    #: Number of times a download is retried if its checksum does not match the expected one
+    checksum_retries: int
+    #: :class:`~eodag.plugins.download.base.Download`
+    #: Maximum number of concurrent connections used to download a single file by byte ranges
+    download_segments: int
+    #: :class:`~eodag.plugins.download.base.Download` Size in bytes of the ranges of segmented downloads
+    download_segment_size: int
     #: :class:`~eodag.plugins.download.http.HTTPDownload` Whether the product has to be ordered to download it or not
     order_enabled: bool
     #: :class:`~eodag.plugins.download.http.HTTPDownload` HTTP request method for the order request
@@ -458,6 +476,9 @@ class PluginConfig(yaml.YAMLObject):
     no_auth_download: bool
     #: :class:`~eodag.plugins.download.http.HTTPDownload` Parameters to be added to the query params of the request
     dl_url_params: dict[str, str]
+    #: :class:`~eodag.plugins.download.http.HTTPDownload`
+    #: Whether archives should be extracted while they are downloaded, without writing them to disk
+    stream_extract: bool
     #: :class:`~eodag.plugins.download.aws.AwsDownload`
     #: At which level of the path part of the url the bucket can be found
     bucket_path_level: int
@@ -749,6 +770,7 @@ def load_config(config_path: str) -> dict[str, ProviderConfig]:
 
     # Convert dictionaries to ProviderConfig objects
     from eodag.api.provider import ProviderConfig as ProviderConfigClass
+    from eodag.api.provider import ProvidersDict
 
     providers_configs: list[ProviderConfig] = []
     default_provider_name = pathlib.Path(config_path).stem
@@ -762,8 +784,12 @@ def load_config(config_path: str) -> dict[str, ProviderConfig]:
                 continue
 
             # Each provider YAML file has one provider at the top level
-            # The dictionary will have the provider name as key and provider config as value
-            for provider_name, provider_config in provider_dict.items():
+            # The dictionary will have the provider name as key and provider config as value.
+            # Filtering is done before building configs, which loads their plugins
+            for (
+                provider_name,
+                provider_config,
+            ) in ProvidersDict._get_whitelisted_configs(provider_dict).items():
                 if isinstance(provider_config, dict):
                     # Add the name to the config if not already present
                     provider_config.setdefault("name", provider_name)
@@ -17,6 +17,7 @@
 # limitations under the License.
 from __future__ import annotations
 
+import logging
 from typing import TYPE_CHECKING, Any, Optional
 
 import importlib_metadata
@@ -26,6 +27,33 @@ from eodag.utils.exceptions import PluginNotFoundError
 if TYPE_CHECKING:
     from eodag.config import PluginConfig
 
+logger = logging.getLogger("eodag.plugins.base")
+
+# plugins entry points by name, for each entry point group
+_entry_points_cache: dict[str, dict[str, importlib_metadata.EntryPoint]] = {}
+
+
+def get_plugins_entry_points(
+    topic_group: str, refresh: bool = False
+) -> dict[str, importlib_metadata.EntryPoint]:
+    """Get the plugins entry points of the given group, without loading them.
+
+    Entry points are listed once and cached, as listing them requires scanning the
+    metadata of all installed distributions.
+
+    :param topic_group: The plugins topic group (e.g. ``search`` for the
+                        ``eodag.plugins.search`` entry point group)
+    :param refresh: (optional) Whether to list the entry points again or not
+    :returns: The plugins entry points, by name
+    """
+    group = f"eodag.plugins.{topic_group}"
+    if refresh or group not in _entry_points_cache:
+        _entry_points_cache[group] = {
+            entry_point.name: entry_point
+            for entry_point in importlib_metadata.entry_points(group=group)
+        }
+    return _entry_points_cache[group]
+
 
 class EODAGPluginMount(type):
     """Plugin mount"""
@@ -76,16 +104,57 @@ class PluginTopic(metaclass=EODAGPluginMount):
 
         topic_group = cls.entrypoint_group or cls.__name__.lower()
 
-        for entry_point in importlib_metadata.entry_points(
-            group=f"eodag.plugins.{topic_group}"
-        ):
+        for entry_point in get_plugins_entry_points(topic_group).values():
             try:
                 entry_point.load()
-            except (ModuleNotFoundError, ImportError):
-                continue
+            except ModuleNotFoundError:
+                logger.debug(
+                    "%s plugin skipped, eodag[%s] or eodag[all] needed",
+                    entry_point.name,
+                    ",".join(entry_point.extras),
+                )
+            except ImportError:
+                import traceback as tb
+
+                logger.warning("Unable to load plugin: %s.", entry_point.name)
+                logger.warning("Reason:\n%s", tb.format_exc())
+                logger.warning(
+                    "Check that the plugin module (%s) is importable",
+                    entry_point.name,
+                )
 
         setattr(cls, "_plugins_loaded", True)
 
+    @classmethod
+    def load_plugin(cls, name: str) -> EODAGPluginMount:
+        """Get the plugin class named ``name`` for this topic, only loading its entry
+        point if the class is not registered yet.
+
+        :param name: The plugin class name
+        :returns: The plugin class
+        :raises: :class:`~eodag.utils.exceptions.PluginNotFoundError`
+        """
+        try:
+            return cls.get_plugin_by_class_name(name)
+        except PluginNotFoundError:
+            pass
+
+        topic_group = cls.entrypoint_group or cls.__name__.lower()
+        if entry_point := get_plugins_entry_points(topic_group).get(name):
+            try:
+                entry_point.load()
+            except ImportError as e:
+                raise PluginNotFoundError(
+                    f"Unable to load plugin {name}: {type(e).__name__}: {e}"
+                ) from e
+
+        try:
+            return cls.get_plugin_by_class_name(name)
+        except PluginNotFoundError:
+            # plugin class may be registered under another entry point name
+            cls.ensure_plugins_loaded()
+            return cls.get_plugin_by_class_name(name)
+
     def __repr__(self) -> str:
         config = getattr(self, "config", None)
         priority = ""
@@ -17,11 +17,16 @@
 # limitations under the License.
 """EODAG plugins.crunch package"""
 
-from .filter_date import Crunch, FilterDate
-from .filter_latest_intersect import FilterLatestIntersect
-from .filter_latest_tpl_name import FilterLatestByName
-from .filter_overlap import FilterOverlap
-from .filter_property import FilterProperty
+from typing import TYPE_CHECKING, Any
+
+from .base import Crunch
+
+if TYPE_CHECKING:
+    from .filter_date import FilterDate
+    from .filter_latest_intersect import FilterLatestIntersect
+    from .filter_latest_tpl_name import FilterLatestByName
+    from .filter_overlap import FilterOverlap
+    from .filter_property import FilterProperty
 
 __all__ = [
     "Crunch",
@@ -31,3 +36,23 @@ __all__ = [
     "FilterOverlap",
     "FilterProperty",
 ]
+
+# plugins modules are only imported when first needed
+_LAZY_IMPORTS: dict[str, tuple[str, str]] = {
+    "FilterDate": (".filter_date", "FilterDate"),
+    "FilterLatestIntersect": (".filter_latest_intersect", "FilterLatestIntersect"),
+    "FilterLatestByName": (".filter_latest_tpl_name", "FilterLatestByName"),
+    "FilterOverlap": (".filter_overlap", "FilterOverlap"),
+    "FilterProperty": (".filter_property", "FilterProperty"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_IMPORTS:
+        from importlib import import_module
+
+        module_path, attr_name = _LAZY_IMPORTS[name]
+        value = getattr(import_module(module_path, __name__), attr_name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
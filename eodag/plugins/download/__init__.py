@@ -17,8 +17,29 @@
 # limitations under the License.
 """EODAG download package"""
 
-from .aws import AwsDownload
+from typing import TYPE_CHECKING, Any
+
 from .base import Download
-from .http import HTTPDownload
+
+if TYPE_CHECKING:
+    from .aws import AwsDownload
+    from .http import HTTPDownload
 
 __all__ = ["Download", "AwsDownload", "HTTPDownload"]
+
+# plugins modules are only imported when first needed
+_LAZY_IMPORTS: dict[str, tuple[str, str]] = {
+    "AwsDownload": (".aws", "AwsDownload"),
+    "HTTPDownload": (".http", "HTTPDownload"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_IMPORTS:
+        from importlib import import_module
+
+        module_path, attr_name = _LAZY_IMPORTS[name]
+        value = getattr(import_module(module_path, __name__), attr_name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -20,6 +20,8 @@ from __future__ import annotations
 import logging
 import os
 import re
+from functools import partial
+from operator import attrgetter
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal, Optional, Union, cast
 
@@ -51,17 +53,26 @@ from eodag.utils import (
     rename_subfolder,
     sanitize,
 )
+from eodag.utils.checksum import ChecksumVerifier, s3_etag_checksum
 from eodag.utils.exceptions import (
     AuthenticationError,
+    ChecksumError,
     DownloadError,
     MisconfiguredError,
     NoMatchingCollection,
     NotAvailableError,
     TimeOutError,
 )
-from eodag.utils.s3 import S3FileInfo, open_s3_zipped_object, stream_download_from_s3
+from eodag.utils.s3 import (
+    S3FileInfo,
+    list_s3_prefixes,
+    open_s3_zipped_object,
+    s3_client_identity,
+    s3_listing_cache,
+    stream_download_from_s3,
+)
 
-from .base import Download
+from .base import Download, _ConnectionsBudget
 
 if TYPE_CHECKING:
     from mypy_boto3_s3 import S3ServiceResource
@@ -210,6 +221,19 @@ class AwsDownload(Download):
         * :attr:`~eodag.config.PluginConfig.bucket_path_level` (``int``): at which level of the
           path part of the url the bucket can be found; If no bucket_path_level is given, the bucket
           is taken from the first element of the netloc part.
+        * :attr:`~eodag.config.PluginConfig.verify_checksum` (``bool``): if downloaded objects should
+          be hashed while received and compared to the ``file:checksum`` of their asset or to their
+          ``ETag`` (MD5 of objects neither uploaded by parts nor encrypted with SSE-KMS or SSE-C keys);
+          objects whose asset checksum is known are downloaded using a single request to be verified,
+          other objects downloaded by concurrent parts are not verified; default: ``True``
+        * :attr:`~eodag.config.PluginConfig.checksum_retries` (``int``): number of times an object
+          download is retried if its checksum does not match; default: ``2``
+        * :attr:`~eodag.config.PluginConfig.download_segments` (``int``): maximum number of concurrent ranged
+          GET requests used to download a single object, within the workers of the download executor not
+          used by other transfers; ``1`` disables multipart downloads; default: ``EODAG_DOWNLOAD_SEGMENTS``
+          environment variable or ``4``
+        * :attr:`~eodag.config.PluginConfig.download_segment_size` (``int``): size in bytes of the requested
+          parts, objects smaller than two parts are downloaded using a single request; default: ``16 MiB``
         * :attr:`~eodag.config.PluginConfig.products` (``dict[str, dict[str, Any]``): collection
           specific config; the keys are the collections, the values are dictionaries which can contain the keys:
 
@@ -366,16 +390,27 @@ class AwsDownload(Download):
                     if bucket_objects
                     else {}
                 )
-                if not os.path.isfile(chunk_abs_path):
-                    transfer_config = TransferConfig(use_threads=False)
-                    product_chunk.Bucket().download_file(
-                        product_chunk.key,
+                if os.path.isfile(chunk_abs_path):
+                    return
+                # connections used by concurrent parts are taken from the connections of
+                # the executor not used by other transfers
+                connections_budget = _ConnectionsBudget.of(executor)
+                connections = connections_budget.acquire(
+                    1
+                    if self._asset_checksum_verified(product, product_chunk)
+                    else self._object_segments(product_chunk.size)
+                )
+                try:
+                    self._download_object(
+                        product,
+                        product_chunk,
                         chunk_abs_path,
-                        ExtraArgs=extra_args,
-                        Callback=progress_callback,
-                        Config=transfer_config,
+                        extra_args,
+                        progress_callback,
+                        self._transfer_config(product_chunk.size, connections),
                     )
-                return
+                finally:
+                    connections_budget.release(connections)
 
             # use parallelization if possible.
             # when products are already downloaded in parallel but the executor has only one worker,
@@ -422,6 +457,183 @@ class AwsDownload(Download):
 
         return product_local_path
 
+    def _object_checksum_verifier(
+        self, product: EOProduct, obj: Any
+    ) -> Optional[ChecksumVerifier]:
+        """Verifier of a S3 object, using the ``file:checksum`` of its asset or its ``ETag``
+        if it is a MD5 digest, see :func:`~eodag.utils.checksum.s3_etag_checksum`"""
+        object_path = f"{obj.bucket_name}/{obj.key}"
+        return self._checksum_verifier(
+            *self._object_assets_checksums(product, obj),
+            s3_etag_checksum(
+                getattr(obj, "e_tag", None),
+                getattr(obj, "server_side_encryption", None),
+                getattr(obj, "sse_customer_algorithm", None),
+            ),
+            name=f"s3://{object_path}",
+        )
+
+    @staticmethod
+    def _object_assets_checksums(product: EOProduct, obj: Any) -> list[Any]:
+        """``file:checksum`` of the product assets of a S3 object"""
+        object_path = f"{obj.bucket_name}/{obj.key}"
+        return [
+            asset.get("file:checksum")
+            for asset in product.assets.values()
+            if asset.get("href", "").split("s3://")[-1] == object_path
+        ]
+
+    def _asset_checksum_verified(self, product: EOProduct, obj: Any) -> bool:
+        """Whether a S3 object has to be verified using the checksum of its asset, and is
+        thus downloaded using a single request whose data is hashed in order"""
+        return (
+            self._checksum_verifier(
+                *self._object_assets_checksums(product, obj), name=obj.key
+            )
+            is not None
+        )
+
+    def _object_segments(self, size: Optional[int]) -> int:
+        """Number of concurrent parts a S3 object of the given size can be downloaded by.
+
+        Objects of at least two :attr:`~eodag.config.PluginConfig.download_segment_size`
+        parts are downloaded using up to :attr:`~eodag.config.PluginConfig.download_segments`
+        concurrent ranged GET requests, other objects using a single request.
+        """
+        if not isinstance(size, int) or size < 2 * self._download_segment_size():
+            return 1
+        return max(1, self._download_segments())
+
+    def _transfer_config(
+        self, size: Optional[int], max_concurrency: Optional[int] = None
+    ) -> TransferConfig:
+        """Transfer settings of a S3 object of the given size, see :meth:`_object_segments`.
+
+        Concurrent parts requests run in threads of the boto3 transfer manager, not in
+        the download executor, so that no task of the executor waits for other tasks
+        submitted to it.
+
+        :param size: size of the object
+        :param max_concurrency: (optional) maximum number of concurrent requests, e.g.
+                                the connections of the download executor left to the object
+        """
+        segments = self._object_segments(size)
+        if max_concurrency is not None:
+            segments = min(segments, max_concurrency)
+        if segments < 2:
+            return TransferConfig(use_threads=False)
+        segment_size = self._download_segment_size()
+        return TransferConfig(
+            multipart_threshold=2 * segment_size,
+            multipart_chunksize=segment_size,
+            max_concurrency=segments,
+            use_threads=True,
+        )
+
+    def _download_object(
+        self,
+        product: EOProduct,
+        obj: Any,
+        path: str,
+        extra_args: dict[str, Any],
+        progress_callback: ProgressCallback,
+        transfer_config: TransferConfig,
+    ) -> None:
+        """Download a S3 object of the product to ``path``, verifying its checksum if it
+        is not downloaded by concurrent parts, or if its asset checksum is known.
+
+        :raises: :class:`~eodag.utils.exceptions.ChecksumError` if the downloaded data
+                 still does not match the expected checksum after
+                 :attr:`~eodag.config.PluginConfig.checksum_retries` retries
+        """
+        verifier = self._object_checksum_verifier(product, obj)
+        if (
+            verifier is not None
+            and transfer_config.use_threads
+            and not self._asset_checksum_verified(product, obj)
+        ):
+            # parts are received out of order: objects only verifiable by their ETag
+            # are downloaded by concurrent parts without verification, while the ones
+            # whose asset checksum is known are verified using a single stream
+            logger.debug(
+                "Checksum of s3://%s/%s not verified", obj.bucket_name, obj.key
+            )
+            verifier = None
+        if verifier is None:
+            obj.Bucket().download_file(
+                obj.key,
+                path,
+                ExtraArgs=extra_args,
+                Callback=progress_callback,
+                Config=transfer_config,
+            )
+            return
+        retries = self._checksum_retries()
+        while True:
+            try:
+                self._download_verified_object(
+                    obj, path, extra_args, progress_callback, verifier
+                )
+                return
+            except ChecksumError as e:
+                if retries <= 0:
+                    raise
+                retries -= 1
+                logger.warning("%s, downloading it again", e)
+                verifier = cast(
+                    ChecksumVerifier, self._object_checksum_verifier(product, obj)
+                )
+
+    @staticmethod
+    def _download_verified_object(
+        obj: Any,
+        path: str,
+        extra_args: dict[str, Any],
+        progress_callback: ProgressCallback,
+        verifier: ChecksumVerifier,
+    ) -> None:
+        """Download a S3 object to ``path`` while hashing its content.
+
+        The object is written to a temporary file, renamed once its checksum is verified.
+        A checksum taken from the ``ETag`` of the object is not verified if the response
+        shows that the ``ETag`` is not a MD5 digest of the content (e.g. SSE-KMS encryption).
+
+        :raises: :class:`~eodag.utils.exceptions.ChecksumError` if the downloaded data
+                 does not match the expected checksum
+        """
+        temp_path = f"{path}~"
+        response = obj.get(**extra_args)
+        etag = response.get("ETag")
+        verified: Optional[ChecksumVerifier] = verifier
+        if (
+            isinstance(etag, str)
+            and verifier.expected == etag.strip('"').lower()
+            and not s3_etag_checksum(
+                etag,
+                response.get("ServerSideEncryption"),
+                response.get("SSECustomerAlgorithm"),
+            )
+        ):
+            logger.debug("%s not verified, its ETag is not a MD5 digest", verifier.name)
+            verified = None
+        body = response["Body"]
+        try:
+            with open(temp_path, "wb") as fh:
+                for chunk in body.iter_chunks(chunk_size=1024 * 1024):
+                    fh.write(chunk)
+                    if verified:
+                        verified.update(chunk)
+                    progress_callback(len(chunk))
+        finally:
+            body.close()
+        if verified:
+            try:
+                verified.verify()
+            except ChecksumError:
+                os.remove(temp_path)
+                raise
+        os.replace(temp_path, path)
+
     def _download_file_in_zip(
         self,
         downloader_auth: AwsAuth,
@@ -652,13 +864,26 @@ class AwsDownload(Download):
         :param raise_error: raise error if there is nothing to download
         :return: set of product chunks that can be downloaded
         """
-        product_chunks: list[Any] = []
+        prefixes_by_bucket: dict[str, list[str]] = {}
         for bucket_name, prefix in bucket_names_and_prefixes:
             # unauthenticated items filtered out
             if bucket_name in authenticated_objects.keys():
-                product_chunks.extend(
-                    authenticated_objects[bucket_name].filter(Prefix=prefix)
-                )
+                prefixes_by_bucket.setdefault(bucket_name, []).append(prefix or "")
+
+        product_chunks: list[Any] = []
+        for bucket_name, prefixes in prefixes_by_bucket.items():
+            listings = list_s3_prefixes(
+                prefixes,
+                partial(
+                    self._list_prefix,
+                    authenticated_objects[bucket_name],
+                    bucket_name,
+                ),
+                get_key=attrgetter("key"),
+                max_workers=getattr(self.config, "max_workers", None),
+            )
+            for chunks in listings.values():
+                product_chunks.extend(chunks)
 
         unique_product_chunks = set(product_chunks)
 
@@ -681,6 +906,32 @@ class AwsDownload(Download):
 
         return unique_product_chunks
 
+    def _list_prefix(self, objects: Any, bucket_name: str, prefix: str) -> list[Any]:
+        """
+        List the objects under a prefix of a bucket, using :data:`~eodag.utils.s3.s3_listing_cache`
+        for the endpoint and credentials of the objects client
+
+        :param objects: authenticated objects of the bucket
+        :param bucket_name: name of the bucket
+        :param prefix: prefix of the listed objects
+        :return: listed objects
+        """
+        client = getattr(
+            getattr(getattr(objects, "_parent", None), "meta", None), "client", None
+        )
+        return s3_listing_cache.get_or_set(
+            (
+                self.provider,
+                getattr(self.config, "s3_endpoint", None),
+                *s3_client_identity(client),
+                bucket_name,
+                prefix,
+                "objects",
+            ),
+            lambda: list(objects.filter(Prefix=prefix)),
+            copy_value=False,
+        )
+
     def stream_download(
         self,
         product: EOProduct,
@@ -820,6 +1071,8 @@ class AwsDownload(Download):
                 )
                 if data_type:
                     file_info.data_type = data_type
+                if verifier := self._object_checksum_verifier(product, obj):
+                    file_info.checksum = verifier.expected
 
                 files_info.append(file_info)
             except NotAvailableError as e:
@@ -19,29 +19,46 @@ from __future__ import annotations
 
 import datetime as dt
 import hashlib
+import heapq
+import itertools
 import logging
 import os
+import random
 import shutil
 import tarfile
 import tempfile
+import threading
+import weakref
 import zipfile
 from abc import abstractmethod
+from collections import Counter
+from functools import partial
 from pathlib import Path
-from time import sleep
-from typing import TYPE_CHECKING, Any, Callable, Literal, Optional, TypeVar, Union
+from time import monotonic, perf_counter, sleep
+from typing import TYPE_CHECKING, Any, Callable, Literal, Optional, TypeVar, Union, cast
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
 
 from eodag.api.product.metadata_mapping import ONLINE_STATUS
 from eodag.plugins.base import PluginTopic
 from eodag.utils import (
+    DEFAULT_CHECKSUM_RETRIES,
+    DEFAULT_DOWNLOAD_SEGMENT_SIZE,
+    DEFAULT_DOWNLOAD_SEGMENTS,
     DEFAULT_DOWNLOAD_TIMEOUT,
     DEFAULT_DOWNLOAD_WAIT,
+    DEFAULT_ORDER_POLL_MAX_INTERVAL,
+    DEFAULT_ORDER_POLL_MAX_WORKERS,
     ProgressCallback,
     StreamResponse,
+    path_to_uri,
     sanitize,
     uri_to_path,
 )
+from eodag.utils.archives import archive_members_filter, extract_zip_members
+from eodag.utils.checksum import ChecksumVerifier
+from eodag.utils.download_journal import DownloadJournal
 from eodag.utils.exceptions import (
     AuthenticationError,
     MisconfiguredError,
@@ -65,6 +82,197 @@ logger = logging.getLogger("eodag.download.base")
 T = TypeVar("T")
 
 
+class _BandwidthLimiter:
+    """Token bucket limiting the rate of data downloaded by concurrent downloads of a provider
+
+    :param rate: maximum rate in bytes per second
+    """
+
+    def __init__(self, rate: float) -> None:
+        self.rate = float(rate)
+        self._lock = threading.Lock()
+        self._available_at = monotonic()
+
+    def consume(self, size: int) -> None:
+        """Block until ``size`` bytes can be downloaded without exceeding the rate"""
+        with self._lock:
+            now = monotonic()
+            start = max(self._available_at, now)
+            self._available_at = start + size / self.rate
+        if start > now:
+            sleep(start - now)
+
+
+class _ConnectionsBudget:
+    """Connections shared by the transfers running in a download executor, so that
+    transfers using several connections do not open more connections than the executor
+    has workers
+
+    :param size: number of connections, the number of workers of the executor
+    """
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self._lock = threading.Lock()
+        self._used = 0
+
+    @classmethod
+    def of(cls, executor: ThreadPoolExecutor) -> _ConnectionsBudget:
+        """Budget of the connections of a download executor"""
+        with _connections_budgets_lock:
+            budget = _connections_budgets.get(executor)
+            if budget is None:
+                budget = _connections_budgets[executor] = cls(executor._max_workers)
+        return budget
+
+    def acquire(self, wanted: int) -> int:
+        """Reserve up to ``wanted`` connections, at least one as the calling worker
+        needs one
+
+        :returns: the number of reserved connections, to be released once done
+        """
+        with self._lock:
+            granted = max(1, min(wanted, self.size - self._used))
+            self._used += granted
+        return granted
+
+    def release(self, count: int) -> None:
+        """Release connections reserved by :meth:`acquire`"""
+        with self._lock:
+            self._used -= count
+
+
+_connections_budgets: weakref.WeakKeyDictionary[
+    ThreadPoolExecutor, _ConnectionsBudget
+] = weakref.WeakKeyDictionary()
+_connections_budgets_lock = threading.Lock()
+
+
+class _OrderPoller:
+    """Order status checks of the products of a batch that are not available yet
+
+    Pending orders are checked by a small pool of threads once they are due, instead of
+    waiting in download workers. The delay between two checks of a product grows with a
+    jittered exponential backoff, and is at least the ``Retry-After`` delay requested by
+    the provider.
+
+    :param interval: initial delay in seconds between two status checks of a product
+    :param max_workers: maximum number of concurrent status checks
+    """
+
+    backoff_factor = 1.5
+
+    def __init__(
+        self, interval: float, max_workers: int = DEFAULT_ORDER_POLL_MAX_WORKERS
+    ) -> None:
+        self.interval = interval
+        self.max_interval = max(interval, DEFAULT_ORDER_POLL_MAX_INTERVAL)
+        self.max_workers = max_workers
+        #: running status checks
+        self.running: dict[Future[None], EOProduct] = {}
+        self._queue: list[tuple[float, int, EOProduct]] = []
+        self._queue_order = itertools.count()
+        self._checks: Counter[int] = Counter()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def __len__(self) -> int:
+        return len(self._queue) + len(self.running)
+
+    @staticmethod
+    def supports(product: EOProduct) -> bool:
+        """Whether the order status of a product can be checked by the poller"""
+        return (
+            callable(getattr(product.downloader, "order", None))
+            and bool(product.properties.get("eodag:status_link"))
+            and product.properties.get("order:status") != ONLINE_STATUS
+        )
+
+    def add(self, product: EOProduct) -> None:
+        """Schedule the next status check of a product"""
+        delay = min(
+            self.interval * self.backoff_factor ** self._checks[id(product)],
+            self.max_interval,
+        )
+        self._checks[id(product)] += 1
+        # spread the checks of products ordered at the same time
+        delay = random.uniform(delay / 2, delay)
+        if retry_after := getattr(product, "retry_after", None):
+            delay = max(delay, retry_after)
+        heapq.heappush(
+            self._queue, (monotonic() + delay, next(self._queue_order), product)
+        )
+
+    def next_check(self) -> Optional[float]:
+        """Seconds until the next status check can be submitted"""
+        if not self._queue or len(self.running) >= self.max_workers:
+            return None
+        return max(self._queue[0][0] - monotonic(), 0.0)
+
+    def submit_due(self) -> None:
+        """Start the due status checks, within the concurrency limit"""
+        now = monotonic()
+        while (
+            self._queue
+            and self._queue[0][0] <= now
+            and len(self.running) < self.max_workers
+        ):
+            product = heapq.heappop(self._queue)[2]
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="eodag-order-poll"
+                )
+            self.running[self._executor.submit(self._check, product)] = product
+
+    @staticmethod
+    def _check(product: EOProduct) -> None:
+        downloader = cast("Download", product.downloader)
+        auth = (
+            product.downloader_auth.authenticate()
+            if product.downloader_auth is not None
+            else None
+        )
+        # a single status check, without waiting
+        downloader.order(product, auth, timeout=-1)  # type: ignore[attr-defined]
+
+    def finished(self, future: Future[None]) -> bool:
+        """Whether the order of the product of a finished status check is ready
+
+        :raises: the error of the status check, unless the product is not available yet
+        """
+        product = self.running.pop(future)
+        try:
+            future.result()
+        except NotAvailableError as e:
+            logger.debug(e)
+        ready = product.properties.get("order:status") == ONLINE_STATUS
+        if ready:
+            del self._checks[id(product)]
+        return ready
+
+    def products(self) -> list[EOProduct]:
+        """Products whose order status is being checked or waits to be checked"""
+        return [*self.running.values(), *(item[2] for item in self._queue)]
+
+    def shutdown(self) -> None:
+        """Shutdown the threads checking order statuses"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+
+
+class _RateLimitedProgressCallback(ProgressCallback):
+    """Progress callback throttling the download it reports, using a shared
+    :class:`_BandwidthLimiter`"""
+
+    def __init__(self, limiter: _BandwidthLimiter, *args: Any, **kwargs: Any) -> None:
+        self.limiter = limiter
+        super().__init__(*args, **kwargs)
+
+    def __call__(self, increment: int, total: Optional[int] = None) -> None:
+        """Wait for the bandwidth limit, then update the progress bar"""
+        self.limiter.consume(increment)
+        super().__call__(increment, total)
+
+
 class Download(PluginTopic):
     """Base Download Plugin.
 
@@ -78,7 +286,12 @@ class Download(PluginTopic):
     - download data in the ``output_dir`` folder defined in the plugin's
       configuration or passed through kwargs
     - extract products from their archive (if relevant) if ``extract`` is set to ``True``
-      (``True`` by default)
+      (``True`` by default). Zip members are extracted in parallel, using up to
+      :attr:`~eodag.config.PluginConfig.extract_max_workers` threads, and only the ones
+      matching the ``asset`` regex filter if given
+    - verify downloaded data against its expected checksum (e.g. ``file:checksum``) while
+      it is received, if :attr:`~eodag.config.PluginConfig.verify_checksum` is enabled, and
+      retry up to :attr:`~eodag.config.PluginConfig.checksum_retries` times on mismatch
     - save a product in an archive/directory (in ``output_dir``) whose name must be
       the product's ``title`` property
     - update the product's ``location`` attribute once its data is downloaded (and
@@ -318,6 +531,48 @@ class Download(PluginTopic):
         product_hash = str(product.collection) + "-" + str(product.properties["id"])
         return hashlib.md5(product_hash.encode("utf-8")).hexdigest()
 
+    @staticmethod
+    def _check_selected_members(
+        members: list[Any], fs_path: str, asset_filter: Optional[str]
+    ) -> None:
+        """Check that the asset filter selected some archive members"""
+        if asset_filter and not members:
+            raise NotAvailableError(
+                rf"No archive member matching re.fullmatch(r'{asset_filter}') was found in {fs_path}"
+            )
+
+    def _checksum_verifier(
+        self, *checksums: Any, name: str
+    ) -> Optional[ChecksumVerifier]:
+        """Verifier of downloaded data, for the first supported expected checksum.
+
+        :param checksums: expected checksums, e.g. ``file:checksum`` or provider MD5
+        :param name: name of the downloaded data, used in error messages
+        :returns: the verifier, or ``None`` if no checksum is known or verification is disabled
+        """
+        if not getattr(self.config, "verify_checksum", True):
+            return None
+        return ChecksumVerifier.from_checksums(*checksums, name=name)
+
+    def _checksum_retries(self) -> int:
+        """Number of times a download is retried if its checksum does not match"""
+        return int(getattr(self.config, "checksum_retries", DEFAULT_CHECKSUM_RETRIES))
+
+    def _download_segments(self) -> int:
+        """Maximum number of connections used to download a single file"""
+        return int(
+            getattr(self.config, "download_segments", None)
+            or os.getenv("EODAG_DOWNLOAD_SEGMENTS")
+            or DEFAULT_DOWNLOAD_SEGMENTS
+        )
+
+    def _download_segment_size(self) -> int:
+        """Size in bytes of the ranges of segmented downloads"""
+        return int(
+            getattr(self.config, "download_segment_size", None)
+            or DEFAULT_DOWNLOAD_SEGMENT_SIZE
+        )
+
     def _resolve_archive_depth(self, product_path: str) -> str:
         """Update product_path using archive_depth from provider configuration.
 
@@ -418,18 +673,26 @@ class Download(PluginTopic):
 
             extract_complete = False
             fs_path_lower = fs_path.lower()
+            # only extract archive members matching the asset filter, if any
+            select_member = archive_members_filter(kwargs.get("asset"))
+            extract_start = perf_counter()
             if fs_path_lower.endswith(".zip"):
                 with zipfile.ZipFile(fs_path, "r") as zfile:
-                    fileinfos = zfile.infolist()
-
-                    progress_callback.reset(total=len(fileinfos))
-
-                    for fileinfo in fileinfos:
-                        zfile.extract(
-                            fileinfo,
-                            path=extraction_dir,
-                        )
-                        progress_callback(1)
+                    fileinfos = [
+                        fileinfo
+                        for fileinfo in zfile.infolist()
+                        if select_member(fileinfo.filename)
+                    ]
+                self._check_selected_members(fileinfos, fs_path, kwargs.get("asset"))
+
+                progress_callback.reset(total=len(fileinfos))
+                extract_zip_members(
+                    fs_path,
+                    fileinfos,
+                    extraction_dir,
+                    max_workers=getattr(self.config, "extract_max_workers", None),
+                    callback=lambda _: progress_callback(1),
+                )
                 # in some cases, only a lone file is extracted without being in a directory
                 # then, we create a directory in which we place this file
                 product_extraction_path = self._resolve_archive_depth(extraction_dir)
@@ -446,7 +709,13 @@ class Download(PluginTopic):
             ):
                 with tarfile.open(fs_path, "r") as zfile:
                     progress_callback.reset(total=1)
-                    zfile.extractall(path=extraction_dir)
+                    members = [
+                        member
+                        for member in zfile.getmembers()
+                        if select_member(member.name)
+                    ]
+                    self._check_selected_members(members, fs_path, kwargs.get("asset"))
+                    zfile.extractall(path=extraction_dir, members=members)
                     progress_callback(1)
                 # in some cases, only a lone file is extracted without being in a directory
                 # then, we create a directory in which we place this file
@@ -460,6 +729,15 @@ class Download(PluginTopic):
             else:
                 progress_callback(1, total=1)
 
+            if extract_complete:
+                extract_duration = perf_counter() - extract_start
+                progress_callback.set_postfix_str(
+                    f"extracted in {extract_duration:.2f}s"
+                )
+                logger.info(
+                    "Extracted %s in %.2fs", os.path.basename(fs_path), extract_duration
+                )
+
             tmp_dir.cleanup()
 
             if delete_archive and os.path.isfile(fs_path) and extract_complete:
@@ -487,13 +765,33 @@ class Download(PluginTopic):
         executor: Optional[ThreadPoolExecutor] = None,
         wait: float = DEFAULT_DOWNLOAD_WAIT,
         timeout: float = DEFAULT_DOWNLOAD_TIMEOUT,
+        journal: Optional[Union[str, DownloadJournal]] = None,
+        target: Optional[str] = None,
         **kwargs: Unpack[DownloadConf],
     ) -> list[str]:
         """
         Base download_all method.
 
         This specific implementation uses the :meth:`~eodag.api.product._product.EOProduct.download` method
-        implemented by the plugin to **sequentially** attempt to download products.
+        implemented by the plugin to attempt to download products in parallel.
+
+        Products are scheduled by next download try: a product is submitted as soon as a
+        worker is free and its provider has less running downloads than its
+        :attr:`~eodag.config.PluginConfig.max_workers`. Products not available yet are tried
+        again ``wait`` minutes later, without blocking other downloads. Ordered products having
+        an ``eodag:status_link`` are instead checked by a shared order poller, with a jittered
+        backoff honoring the ``Retry-After`` delay of the provider, and downloaded once ready.
+        Concurrent downloads of a provider share its
+        :attr:`~eodag.config.PluginConfig.max_bandwidth` if set.
+
+        If a ``journal`` is given, the state of each download is recorded in it and
+        products are claimed in it before being downloaded: products already downloaded
+        according to the journal are not downloaded again, and products being downloaded
+        by another process sharing the journal are checked again later.
+
+        If a ``target`` is given, products are transferred to this object storage prefix
+        using :meth:`~eodag.api.product._product.EOProduct.transfer_to` instead of being
+        downloaded to the local disk.
 
         :param products: Products to download
         :param auth: (optional) authenticated object
@@ -508,22 +806,32 @@ class Download(PluginTopic):
         :param wait: (optional) If download fails, wait time in minutes between two download tries
         :param timeout: (optional) If download fails, maximum time in minutes before stop retrying
                         to download
+        :param journal: (optional) A download journal, or the path of its SQLite database file
+        :param target: (optional) A ``s3://bucket/prefix`` URL where products are transferred
         :param kwargs: `output_dir` (str), `extract` (bool), `delete_archive` (bool)
                         and `dl_url_params` (dict) can be provided as additional kwargs
                         and will override any other values defined in a configuration
-                        file or with environment variables.
+                        file or with environment variables. Transfers also accept the
+                        `s3_client`, `part_size` and `max_concurrency` parameters of
+                        :meth:`~eodag.api.product._product.EOProduct.transfer_to`.
         :returns: List of absolute paths to the downloaded products in the local
             filesystem (e.g. ``['/tmp/product.zip']`` on Linux or
-            ``['C:\\Users\\username\\AppData\\Local\\Temp\\product.zip']`` on Windows)
+            ``['C:\\Users\\username\\AppData\\Local\\Temp\\product.zip']`` on Windows),
+            or of the ``s3://`` URLs of the transferred products if a ``target`` is given
         """
-        # Products are going to be removed one by one from this sequence once
-        # downloaded.
+        if target is not None:
+            from eodag.utils.s3 import parse_s3_url
+
+            # check the target before scheduling transfers
+            parse_s3_url(target)
+            target = target.rstrip("/") + "/"
         products = products[:]
         paths: list[str] = []
         # initiate retry loop
         start_time = dt.datetime.now()
         stop_time = start_time + dt.timedelta(minutes=timeout)
         nb_products = len(products)
+        nb_done = 0
         retry_count = 0
         # another output for notebooks
         nb_info = NotebookWidgets()
@@ -534,8 +842,18 @@ class Download(PluginTopic):
         # whether the executor was created during parallel product downloads or not
         self._config_executor(executor, "eodag-download-all")
 
+        # products waiting to be downloaded, ordered by next download try
+        queue: list[tuple[dt.datetime, int, EOProduct]] = []
+        queue_order = itertools.count()
         for product in products:
             product.next_try = start_time
+            heapq.heappush(queue, (start_time, next(queue_order), product))
+
+        download_journal = (
+            DownloadJournal(journal) if isinstance(journal, str) else journal
+        )
+        if download_journal is not None:
+            download_journal.enqueue(products)
 
         # progress bar init
         if progress_callback is None:
@@ -568,100 +886,292 @@ class Download(PluginTopic):
                 )
             )
         )
+        # Keep at least one thread available for nested tasks downloading assets, to prevent
+        # deadlocks caused by submitting and waiting for a task within a task. If there is only
+        # one worker, a specific process at assets download level is used to avoid deadlocks.
+        max_running = executor._max_workers
+        if nested_asset_downloads:
+            max_running = max(max_running - 1, 1)
+
+        running: dict[Future[str], EOProduct] = {}
+        running_by_provider: Counter[str] = Counter()
+        bandwidth_limiters: dict[str, _BandwidthLimiter] = {}
+        # ordered products are checked by the poller until they can be downloaded
+        order_poller = _OrderPoller(wait * 60)
+
+        def provider_config(product: EOProduct, name: str) -> Any:
+            return getattr(getattr(product.downloader, "config", None), name, None)
+
+        def product_downloaded(product: EOProduct, path: str) -> None:
+            nonlocal nb_done, stop_time
+            paths.append(path)
+
+            if downloaded_callback:
+                downloaded_callback(product)
+
+            nb_done += 1
+            progress_callback(1)
+
+            # reset stop time for next product
+            stop_time = dt.datetime.now() + dt.timedelta(minutes=timeout)
+
+        def claim(product: EOProduct) -> bool:
+            """Claim a product in the journal before downloading it. Products downloaded
+            according to the journal are done, and the ones being downloaded by another
+            process are checked again once their claim may have expired. Products ordered by
+            another process are claimed by it the same way."""
+            journal = cast(DownloadJournal, download_journal)
+            if journal.claim(product):
+                return True
+            entry = journal.get(product) or {}
+            if entry.get("state") == DownloadJournal.DONE:
+                logger.info(
+                    "Product already downloaded according to the download journal: %s",
+                    entry["path"],
+                )
+                # products transferred to S3 have no local location
+                if target is None and os.path.isabs(entry["path"]):
+                    product.location = path_to_uri(entry["path"])
+                product_downloaded(product, entry["path"])
+            else:
+                logger.debug(
+                    "Product %s is claimed by %s (%s)",
+                    product.properties["title"],
+                    entry.get("owner"),
+                    entry.get("state"),
+                )
+                next_try = dt.datetime.now() + dt.timedelta(seconds=journal.lease)
+                heapq.heappush(queue, (next_try, next(queue_order), product))
+            return False
+
+        def submit(product: EOProduct) -> None:
+            product.next_try += dt.timedelta(minutes=wait)
+            rate_limited_callback: Optional[_RateLimitedProgressCallback] = None
+            if max_bandwidth := provider_config(product, "max_bandwidth"):
+                limiter = bandwidth_limiters.setdefault(
+                    product.provider, _BandwidthLimiter(max_bandwidth)
+                )
+                rate_limited_callback = _RateLimitedProgressCallback(
+                    limiter, **getattr(product_progress_callback, "kwargs", {})
+                )
+            transfer: Callable[..., str] = (
+                partial(product.transfer_to, target)
+                if target is not None
+                else product.download
+            )
+            future = executor.submit(
+                transfer,
+                progress_callback=rate_limited_callback or product_progress_callback,
+                executor=executor,
+                wait=wait,
+                timeout=-1,
+                **kwargs,  # type: ignore
+            )
+            if rate_limited_callback is not None:
+                close_callback = rate_limited_callback.close
+                future.add_done_callback(lambda _: close_callback())
+            running[future] = product
+            running_by_provider[product.provider] += 1
+
+        def schedule_ready_products() -> None:
+            """Submit products whose download can be tried, within concurrency limits"""
+            deferred = []
+            now = dt.datetime.now()
+            while queue and queue[0][0] <= now and len(running) < max_running:
+                item = heapq.heappop(queue)
+                product = item[2]
+                provider_limit = provider_config(product, "max_workers")
+                if provider_limit and running_by_provider[product.provider] >= int(
+                    provider_limit
+                ):
+                    deferred.append(item)
+                    continue
+                if download_journal is not None and not claim(product):
+                    continue
+                submit(product)
+            for item in deferred:
+                heapq.heappush(queue, item)
+
+        def product_not_available(product: EOProduct, error: str) -> None:
+            """Record a product that could not be downloaded before the timeout"""
+            if download_journal is not None:
+                download_journal.set_state(product, DownloadJournal.FAILED, error=error)
+            logger.warning(
+                "Product could not be downloaded: %s",
+                product.properties["title"],
+            )
 
-        with progress_callback as bar:
-            while "Loop until all products are download or timeout is reached":
-                # try downloading each product in parallel before retry
-
-                # Download products in batches to handle nested tasks to download assets in parallel.
-                # We avoid having less workers in the executor than the number of products to download in parallel
-                # to prevent deadlocks. This could happen by submiting and waiting for a task within a task.
-                # We ensure at least one thread is available for these tasks and at least one product is downloaded
-                # at a time.
-                # If there is only one worker, a specific process at assets download level is used to avoid deadlocks.
-                batch_size = len(products)
-                if nested_asset_downloads and executor._max_workers <= batch_size:
-                    batch_size = max(executor._max_workers - 1, 1)
-
-                products_batch = products[:batch_size]
-                futures = {}
-
-                for idx, product in enumerate(products_batch):
-                    if dt.datetime.now() >= product.next_try:
-                        products[idx].next_try += dt.timedelta(minutes=wait)
-                        future = executor.submit(
-                            product.download,
-                            progress_callback=product_progress_callback,
-                            executor=executor,
-                            wait=wait,
-                            timeout=-1,
-                            **kwargs,  # type: ignore
-                        )
-                        futures[future] = product
-
-                for future in as_completed(futures.keys()):
-                    product = futures[future]
-                    try:
-                        result = future.result()
-                        paths.append(result)
-
-                        if downloaded_callback:
-                            downloaded_callback(product)
-
-                        # product downloaded, to not retry it
-                        products.remove(product)
-                        bar(1)
-
-                        # reset stop time for next product
-                        stop_time = dt.datetime.now() + dt.timedelta(minutes=timeout)
+        def order_checked(future: Future[None]) -> None:
+            """Schedule the download of a product whose order is ready, or its next
+            order status check"""
+            product = order_poller.running[future]
+            try:
+                ready = order_poller.finished(future)
+            except (AuthenticationError, MisconfiguredError) as e:
+                if download_journal is not None:
+                    download_journal.set_state(
+                        product, DownloadJournal.FAILED, error=str(e)
+                    )
+                logger.exception(
+                    f"Stopped because of credentials problems with provider {self.provider}"
+                )
+                raise
+            except Exception as e:
+                if download_journal is not None:
+                    download_journal.set_state(
+                        product, DownloadJournal.FAILED, error=str(e)
+                    )
+                logger.error(
+                    f"Order status of product {product} could not be checked: {e}. "
+                    "Skipping it"
+                )
+                return
+            if ready:
+                product.next_try = dt.datetime.now()
+                heapq.heappush(queue, (product.next_try, next(queue_order), product))
+            elif dt.datetime.now() < stop_time:
+                order_poller.add(product)
+            else:
+                product_not_available(
+                    product, f"order:status {product.properties.get('order:status')}"
+                )
 
-                    except NotAvailableError as e:
-                        logger.info(e)
-                        continue
+        def next_try_delay() -> Optional[float]:
+            """Seconds until the next product download can be tried if a worker is free, or
+            until the next order status check.
+
+            Products already ready are waiting for a running download of their provider.
+            """
+            delays = []
+            if (next_check := order_poller.next_check()) is not None:
+                delays.append(next_check)
+            if len(running) < max_running:
+                now = dt.datetime.now()
+                delays.extend(
+                    (next_try - now).total_seconds()
+                    for next_try, _, _ in queue
+                    if next_try > now
+                )
+            return min(delays) if delays else None
+
+        def wait_timeout() -> Optional[float]:
+            """Seconds to wait for running downloads, refreshing their journal claims in time"""
+            delay = next_try_delay()
+            if download_journal is None:
+                return delay
+            heartbeat_interval = download_journal.lease / 3
+            return (
+                heartbeat_interval if delay is None else min(delay, heartbeat_interval)
+            )
 
-                    except (AuthenticationError, MisconfiguredError):
-                        logger.exception(
-                            f"Stopped because of credentials problems with provider {self.provider}"
+        try:
+            with progress_callback:
+                while "Loop until all products are download or timeout is reached":
+                    schedule_ready_products()
+                    order_poller.submit_due()
+
+                    # pending orders are waited for below, until their next status check
+                    if not running and not order_poller:
+                        if not queue:
+                            break
+                        if dt.datetime.now() >= stop_time:
+                            logger.warning(
+                                f"{len(queue)} products could not be downloaded: "
+                                + str([item[2].properties["title"] for item in queue])
+                            )
+                            break
+                        # next try may have just passed
+                        wait_seconds = max(
+                            0.0, (queue[0][0] - dt.datetime.now()).total_seconds()
                         )
-                        raise
+                        retry_count += 1
+                        info_message = (
+                            f"[Retry #{retry_count}, {nb_done}/{nb_products} D/L] "
+                            f"Waiting {wait_seconds:.0f}s until next download try (retry every {wait}' for {timeout}')"
+                        )
+                        logger.info(info_message)
+                        nb_info.display_html(info_message)
+                        sleep(wait_seconds + 1)
+                        continue
 
-                    except (RuntimeError, Exception):
-                        import traceback as tb
+                    # handle downloads as soon as they end, and start pending ones as soon as possible
+                    futures: set[Future[Any]] = {*running, *order_poller.running}
+                    if not futures:
+                        # only pending orders, waiting for their next status check
+                        sleep(wait_timeout() or 0)
+                        continue
+                    done, _ = wait_futures(
+                        futures, timeout=wait_timeout(), return_when=FIRST_COMPLETED
+                    )
+                    if download_journal is not None:
+                        download_journal.heartbeat()
+                    for future in done:
+                        if future in order_poller.running:
+                            order_checked(future)
+                            continue
+                        product = running.pop(future)
+                        running_by_provider[product.provider] -= 1
+                        try:
+                            result = future.result()
+                            if download_journal is not None:
+                                download_journal.set_state(
+                                    product, DownloadJournal.DONE, path=result
+                                )
+                            product_downloaded(product, result)
 
-                        logger.error(
-                            f"A problem occurred during download of product: {product}. "
-                            "Skipping it"
-                        )
-                        logger.debug(f"\n{tb.format_exc()}")
+                        except NotAvailableError as e:
+                            logger.info(e)
+                            if dt.datetime.now() < stop_time:
+                                if download_journal is not None:
+                                    download_journal.set_state(
+                                        product, DownloadJournal.ORDERED, error=str(e)
+                                    )
+                                if _OrderPoller.supports(product):
+                                    order_poller.add(product)
+                                else:
+                                    heapq.heappush(
+                                        queue,
+                                        (product.next_try, next(queue_order), product),
+                                    )
+                            else:
+                                product_not_available(product, str(e))
+
+                        except (AuthenticationError, MisconfiguredError) as e:
+                            if download_journal is not None:
+                                download_journal.set_state(
+                                    product, DownloadJournal.FAILED, error=str(e)
+                                )
+                            logger.exception(
+                                f"Stopped because of credentials problems with provider {self.provider}"
+                            )
+                            raise
 
-                        # product skipped, to not retry it
-                        products.remove(product)
+                        except (RuntimeError, Exception) as e:
+                            import traceback as tb
 
-                if (
-                    len(products) > 0
-                    and dt.datetime.now() < products[0].next_try
-                    and dt.datetime.now() < stop_time
-                ):
-                    wait_seconds = (products[0].next_try - dt.datetime.now()).seconds
-                    retry_count += 1
-                    info_message = (
-                        f"[Retry #{retry_count}, {nb_products - len(products)}/{nb_products} D/L] "
-                        f"Waiting {wait_seconds}s until next download try (retry every {wait}' for {timeout}')"
+                            if download_journal is not None:
+                                download_journal.set_state(
+                                    product, DownloadJournal.FAILED, error=str(e)
+                                )
+                            logger.error(
+                                f"A problem occurred during download of product: {product}. "
+                                "Skipping it"
+                            )
+                            logger.debug(f"\n{tb.format_exc()}")
+        finally:
+            order_poller.shutdown()
+            if download_journal is not None:
+                # products left claimed by an interrupted batch can be claimed again
+                for future, product in running.items():
+                    future.cancel()
+                    download_journal.set_state(
+                        product, DownloadJournal.FAILED, error="interrupted"
                     )
-
-                    logger.info(info_message)
-                    nb_info.display_html(info_message)
-                    sleep(wait_seconds + 1)
-                elif len(products) > 0 and dt.datetime.now() >= stop_time:
-                    logger.warning(
-                        f"{len(products)} products could not be downloaded: "
-                        + str([prod.properties["title"] for prod in products])
+                for product in order_poller.products():
+                    download_journal.set_state(
+                        product, DownloadJournal.FAILED, error="interrupted"
                     )
-                    break
-                elif len(products) == 0:
-                    break
 
-        # Shutdown executor at the end
         executor.shutdown(wait=True)
 
         return paths
@@ -709,6 +1219,13 @@ class Download(PluginTopic):
                             ) or timeout <= 0:
                                 return download
 
+                        # wait at least the delay requested by the provider
+                        if retry_after := getattr(product, "retry_after", None):
+                            product.next_try = max(
+                                product.next_try,
+                                datetime_now + dt.timedelta(seconds=retry_after),
+                            )
+
                         if not getattr(self.config, "order_enabled", False):
                             raise NotAvailableError(
                                 f"Product is not available for download and order is not supported for"
@@ -17,13 +17,21 @@
 # limitations under the License.
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
 import os
 import re
 import shutil
 import tarfile
+import tempfile
+import threading
+import time
 import zipfile
+from collections import deque
+from contextlib import suppress
 from email.message import Message
+from functools import partial
 from itertools import chain
 from json import JSONDecodeError
 from pathlib import Path
@@ -32,9 +40,10 @@ from urllib.parse import parse_qs, urlparse
 
 import geojson
 import requests
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 from lxml import etree
 from requests import RequestException
+from requests.adapters import HTTPAdapter
 from requests.auth import AuthBase
 from requests.structures import CaseInsensitiveDict
 from typing_extensions import TypedDict
@@ -51,6 +60,7 @@ from eodag.api.product.metadata_mapping import (
 )
 from eodag.plugins.download.base import Download
 from eodag.utils import (
+    DEFAULT_ASSET_HEADERS_CACHE_TTL,
     DEFAULT_DOWNLOAD_TIMEOUT,
     DEFAULT_DOWNLOAD_WAIT,
     DEFAULT_STREAM_REQUESTS_TIMEOUT,
@@ -68,8 +78,21 @@ from eodag.utils import (
     string_to_jsonpath,
     uri_to_path,
 )
+from eodag.utils.archives import (
+    NotStreamableArchiveError,
+    archive_members_filter,
+    check_remote_zip_member,
+    extract_archive_stream,
+    extract_remote_zip_members,
+    is_streamable_archive,
+    iter_remote_zip_member,
+    read_remote_zip_members,
+)
+from eodag.utils.cache import TTLCache
+from eodag.utils.checksum import ChecksumVerifier, content_md5_checksum
 from eodag.utils.exceptions import (
     AuthenticationError,
+    ChecksumError,
     DownloadError,
     MisconfiguredError,
     NotAvailableError,
@@ -77,6 +100,8 @@ from eodag.utils.exceptions import (
     TimeOutError,
     ValidationError,
 )
+from eodag.utils.files import link_or_copy, mmap_chunks
+from eodag.utils.requests import retry_after_seconds
 
 if TYPE_CHECKING:
     from jsonpath_ng import JSONPath
@@ -90,6 +115,32 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("eodag.download.http")
 
+#: headers of assets ``HEAD`` responses stored in :data:`asset_headers_cache`
+_PROBED_HEADERS = ("Content-Length", "Content-Disposition", "ETag", "Accept-Ranges")
+_probe_session_lock = threading.Lock()
+
+#: Cache of the headers of assets ``HEAD`` responses (size, filename, ``ETag`` and ``Accept-Ranges``),
+#: keyed by provider, asset URL, query parameters and authentication
+asset_headers_cache = TTLCache(
+    ttl=float(
+        os.getenv("EODAG_ASSET_HEADERS_CACHE_TTL", DEFAULT_ASSET_HEADERS_CACHE_TTL)
+    ),
+    maxsize=4096,
+)
+
+
+def _auth_identity(auth: Optional[AuthBase]) -> Optional[str]:
+    """Digest of the type and state of an authentication object, identifying in cache keys
+    what its requests are allowed to see. Credentials are hashed, not to keep them in keys.
+    Objects without credentials attributes are identified by their ``repr()``.
+    """
+    if auth is None:
+        return None
+    state = json.dumps(vars(auth), sort_keys=True, default=repr)
+    return hashlib.sha256(
+        f"{type(auth).__qualname__}:{state}".encode(), usedforsecurity=False
+    ).hexdigest()
+
 
 class HTTPDownload(Download):
     """HTTPDownload plugin. Handles product download over HTTP protocol
@@ -133,6 +184,20 @@ class HTTPDownload(Download):
         * :attr:`~eodag.config.PluginConfig.order_status` (:class:`~eodag.config.PluginConfig.OrderStatus`):
           configuration to handle the order status; contains information which method to use, how the response data is
           interpreted, which status corresponds to success, ordered and error and what should be done on success.
+        * :attr:`~eodag.config.PluginConfig.stream_extract` (``bool``): if archives should be extracted while they
+          are downloaded, without being written to disk; only applies if ``extract`` and ``delete_archive`` are
+          enabled; default: ``False``
+        * :attr:`~eodag.config.PluginConfig.download_segments` (``int``): maximum number of concurrent connections
+          used to download a single file by byte ranges, when the server accepts them; ``1`` disables segmented
+          downloads; default: ``EODAG_DOWNLOAD_SEGMENTS`` environment variable or ``4``
+        * :attr:`~eodag.config.PluginConfig.download_segment_size` (``int``): size in bytes of the requested ranges,
+          files smaller than two ranges are downloaded using a single connection; default: ``16 MiB``
+        * :attr:`~eodag.config.PluginConfig.verify_checksum` (``bool``): if downloaded data should be hashed while
+          received and compared to the ``file:checksum`` of the product or asset, or to the ``Content-MD5`` response
+          header; files downloaded by concurrent byte ranges are hashed in order as their ranges complete;
+          default: ``True``
+        * :attr:`~eodag.config.PluginConfig.checksum_retries` (``int``): number of times a download is retried if its
+          checksum does not match; default: ``2``
         * :attr:`~eodag.config.PluginConfig.products` (``dict[str, dict[str, Any]``): collection specific config; the
           keys are the collections, the values are dictionaries which can contain the key
           :attr:`~eodag.config.PluginConfig.extract` to overwrite the provider config for a specific collection
@@ -142,6 +207,63 @@ class HTTPDownload(Download):
     def __init__(self, provider: str, config: PluginConfig) -> None:
         super(HTTPDownload, self).__init__(provider, config)
 
+    def _get_probe_session(self, pool_maxsize: int) -> requests.Session:
+        """Session whose pooled connections are shared by the assets ``HEAD`` requests of
+        the plugin, pooling at least ``pool_maxsize`` connections per host"""
+        with _probe_session_lock:
+            session: Optional[requests.Session] = getattr(self, "_probe_session", None)
+            if session is None:
+                session = self._probe_session = requests.Session()
+                self._probe_pool_maxsize = 0
+            if self._probe_pool_maxsize < pool_maxsize:
+                # sized for the threads of the executor running the requests
+                adapter = HTTPAdapter(pool_maxsize=pool_maxsize)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self._probe_pool_maxsize = pool_maxsize
+            return session
+
+    def _probe_asset_headers(
+        self,
+        href: str,
+        auth: Optional[AuthBase],
+        params: Optional[dict[str, str]],
+        pool_maxsize: int,
+    ) -> CaseInsensitiveDict[str]:
+        """Headers of an asset ``HEAD`` response giving its size, filename, ``ETag`` and
+        ``Accept-Ranges``, cached in :data:`asset_headers_cache`
+
+        :param pool_maxsize: number of threads concurrently requesting headers
+        :raises: :class:`~requests.RequestException` if the request failed
+        """
+
+        def probe() -> dict[str, str]:
+            response = self._get_probe_session(pool_maxsize).head(
+                href,
+                auth=auth,
+                params=params,
+                headers=USER_AGENT,
+                timeout=getattr(self.config, "timeout", HTTP_REQ_TIMEOUT),
+                verify=getattr(self.config, "ssl_verify", True),
+            )
+            response.raise_for_status()
+            headers = {}
+            for name in _PROBED_HEADERS:
+                value = response.headers.get(name)
+                if value is not None:
+                    headers[name] = value
+            return headers
+
+        key = (
+            self.provider,
+            href,
+            json.dumps(params or {}, sort_keys=True),
+            _auth_identity(auth),
+        )
+        return CaseInsensitiveDict(
+            asset_headers_cache.get_or_set(key, probe, copy_value=False)
+        )
+
     def _should_ignore_assets(self, product: EOProduct) -> bool:
         """Get ignore_assets value with product-level override support."""
         product_conf = getattr(self.config, "products", {}).get(product.collection, {})
@@ -425,6 +547,9 @@ class HTTPDownload(Download):
                 else:
                     raise DownloadError.from_error(e, msg) from e
 
+        # delay before the next status check requested by the provider
+        product.retry_after = retry_after_seconds(response.headers.get("Retry-After"))
+
         if not skip_parsing_status_response:
             # status request
             json_response = response.json()
@@ -619,6 +744,14 @@ class HTTPDownload(Download):
         The downloaded product is assumed to be a Zip file. If it is not,
         the user is warned, it is renamed to remove the zip extension and
         no further treatment is done (no extraction)
+
+        Data is first written to a ``.part`` file, with a ``.part.json`` sidecar storing
+        the remote file validators (``ETag``, ``Last-Modified``, size). An interrupted
+        download is resumed from this partial file if the validators still match.
+
+        If an ``asset`` filter is given for a zipped product whose server accepts byte
+        ranges, only the matching archive members are fetched and extracted, using the
+        archive central directory.
         """
         if auth is not None and not isinstance(auth, AuthBase):
             raise MisconfiguredError(f"Incompatible auth plugin: {type(auth)}")
@@ -673,42 +806,77 @@ class HTTPDownload(Download):
             timeout: float,
             **kwargs: Unpack[DownloadConf],
         ) -> os.PathLike:
-            is_empty = True
-            chunk_iterator = self._raw_stream_download(
-                product, auth, progress_callback, **kwargs
-            )
-            if fs_path is not None:
+            if fs_path is None:
+                raise DownloadError(
+                    f"download of product {product.properties['id']} failed"
+                )
+
+            def product_file_path() -> Path:
                 ext = Path(product.filename).suffix
                 path = Path(fs_path).with_suffix(ext)
                 if "ORDERABLE" in path.stem and product.properties.get("title"):
                     path = path.with_stem(sanitize(product.properties["title"]))
-
-                with open(path, "wb") as fhandle:
-                    for chunk in chunk_iterator:
-                        is_empty = False
-                        progress_callback(len(chunk))
-                        fhandle.write(chunk)
-                product._stream.close()  # Closing response stream
-
-                if is_empty:
-                    raise DownloadError(f"product {product.properties['id']} is empty")
-                else:
-                    # make sure storage status is online
-                    product.properties["order:status"] = ONLINE_STATUS
-
                 return path
-            else:
-                raise DownloadError(
-                    f"download of product {product.properties['id']} failed"
+
+            # only extract the archive members selected by the asset filter, if possible,
+            # before the whole archive is requested
+            extract = kwargs.get("extract")
+            if extract is None:
+                extract = getattr(self.config, "extract", True)
+            if extract and self._probe_product_stream(product, auth, **kwargs):
+                path = product_file_path()
+                members = (
+                    self._selected_zip_members(product, auth, **kwargs)
+                    if not os.path.exists(os.path.splitext(path)[0])
+                    else None
                 )
+                if members:
+                    return self._download_zip_members(
+                        product, auth, path, members, progress_callback
+                    )
+                product._stream.close()
+
+            chunk_iterator = self._raw_stream_download(
+                product, auth, progress_callback, **kwargs
+            )
+            path = product_file_path()
+            retries = self._checksum_retries()
+            while True:
+                try:
+                    return self._download_stream_to_path(
+                        product,
+                        auth,
+                        path,
+                        chunk_iterator,
+                        progress_callback,
+                        **kwargs,
+                    )
+                except ChecksumError as e:
+                    if retries <= 0:
+                        raise
+                    retries -= 1
+                    logger.warning("%s, downloading it again", e)
+                    chunk_iterator = self._raw_stream_download(
+                        product, auth, progress_callback, **kwargs
+                    )
 
         path = download_request(
             product, auth, progress_callback, wait, timeout, **kwargs
         )
 
-        with open(record_filename, "w") as fh:
-            fh.write(url)
-        logger.debug("Download recorded in %s", record_filename)
+        # products restricted by an asset filter are not recorded as downloaded, so that
+        # a later download of the whole product is not skipped
+        whole_product = kwargs.get("asset") is None
+        if whole_product:
+            with open(record_filename, "w") as fh:
+                fh.write(url)
+            logger.debug("Download recorded in %s", record_filename)
+
+        if os.path.isdir(path):
+            # archive extracted while downloaded
+            if whole_product:
+                product.location = path_to_uri(str(path))
+            return str(path)
 
         if os.path.isfile(path) and not (
             zipfile.is_zipfile(path) or tarfile.is_tarfile(path)
@@ -722,7 +890,8 @@ class HTTPDownload(Download):
             if not os.path.isdir(new_fs_path):
                 os.makedirs(new_fs_path)
             shutil.move(path, new_fs_path)
-            product.location = path_to_uri(new_fs_path)
+            if whole_product:
+                product.location = path_to_uri(new_fs_path)
             return new_fs_path
 
         product_path = self._finalize(
@@ -730,9 +899,724 @@ class HTTPDownload(Download):
             progress_callback=progress_callback,
             **kwargs,
         )
-        product.location = path_to_uri(product_path)
+        if whole_product:
+            product.location = path_to_uri(product_path)
+        return product_path
+
+    def _download_stream_to_path(
+        self,
+        product: EOProduct,
+        auth: Optional[AuthBase],
+        path: Path,
+        chunk_iterator: Iterator[bytes],
+        progress_callback: ProgressCallback,
+        **kwargs: Unpack[DownloadConf],
+    ) -> Path:
+        """Download the opened product stream to ``path``, or extract it while downloaded.
+
+        Received data is hashed while written and compared to the expected product checksum.
+
+        :returns: path of the downloaded file, or of the extracted product
+        :raises: :class:`~eodag.utils.exceptions.ChecksumError` if the downloaded data
+                 does not match the expected checksum
+        """
+        if self._stream_extract_enabled(path, **kwargs):
+            try:
+                product_path = self._stream_extract(
+                    product,
+                    path,
+                    chunk_iterator,
+                    progress_callback,
+                    self._product_checksum_verifier(product),
+                )
+                product.properties["order:status"] = ONLINE_STATUS
+                return product_path
+            except NotStreamableArchiveError as e:
+                logger.info(
+                    "Cannot extract %s while downloading it, downloading it first: %s",
+                    path.name,
+                    e,
+                )
+                # bytes received by the extraction attempt are received again
+                progress_callback.reset()
+                chunk_iterator = self._raw_stream_download(
+                    product, auth, progress_callback, **kwargs
+                )
+
+        is_empty = True
+        verifier = self._product_checksum_verifier(product)
+        # download to a partial file, that can be resumed if validators still match
+        part_path = f"{path}.part"
+        validators = self._stream_validators(product)
+        done_ranges = self._partial_download_ranges(part_path, validators)
+        if segment_ranges := self._segment_ranges(product):
+            self._segmented_download(
+                product,
+                auth,
+                part_path,
+                segment_ranges,
+                progress_callback,
+                done_ranges,
+                validators,
+                verifier,
+            )
+            is_empty = False
+        else:
+            offset = self._contiguous_size(done_ranges)
+            if offset:
+                offset, chunk_iterator = self._resume_stream_download(
+                    product, auth, offset, chunk_iterator
+                )
+            if offset:
+                is_empty = False
+                progress_callback(offset)
+                if verifier:
+                    verifier.update_from_file(part_path, offset)
+            if validators:
+                self._write_partial_download_sidecar(part_path, validators)
+            with open(part_path, "r+b" if offset else "wb") as fhandle:
+                fhandle.truncate(offset)
+                fhandle.seek(offset)
+                for chunk in chunk_iterator:
+                    is_empty = False
+                    progress_callback(len(chunk))
+                    fhandle.write(chunk)
+                    if verifier:
+                        verifier.update(chunk)
+        product._stream.close()  # Closing response stream
+
+        if is_empty:
+            os.remove(part_path)
+            raise DownloadError(f"product {product.properties['id']} is empty")
+        if verifier:
+            try:
+                verifier.verify()
+            except ChecksumError:
+                self._remove_partial_download(part_path)
+                raise
+        os.replace(part_path, path)
+        self._remove_partial_download(part_path)
+        # make sure storage status is online
+        product.properties["order:status"] = ONLINE_STATUS
+        return path
+
+    def _product_checksum_verifier(
+        self, product: EOProduct
+    ) -> Optional[ChecksumVerifier]:
+        """Verifier of the opened product stream, using the ``file:checksum`` product
+        property or the ``Content-MD5`` response header"""
+        return self._checksum_verifier(
+            product.properties.get("file:checksum"),
+            self._content_md5(getattr(product, "_stream", None)),
+            name=f"product {product.properties.get('id')}",
+        )
+
+    @staticmethod
+    def _content_md5(response: Optional[Response]) -> Optional[str]:
+        """MD5 digest of the response content given by its ``Content-MD5`` header, if
+        the content is not encoded (and thus decoded by ``requests``)"""
+        headers = getattr(response, "headers", None) or {}
+        if str(headers.get("Content-Encoding", "identity")).lower() != "identity":
+            return None
+        return content_md5_checksum(headers.get("Content-MD5"))
+
+    def _stream_extract_enabled(
+        self, path: Path, **kwargs: Unpack[DownloadConf]
+    ) -> bool:
+        """Whether the archive to download to ``path`` should be extracted while downloaded"""
+
+        def conf(name: str, default: bool) -> bool:
+            value = kwargs.get(name)
+            if value is None:
+                value = getattr(self.config, name, default)
+            return bool(value)
+
+        return (
+            conf("stream_extract", False)
+            and conf("extract", True)
+            and conf("delete_archive", True)
+            and is_streamable_archive(path.name)
+            and not os.path.exists(os.path.splitext(path)[0])
+        )
+
+    def _stream_extract(
+        self,
+        product: EOProduct,
+        path: Path,
+        chunk_iterator: Iterator[bytes],
+        progress_callback: ProgressCallback,
+        verifier: Optional[ChecksumVerifier] = None,
+    ) -> Path:
+        """Extract the product archive from its opened stream, without writing it to disk.
+
+        Members are extracted to a temporary directory next to ``path``, moved in place
+        once the whole archive is extracted.
+
+        :param product: product whose stream is opened
+        :param path: path where the archive would have been downloaded
+        :param chunk_iterator: chunks of the archive
+        :param progress_callback: progress callback updated with downloaded bytes
+        :param verifier: (optional) verifier of the archive checksum, checked before the
+                         extracted product is moved in place
+        :returns: path of the extracted product
+        :raises: :class:`~eodag.utils.archives.NotStreamableArchiveError` if the archive
+                 cannot be extracted while downloaded
+        """
+
+        def chunks_with_progress() -> Iterator[bytes]:
+            for chunk in chunk_iterator:
+                progress_callback(len(chunk))
+                if verifier:
+                    verifier.update(chunk)
+                yield chunk
+
+        chunks = chunks_with_progress()
+
+        product_path = Path(os.path.splitext(path)[0])
+        extraction_dir = tempfile.mkdtemp(prefix=".extract-", dir=path.parent)
+        try:
+            logger.debug("Extracting %s while downloading it", path.name)
+            extract_archive_stream(chunks, extraction_dir, path.name)
+            if verifier:
+                # data following the extracted members (e.g. zip central directory)
+                for _ in chunks:
+                    pass
+                verifier.verify()
+            product_extraction_path = self._resolve_archive_depth(extraction_dir)
+            if os.path.isfile(product_extraction_path):
+                os.makedirs(product_path)
+            shutil.move(product_extraction_path, product_path)
+        finally:
+            product._stream.close()
+            shutil.rmtree(extraction_dir, ignore_errors=True)
+        return product_path
+
+    @staticmethod
+    def _stream_validators(product: EOProduct) -> dict[str, Any]:
+        """Values identifying the remote file of the opened product stream, used to check
+        that a partial download can be resumed. Empty if the server gives no validator.
+        """
+        headers = product._stream.headers
+        validators = {
+            "url": product.remote_location,
+            "size": getattr(product, "size", None),
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+        }
+        if not isinstance(validators["etag"], str):
+            validators["etag"] = None
+        if not isinstance(validators["last_modified"], str):
+            validators["last_modified"] = None
+        if not validators["etag"] and not validators["last_modified"]:
+            return {}
+        return validators
+
+    @staticmethod
+    def _remove_partial_download(part_path: str) -> None:
+        """Remove a partial download file and its sidecar"""
+        for file_path in (part_path, f"{part_path}.json"):
+            if os.path.isfile(file_path):
+                os.remove(file_path)
+
+    @staticmethod
+    def _write_partial_download_sidecar(
+        part_path: str,
+        validators: dict[str, Any],
+        ranges: Optional[list[tuple[int, int]]] = None,
+    ) -> None:
+        """Write the sidecar of a partial download: validators of the remote file, and
+        downloaded byte ranges if the file is not written sequentially
+        """
+        sidecar = dict(validators, ranges=ranges) if ranges is not None else validators
+        with open(f"{part_path}.json", "w") as fh:
+            json.dump(sidecar, fh)
+
+    def _partial_download_ranges(
+        self, part_path: str, validators: dict[str, Any]
+    ) -> list[tuple[int, int]]:
+        """Byte ranges already downloaded to the given partial file.
+
+        The partial file and its sidecar are removed if validators of the remote file
+        do not match the ones stored in the sidecar.
+        """
+        sidecar: dict[str, Any] = {}
+        if os.path.isfile(part_path):
+            try:
+                with open(f"{part_path}.json") as fh:
+                    sidecar = json.load(fh)
+            except (OSError, ValueError):
+                pass
+        if not validators or any(sidecar.get(k) != v for k, v in validators.items()):
+            self._remove_partial_download(part_path)
+            return []
+        if sidecar.get("ranges") is not None:
+            ranges = [(int(start), int(end)) for start, end in sidecar["ranges"]]
+        elif part_size := os.path.getsize(part_path):
+            ranges = [(0, part_size - 1)]
+        else:
+            ranges = []
+        logger.debug(
+            "Found partial download %s (%s bytes)",
+            part_path,
+            sum(end + 1 - start for start, end in ranges),
+        )
+        return ranges
+
+    @staticmethod
+    def _contiguous_size(ranges: list[tuple[int, int]]) -> int:
+        """Size of the data contiguously covered by the given byte ranges from offset 0"""
+        size = 0
+        for start, end in sorted(ranges):
+            if start > size:
+                break
+            size = max(size, end + 1)
+        return size
+
+    def _request_range(
+        self,
+        product: EOProduct,
+        auth: Optional[AuthBase],
+        start: int,
+        end: Optional[int] = None,
+        session: Optional[requests.Session] = None,
+    ) -> Response:
+        """Request a byte range of the file of the opened product stream.
+
+        :raises: :class:`~eodag.utils.exceptions.DownloadError` if the server does not
+                 answer with the requested range
+        """
+        stream = product._stream
+        headers = dict(USER_AGENT, Range=f"bytes={start}-{'' if end is None else end}")
+        # the whole file is returned instead of the range if it has changed
+        if_range = stream.headers.get("ETag") or stream.headers.get("Last-Modified")
+        if isinstance(if_range, str) and not if_range.startswith("W/"):
+            headers["If-Range"] = if_range
+        response = (session or requests).get(
+            stream.url,
+            stream=True,
+            # redirection locations (e.g. pre-signed urls) must not receive credentials
+            auth=None if stream.history else auth,
+            headers=headers,
+            timeout=DEFAULT_STREAM_REQUESTS_TIMEOUT,
+            verify=getattr(self.config, "ssl_verify", True),
+        )
+        response.raise_for_status()
+        if response.status_code != 206:
+            response.close()
+            raise DownloadError(
+                f"Range request not satisfied for {product.properties['id']}"
+            )
+        return response
+
+    def _resume_stream_download(
+        self,
+        product: EOProduct,
+        auth: Optional[AuthBase],
+        offset: int,
+        chunk_iterator: Iterator[bytes],
+    ) -> tuple[int, Iterator[bytes]]:
+        """Replace the opened product stream with a stream starting at ``offset``, if the
+        server supports it.
+
+        :returns: the offset from which returned chunks start, and the chunks iterator
+        """
+        stream = product._stream
+        if offset == getattr(product, "size", None):
+            # the whole file had already been downloaded
+            stream.close()
+            return offset, iter(())
+        if str(stream.headers.get("Accept-Ranges", "")).lower() == "bytes":
+            try:
+                response = self._request_range(product, auth, offset)
+            except (DownloadError, RequestException) as e:
+                logger.debug("Cannot resume download, restarting it: %s", e)
+            else:
+                stream.close()
+                product._stream = response
+                return offset, response.iter_content(chunk_size=64 * 1024)
+        return 0, chunk_iterator
+
+    @staticmethod
+    def _ranges_supported(product: EOProduct) -> bool:
+        """Whether byte ranges of the file of the opened product stream can be requested"""
+        headers = product._stream.headers
+        return (
+            str(headers.get("Accept-Ranges", "")).lower() == "bytes"
+            and str(headers.get("Content-Encoding", "identity")).lower() == "identity"
+            and getattr(product._stream.request, "method", None) in ("GET", "HEAD")
+        )
+
+    def _probe_product_stream(
+        self,
+        product: EOProduct,
+        auth: Optional[AuthBase],
+        **kwargs: Unpack[DownloadConf],
+    ) -> bool:
+        """Request the headers of the product file with a ``HEAD`` request standing for its
+        stream, so that the archive members selected by the ``asset`` filter can be fetched
+        by byte ranges before the whole file is requested.
+
+        Products without ``asset`` filter, not online or not downloaded using ``GET``
+        requests are not probed.
+
+        :returns: whether ``product._stream`` is the ``HEAD`` response of the product file
+        """
+        req_method = (
+            product.properties.get("eodag:download_method", "").lower()
+            or getattr(self.config, "method", "GET").lower()
+        )
+        url = product.remote_location
+        if (
+            not kwargs.get("asset")
+            or req_method != "get"
+            or url.startswith(NOT_AVAILABLE)
+            or product.properties.get("order:status", ONLINE_STATUS) != ONLINE_STATUS
+        ):
+            return False
+        try:
+            response = requests.head(
+                url,
+                auth=None if getattr(self.config, "no_auth_download", False) else auth,
+                params=kwargs.get("dl_url_params")
+                or getattr(self.config, "dl_url_params", {}),
+                headers=USER_AGENT,
+                allow_redirects=True,
+                timeout=getattr(self.config, "timeout", HTTP_REQ_TIMEOUT),
+                verify=getattr(self.config, "ssl_verify", True),
+            )
+            response.raise_for_status()
+        except RequestException as e:
+            logger.debug("Cannot probe %s, requesting the whole file: %s", url, e)
+            return False
+        product._stream = response
+        product.headers = response.headers
+        product.filename = self._check_product_filename(product)
+        product.size = int(response.headers.get("Content-Length", 0)) or None
+        return True
+
+    def _iter_range(
+        self,
+        product: EOProduct,
+        auth: Optional[AuthBase],
+        start: int,
+        end: int,
+        session: Optional[requests.Session] = None,
+    ) -> Iterator[bytes]:
+        """Chunks of a byte range of the file of the opened product stream"""
+        with self._request_range(product, auth, start, end, session) as response:
+            yield from response.iter_content(chunk_size=64 * 1024)
+
+    def _selected_zip_members(
+        self,
+        product: EOProduct,
+        auth: Optional[AuthBase],
+        session: Optional[requests.Session] = None,
+        **kwargs: Unpack[DownloadConf],
+    ) -> Optional[list[zipfile.ZipInfo]]:
+        """Members of the zipped product of the opened stream selected by the ``asset``
+        filter, read from the archive central directory fetched by byte ranges.
+
+        :returns: the selected file members, or ``None`` if no filter is given or if the
+                  archive members cannot be fetched by byte ranges
+        """
+        asset_filter = kwargs.get("asset")
+        size = getattr(product, "size", None)
+        if (
+            not asset_filter
+            or not str(getattr(product, "filename", "")).lower().endswith(".zip")
+            or not isinstance(size, int)
+            or not self._ranges_supported(product)
+        ):
+            return None
+        try:
+            members = read_remote_zip_members(
+                partial(self._iter_range, product, auth, session=session), size
+            )
+        except (zipfile.BadZipFile, DownloadError, RequestException) as e:
+            logger.debug(
+                "Cannot read the central directory of %s, using the whole archive: %s",
+                product.filename,
+                e,
+            )
+            return None
+        select_member = archive_members_filter(asset_filter)
+        members = [m for m in members if not m.is_dir() and select_member(m.filename)]
+        try:
+            for member in members:
+                check_remote_zip_member(member)
+        except NotStreamableArchiveError as e:
+            logger.debug(
+                "Cannot fetch members of %s by byte ranges, using the whole archive: %s",
+                product.filename,
+                e,
+            )
+            return None
+        return members
+
+    def _download_zip_members(
+        self,
+        product: EOProduct,
+        auth: Optional[AuthBase],
+        path: Path,
+        members: list[zipfile.ZipInfo],
+        progress_callback: ProgressCallback,
+    ) -> Path:
+        """Extract members of the zipped product of the opened stream, fetching only their
+        data by byte ranges instead of downloading the whole archive.
+
+        Members are extracted to a temporary directory next to ``path``, moved in place
+        once they are all extracted.
+
+        :param product: product whose stream is opened
+        :param auth: authentication to use for ranges requests
+        :param path: path where the archive would have been downloaded
+        :param members: archive members to extract, see :meth:`_selected_zip_members`
+        :param progress_callback: progress callback updated with extracted bytes
+        :returns: path of the extracted product
+        """
+        product._stream.close()
+        progress_callback.reset(total=sum(m.file_size for m in members))
+        product_path = Path(os.path.splitext(path)[0])
+        extraction_dir = tempfile.mkdtemp(prefix=".extract-", dir=path.parent)
+        try:
+            logger.debug(
+                "Extracting %s member(s) of %s from byte ranges",
+                len(members),
+                path.name,
+            )
+            with requests.Session() as session:
+                extract_remote_zip_members(
+                    partial(self._iter_range, product, auth, session=session),
+                    members,
+                    extraction_dir,
+                    progress_callback,
+                )
+            product_extraction_path = self._resolve_archive_depth(extraction_dir)
+            if os.path.isfile(product_extraction_path):
+                os.makedirs(product_path)
+            shutil.move(product_extraction_path, product_path)
+        finally:
+            shutil.rmtree(extraction_dir, ignore_errors=True)
+        product.properties["order:status"] = ONLINE_STATUS
         return product_path
 
+    def _stream_zip_members(
+        self,
+        product: EOProduct,
+        auth: Optional[AuthBase],
+        members: list[zipfile.ZipInfo],
+    ) -> StreamResponse:
+        """Stream members of the zipped product, fetching only their data by byte ranges.
+        Several members are streamed as a new zip archive.
+
+        :param product: product whose stream was opened
+        :param auth: authentication to use for ranges requests
+        :param members: archive members to stream, see :meth:`_selected_zip_members`
+        :returns: the members stream
+        """
+        fetch_range = partial(self._iter_range, product, auth)
+        if len(members) == 1:
+            filename = os.path.basename(members[0].filename)
+            return StreamResponse(
+                content=iter_remote_zip_member(fetch_range, members[0]),
+                filename=filename,
+                size=members[0].file_size,
+                media_type=guess_file_type(filename),
+            )
+        zip_stream = ZipStream(sized=True)
+        for member in members:
+            zip_stream.add(
+                iter_remote_zip_member(fetch_range, member),
+                arcname=member.filename,
+                size=member.file_size,
+            )
+        return StreamResponse(
+            content=zip_stream,
+            media_type="application/zip",
+            filename=product.filename,
+            size=len(zip_stream),
+        )
+
+    def _segment_ranges(self, product: EOProduct) -> list[tuple[int, int]]:
+        """Byte ranges in which the opened product stream can be split to be downloaded
+        using several connections. Empty if the stream cannot or should not be split.
+        """
+        segment_size = self._download_segment_size()
+        size = getattr(product, "size", None)
+        if not isinstance(size, int) or size < 2 * segment_size:
+            return []
+        if self._download_segments() < 2 or not self._ranges_supported(product):
+            return []
+        return [
+            (start, min(start + segment_size, size) - 1)
+            for start in range(0, size, segment_size)
+        ]
+
+    def _segmented_download(
+        self,
+        product: EOProduct,
+        auth: Optional[AuthBase],
+        path: Union[str, os.PathLike],
+        segment_ranges: list[tuple[int, int]],
+        progress_callback: ProgressCallback,
+        done_ranges: Optional[list[tuple[int, int]]] = None,
+        validators: Optional[dict[str, Any]] = None,
+        verifier: Optional[ChecksumVerifier] = None,
+    ) -> None:
+        """Download the product stream to a preallocated file, fetching its byte ranges
+        concurrently.
+
+        The first range is read from the already opened stream. The number of
+        connections starts at 2 and is doubled, up to
+        :attr:`~eodag.config.PluginConfig.download_segments`, as long as it improves the
+        measured throughput. Ranges are received out of order: the file is hashed in
+        order as its contiguous downloaded prefix grows, read back from the file.
+
+        :param product: product whose stream is opened
+        :param auth: authentication to use for ranges requests
+        :param path: path of the file to write
+        :param segment_ranges: inclusive byte ranges covering the whole file
+        :param progress_callback: progress callback updated from worker threads
+        :param done_ranges: (optional) byte ranges already downloaded to ``path``
+        :param validators: (optional) validators of the remote file, downloaded ranges
+                           are recorded in a sidecar file next to ``path`` if given
+        :param verifier: (optional) verifier updated with the whole file, in order
+        """
+        stream = product._stream
+        max_segments = self._download_segments()
+
+        # skip segments already downloaded
+        done_ranges = list(done_ranges or [])
+        todo_ranges = [
+            (start, end)
+            for start, end in segment_ranges
+            if not any(s <= start and end <= e for s, e in done_ranges)
+        ]
+        progress_callback(
+            sum(end + 1 - start for start, end in segment_ranges)
+            - sum(end + 1 - start for start, end in todo_ranges)
+        )
+
+        lock = threading.Lock()
+        stop = threading.Event()
+        local = threading.local()
+        sessions: list[requests.Session] = []
+        received = [0]
+        # size of the beginning of the file already added to the verifier
+        hashed = 0
+
+        def hash_downloaded_prefix() -> None:
+            nonlocal hashed
+            contiguous = self._contiguous_size(done_ranges)
+            if verifier and contiguous > hashed:
+                verifier.update_from_file(str(path), contiguous - hashed, hashed)
+                hashed = contiguous
+
+        fd = os.open(path, os.O_RDWR | os.O_CREAT | getattr(os, "O_BINARY", 0))
+
+        def write_at(data: bytes, offset: int) -> None:
+            if hasattr(os, "pwrite"):
+                view = memoryview(data)
+                while view:
+                    written = os.pwrite(fd, view, offset)
+                    view, offset = view[written:], offset + written
+            else:
+                with lock:
+                    os.lseek(fd, offset, os.SEEK_SET)
+                    os.write(fd, data)
+
+        def fetch_range(
+            start: int, end: int, response: Optional[Response] = None
+        ) -> None:
+            if response is None:
+                session = getattr(local, "session", None)
+                if session is None:
+                    session = local.session = requests.Session()
+                    with lock:
+                        sessions.append(session)
+                response = self._request_range(product, auth, start, end, session)
+            offset = start
+            try:
+                for chunk in response.iter_content(chunk_size=64 * 1024):
+                    if stop.is_set():
+                        return
+                    chunk = chunk[: end + 1 - offset]
+                    write_at(chunk, offset)
+                    offset += len(chunk)
+                    with lock:
+                        received[0] += len(chunk)
+                        progress_callback(len(chunk))
+                    if offset > end:
+                        break
+            finally:
+                response.close()
+            if offset <= end:
+                raise DownloadError(
+                    f"Incomplete range {start}-{end} for {product.properties['id']}"
+                )
+
+        logger.debug(
+            "Downloading %s using up to %s connections",
+            product.properties["id"],
+            max_segments,
+        )
+        pending = deque(todo_ranges)
+        connections = min(2, max_segments)
+        best_rate = 0.0
+        window_start, window_received = time.monotonic(), 0
+        try:
+            if validators:
+                self._write_partial_download_sidecar(str(path), validators, done_ranges)
+            os.ftruncate(fd, segment_ranges[-1][1] + 1)
+            with ThreadPoolExecutor(max_workers=max_segments) as pool:
+                futures = {}
+                if pending and pending[0] == segment_ranges[0]:
+                    first_range = pending.popleft()
+                    futures[pool.submit(fetch_range, *first_range, stream)] = (
+                        first_range
+                    )
+                running = set(futures)
+                try:
+                    while running or pending:
+                        while pending and len(running) < connections:
+                            next_range = pending.popleft()
+                            future = pool.submit(fetch_range, *next_range)
+                            futures[future] = next_range
+                            running.add(future)
+                        done, running = wait(
+                            running, timeout=0.2, return_when=FIRST_COMPLETED
+                        )
+                        for future in done:
+                            future.result()
+                            done_ranges.append(futures.pop(future))
+                        if done and validators:
+                            self._write_partial_download_sidecar(
+                                str(path), validators, done_ranges
+                            )
+                        if done:
+                            hash_downloaded_prefix()
+                        elapsed = time.monotonic() - window_start
+                        if connections >= max_segments or elapsed < 0.2:
+                            continue
+                        # double connections while it significantly improves throughput
+                        rate = (received[0] - window_received) / elapsed
+                        if rate > best_rate * 1.1:
+                            best_rate = rate
+                            connections = min(2 * connections, max_segments)
+                        else:
+                            max_segments = connections
+                        window_start, window_received = time.monotonic(), received[0]
+                except BaseException:
+                    stop.set()
+                    for future in running:
+                        future.cancel()
+                    raise
+        finally:
+            os.close(fd)
+            for session in sessions:
+                session.close()
+        hash_downloaded_prefix()
+
     def _check_stream_size(self, product: EOProduct) -> int:
         stream_size = int(product._stream.headers.get("content-length", 0))
         if (
@@ -788,6 +1672,10 @@ class HTTPDownload(Download):
         Returns dictionary of :class:`~fastapi.responses.StreamingResponse` keyword-arguments.
         It contains a generator to streamed download chunks and the response headers.
 
+        If an ``asset`` filter is given for a zipped product whose server accepts byte
+        ranges, only the matching archive members are fetched and streamed, as a new zip
+        archive if several members match.
+
         :param product: The EO product to download
         :param auth: (optional) authenticated object
         :param progress_callback: (optional) A progress callback
@@ -864,8 +1752,25 @@ class HTTPDownload(Download):
                 else:
                     pass
 
+        # local product file served from a memory map
+        if product.remote_location.startswith("file:") and os.path.isfile(
+            local_path := uri_to_path(product.remote_location)
+        ):
+            return StreamResponse(
+                content=mmap_chunks(local_path),
+                filename=os.path.basename(local_path),
+                size=os.path.getsize(local_path),
+            )
+
         chunk_iterator = self._raw_stream_download(product, auth, None, **kwargs)
 
+        # only fetch the archive members selected by the asset filter, if possible
+        members = self._selected_zip_members(product, auth, **kwargs)
+        if members is not None:
+            product._stream.close()
+            self._check_selected_members(members, product.filename, kwargs.get("asset"))
+            return self._stream_zip_members(product, auth, members)
+
         # start reading chunks to set product.headers
         try:
             first_chunk = next(chunk_iterator)
@@ -874,8 +1779,14 @@ class HTTPDownload(Download):
             logger.error("product %s is empty", product.properties["id"])
             raise NotAvailableError(f"product {product.properties['id']} is empty")
 
+        content: Iterator[bytes] = chain(iter([first_chunk]), chunk_iterator)
+        if verifier := self._product_checksum_verifier(product):
+            # already streamed data cannot be downloaded again, the mismatch is raised
+            # at the end of the stream
+            content = verifier.wrap(content)
+
         return StreamResponse(
-            content=chain(iter([first_chunk]), chunk_iterator),
+            content=content,
             headers=getattr(product, "headers", {}),
             filename=getattr(product, "filename", None),
             size=getattr(product, "size", None),
@@ -1144,13 +2055,41 @@ class HTTPDownload(Download):
             else None
         )
 
+        def set_asset_rel_path(asset: Asset) -> None:
+            """Set the path of the asset relative to the product directory"""
+            asset_rel_path = asset.rel_path
+            if flatten_top_dirs:
+                asset_rel_path = asset_rel_path.replace(assets_common_subdir, "").strip(
+                    os.sep
+                )
+            asset_rel_dir = os.path.dirname(asset_rel_path)
+
+            if not getattr(asset, "filename", None):
+                # default filename extracted from path
+                asset.filename = os.path.basename(asset.rel_path)
+
+            asset.rel_path = os.path.join(asset_rel_dir, cast(str, asset.filename))
+
+        def get_local_chunks(asset: Asset) -> Iterator[memoryview]:
+            """Chunks of a local asset, read from a memory map of its file"""
+            verifier = self._checksum_verifier(
+                asset.get("file:checksum"), name=f"asset {asset.key}"
+            )
+            for chunk in mmap_chunks(uri_to_path(asset["href"])):
+                progress_callback(len(chunk))
+                if verifier:
+                    verifier.update(chunk)
+                yield chunk
+            if verifier:
+                verifier.verify()
+
         def get_chunks_generator(asset: Asset) -> Iterator[bytes]:
             """Create a generator function that will be called by ZipStream when needed."""
 
             asset_href = asset.get("href")
             # This function will be called by zipstream when it needs the data
-            if not asset_href or asset_href.startswith("file:"):
-                logger.info(f"Local asset detected. Download skipped for {asset_href}")
+            if not asset_href:
+                logger.info(f"Asset without href. Download skipped for {asset.key}")
                 return
 
             # Determine auth
@@ -1172,14 +2111,6 @@ class HTTPDownload(Download):
                 ) as stream:
                     stream.raise_for_status()
 
-                    # Process asset path
-                    asset_rel_path = asset.rel_path
-                    if flatten_top_dirs:
-                        asset_rel_path = asset_rel_path.replace(
-                            assets_common_subdir, ""
-                        ).strip(os.sep)
-                    asset_rel_dir = os.path.dirname(asset_rel_path)
-
                     if not getattr(asset, "filename", None):
                         # try getting filename in GET header if was not found in HEAD result
                         asset_content_disposition = stream.headers.get(
@@ -1193,18 +2124,22 @@ class HTTPDownload(Download):
                                 ),
                             )
 
-                    if not getattr(asset, "filename", None):
-                        # default filename extracted from path
-                        asset.filename = os.path.basename(asset.rel_path)
+                    # Process asset path
+                    set_asset_rel_path(asset)
 
-                    asset.rel_path = os.path.join(
-                        asset_rel_dir, cast(str, asset.filename)
+                    verifier = self._checksum_verifier(
+                        asset.get("file:checksum"),
+                        self._content_md5(stream),
+                        name=f"asset {asset.key}",
                     )
-
                     for chunk in stream.iter_content(chunk_size=64 * 1024):
                         if chunk:
                             progress_callback(len(chunk))
+                            if verifier:
+                                verifier.update(chunk)
                             yield chunk
+                    if verifier:
+                        verifier.verify()
 
             except requests.exceptions.Timeout as exc:
                 raise TimeOutError(
@@ -1218,6 +2153,18 @@ class HTTPDownload(Download):
 
         # Process each asset
         for asset in assets_values:
+            if asset.get("href", "").startswith("file:"):
+                # local assets are read lazily from a memory map of their file
+                set_asset_rel_path(asset)
+                assets_stream_list.append(
+                    StreamResponse(
+                        content=get_local_chunks(asset),
+                        filename=getattr(asset, "filename", None),
+                        arcname=asset.rel_path,
+                        size=getattr(asset, "size", 0) or None,
+                    )
+                )
+                continue
             asset_chunks = get_chunks_generator(asset)
             try:
                 # start reading chunks to set assets attributes
@@ -1267,8 +2214,20 @@ class HTTPDownload(Download):
 
         assets_values = product.assets.get_values(kwargs.get("asset") or "")
 
-        assets_stream_list = self._raw_stream_download_assets(
-            product, executor, auth, progress_callback, assets_values, **kwargs
+        # count local assets
+        local_assets_count = 0
+        for asset in assets_values:
+            if asset["href"].startswith("file:"):
+                local_assets_count += 1
+        # the path of a product whose assets are all local is returned without copying them
+        all_assets_local = local_assets_count == len(assets_urls)
+
+        assets_stream_list = (
+            self._raw_stream_download_assets(
+                product, executor, auth, progress_callback, assets_values, **kwargs
+            )
+            if not all_assets_local
+            else []
         )
 
         # remove existing incomplete file
@@ -1284,17 +2243,16 @@ class HTTPDownload(Download):
             "flatten_top_dirs", getattr(self.config, "flatten_top_dirs", True)
         )
 
-        # count local assets
-        local_assets_count = 0
-        for asset in assets_values:
+        def download_asset(
+            asset: Asset, asset_stream: StreamResponse, asset_abs_path: str
+        ) -> Optional[ChecksumError]:
             if asset["href"].startswith("file:"):
-                local_assets_count += 1
-                continue
-
-        def download_asset(asset_stream: StreamResponse) -> None:
+                # local asset linked or copied without reading its data
+                os.makedirs(os.path.dirname(asset_abs_path), exist_ok=True)
+                link_or_copy(uri_to_path(asset["href"]), asset_abs_path)
+                progress_callback(getattr(asset, "size", 0))
+                return None
             asset_chunks = asset_stream.content
-            asset_path = cast(str, asset_stream.arcname)
-            asset_abs_path = os.path.join(fs_dir_path, asset_path)
             asset_abs_path_temp = asset_abs_path + "~"
             # create asset subdir if not exist
             asset_abs_path_dir = os.path.dirname(asset_abs_path)
@@ -1304,10 +2262,14 @@ class HTTPDownload(Download):
                 os.remove(asset_abs_path_temp)
             if not os.path.isfile(asset_abs_path):
                 logger.debug("Downloading to temporary file '%s'", asset_abs_path_temp)
-                with open(asset_abs_path_temp, "wb") as fhandle:
-                    for chunk in asset_chunks:
-                        if chunk:
-                            fhandle.write(chunk)
+                try:
+                    with open(asset_abs_path_temp, "wb") as fhandle:
+                        for chunk in asset_chunks:
+                            if chunk:
+                                fhandle.write(chunk)
+                except ChecksumError as e:
+                    os.remove(asset_abs_path_temp)
+                    return e
                 logger.debug(
                     "Download completed. Renaming temporary file '%s' to '%s'",
                     os.path.basename(asset_abs_path_temp),
@@ -1320,29 +2282,64 @@ class HTTPDownload(Download):
                     "Asset already exists at '%s', skipping download", asset_abs_path
                 )
                 progress_callback(skipped_size)
-            return
+            return None
 
-        # use parallelization if possible
-        # when products are already downloaded in parallel but the executor has only one worker,
-        # we avoid submitting nested tasks to the executor to prevent deadlocks
-        if (
-            executor._thread_name_prefix == "eodag-download-all"
-            and executor._max_workers == 1
-        ):
-            for asset_stream in assets_stream_list:
-                download_asset(asset_stream)
-        else:
-            futures = (
-                executor.submit(download_asset, asset_stream)
-                for asset_stream in assets_stream_list
+        # assets are downloaded again if their checksum does not match, to the path
+        # computed for the whole set of assets
+        assets_to_download = [
+            (
+                asset,
+                asset_stream,
+                os.path.join(fs_dir_path, cast(str, asset_stream.arcname)),
             )
-            [f.result() for f in as_completed(futures)]
+            for asset, asset_stream in zip(assets_values, assets_stream_list)
+        ]
+        retries = self._checksum_retries()
+        while assets_to_download:
+            # use parallelization if possible
+            # when products are already downloaded in parallel but the executor has only one worker,
+            # we avoid submitting nested tasks to the executor to prevent deadlocks
+            if (
+                executor._thread_name_prefix == "eodag-download-all"
+                and executor._max_workers == 1
+            ):
+                errors = [download_asset(*item) for item in assets_to_download]
+            else:
+                errors = list(
+                    executor.map(lambda item: download_asset(*item), assets_to_download)
+                )
+            failed = [
+                (item, error)
+                for item, error in zip(assets_to_download, errors)
+                if error is not None
+            ]
+            if not failed:
+                break
+            if retries <= 0:
+                raise failed[0][1]
+            retries -= 1
+            for _, error in failed:
+                logger.warning("%s, downloading it again", error)
+            retry_streams = self._raw_stream_download_assets(
+                product,
+                executor,
+                auth,
+                progress_callback,
+                [asset for (asset, _, _), _ in failed],
+                **kwargs,
+            )
+            assets_to_download = [
+                (asset, asset_stream, asset_abs_path)
+                for ((asset, _, asset_abs_path), _), asset_stream in zip(
+                    failed, retry_streams
+                )
+            ]
 
         if shutdown_executor:
             executor.shutdown(wait=True)
 
         # only one local asset
-        if local_assets_count == len(assets_urls) and local_assets_count == 1:
+        if all_assets_local and local_assets_count == 1:
             # remove empty {fs_dir_path}
             shutil.rmtree(fs_dir_path)
             # and return assets_urls[0] path
@@ -1350,7 +2347,7 @@ class HTTPDownload(Download):
             # do not flatten dir
             flatten_top_dirs = False
         # several local assets
-        elif local_assets_count == len(assets_urls) and local_assets_count > 0:
+        elif all_assets_local and local_assets_count > 0:
             common_path = os.path.commonpath([uri_to_path(uri) for uri in assets_urls])
             # remove empty {fs_dir_path}
             shutil.rmtree(fs_dir_path)
@@ -1411,7 +2408,6 @@ class HTTPDownload(Download):
 
         total_size = 0
 
-        timeout = getattr(self.config, "timeout", HTTP_REQ_TIMEOUT)
         ssl_verify = getattr(self.config, "ssl_verify", True)
 
         # loop for assets size & filename in parallel
@@ -1421,16 +2417,9 @@ class HTTPDownload(Download):
             if asset["href"] and not asset["href"].startswith("file:"):
                 # HEAD request for size & filename
                 try:
-                    asset_headers_resp = requests.head(
-                        asset["href"],
-                        auth=auth,
-                        params=params,
-                        headers=USER_AGENT,
-                        timeout=timeout,
-                        verify=ssl_verify,
+                    asset_headers = self._probe_asset_headers(
+                        asset["href"], auth, params, executor._max_workers
                     )
-                    asset_headers_resp.raise_for_status()
-                    asset_headers = asset_headers_resp.headers
                 except RequestException as e:
                     logger.debug(f"HEAD request failed: {str(e)}")
                     asset_headers = CaseInsensitiveDict()
@@ -1479,6 +2468,11 @@ class HTTPDownload(Download):
                             asset.size = int(size_str) if size_str.isdigit() else 0
 
                 total_size += asset.size
+            elif asset["href"]:
+                # local asset size from the filesystem
+                with suppress(OSError, ValueError):
+                    asset.size = os.path.getsize(uri_to_path(asset["href"]))
+                    total_size += asset.size
 
         # use parallelization if possible
         # when products are already downloaded in parallel but the executor has only one worker,
@@ -24,12 +24,13 @@ from operator import attrgetter
 from typing import TYPE_CHECKING, Any, Iterator, Optional, Union, cast
 
 import importlib_metadata
+from packaging.requirements import Requirement
 
-from eodag.api.provider import ProvidersDict
+from eodag.api.provider import ProvidersDict, normalize_plugin_config
 from eodag.config import AUTH_TOPIC_KEYS, PLUGINS_TOPICS_KEYS, load_config
 from eodag.plugins.apis.base import Api
 from eodag.plugins.authentication.base import Authentication
-from eodag.plugins.base import EODAGPluginMount
+from eodag.plugins.base import get_plugins_entry_points
 from eodag.plugins.crunch.base import Crunch
 from eodag.plugins.download.base import Download
 from eodag.plugins.search.base import Search
@@ -48,6 +49,7 @@ if TYPE_CHECKING:
     from eodag.api.provider import ProviderConfig
     from eodag.config import PluginConfig
     from eodag.plugins.base import PluginTopic
+    from eodag.utils.cache import TTLCache
 
 
 logger = logging.getLogger("eodag.plugins.manager")
@@ -75,40 +77,31 @@ class PluginManager:
 
     skipped_plugins: list[str]
 
+    #: queryables cache given to the built search plugins
+    queryables_cache: Optional[TTLCache]
+
     def __init__(self, providers: ProvidersDict) -> None:
         self.skipped_plugins = []
+        self.queryables_cache = None
         self.providers = providers
-        # Load all the plugins. This will make all plugin classes of a particular
-        # type to be available in the base plugin class's 'plugins' attribute.
-        # For example, by importing module 'eodag.plugins.search.resto', the plugin
-        # 'RestoSearch' will be available in self.supported_topics['search'].plugins
+        # List the plugins entry points. Plugins are not loaded here but when first
+        # built, see :meth:`_build_plugin`. For example, module 'eodag.plugins.search.qssearch'
+        # is only imported when a 'StacSearch' plugin is needed, which then registers
+        # 'StacSearch' among the plugins of the search topic.
         for topic in self.supported_topics:
             # This way of discovering plugins means that anyone can create eodag
             # plugins as a separate python package (though it must require eodag), and
             # have it discovered as long as they declare an entry point of the type
             # 'eodag.plugins.search' for example in its setup script. See the setup
             # script of eodag for an example of how to do this.
-            for entry_point in importlib_metadata.entry_points(
-                group="eodag.plugins.{}".format(topic)
-            ):
-                try:
-                    entry_point.load()
-                except ModuleNotFoundError:
+            for entry_point in get_plugins_entry_points(topic, refresh=True).values():
+                if not self._entry_point_extras_installed(entry_point):
                     logger.debug(
                         "%s plugin skipped, eodag[%s] or eodag[all] needed",
                         entry_point.name,
                         ",".join(entry_point.extras),
                     )
                     self.skipped_plugins.append(entry_point.name)
-                except ImportError:
-                    import traceback as tb
-
-                    logger.warning("Unable to load plugin: %s.", entry_point.name)
-                    logger.warning("Reason:\n%s", tb.format_exc())
-                    logger.warning(
-                        "Check that the plugin module (%s) is importable",
-                        entry_point.name,
-                    )
                 plugin_config_paths = self._get_external_provider_config_paths(
                     entry_point
                 )
@@ -119,6 +112,28 @@ class PluginManager:
                     self.providers.update_from_configs(plugin_configs)
         self.rebuild()
 
+    @staticmethod
+    def _entry_point_extras_installed(
+        entry_point: importlib_metadata.EntryPoint,
+    ) -> bool:
+        """Check, without loading it, that the requirements of the extras needed by an
+        entry point (e.g. ``eodag[usgs]``) are installed."""
+        dist = entry_point.dist
+        if not entry_point.extras or dist is None:
+            return True
+
+        for requirement in dist.requires or []:
+            req = Requirement(requirement)
+            if req.marker is None or not any(
+                req.marker.evaluate({"extra": extra}) for extra in entry_point.extras
+            ):
+                continue
+            try:
+                importlib_metadata.distribution(req.name)
+            except importlib_metadata.PackageNotFoundError:
+                return False
+        return True
+
     def _get_external_provider_config_paths(
         self,
         entry_point: importlib_metadata.EntryPoint,
@@ -220,6 +235,8 @@ class PluginManager:
                 raise MisconfiguredError(
                     f"No search plugin configured for {config.name}."
                 )
+            if self.queryables_cache is not None:
+                plugin.queryables_cache = self.queryables_cache
             return plugin
 
         configs: Optional[list[ProviderConfig]]
@@ -425,7 +442,7 @@ class PluginManager:
         :param options: The configuration parameters of the cruncher
         :returns: The cruncher named `name`
         """
-        klass = Crunch.get_plugin_by_class_name(name)
+        klass = Crunch.load_plugin(name)
         return klass(options)
 
     def sort_providers(self) -> None:
@@ -487,9 +504,9 @@ class PluginManager:
         )
         if cached_instance is not None:
             return cached_instance
-        plugin_class = EODAGPluginMount.get_plugin_by_class_name(
-            topic_class, getattr(plugin_conf, "type")
-        )
+        # plugin module is imported from its entry point when first needed
+        plugin_class = topic_class.load_plugin(getattr(plugin_conf, "type"))
+        normalize_plugin_config(provider, plugin_conf, plugin_class)
         plugin: Union[Api, Search, Download, Authentication, Crunch] = plugin_class(
             provider, plugin_conf
         )
@@ -17,12 +17,13 @@
 # limitations under the License.
 from __future__ import annotations
 
+import functools
 import logging
 import re
 from typing import TYPE_CHECKING, Annotated
 
 import orjson
-from pydantic import AliasChoices
+from pydantic import AliasChoices, BaseModel
 from pydantic import ValidationError as PydanticValidationError
 from pydantic.fields import Field, FieldInfo
 
@@ -39,6 +40,7 @@ from eodag.types.queryables import Queryables, QueryablesDict
 from eodag.types.search_args import SortByList
 from eodag.types.stac_metadata import CommonStacMetadata, create_stac_metadata_model
 from eodag.utils import (
+    DEFAULT_QUERYABLES_CACHE_TTL,
     GENERIC_COLLECTION,
     deepcopy,
     format_dict_items,
@@ -47,11 +49,12 @@ from eodag.utils import (
     string_to_jsonpath,
     update_nested_dict,
 )
+from eodag.utils.cache import TTLCache
 from eodag.utils.dates import get_datetime
 from eodag.utils.exceptions import ValidationError
 
 if TYPE_CHECKING:
-    from typing import Any, Optional, Union
+    from typing import Any, Callable, Optional, Union
 
     from mypy_boto3_s3 import S3ServiceResource
     from requests.auth import AuthBase
@@ -73,6 +76,8 @@ class Search(PluginTopic):
     next_page_query_obj: Optional[dict[str, Any]]
     total_items_nb: int
     need_count: bool
+    #: queryables cache shared by plugins, set by :class:`~eodag.plugins.manager.PluginManager`
+    queryables_cache: Optional[TTLCache] = None
 
     def __init__(self, provider: str, config: PluginConfig) -> None:
         super(Search, self).__init__(provider, config)
@@ -479,6 +484,29 @@ class Search(PluginTopic):
                 **all_queryables,
             )
 
+    def get_queryables_cache(self) -> TTLCache:
+        """
+        Get the shared queryables cache, or a plugin-level in-memory cache if none was given.
+
+        :returns: queryables cache of the plugin
+        """
+        if self.queryables_cache is None:
+            self.queryables_cache = TTLCache(ttl=DEFAULT_QUERYABLES_CACHE_TTL)
+        return self.queryables_cache
+
+    def fetch_queryables_data(self, url: str, fetch: Callable[[], Any]) -> Any:
+        """
+        Fetch raw data needed to build queryables (queryables, forms, constraints),
+        using :meth:`get_queryables_cache`.
+
+        :param url: url from which the data is fetched, used as cache key
+        :param fetch: callable fetching and returning the JSON-serializable data
+        :returns: fetched data
+        """
+        return self.get_queryables_cache().get_or_set(
+            (self.provider, "data", url), fetch, persist=True
+        )
+
     def validate(
         self,
         search_params: dict[str, Any],
@@ -533,8 +561,10 @@ class Search(PluginTopic):
         queryables_model = create_stac_metadata_model(
             base_models=[Queryables, CommonStacMetadata]
         )
-        eodag_queryables = model_fields_to_annotated(queryables_model.model_fields)
-        queryables["collection"] = eodag_queryables.pop("collection")
+        queryables_fields = queryables_model.model_fields
+        queryables["collection"] = model_fields_to_annotated(
+            {"collection": queryables_fields["collection"]}
+        )["collection"]
         # add default value for collection
         if collection_or_alias := alias or collection:
             queryables["collection"] = Annotated[
@@ -544,27 +574,21 @@ class Search(PluginTopic):
         # provider prefix regex
         prefix_re = re.compile(r"^" + re.escape(self.provider) + r"[_:]")
 
-        for k, v in eodag_queryables.items():
-            field_info = queryables_model.model_fields[k]
-            queryable_alias = field_info.alias
-            # Collect every alias under which the queryable could appear in the
-            # metadata_mapping (model field name + declared alias(es)).
-            candidates = (
-                [a[0] for a in queryable_alias.convert_to_aliases()]
-                if isinstance(queryable_alias, AliasChoices)
-                else [queryable_alias]
-            )
-            candidates.append(k)
+        # only convert the selected fields, as converting copies them
+        selected_fields: dict[str, FieldInfo] = {}
+        for k, candidates in _get_fields_aliases(queryables_model).items():
+            if k == "collection":
+                continue
             # Core search strips the ``<provider>:`` / ``<provider>_`` prefix
             # from user-supplied keys before sending them to the plugin, so the
             # metadata_mapping may store the queryable under its unprefixed name.
             in_metadata = any(
                 c in metadata_mapping or prefix_re.sub("", c) in metadata_mapping
                 for c in candidates
-                if c
             )
-            if field_info.is_required() or in_metadata:
-                queryables[k] = v
+            if queryables_fields[k].is_required() or in_metadata:
+                selected_fields[k] = queryables_fields[k]
+        queryables.update(model_fields_to_annotated(selected_fields))
         return queryables
 
     def get_assets_from_mapping(self, provider_item: dict[str, Any]) -> dict[str, Any]:
@@ -598,3 +622,25 @@ class Search(PluginTopic):
             assets[key] = deepcopy(values)
             assets[key]["href"] = url_path
         return assets
+
+
+@functools.lru_cache(maxsize=None)
+def _get_fields_aliases(model: type[BaseModel]) -> dict[str, list[str]]:
+    """Every name under which each field of the given model could appear in a
+    metadata_mapping (model field name + declared alias(es)).
+
+    :param model: pydantic model, cached models from
+                  :func:`~eodag.types.stac_metadata.create_stac_metadata_model` are expected
+    :returns: field names associated to their aliases
+    """
+    fields_aliases: dict[str, list[str]] = {}
+    for k, field_info in model.model_fields.items():
+        queryable_alias = field_info.alias
+        candidates = (
+            [a[0] for a in queryable_alias.convert_to_aliases()]
+            if isinstance(queryable_alias, AliasChoices)
+            else [queryable_alias]
+        )
+        candidates.append(k)
+        fields_aliases[k] = [str(c) for c in candidates if c]
+    return fields_aliases
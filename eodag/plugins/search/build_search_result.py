@@ -22,8 +22,9 @@ import hashlib
 import logging
 import re
 from collections import OrderedDict
+from functools import partial
 from types import MethodType
-from typing import TYPE_CHECKING, Annotated, Any, Optional
+from typing import TYPE_CHECKING, Annotated, Any, Optional, Union
 from urllib.parse import quote_plus, unquote_plus
 
 import geojson
@@ -59,7 +60,6 @@ from eodag.utils import (
     get_geometry_from_ecmwf_location,
     get_geometry_from_various,
 )
-from eodag.utils.cache import instance_cached_method
 from eodag.utils.dates import (
     COMPACT_DATE_RANGE_PATTERN,
     DATE_RANGE_PATTERN,
@@ -258,6 +258,57 @@ def ecmwf_temporal_to_eodag(
         return None, None
 
 
+class ConstraintsIndex:
+    """Index of a provider constraints list, associating each keyword value to the bitset
+    of the constraint entries containing it. Filtering constraints is then done using
+    bitsets intersections, ``1 << i`` standing for the ``i``-th constraint entry.
+
+    The index and its constraints must not be modified once built.
+
+    :param constraints: list of constraints received from the provider
+    """
+
+    def __init__(self, constraints: list[dict[str, Any]]) -> None:
+        self.constraints = constraints
+        #: bitset of all the constraint entries
+        self.all_entries = (1 << len(constraints)) - 1
+        #: ordered constraint keywords
+        self.keywords: list[str] = list(
+            OrderedDict.fromkeys(k for c in constraints for k in c.keys())
+        )
+        #: keywords present in all the constraint entries
+        self.required_keywords: set[str] = set(self.keywords)
+        #: constraint entries bitset per keyword and value
+        self.entries: dict[str, dict[Any, int]] = {k: {} for k in self.keywords}
+        #: constraint entries bitset per date interval value
+        self.date_intervals: dict[str, int] = {}
+
+        for i, constraint in enumerate(constraints):
+            self.required_keywords &= constraint.keys()
+            bit = 1 << i
+            for keyword, values in constraint.items():
+                keyword_entries = self.entries[keyword]
+                for value in values:
+                    keyword_entries[value] = keyword_entries.get(value, 0) | bit
+                    if keyword == "date" and "/" in value:
+                        self.date_intervals[value] = (
+                            self.date_intervals.get(value, 0) | bit
+                        )
+
+    def values(self, keyword: str, entries: int) -> set[Any]:
+        """Values of the given keyword in the given constraint entries
+
+        :param keyword: constraint keyword
+        :param entries: bitset of constraint entries
+        :returns: set of values
+        """
+        return {
+            value
+            for value, value_entries in self.entries.get(keyword, {}).items()
+            if value_entries & entries
+        }
+
+
 class ECMWFSearch(PostJsonSearch):
     """ECMWF search plugin.
 
@@ -626,7 +677,7 @@ class ECMWFSearch(PostJsonSearch):
         product_dq = col_config.get("discover_queryables", {}) or {}
         dq_conf = {**provider_dq, **product_dq, **queryables_config}
         constraints_url = format_metadata(dq_conf.get("constraints_url", ""), **filters)
-        constraints: list[dict[str, Any]] = self._fetch_data(constraints_url)
+        constraints_index = self._fetch_constraints_index(constraints_url)
 
         form_url = format_metadata(dq_conf.get("form_url", ""), **filters)
         form: list[dict[str, Any]] = self._fetch_data(form_url)
@@ -661,20 +712,18 @@ class ECMWFSearch(PostJsonSearch):
         required_keywords: set[str] = set()
 
         # calculate available values
-        if constraints:
+        if constraints_index.constraints:
             # Apply constraints filtering
             available_values = self.available_values_from_constraints(
-                constraints,
+                constraints_index,
                 non_empty_formated,
                 form,
             )
 
-            # Pre-compute the required keywords (present in all constraint dicts)
+            # required keywords (present in all constraint dicts)
             # when form, required keywords are extracted directly from form
             if not form:
-                required_keywords = set.intersection(
-                    *(map(lambda d: set(d.keys()), constraints))
-                )
+                required_keywords = constraints_index.required_keywords
 
         else:
             values_url = getattr(self.config, "available_values_url", "")
@@ -746,7 +795,7 @@ class ECMWFSearch(PostJsonSearch):
 
     def available_values_from_constraints(
         self,
-        constraints: list[dict[str, Any]],
+        constraints: Union[list[dict[str, Any]], ConstraintsIndex],
         input_keywords: dict[str, Any],
         form: list[dict[str, Any]],
     ) -> dict[str, list[str]]:
@@ -754,30 +803,31 @@ class ECMWFSearch(PostJsonSearch):
         Filter constraints using input_keywords. Return list of available queryables.
         All constraint entries must have the same parameters.
 
-        :param constraints: list of constraints received from the provider
+        :param constraints: list of constraints received from the provider, or its index
         :param input_keywords: dict of input parameters given by the user
         :param form: form received from the provider
         :return: dict with available values for each parameter
         """
+        index = (
+            constraints
+            if isinstance(constraints, ConstraintsIndex)
+            else ConstraintsIndex(constraints)
+        )
+
         # get form keywords and form required keywords
         form_keywords = [f["name"] for f in form]
         required_by_form = [f["name"] for f in form if f.get("required", False)]
 
-        # get ordered constraint keywords
-        constraints_keywords = list(
-            OrderedDict.fromkeys(k for c in constraints for k in c.keys())
-        )
-
         # prepare ordered input keywords formatted as provider's keywords
         # required to filter with constraints
         ordered_keywords = (
-            [kw for kw in form_keywords if kw in constraints_keywords]
+            [kw for kw in form_keywords if kw in index.keywords]
             if form_keywords
-            else constraints_keywords
+            else index.keywords
         )
 
-        # filter constraint entries matching input keyword values
-        filtered_constraints: list[dict[str, Any]]
+        # bitset of the constraint entries matching input keyword values
+        entries = index.all_entries
 
         parsed_keywords: list[str] = []
         for keyword in ordered_keywords:
@@ -816,61 +866,50 @@ class ECMWFSearch(PostJsonSearch):
             if keyword.split(":")[-1] == "time":
                 filter_v = ["0000" if str(v) == "0" else v for v in filter_v]
 
-            # Collect missing values to report errors
+            # Filter constraint entries and collect missing values to report errors
             missing_values = set(filter_v)
-
-            # Filter constraints and check for missing values
-            filtered_constraints = []
-            for entry in constraints:
-                # Filter based on the presence of any value in filter_v
-                entry_values = entry.get(keyword, [])
-
-                # date constraint may be intervals. We identify intervals with a "/" in the value.
-                # date constraint can be a mixed list of single values (e.g "2023-06-27")
-                # and intervals (e.g. "2024-11-12/2025-11-20").
-                # collections with mixed values: CAMS_GAC_FORECAST, CAMS_EU_AIR_QUALITY_FORECAST
-                present_values = []
-                for entry_value in entry_values:
-                    if keyword == "date" and "/" in entry_value:
-                        input_range = values
-                        if isinstance(values, list):
-                            input_range = values[0]
-                        if "/" not in input_range:
-                            input_range = f"{input_range}/{input_range}"
-                        if is_range_in_range(entry_value, input_range):
-                            present_values.extend(filter_v)
-                    else:
-                        new_values = [
-                            value for value in filter_v if value == entry_value
-                        ]
-                        present_values.extend(new_values)
-
-                # Remove present values from the missing_values set
-                missing_values -= set(present_values)
-
-                if present_values:
-                    filtered_constraints.append(entry)
+            filtered_entries = 0
+            keyword_entries = index.entries.get(keyword, {})
+            for value in filter_v:
+                # date intervals are only matched below
+                if keyword == "date" and "/" in value:
+                    continue
+                if value_entries := keyword_entries.get(value, 0) & entries:
+                    filtered_entries |= value_entries
+                    missing_values.discard(value)
+
+            # date constraint may be intervals. We identify intervals with a "/" in the value.
+            # date constraint can be a mixed list of single values (e.g "2023-06-27")
+            # and intervals (e.g. "2024-11-12/2025-11-20").
+            # collections with mixed values: CAMS_GAC_FORECAST, CAMS_EU_AIR_QUALITY_FORECAST
+            if keyword == "date":
+                for interval, interval_entries in index.date_intervals.items():
+                    if not (interval_entries := interval_entries & entries):
+                        continue
+                    input_range = values[0] if isinstance(values, list) else values
+                    if "/" not in input_range:
+                        input_range = f"{input_range}/{input_range}"
+                    if is_range_in_range(interval, input_range):
+                        filtered_entries |= interval_entries
+                        missing_values.clear()
 
             any_value_allowed = False
-            if not filtered_constraints or missing_values:
-                allowed_values = list(
-                    {value for c in constraints for value in c.get(keyword, [])}
-                )
+            if not filtered_entries or missing_values:
                 # if keyword in required_by_form then any_value_allowed = False:
                 #   use constraints file to determine if the parameter matches the allowed values
                 # if allowed_values is not empty then any_value_allowed = False:
                 #   use constraints file to determine if the parameter matches the allowed values
-                if keyword not in required_by_form and not allowed_values:
+                if keyword not in required_by_form and not index.values(
+                    keyword, entries
+                ):
                     # keyword not required by form and the list of allowed values is empty:
                     # accept any value for this keyword
                     any_value_allowed = True
 
             # raise an error as no constraint entry matched the input keywords
             # raise an error if one value from input is not allowed
-            if not any_value_allowed and (not filtered_constraints or missing_values):
-                allowed_values = list(
-                    {value for c in constraints for value in c.get(keyword, [])}
-                )
+            if not any_value_allowed and (not filtered_entries or missing_values):
+                allowed_values = list(index.values(keyword, entries))
                 # restore ecmwf: prefix before raising error
                 keyword = ECMWF_PREFIX + keyword
 
@@ -903,15 +942,14 @@ class ECMWFSearch(PostJsonSearch):
             parsed_keywords.append(keyword)
             if not any_value_allowed:
                 # the parameter must match the allowed values in the constraints file
-                constraints = filtered_constraints
+                entries = filtered_entries
             # else any value is allowed
 
-        available_values: dict[str, Any] = {k: set() for k in ordered_keywords}
-
         # we aggregate the constraint entries left
-        for entry in constraints:
-            for key, value in entry.items():
-                available_values[key].update(value)
+        available_values: dict[str, Any] = {k: set() for k in ordered_keywords}
+        for keyword in index.keywords:
+            if keyword_values := index.values(keyword, entries):
+                available_values.setdefault(keyword, set()).update(keyword_values)
 
         return {k: list(v) for k, v in available_values.items()}
 
@@ -1080,10 +1118,10 @@ class ECMWFSearch(PostJsonSearch):
 
         return qp
 
-    @instance_cached_method()
     def _fetch_data(self, url: str) -> Any:
         """
-        fetches from a provider elements like constraints or forms.
+        fetches from a provider elements like constraints or forms, using the shared
+        queryables cache if available.
 
         :param url: url from which the constraints can be fetched
         :returns: json file content fetched from the provider
@@ -1097,7 +1135,26 @@ class ECMWFSearch(PostJsonSearch):
             else None
         )
         timeout = getattr(self.config, "timeout", DEFAULT_SEARCH_TIMEOUT)
-        return fetch_json(url, auth=auth, timeout=timeout)
+        return self.fetch_queryables_data(
+            url, partial(fetch_json, url, auth=auth, timeout=timeout)
+        )
+
+    def _fetch_constraints_index(self, url: str) -> ConstraintsIndex:
+        """
+        fetches constraints from the provider and indexes them. The index is cached
+        alongside the fetched constraints.
+
+        :param url: url from which the constraints can be fetched
+        :returns: index of the constraints
+        """
+        if not url:
+            return ConstraintsIndex([])
+
+        return self.get_queryables_cache().get_or_set(
+            (self.provider, "constraints_index", url),
+            lambda: ConstraintsIndex(self._fetch_data(url)),
+            copy_value=False,
+        )
 
     def normalize_results(
         self, results: RawSearchResult, **kwargs: Any
@@ -40,6 +40,7 @@ from eodag.plugins.search.static_stac_search import StaticStacSearch
 from eodag.utils import get_bucket_name_and_prefix, get_geometry_from_various
 from eodag.utils.dates import parse_to_utc, to_iso_utc_string
 from eodag.utils.exceptions import RequestError, UnsupportedCollection, ValidationError
+from eodag.utils.s3 import iter_s3_pages
 
 if TYPE_CHECKING:
     from mypy_boto3_s3 import S3Client
@@ -411,31 +412,17 @@ class CopMarineSearch(StaticStacSearch):
                         break
                     continue
 
-            stop_search = False
-            current_object = None
-            while not stop_search:
-                # list_objects returns max 1000 objects -> use marker to get next objects
-                if current_object:
-                    s3_objects = s3_client.list_objects(
-                        Bucket=bucket, Prefix=collection_path, Marker=current_object
-                    )
-                else:
-                    s3_objects = s3_client.list_objects(
-                        Bucket=bucket, Prefix=collection_path
-                    )
-                if "Contents" not in s3_objects:
-                    if len(products) == 0 and i == len(datasets_items_list) - 1:
-                        result = SearchResult([])
-                        if prep.count:
-                            result.number_matched = 0
-                        return result
-                    else:
-                        break
-                elif len(s3_objects["Contents"]) == 0:
-                    stop_search = True
-                    break
-
-                for obj in s3_objects["Contents"]:
+            listed_objects = False
+            for s3_objects in iter_s3_pages(
+                s3_client,
+                bucket,
+                collection_path,
+                namespace=self.provider,
+                FetchOwner=True,
+            ):
+                listed_objects = listed_objects or bool(s3_objects)
+                stop_search = False
+                for obj in s3_objects:
                     item_key = obj["Key"]
                     item_id = os.path.splitext(item_key.split("/")[-1])[0]
                     # filter according to date(s) in item id
@@ -458,9 +445,7 @@ class CopMarineSearch(StaticStacSearch):
                             )
                             if product:
                                 return SearchResult([product], 1)
-                        if len(s3_objects["Contents"]) > 0:
-                            current_object = s3_objects["Contents"][-1]["Key"]
-                            continue
+                        continue
 
                     item_start = None
                     item_end = None
@@ -532,10 +517,21 @@ class CopMarineSearch(StaticStacSearch):
                             )
                             if product:
                                 products.append(product)
-                    current_object = item_key
                     if len(products) >= limit and not prep.count:
                         stop_search = True
                         break
+                if stop_search:
+                    break
+
+            if (
+                not listed_objects
+                and not products
+                and i == len(datasets_items_list) - 1
+            ):
+                result = SearchResult([])
+                if prep.count:
+                    result.number_matched = 0
+                return result
 
         search_params = (
             kwargs
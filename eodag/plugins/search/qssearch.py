@@ -477,34 +477,55 @@ class QueryStringSearch(Search):
             # no pagination
             return self.discover_collections_per_page(**kwargs)
 
+        # number of pages fetched concurrently, next pages are requested by windows
+        concurrent_pages = max(
+            1, self.config.discover_collections.get("concurrent_pages", 1)
+        )
+
         conf_update_dict: dict[str, Any] = {
             "providers_config": {},
             "collections_config": {},
         }
 
+        def fetch_page(page_num: int) -> Optional[dict[str, Any]]:
+            fetch_url = next_page_url_tpl.format(
+                url=unpaginated_fetch_url, page=page_num
+            )
+            return self.discover_collections_per_page(fetch_url=fetch_url, **kwargs)
+
         while True:
-            fetch_url = next_page_url_tpl.format(url=unpaginated_fetch_url, page=page)
+            pages_range = range(page, page + concurrent_pages)
+            if concurrent_pages > 1:
+                with concurrent.futures.ThreadPoolExecutor(
+                    max_workers=concurrent_pages
+                ) as executor:
+                    pages_conf_update = list(executor.map(fetch_page, pages_range))
+            else:
+                pages_conf_update = [fetch_page(page)]
 
-            conf_update_dict_per_page = self.discover_collections_per_page(
-                fetch_url=fetch_url, **kwargs
-            )
+            # pages are merged in order, stopping at the first empty one
+            last_page_reached = False
+            for conf_update_dict_per_page in pages_conf_update:
+                if (
+                    not conf_update_dict_per_page
+                    or not conf_update_dict_per_page.get("providers_config")
+                    or conf_update_dict_per_page.items() <= conf_update_dict.items()
+                ):
+                    # conf_update_dict_per_page is empty or a subset on existing conf
+                    last_page_reached = True
+                    break
+                else:
+                    conf_update_dict["providers_config"].update(
+                        conf_update_dict_per_page["providers_config"]
+                    )
+                    conf_update_dict["collections_config"].update(
+                        conf_update_dict_per_page["collections_config"]
+                    )
 
-            if (
-                not conf_update_dict_per_page
-                or not conf_update_dict_per_page.get("providers_config")
-                or conf_update_dict_per_page.items() <= conf_update_dict.items()
-            ):
-                # conf_update_dict_per_page is empty or a subset on existing conf
+            if last_page_reached:
                 break
-            else:
-                conf_update_dict["providers_config"].update(
-                    conf_update_dict_per_page["providers_config"]
-                )
-                conf_update_dict["collections_config"].update(
-                    conf_update_dict_per_page["collections_config"]
-                )
 
-            page += 1
+            page += concurrent_pages
 
         return conf_update_dict
 
@@ -2218,15 +2239,15 @@ class StacSearch(PostJsonSearch):
                 if hasattr(self, "auth") and isinstance(self.auth, AuthBase)
                 else None
             )
-            response = QueryStringSearch._request(
-                self,
-                PreparedSearch(
-                    url=fetch_url,
-                    auth=auth,
-                    info_message="Fetching queryables: {}".format(fetch_url),
-                    exception_message="Skipping error while fetching queryables for "
-                    "{} {} instance:".format(self.provider, self.__class__.__name__),
-                ),
+            prep = PreparedSearch(
+                url=fetch_url,
+                auth=auth,
+                info_message="Fetching queryables: {}".format(fetch_url),
+                exception_message="Skipping error while fetching queryables for "
+                "{} {} instance:".format(self.provider, self.__class__.__name__),
+            )
+            resp_as_json = self.fetch_queryables_data(
+                fetch_url, lambda: QueryStringSearch._request(self, prep).json()
             )
         except (KeyError, AttributeError) as e:
             raise PluginImplementationError(
@@ -2237,8 +2258,6 @@ class StacSearch(PostJsonSearch):
         else:
             json_queryables = dict()
             try:
-                resp_as_json = response.json()
-
                 # extract results from response json
                 results_entry = self.config.discover_queryables["results_entry"]
                 if not isinstance(results_entry, JSONPath):
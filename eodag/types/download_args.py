@@ -31,7 +31,8 @@ class DownloadConf(TypedDict, total=False):
     :cvar extract: whether to extract the downloaded products, only applies to archived products
     :cvar dl_url_params: additional parameters to pass over to the download url as an url parameter
     :cvar delete_archive: whether to delete the downloaded archives
-    :cvar asset: regex filter to identify assets to download
+    :cvar stream_extract: whether to extract archives while they are downloaded, without writing them to disk
+    :cvar asset: regex filter to identify assets to download, or archive members to extract
     """
 
     output_dir: str
@@ -39,4 +40,5 @@ class DownloadConf(TypedDict, total=False):
     extract: bool
     dl_url_params: dict[str, str]
     delete_archive: bool
+    stream_extract: bool
     asset: Optional[str]
@@ -17,8 +17,10 @@
 # limitations under the License.
 from __future__ import annotations
 
+import hashlib
 import re
-from collections import UserDict
+import threading
+from collections import OrderedDict, UserDict
 from typing import TYPE_CHECKING, Annotated, Any, Optional, Union, cast
 
 from annotated_types import Lt
@@ -209,6 +211,14 @@ class Queryables(CommonQueryables):
         raise ValueError("date not allowed")
 
 
+#: maximum number of models cached by :meth:`QueryablesDict.get_model`
+QUERYABLES_MODELS_CACHE_SIZE = 128
+
+#: models cached by :meth:`QueryablesDict.get_model`, per name and queryables definitions hash
+_queryables_models: OrderedDict[tuple[str, str], BaseModel] = OrderedDict()
+_queryables_models_lock = threading.Lock()
+
+
 class QueryablesDict(UserDict[str, Any]):
     """Class inheriting from UserDict which contains queryables with their annotated type;
 
@@ -320,7 +330,29 @@ class QueryablesDict(UserDict[str, Any]):
         Converts object from :class:`eodag.api.product.QueryablesDict` to :class:`pydantic.BaseModel`
         so that validation can be performed
 
+        Models are cached per name and queryables definitions, see :meth:`clear_models_cache`.
+
         :param model_name: name used for :class:`pydantic.BaseModel` creation
         :return: pydantic BaseModel of the queryables dict
         """
-        return annotated_dict_to_model(model_name, self.data, Queryables)
+        key = (
+            model_name,
+            hashlib.sha1(repr(sorted(self.data.items())).encode("utf-8")).hexdigest(),
+        )
+        with _queryables_models_lock:
+            if (model := _queryables_models.get(key)) is not None:
+                _queryables_models.move_to_end(key)
+                return model
+
+        model = annotated_dict_to_model(model_name, self.data, Queryables)
+        with _queryables_models_lock:
+            _queryables_models[key] = model
+            if len(_queryables_models) > QUERYABLES_MODELS_CACHE_SIZE:
+                _queryables_models.popitem(last=False)
+        return model
+
+    @staticmethod
+    def clear_models_cache() -> None:
+        """Clear the cache of models created by :meth:`get_model`."""
+        with _queryables_models_lock:
+            _queryables_models.clear()
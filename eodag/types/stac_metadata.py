@@ -292,6 +292,20 @@ class CommonStacMetadata(ItemProperties):
         return cls.model_validate(valid)
 
 
+#: created STAC metadata models, with the extensions used as key kept alive to keep their ids unique
+_stac_metadata_models: dict[
+    tuple[Any, ...], tuple[list[BaseStacExtension], type[BaseModel]]
+] = {}
+
+
+def clear_stac_metadata_models_cache() -> None:
+    """Clear the cache of models created by :func:`create_stac_metadata_model`.
+
+    Needed if the extensions used to create cached models were modified in place.
+    """
+    _stac_metadata_models.clear()
+
+
 def create_stac_metadata_model(
     extensions: list[BaseStacExtension] = STAC_EXTENSIONS,
     base_models: list[type[BaseModel]] = [CommonStacMetadata],
@@ -299,11 +313,21 @@ def create_stac_metadata_model(
 ) -> type[BaseModel]:
     """Create a pydantic model to validate item properties.
 
+    Created models are cached per extensions, base models and class name, see
+    :func:`clear_stac_metadata_models_cache`.
+
+    >>> create_stac_metadata_model() is create_stac_metadata_model()
+    True
+
     :param extensions: list of STAC extensions to include in the model
     :param base_model: base model to extend
     :param class_name: name of the created model
     :returns: pydantic model class
     """
+    cache_key = (tuple(id(e) for e in extensions), tuple(base_models), class_name)
+    if cached := _stac_metadata_models.get(cache_key):
+        return cached[1]
+
     extension_models: list[type[BaseModel]] = []
 
     # Check extensions for additional parameters to include
@@ -342,6 +366,7 @@ def create_stac_metadata_model(
     for key in duplicates:
         model.model_fields.pop(key)
 
+    _stac_metadata_models[cache_key] = (list(extensions), model)
     return model
 
 
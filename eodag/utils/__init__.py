@@ -57,13 +57,10 @@ else:
     from typing_extensions import Unpack  # noqa
 
 import orjson
-from tqdm.auto import tqdm
 
 from .exceptions import MisconfiguredError
-from .logging import get_disable_tqdm
 from .logging import logging as eodag_logging
 from .streamresponse import StreamResponse, StreamResponseContent
-from .yaml import LegacyAwareLoader, cached_yaml_load, cached_yaml_load_all
 
 if TYPE_CHECKING:
     from jsonpath_ng import JSONPath, jsonpath
@@ -72,6 +69,9 @@ if TYPE_CHECKING:
 
     from eodag.api.product._product import EOProduct
 
+    from .progress import AggregatedProgressCallback, ProgressCallback
+    from .yaml import LegacyAwareLoader, cached_yaml_load, cached_yaml_load_all
+
 
 logger = py_logging.getLogger("eodag.utils")
 
@@ -122,6 +122,47 @@ REQ_RETRY_STATUS_FORCELIST = [401, 429, 500, 502, 503, 504]
 DEFAULT_DOWNLOAD_WAIT = 0.2
 #: default timeout (in minutes) for download attempts
 DEFAULT_DOWNLOAD_TIMEOUT = 10
+#: default maximum number of concurrent connections used to download a single file by ranges, can be overridden
+#: using :attr:`~eodag.config.PluginConfig.download_segments` or the ``EODAG_DOWNLOAD_SEGMENTS`` environment variable
+DEFAULT_DOWNLOAD_SEGMENTS = 4
+#: default size (in bytes) of the ranges requested for segmented downloads, smaller files are downloaded
+#: using a single connection
+DEFAULT_DOWNLOAD_SEGMENT_SIZE = 16 * 1024 * 1024
+#: default number of times a download is retried if its checksum does not match the expected one, can be
+#: overridden using :attr:`~eodag.config.PluginConfig.checksum_retries`
+DEFAULT_CHECKSUM_RETRIES = 2
+#: default maximum size (in bytes) of the products cache enabled using the ``EODAG_PRODUCTS_CACHE_DIR`` environment
+#: variable, can be overridden using the ``EODAG_PRODUCTS_CACHE_MAX_SIZE`` environment variable
+DEFAULT_PRODUCTS_CACHE_MAX_SIZE = 50 * 1024 * 1024 * 1024
+#: default maximum number of concurrent order status checks of the products downloaded by
+#: :meth:`~eodag.api.core.EODataAccessGateway.download_all`
+DEFAULT_ORDER_POLL_MAX_WORKERS = 4
+#: default maximum delay (in seconds) between two order status checks of a product downloaded by
+#: :meth:`~eodag.api.core.EODataAccessGateway.download_all`, unless the download ``wait`` time is longer
+DEFAULT_ORDER_POLL_MAX_INTERVAL = 600
+#: default time (in seconds) after which the claim of a product in a download journal expires if it is not
+#: refreshed by the process downloading it
+DEFAULT_DOWNLOAD_JOURNAL_LEASE = 60
+#: default time-to-live (in seconds) of cached S3 prefix listings, can be overridden using the
+#: ``EODAG_S3_LISTING_CACHE_TTL`` environment variable
+DEFAULT_S3_LISTING_CACHE_TTL = 600
+#: default size (in bytes) of the parts of the multipart uploads transferring products to an object storage
+DEFAULT_UPLOAD_PART_SIZE = 16 * 1024 * 1024
+#: default maximum number of parts concurrently uploaded when transferring a product to an object storage
+DEFAULT_UPLOAD_MAX_CONCURRENCY = 4
+#: default interval (in seconds) between two updates of the progress bars of products downloads
+DEFAULT_PROGRESS_FLUSH_INTERVAL = 0.1
+
+#: default time-to-live (in seconds) of the cached metadata of assets probed using ``HEAD`` requests, can be
+#: overridden using the ``EODAG_ASSET_HEADERS_CACHE_TTL`` environment variable
+DEFAULT_ASSET_HEADERS_CACHE_TTL = 600
+#: default maximum number of providers concurrently fetched for collections discovery
+DEFAULT_DISCOVER_MAX_WORKERS = 8
+#: default time-to-live (in seconds) of cached queryables, can be overridden using the
+#: ``EODAG_QUERYABLES_CACHE_TTL`` environment variable
+DEFAULT_QUERYABLES_CACHE_TTL = 3600
+#: default time (in seconds) during which expired queryables are still returned while being refreshed
+DEFAULT_QUERYABLES_CACHE_STALE_TTL = 86400
 
 #: default token expiration margin (in seconds). Safety buffer to prevent token rejection from unexpected expiry
 #: between validity check and request. Default value of :attr:`~eodag.config.PluginConfig.token_expiration_margin`
@@ -179,6 +220,15 @@ mimetypes.add_type("image/jp2", ".jp2")
 
 _DEFAULT_SHAPELY_GEOMETRY = None
 
+# names re-exported from submodules depending on heavy libraries (tqdm, yaml)
+_LAZY_IMPORTS: dict[str, tuple[str, str]] = {
+    "ProgressCallback": (".progress", "ProgressCallback"),
+    "AggregatedProgressCallback": (".progress", "AggregatedProgressCallback"),
+    "LegacyAwareLoader": (".yaml", "LegacyAwareLoader"),
+    "cached_yaml_load": (".yaml", "cached_yaml_load"),
+    "cached_yaml_load_all": (".yaml", "cached_yaml_load_all"),
+}
+
 
 def _build_float_range_cls() -> type:
     """Build the :class:`FloatRange` class lazily to avoid importing ``click`` at
@@ -254,6 +304,13 @@ def __getattr__(name: str):
         cls = _build_float_range_cls()
         globals()["FloatRange"] = cls
         return cls
+    if name in _LAZY_IMPORTS:
+        from importlib import import_module
+
+        module_path, attr_name = _LAZY_IMPORTS[name]
+        value = getattr(import_module(module_path, __name__), attr_name)
+        globals()[name] = value
+        return value
     raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
@@ -525,60 +582,6 @@ class DownloadedCallback:
         logger.debug("Download finished for the product %s", product)
 
 
-class ProgressCallback(tqdm):
-    """A callable used to render progress to users for long running processes.
-
-    It inherits from :class:`tqdm.auto.tqdm`, and accepts the same arguments on
-    instantiation: ``iterable``, ``desc``, ``total``, ``leave``, ``file``, ``ncols``,
-    ``mininterval``, ``maxinterval``, ``miniters``, ``ascii``, ``disable``, ``unit``,
-    ``unit_scale``, ``dynamic_ncols``, ``smoothing``, ``bar_format``, ``initial``,
-    ``position``, ``postfix``, ``unit_divisor``.
-
-    It can be globally disabled using ``eodag.utils.logging.setup_logging(0)`` or
-    ``eodag.utils.logging.setup_logging(level, no_progress_bar=True)``, and
-    individually disabled using ``disable=True``.
-    """
-
-    def __init__(self, *args: Any, **kwargs: Any) -> None:
-        self.kwargs = kwargs.copy()
-        if "unit" not in kwargs:
-            kwargs["unit"] = "B"
-        if "unit_scale" not in kwargs:
-            kwargs["unit_scale"] = True
-        if "desc" not in kwargs:
-            kwargs["desc"] = ""
-        if "position" not in kwargs:
-            kwargs["position"] = 0
-        if "disable" not in kwargs:
-            kwargs["disable"] = get_disable_tqdm()
-        if "dynamic_ncols" not in kwargs:
-            kwargs["dynamic_ncols"] = True
-
-        super(ProgressCallback, self).__init__(*args, **kwargs)
-
-    def __call__(self, increment: int, total: Optional[int] = None) -> None:
-        """Update the progress bar.
-
-        :param increment: Amount of data already processed
-        :param total: (optional) Maximum amount of data to be processed
-        """
-        if total is not None and total != self.total:
-            self.reset(total=total)
-
-        self.update(increment)
-
-    def copy(self, *args: Any, **kwargs: Any) -> ProgressCallback:
-        """Returns another progress callback using the same initial
-        keyword-arguments.
-
-        Optional ``args`` and ``kwargs`` parameters will be used to create a
-        new :class:`~eodag.utils.ProgressCallback` instance, overriding initial
-        `kwargs`.
-        """
-
-        return ProgressCallback(*args, **dict(self.kwargs, **kwargs))
-
-
 def repeatfunc(func: Callable[..., Any], n: int, *args: Any) -> starmap:
     """Call ``func`` ``n`` times with ``args``"""
     return starmap(func, repeat(args, n))
@@ -1883,6 +1886,7 @@ __all__ = [
     "StreamResponseContent",
     "DownloadedCallback",
     "ProgressCallback",
+    "AggregatedProgressCallback",
     "MockResponse",
     "Unpack",
     "_deprecated",
@@ -0,0 +1,515 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026, CS GROUP - France, https://www.csgroup.eu/
+#
+# This file is part of EODAG project
+#     https://www.github.com/CS-SI/EODAG
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Archives extraction from streams of bytes, without writing the archive to disk"""
+
+from __future__ import annotations
+
+import io
+import logging
+import os
+import re
+import struct
+import tarfile
+import threading
+import zipfile
+import zlib
+from typing import Callable, Iterable, Iterator, Optional
+
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger("eodag.utils.archives")
+
+#: size of the blocks read from the stream and written to extracted files
+_BLOCK_SIZE = 64 * 1024
+
+_LOCAL_FILE_HEADER = struct.Struct("<4s5H3L2H")
+_LOCAL_FILE_HEADER_SIGNATURE = b"PK\x03\x04"
+_DATA_DESCRIPTOR_SIGNATURE = b"PK\x07\x08"
+#: signatures of the central directory and end of central directory records
+_CENTRAL_DIRECTORY_SIGNATURES = (b"PK\x01\x02", b"PK\x05\x06", b"PK\x06\x06")
+_ZIP64_EXTRA_ID = 0x0001
+
+#: size of the end of a remote zip archive fetched to find its end of central directory
+#: record, which may be followed by a comment of up to 64 KiB
+_ZIP_TAIL_FETCH_SIZE = 64 * 1024 + 22
+_END_OF_CENTRAL_DIRECTORY = struct.Struct("<4s4H2LH")
+_ZIP64_END_OF_CENTRAL_DIRECTORY_LOCATOR = struct.Struct("<4sLQL")
+_ZIP64_END_OF_CENTRAL_DIRECTORY_SIZE = 56
+
+_FLAG_ENCRYPTED = 0x01
+_FLAG_DATA_DESCRIPTOR = 0x08
+_FLAG_UTF8 = 0x800
+
+
+class NotStreamableArchiveError(ValueError):
+    """Raised when an archive cannot be extracted from a stream and must be written
+    to disk first (e.g. zip stored entries using data descriptors)"""
+
+
+class ChunksReader(io.RawIOBase):
+    """Readable file object over an iterable of bytes chunks
+
+    >>> reader = ChunksReader([b"ab", b"", b"cde"])
+    >>> reader.read_exactly(3), reader.read()
+    (b'abc', b'de')
+    """
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self._chunks = iter(chunks)
+        self._pending = memoryview(b"")
+
+    def readable(self) -> bool:
+        """The reader is readable"""
+        return True
+
+    def readinto(self, buffer: bytearray) -> int:  # type: ignore[override]
+        """Read available bytes into the given buffer"""
+        while not self._pending:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._pending = memoryview(chunk)
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+    def unread(self, data: bytes) -> None:
+        """Push back data so that it is returned by the next reads"""
+        if data:
+            self._pending = memoryview(bytes(data) + bytes(self._pending))
+
+    def read_exactly(self, size: int) -> bytes:
+        """Read exactly ``size`` bytes
+
+        :raises: :class:`EOFError` if the stream ends before
+        """
+        data = bytearray()
+        while len(data) < size:
+            chunk = self.read(size - len(data))
+            if not chunk:
+                raise EOFError("Unexpected end of archive stream")
+            data += chunk
+        return bytes(data)
+
+
+def _member_path(dest_dir: str, name: str) -> str:
+    """Path where an archive member is extracted, ignoring absolute and parent
+    components like :meth:`zipfile.ZipFile.extract` does"""
+    parts = [
+        part
+        for part in name.replace("\\", "/").split("/")
+        if part not in ("", ".", "..")
+    ]
+    return os.path.join(dest_dir, *parts)
+
+
+def _zip64_sizes(
+    extra: bytes, compressed_size: int, file_size: int
+) -> tuple[int, int, bool]:
+    """Sizes of a zip entry, read from its zip64 extra field if any"""
+    offset = 0
+    while offset + 4 <= len(extra):
+        header_id, data_size = struct.unpack_from("<2H", extra, offset)
+        if header_id == _ZIP64_EXTRA_ID:
+            data = extra[offset + 4 : offset + 4 + data_size]
+            values = list(struct.unpack_from(f"<{len(data) // 8}Q", data))
+            if file_size == 0xFFFFFFFF and values:
+                file_size = values.pop(0)
+            if compressed_size == 0xFFFFFFFF and values:
+                compressed_size = values.pop(0)
+            return compressed_size, file_size, True
+        offset += 4 + data_size
+    return compressed_size, file_size, False
+
+
+def _copy_zip_entry_data(
+    reader: ChunksReader,
+    fh: Optional[io.BufferedWriter],
+    method: int,
+    compressed_size: Optional[int],
+) -> int:
+    """Copy the data of the current zip entry to ``fh``, decompressing it
+
+    :param compressed_size: size of the compressed data, ``None`` if unknown (then
+                            read until the end of the deflate stream)
+    :returns: CRC-32 of the decompressed data
+    """
+    crc = 0
+    decompressor = zlib.decompressobj(-15) if method == zipfile.ZIP_DEFLATED else None
+    remaining = compressed_size
+    while remaining is None or remaining > 0:
+        block = reader.read(
+            _BLOCK_SIZE if remaining is None else min(remaining, _BLOCK_SIZE)
+        )
+        if not block:
+            raise EOFError("Unexpected end of archive stream")
+        if remaining is not None:
+            remaining -= len(block)
+        if decompressor is not None:
+            data = decompressor.decompress(block)
+            if decompressor.eof:
+                reader.unread(decompressor.unused_data)
+                remaining = 0
+        else:
+            data = block
+        crc = zlib.crc32(data, crc)
+        if fh is not None:
+            fh.write(data)
+    if decompressor is not None:
+        data = decompressor.flush()
+        crc = zlib.crc32(data, crc)
+        if fh is not None:
+            fh.write(data)
+    return crc
+
+
+def extract_zip_stream(chunks: Iterable[bytes], dest_dir: str) -> None:
+    """Extract a zip archive from a stream of bytes, using its local file headers
+
+    Stored and deflated entries are supported, with or without data descriptors
+    for the latter.
+
+    :param chunks: bytes of the zip archive
+    :param dest_dir: directory where archive members are extracted
+    :raises: :class:`NotStreamableArchiveError` if an entry cannot be extracted without
+             reading the central directory first
+    :raises: :class:`zipfile.BadZipFile` if the archive is corrupted
+    """
+    reader = chunks if isinstance(chunks, ChunksReader) else ChunksReader(chunks)
+    while True:
+        signature = reader.read(4)
+        if 0 < len(signature) < 4:
+            signature += reader.read_exactly(4 - len(signature))
+        if not signature or signature in _CENTRAL_DIRECTORY_SIGNATURES:
+            # local entries are followed by the central directory
+            return
+        if signature != _LOCAL_FILE_HEADER_SIGNATURE:
+            raise zipfile.BadZipFile("Bad local file header signature")
+        (
+            _,
+            _,
+            flags,
+            method,
+            _,
+            _,
+            crc,
+            compressed_size,
+            file_size,
+            name_length,
+            extra_length,
+        ) = _LOCAL_FILE_HEADER.unpack(
+            signature + reader.read_exactly(_LOCAL_FILE_HEADER.size - 4)
+        )
+        name_bytes = reader.read_exactly(name_length)
+        name = name_bytes.decode("utf-8" if flags & _FLAG_UTF8 else "cp437")
+        compressed_size, file_size, is_zip64 = _zip64_sizes(
+            reader.read_exactly(extra_length), compressed_size, file_size
+        )
+
+        if flags & _FLAG_ENCRYPTED:
+            raise NotStreamableArchiveError(f"{name} is encrypted")
+        if method not in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED):
+            raise NotStreamableArchiveError(
+                f"{name} uses an unsupported compression method ({method})"
+            )
+        has_descriptor = bool(flags & _FLAG_DATA_DESCRIPTOR)
+        if has_descriptor and method == zipfile.ZIP_STORED:
+            raise NotStreamableArchiveError(
+                f"{name} size is only known from the central directory"
+            )
+
+        member_path = _member_path(dest_dir, name)
+        if name.endswith("/"):
+            os.makedirs(member_path, exist_ok=True)
+            computed_crc = _copy_zip_entry_data(
+                reader, None, method, None if has_descriptor else compressed_size
+            )
+        else:
+            os.makedirs(os.path.dirname(member_path), exist_ok=True)
+            with open(member_path, "wb") as fh:
+                computed_crc = _copy_zip_entry_data(
+                    reader, fh, method, None if has_descriptor else compressed_size
+                )
+
+        if has_descriptor:
+            descriptor = reader.read_exactly(4)
+            if descriptor == _DATA_DESCRIPTOR_SIGNATURE:
+                descriptor = reader.read_exactly(4)
+            (crc,) = struct.unpack("<L", descriptor)
+            reader.read_exactly(16 if is_zip64 else 8)
+        if computed_crc != crc:
+            raise zipfile.BadZipFile(f"Bad CRC-32 for file {name}")
+        logger.debug("Extracted %s", member_path)
+
+
+def extract_tar_stream(chunks: Iterable[bytes], dest_dir: str) -> None:
+    """Extract a tar archive, compressed or not, from a stream of bytes
+
+    :param chunks: bytes of the tar archive
+    :param dest_dir: directory where archive members are extracted
+    """
+    reader = chunks if isinstance(chunks, ChunksReader) else ChunksReader(chunks)
+    with tarfile.open(fileobj=reader, mode="r|*") as tar:
+        if hasattr(tarfile, "data_filter"):
+            tar.extractall(path=dest_dir, filter="data")
+        else:
+            tar.extractall(path=dest_dir)
+
+
+def extract_archive_stream(
+    chunks: Iterable[bytes], dest_dir: str, filename: str
+) -> None:
+    """Extract an archive from a stream of bytes, its type being guessed from its
+    file name
+
+    :param chunks: bytes of the archive
+    :param dest_dir: directory where archive members are extracted
+    :param filename: name of the archive (``.zip``, ``.tar``, ``.tar.gz`` or ``.tgz``)
+    :raises: :class:`NotStreamableArchiveError` if the archive cannot be extracted
+             from a stream
+    """
+    filename = filename.lower()
+    if filename.endswith(".zip"):
+        extract_zip_stream(chunks, dest_dir)
+    elif filename.endswith((".tar", ".tar.gz", ".tgz")):
+        extract_tar_stream(chunks, dest_dir)
+    else:
+        raise NotStreamableArchiveError(f"{filename} is not a supported archive")
+
+
+def is_streamable_archive(filename: str) -> bool:
+    """Whether an archive of the given file name may be extracted from a stream"""
+    return filename.lower().endswith((".zip", ".tar", ".tar.gz", ".tgz"))
+
+
+def archive_members_filter(pattern: Optional[str]) -> Callable[[str], bool]:
+    """Filter selecting archive members whose path or file name fully matches the given
+    regex pattern, or all members if no pattern is given
+
+    >>> select = archive_members_filter(r".*_B0[12]\\.jp2")
+    >>> select("GRANULE/IMG_DATA/T31TDH_B01.jp2"), select("MTD_TL.xml")
+    (True, False)
+    """
+    if not pattern:
+        return lambda name: True
+    regex = re.compile(pattern)
+    return lambda name: bool(
+        regex.fullmatch(name) or regex.fullmatch(os.path.basename(name.rstrip("/")))
+    )
+
+
+def _partition_members(
+    members: list[zipfile.ZipInfo], parts: int
+) -> list[list[zipfile.ZipInfo]]:
+    """Split members in partitions of balanced uncompressed sizes"""
+    partitions: list[list[zipfile.ZipInfo]] = [[] for _ in range(parts)]
+    sizes = [0] * parts
+    for member in sorted(members, key=lambda m: m.file_size, reverse=True):
+        smallest = sizes.index(min(sizes))
+        partitions[smallest].append(member)
+        sizes[smallest] += member.file_size
+    return [partition for partition in partitions if partition]
+
+
+def extract_zip_members(
+    archive_path: str,
+    members: list[zipfile.ZipInfo],
+    dest_dir: str,
+    max_workers: Optional[int] = None,
+    callback: Optional[Callable[[zipfile.ZipInfo], None]] = None,
+) -> None:
+    """Extract members of a zip file using several threads
+
+    Members are partitioned by uncompressed size between workers, each one reading the
+    archive through its own file handle.
+
+    :param archive_path: path of the zip file
+    :param members: members of the zip file to extract
+    :param dest_dir: directory where members are extracted
+    :param max_workers: (optional) maximum number of threads, defaults to the
+                        :class:`concurrent.futures.ThreadPoolExecutor` one
+    :param callback: (optional) function called with each extracted member
+    """
+    if max_workers is None:
+        max_workers = min(32, (os.cpu_count() or 1) + 4)
+    lock = threading.Lock()
+
+    def extract_partition(partition: list[zipfile.ZipInfo]) -> None:
+        with zipfile.ZipFile(archive_path) as zfile:
+            for member in partition:
+                try:
+                    zfile.extract(member, path=dest_dir)
+                except FileExistsError:
+                    # parent directory concurrently created by another worker
+                    zfile.extract(member, path=dest_dir)
+                if callback is not None:
+                    with lock:
+                        callback(member)
+
+    partitions = _partition_members(members, max(1, max_workers))
+    if len(partitions) <= 1:
+        for partition in partitions:
+            extract_partition(partition)
+        return
+    with ThreadPoolExecutor(
+        max_workers=len(partitions), thread_name_prefix="eodag-extract"
+    ) as executor:
+        for future in [executor.submit(extract_partition, p) for p in partitions]:
+            future.result()
+
+
+def read_remote_zip_members(
+    fetch_range: Callable[[int, int], Iterable[bytes]], size: int
+) -> list[zipfile.ZipInfo]:
+    """Members of a remote zip archive, read from its central directory fetched by byte
+    ranges, without fetching the data of the members
+
+    :param fetch_range: function returning the bytes of the archive between two
+                        inclusive offsets, as chunks
+    :param size: size of the archive
+    :returns: members of the archive, whose ``header_offset`` are absolute offsets in it
+    :raises: :class:`zipfile.BadZipFile` if the archive is corrupted
+    """
+    tail_start = max(0, size - _ZIP_TAIL_FETCH_SIZE)
+    tail = b"".join(fetch_range(tail_start, size - 1))
+    eocd_offset = tail.rfind(b"PK\x05\x06")
+    if eocd_offset < 0 or eocd_offset + _END_OF_CENTRAL_DIRECTORY.size > len(tail):
+        raise zipfile.BadZipFile("End of central directory record not found")
+    eocd_end = eocd_offset + _END_OF_CENTRAL_DIRECTORY.size
+    *_, cd_start, _ = _END_OF_CENTRAL_DIRECTORY.unpack(tail[eocd_offset:eocd_end])
+
+    locator_offset = eocd_offset - _ZIP64_END_OF_CENTRAL_DIRECTORY_LOCATOR.size
+    if locator_offset >= 0 and tail[locator_offset:eocd_offset].startswith(
+        b"PK\x06\x07"
+    ):
+        # zip64 archive, whose central directory offset is in its zip64 end record
+        _, _, zip64_eocd_offset, _ = _ZIP64_END_OF_CENTRAL_DIRECTORY_LOCATOR.unpack(
+            tail[locator_offset:eocd_offset]
+        )
+        zip64_eocd = b"".join(
+            fetch_range(
+                zip64_eocd_offset,
+                zip64_eocd_offset + _ZIP64_END_OF_CENTRAL_DIRECTORY_SIZE - 1,
+            )
+        )
+        (cd_start,) = struct.unpack_from("<Q", zip64_eocd, 48)
+
+    # central directory followed by the end records
+    if cd_start >= tail_start:
+        directory = tail[cd_start - tail_start : eocd_end]
+    else:
+        directory = b"".join(fetch_range(cd_start, tail_start - 1)) + tail[:eocd_end]
+    with zipfile.ZipFile(io.BytesIO(directory)) as zfile:
+        members = zfile.infolist()
+    # offsets parsed without the data preceding the central directory are relative to it
+    for member in members:
+        member.header_offset += cd_start
+    return members
+
+
+def check_remote_zip_member(member: zipfile.ZipInfo) -> None:
+    """Check that a member of a remote zip archive can be fetched by byte ranges
+
+    :raises: :class:`NotStreamableArchiveError` if the member is encrypted or uses an
+             unsupported compression method
+    """
+    if member.flag_bits & _FLAG_ENCRYPTED:
+        raise NotStreamableArchiveError(f"{member.filename} is encrypted")
+    if member.compress_type not in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED):
+        raise NotStreamableArchiveError(
+            f"{member.filename} uses an unsupported compression method "
+            f"({member.compress_type})"
+        )
+
+
+def iter_remote_zip_member(
+    fetch_range: Callable[[int, int], Iterable[bytes]], member: zipfile.ZipInfo
+) -> Iterator[bytes]:
+    """Data of a member of a remote zip archive, fetched by byte ranges and
+    decompressed while received
+
+    Stored and deflated members are supported. Their CRC-32 is checked once their whole
+    data is read.
+
+    :param fetch_range: function returning the bytes of the archive between two
+                        inclusive offsets, as chunks
+    :param member: member of the archive, as returned by :func:`read_remote_zip_members`
+    :raises: :class:`NotStreamableArchiveError` if the member cannot be fetched by byte
+             ranges, see :func:`check_remote_zip_member`
+    :raises: :class:`zipfile.BadZipFile` if the archive is corrupted
+    """
+    check_remote_zip_member(member)
+    if not member.compress_size:
+        return
+    header = b"".join(
+        fetch_range(
+            member.header_offset, member.header_offset + _LOCAL_FILE_HEADER.size - 1
+        )
+    )
+    if not header.startswith(_LOCAL_FILE_HEADER_SIGNATURE):
+        raise zipfile.BadZipFile("Bad local file header signature")
+    *_, name_length, extra_length = _LOCAL_FILE_HEADER.unpack(header)
+    data_start = (
+        member.header_offset + _LOCAL_FILE_HEADER.size + name_length + extra_length
+    )
+
+    crc = 0
+    decompressor = (
+        zlib.decompressobj(-15)
+        if member.compress_type == zipfile.ZIP_DEFLATED
+        else None
+    )
+    for chunk in fetch_range(data_start, data_start + member.compress_size - 1):
+        data = decompressor.decompress(chunk) if decompressor is not None else chunk
+        crc = zlib.crc32(data, crc)
+        if data:
+            yield data
+    if decompressor is not None and (data := decompressor.flush()):
+        crc = zlib.crc32(data, crc)
+        yield data
+    if crc != member.CRC:
+        raise zipfile.BadZipFile(f"Bad CRC-32 for file {member.filename}")
+
+
+def extract_remote_zip_members(
+    fetch_range: Callable[[int, int], Iterable[bytes]],
+    members: list[zipfile.ZipInfo],
+    dest_dir: str,
+    progress: Optional[Callable[[int], None]] = None,
+) -> None:
+    """Extract members of a remote zip archive, fetching only their data by byte ranges
+
+    :param fetch_range: function returning the bytes of the archive between two
+                        inclusive offsets, as chunks
+    :param members: members to extract, as returned by :func:`read_remote_zip_members`
+    :param dest_dir: directory where members are extracted
+    :param progress: (optional) function called with the size of each extracted block
+    """
+    for member in members:
+        member_path = _member_path(dest_dir, member.filename)
+        if member.is_dir():
+            os.makedirs(member_path, exist_ok=True)
+            continue
+        os.makedirs(os.path.dirname(member_path), exist_ok=True)
+        with open(member_path, "wb") as fh:
+            for data in iter_remote_zip_member(fetch_range, member):
+                fh.write(data)
+                if progress is not None:
+                    progress(len(data))
+        logger.debug("Extracted %s", member_path)
@@ -15,15 +15,28 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import contextlib
+import copy
 import functools
+import hashlib
+import json
 import logging
-from typing import Any, Callable, TypeVar
+import os
+import shutil
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Optional, TypeVar, cast
 
 logger = logging.getLogger("eodag.cache")
 
 R = TypeVar("R")
 
 
+def _identity(value: R) -> R:
+    return value
+
+
 def instance_cached_method(
     maxsize: int = 128,
 ) -> Callable[[Callable[..., R]], Callable[..., R]]:
@@ -66,3 +79,174 @@ def instance_cached_method(
         return wrapper
 
     return decorator
+
+
+class TTLCache:
+    """
+    Thread-safe cache with time-to-live, stale-while-revalidate and optional on-disk tier.
+
+    Keys are tuples whose first item is a namespace (usually a provider name), which
+    allows invalidating all the entries of a namespace at once. Entries younger than
+    ``ttl`` are returned as-is. Entries older than ``ttl`` but younger than
+    ``ttl + stale_ttl`` are returned while being refreshed in a background thread.
+    Older entries are computed again synchronously.
+
+    Values are deep-copied when returned, so that callers can safely mutate them. If
+    ``cache_dir`` is set, values stored with ``persist=True`` must be JSON-serializable
+    and are also written to disk, to be shared between sessions.
+
+    :param ttl: Time-to-live of cached entries, in seconds. ``0`` disables the cache.
+    :param stale_ttl: Additional time, in seconds, during which expired entries are still
+                      returned while being refreshed.
+    :param maxsize: Maximum number of in-memory entries.
+    :param cache_dir: (optional) Directory of the on-disk tier.
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        stale_ttl: float = 0,
+        maxsize: int = 256,
+        cache_dir: Optional[str] = None,
+    ) -> None:
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.maxsize = maxsize
+        self.cache_dir = cache_dir
+        self._entries: OrderedDict[tuple[Any, ...], tuple[float, Any]] = OrderedDict()
+        self._refreshing: set[tuple[Any, ...]] = set()
+        self._lock = threading.Lock()
+
+    def get_or_set(
+        self,
+        key: tuple[Any, ...],
+        compute: Callable[[], R],
+        persist: bool = False,
+        copy_value: bool = True,
+    ) -> R:
+        """
+        Get the value cached for ``key``, or compute and cache it.
+
+        :param key: Cache key, its first item being the namespace.
+        :param compute: Callable returning the value to cache. Exceptions are not cached.
+        :param persist: If the value must also be stored in the on-disk tier.
+        :param copy_value: If a copy of the cached value must be returned. Only disable it
+                           for values that are never mutated.
+        :returns: The cached value, or a copy of it.
+        """
+        get_value = copy.deepcopy if copy_value else _identity
+
+        if self.ttl <= 0:
+            return compute()
+
+        entry = self._get_entry(key, persist)
+        if entry is not None:
+            timestamp, value = entry
+            age = time.time() - timestamp
+            if age < self.ttl:
+                logger.debug("Cache hit for %s", key)
+                return get_value(value)
+            if age < self.ttl + self.stale_ttl:
+                logger.debug("Stale cache hit for %s, refreshing it", key)
+                self._refresh_in_background(key, compute, persist)
+                return get_value(value)
+
+        value = compute()
+        self._set_entry(key, value, persist)
+        return get_value(value)
+
+    def invalidate(self, namespace: Optional[str] = None) -> None:
+        """
+        Remove cached entries from both tiers.
+
+        :param namespace: (optional) Only remove the entries of this namespace.
+        """
+        with self._lock:
+            for key in list(self._entries):
+                if namespace is None or key[0] == namespace:
+                    del self._entries[key]
+        if self.cache_dir:
+            path = (
+                os.path.join(self.cache_dir, self._namespace_dirname(namespace))
+                if namespace is not None
+                else self.cache_dir
+            )
+            shutil.rmtree(path, ignore_errors=True)
+
+    def _get_entry(
+        self, key: tuple[Any, ...], persist: bool
+    ) -> Optional[tuple[float, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+        if not (persist and self.cache_dir):
+            return None
+        try:
+            with open(self._entry_path(key), "r") as fh:
+                stored = json.load(fh)
+        except (OSError, ValueError):
+            return None
+        entry = (stored["timestamp"], stored["value"])
+        self._store_in_memory(key, entry)
+        return entry
+
+    def _set_entry(self, key: tuple[Any, ...], value: Any, persist: bool) -> None:
+        entry = (time.time(), value)
+        self._store_in_memory(key, entry)
+        if not (persist and self.cache_dir):
+            return
+        path = self._entry_path(key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp_path, "w") as fh:
+                json.dump({"timestamp": entry[0], "value": value}, fh)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug("Could not write %s cache entry to disk: %s", key, e)
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)
+
+    def _store_in_memory(self, key: tuple[Any, ...], entry: tuple[float, Any]) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def _refresh_in_background(
+        self, key: tuple[Any, ...], compute: Callable[[], Any], persist: bool
+    ) -> None:
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def refresh() -> None:
+            try:
+                self._set_entry(key, compute(), persist)
+            except Exception as e:
+                logger.debug("Could not refresh %s cache entry: %s", key, e)
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(
+            target=refresh, name="eodag-cache-refresh", daemon=True
+        ).start()
+
+    @staticmethod
+    def _namespace_dirname(namespace: Any) -> str:
+        return hashlib.sha256(str(namespace).encode("utf-8")).hexdigest()[:16]
+
+    def _entry_path(self, key: tuple[Any, ...]) -> str:
+        key_hash = hashlib.sha256(
+            json.dumps(key, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+        return os.path.join(
+            cast(str, self.cache_dir),
+            self._namespace_dirname(key[0]),
+            f"{key_hash}.json",
+        )
@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026, CS GROUP - France, https://www.csgroup.eu/
+#
+# This file is part of EODAG project
+#     https://www.github.com/CS-SI/EODAG
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Checksums of downloaded data, computed incrementally while the data is received"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import hashlib
+import re
+from typing import Any, Iterable, Iterator, Optional, Union
+
+from eodag.utils.exceptions import ChecksumError
+
+#: multihash prefixes (hash function code and digest length) of supported algorithms
+_MULTIHASH_PREFIXES = {
+    "d50110": "md5",
+    "1114": "sha1",
+    "1220": "sha256",
+    "1340": "sha512",
+}
+#: algorithms guessed from the length of plain hexadecimal digests
+_HEX_DIGEST_LENGTHS = {32: "md5", 40: "sha1", 64: "sha256", 128: "sha512"}
+
+_HEX_RE = re.compile(r"[0-9a-f]+")
+
+_BLOCK_SIZE = 1024 * 1024
+
+
+def parse_checksum(value: Any) -> Optional[tuple[str, str]]:
+    """Algorithm and hexadecimal digest of a checksum given as a multihash (as in
+    STAC ``file:checksum``) or as a plain hexadecimal digest (e.g. a S3 ``ETag``)
+
+    >>> parse_checksum("1220" + "ab" * 32) == ("sha256", "ab" * 32)
+    True
+    >>> parse_checksum('"d41d8cd98f00b204e9800998ecf8427e"')
+    ('md5', 'd41d8cd98f00b204e9800998ecf8427e')
+    >>> parse_checksum("d41d8cd98f00b204e9800998ecf8427e-2") is None
+    True
+
+    :param value: checksum to parse
+    :returns: algorithm name and digest, or ``None`` if the checksum is not supported
+    """
+    if not isinstance(value, str):
+        return None
+    value = value.strip().strip('"').lower()
+    if not _HEX_RE.fullmatch(value):
+        return None
+    for prefix, algorithm in _MULTIHASH_PREFIXES.items():
+        digest = value[len(prefix) :]
+        if (
+            value.startswith(prefix)
+            and len(digest) == 2 * hashlib.new(algorithm).digest_size
+        ):
+            return algorithm, digest
+    if hex_algorithm := _HEX_DIGEST_LENGTHS.get(len(value)):
+        return hex_algorithm, value
+    return None
+
+
+def s3_etag_checksum(
+    etag: Any,
+    server_side_encryption: Any = None,
+    sse_customer_algorithm: Any = None,
+) -> Optional[str]:
+    """MD5 digest given by the ``ETag`` of a S3 object, if its ``ETag`` is one.
+
+    ``ETag`` of objects uploaded by parts (``<digest>-<parts count>``) and of objects
+    encrypted with SSE-KMS or SSE-C keys are not MD5 digests of their content.
+
+    >>> s3_etag_checksum('"d41d8cd98f00b204e9800998ecf8427e"')
+    'd41d8cd98f00b204e9800998ecf8427e'
+    >>> s3_etag_checksum('"d41d8cd98f00b204e9800998ecf8427e-2"') is None
+    True
+    >>> s3_etag_checksum('"d41d8cd98f00b204e9800998ecf8427e"', "aws:kms") is None
+    True
+
+    :param etag: ``ETag`` of the object
+    :param server_side_encryption: (optional) ``ServerSideEncryption`` of the object
+    :param sse_customer_algorithm: (optional) ``SSECustomerAlgorithm`` of the object
+    :returns: the hexadecimal MD5 digest, or ``None`` if the ``ETag`` is not a MD5 digest
+    """
+    if isinstance(sse_customer_algorithm, str) and sse_customer_algorithm:
+        return None
+    if isinstance(server_side_encryption, str) and server_side_encryption.startswith(
+        "aws:kms"
+    ):
+        return None
+    if not isinstance(etag, str):
+        return None
+    digest = etag.strip().strip('"').lower()
+    if len(digest) != 2 * hashlib.md5().digest_size or not _HEX_RE.fullmatch(digest):
+        return None
+    return digest
+
+
+def content_md5_checksum(value: Any) -> Optional[str]:
+    """Hexadecimal MD5 digest of a base64 encoded ``Content-MD5`` HTTP header
+
+    >>> content_md5_checksum("1B2M2Y8AsgTpgAmY7PhCfg==")
+    'd41d8cd98f00b204e9800998ecf8427e'
+    """
+    if not isinstance(value, str):
+        return None
+    try:
+        digest = base64.b64decode(value, validate=True)
+    except (binascii.Error, ValueError):
+        return None
+    return digest.hex() if len(digest) == hashlib.md5().digest_size else None
+
+
+class ChecksumVerifier:
+    """Incremental checksum of a stream of data, compared to its expected value once
+    the whole data has been received
+
+    >>> verifier = ChecksumVerifier("d41d8cd98f00b204e9800998ecf8427e", "empty")
+    >>> list(verifier.wrap([b""]))
+    [b'']
+    >>> verifier = ChecksumVerifier("d41d8cd98f00b204e9800998ecf8427e", "data")
+    >>> list(verifier.wrap([b"a"]))  # doctest: +ELLIPSIS
+    Traceback (most recent call last):
+     ...
+    eodag.utils.exceptions.ChecksumError: md5 checksum mismatch for data: expected d41d8..., got 0cc17...
+
+    :param checksum: expected checksum, see :func:`parse_checksum`
+    :param name: name of the verified data, used in error messages
+    :raises: :class:`ValueError` if the checksum is not supported
+    """
+
+    def __init__(self, checksum: str, name: str) -> None:
+        parsed = parse_checksum(checksum)
+        if parsed is None:
+            raise ValueError(f"Unsupported checksum {checksum}")
+        self.algorithm, self.expected = parsed
+        self.name = name
+        self._hash = hashlib.new(self.algorithm)
+
+    @classmethod
+    def from_checksums(cls, *checksums: Any, name: str) -> Optional[ChecksumVerifier]:
+        """Verifier for the first supported checksum among the given ones
+
+        :returns: the verifier, or ``None`` if no checksum is supported
+        """
+        for checksum in checksums:
+            if parse_checksum(checksum) is not None:
+                return cls(checksum, name)
+        return None
+
+    def update(self, data: Union[bytes, bytearray, memoryview]) -> None:
+        """Add received data to the checksum"""
+        self._hash.update(data)
+
+    def update_from_file(self, path: str, size: int, offset: int = 0) -> None:
+        """Add ``size`` bytes of a file from ``offset`` to the checksum, e.g. the already
+        downloaded part of a resumed download"""
+        with open(path, "rb") as fh:
+            fh.seek(offset)
+            while size > 0:
+                block = fh.read(min(size, _BLOCK_SIZE))
+                if not block:
+                    break
+                self._hash.update(block)
+                size -= len(block)
+
+    def wrap(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        """Add the chunks to the checksum while yielding them, and verify it once all
+        chunks have been yielded
+
+        :raises: :class:`~eodag.utils.exceptions.ChecksumError` at the end of the
+                 chunks if their checksum does not match the expected one
+        """
+        for chunk in chunks:
+            self._hash.update(chunk)
+            yield chunk
+        self.verify()
+
+    def verify(self) -> None:
+        """Compare the checksum of received data to the expected one
+
+        :raises: :class:`~eodag.utils.exceptions.ChecksumError` if they differ
+        """
+        if (digest := self._hash.hexdigest()) != self.expected:
+            raise ChecksumError(
+                f"{self.algorithm} checksum mismatch for {self.name}: "
+                f"expected {self.expected}, got {digest}"
+            )
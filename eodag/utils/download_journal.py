@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026, CS GROUP - France, https://www.csgroup.eu/
+#
+# This file is part of EODAG project
+#     https://www.github.com/CS-SI/EODAG
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Journal of products downloads, stored in a SQLite database shared between processes"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import os
+import socket
+import sqlite3
+import time
+import uuid
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Optional
+
+from eodag.utils import DEFAULT_DOWNLOAD_JOURNAL_LEASE
+from eodag.utils.files import path_size
+
+if TYPE_CHECKING:
+    from eodag.api.product import EOProduct
+
+logger = logging.getLogger("eodag.utils.download_journal")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS downloads (
+    provider TEXT NOT NULL,
+    product_id TEXT NOT NULL,
+    title TEXT,
+    state TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    bytes INTEGER NOT NULL DEFAULT 0,
+    path TEXT,
+    error TEXT,
+    owner TEXT,
+    updated REAL NOT NULL,
+    PRIMARY KEY (provider, product_id)
+)
+"""
+
+
+class DownloadJournal:
+    """
+    Crash-safe journal of products downloads, stored in a SQLite database that can be
+    shared between processes.
+
+    The journal records the state of each product download (``queued``, ``ordered``,
+    ``downloading``, ``done`` or ``failed``) with its number of attempts, the size in
+    bytes and path of the downloaded product, and the last error. Processes sharing a
+    journal claim each product before downloading it, so that a batch of products is
+    split between them without being downloaded twice, and a batch interrupted by a
+    crash is resumed where it stopped. Claims are refreshed while products are
+    downloaded, and those not refreshed for ``lease`` seconds (e.g. of a crashed
+    process) can be taken over by other processes.
+
+    :param path: Path of the SQLite database file, created if needed.
+    :param lease: Time in seconds after which a claim that was not refreshed expires.
+    """
+
+    QUEUED = "queued"
+    ORDERED = "ordered"
+    DOWNLOADING = "downloading"
+    DONE = "done"
+    FAILED = "failed"
+
+    def __init__(
+        self, path: str, lease: float = DEFAULT_DOWNLOAD_JOURNAL_LEASE
+    ) -> None:
+        self.path = os.path.abspath(path)
+        self.lease = lease
+        #: identifier of the claims of this journal instance
+        self.owner = f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        if os.path.dirname(self.path):
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with self._transaction() as conn:
+            conn.execute(_SCHEMA)
+
+    @contextlib.contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Connection to the database, within a transaction holding its write lock"""
+        conn = sqlite3.connect(self.path, timeout=60, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _key(product: EOProduct) -> tuple[str, str]:
+        return str(product.provider), str(product.properties["id"])
+
+    def enqueue(self, products: Iterable[EOProduct]) -> None:
+        """
+        Add products to the journal, as ``queued`` if they are not recorded yet.
+
+        :param products: The products to download.
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO downloads (provider, product_id, title, state, updated) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [
+                    (*self._key(p), p.properties.get("title"), self.QUEUED, now)
+                    for p in products
+                ],
+            )
+
+    def claim(self, product: EOProduct) -> bool:
+        """
+        Claim a product before downloading it, and set it as ``downloading``.
+
+        A product cannot be claimed if it is already downloaded and its path still exists
+        (or was transferred to a ``s3://`` URL), or if it is being ordered or downloaded
+        under a claim of another owner that did not expire.
+
+        :param product: The product to download.
+        :returns: Whether the product was claimed.
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT state, path, owner, updated FROM downloads "
+                "WHERE provider = ? AND product_id = ?",
+                self._key(product),
+            ).fetchone()
+            if row is not None:
+                if (
+                    row["state"] == self.DONE
+                    and row["path"]
+                    and (row["path"].startswith("s3://") or os.path.exists(row["path"]))
+                ):
+                    return False
+                if (
+                    row["state"] in (self.ORDERED, self.DOWNLOADING)
+                    and row["owner"] != self.owner
+                    and row["updated"] > now - self.lease
+                ):
+                    return False
+            conn.execute(
+                "INSERT INTO downloads (provider, product_id, title, state, attempts, owner, updated) "
+                "VALUES (?, ?, ?, ?, 1, ?, ?) "
+                "ON CONFLICT (provider, product_id) DO UPDATE SET "
+                "state = excluded.state, attempts = attempts + 1, error = NULL, "
+                "owner = excluded.owner, updated = excluded.updated",
+                (
+                    *self._key(product),
+                    product.properties.get("title"),
+                    self.DOWNLOADING,
+                    self.owner,
+                    now,
+                ),
+            )
+        return True
+
+    def heartbeat(self) -> None:
+        """Refresh the claims of the products being ordered or downloaded by this journal
+        instance"""
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE downloads SET updated = ? WHERE owner = ? AND state IN (?, ?)",
+                (time.time(), self.owner, self.ORDERED, self.DOWNLOADING),
+            )
+
+    def set_state(
+        self,
+        product: EOProduct,
+        state: str,
+        path: Optional[str] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        """
+        Record the state of a product download.
+
+        :param product: The product.
+        :param state: Its new download state.
+        :param path: (optional) Path of the downloaded product, whose size is also recorded.
+        :param error: (optional) Error that occurred during the download.
+        """
+        size = 0
+        if path:
+            with contextlib.suppress(OSError):
+                size = path_size(path)
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE downloads SET state = ?, path = COALESCE(?, path), bytes = ?, error = ?, "
+                "updated = ? WHERE provider = ? AND product_id = ?",
+                (state, path, size, error, time.time(), *self._key(product)),
+            )
+
+    def get(self, product: EOProduct) -> Optional[dict[str, Any]]:
+        """
+        Recorded download of a product.
+
+        :param product: The product.
+        :returns: The journal entry of the product, or ``None`` if it is not recorded.
+        """
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT * FROM downloads WHERE provider = ? AND product_id = ?",
+                self._key(product),
+            ).fetchone()
+        return dict(row) if row is not None else None
+
+    def entries(self, state: Optional[str] = None) -> list[dict[str, Any]]:
+        """
+        Recorded downloads of all the products of the journal.
+
+        :param state: (optional) Only return the downloads in this state.
+        :returns: The journal entries.
+        """
+        query = "SELECT * FROM downloads"
+        params: tuple[str, ...] = ()
+        if state is not None:
+            query += " WHERE state = ?"
+            params = (state,)
+        with self._transaction() as conn:
+            rows = conn.execute(query + " ORDER BY provider, product_id", params)
+            return [dict(row) for row in rows.fetchall()]
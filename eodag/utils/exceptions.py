@@ -128,6 +128,10 @@ class DownloadError(RequestError):
     """An error indicating something wrong with the download process"""
 
 
+class ChecksumError(DownloadError):
+    """An error indicating that downloaded data does not match its expected checksum"""
+
+
 class TimeOutError(RequestError):
     """An error indicating that a timeout has occurred"""
 
@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026, CS GROUP - France, https://www.csgroup.eu/
+#
+# This file is part of EODAG project
+#     https://www.github.com/CS-SI/EODAG
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Local files handled without copying their data through Python buffers"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import mmap
+import os
+import shutil
+import threading
+import uuid
+from typing import Iterator
+
+logger = logging.getLogger("eodag.utils.files")
+
+#: ``ioctl`` request cloning a file on copy-on-write filesystems (btrfs, xfs, ...), see ``ioctl_ficlone(2)``
+_FICLONE = 0x40049409
+
+#: size of the chunks of memory-mapped files
+MMAP_CHUNK_SIZE = 1024 * 1024
+
+
+def _reflink(src: str, dst: str) -> None:
+    """Clone ``src`` to ``dst``, sharing their data blocks until one of them is modified
+
+    :raises: :class:`OSError` if the filesystem or the platform does not support it
+    """
+    try:
+        import fcntl
+    except ImportError as e:
+        raise OSError("reflinks are not supported on this platform") from e
+
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        try:
+            fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+        except OSError:
+            fdst.close()
+            os.remove(dst)
+            raise
+
+
+def _kernel_copy(src: str, dst: str) -> None:
+    """Copy ``src`` to ``dst`` within the kernel, using ``copy_file_range`` (which may also
+    clone data on some filesystems) or ``sendfile`` as a fallback"""
+    copy_file_range = getattr(os, "copy_file_range", None)
+    if copy_file_range is None:
+        # shutil.copyfile uses sendfile when available
+        shutil.copyfile(src, dst)
+        return
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        size = os.fstat(fsrc.fileno()).st_size
+        copied = 0
+        try:
+            while copied < size:
+                sent = copy_file_range(fsrc.fileno(), fdst.fileno(), size - copied)
+                if sent == 0:
+                    break
+                copied += sent
+        except OSError:
+            # e.g. not supported between these filesystems
+            fsrc.seek(copied)
+            fdst.seek(copied)
+            shutil.copyfileobj(fsrc, fdst)
+
+
+def link_or_copy(src: str, dst: str) -> str:
+    """
+    Make the local file ``src`` available at ``dst`` without copying its data if possible.
+
+    ``dst`` is atomically replaced by a clone of ``src`` (reflink) on copy-on-write
+    filesystems, else by a hard link to ``src`` or, if they are not on the same
+    filesystem, by a copy made within the kernel. A hard link shares the file with
+    ``src``, which must then not be modified in place.
+
+    :param src: Path of the source file.
+    :param dst: Path of the destination file.
+    :returns: The method used: ``reflink``, ``hardlink`` or ``copy``.
+    """
+    tmp_dst = f"{dst}.{os.getpid()}-{threading.get_ident()}-{uuid.uuid4().hex[:8]}~"
+    try:
+        try:
+            _reflink(src, tmp_dst)
+            method = "reflink"
+        except OSError:
+            try:
+                os.link(src, tmp_dst)
+                method = "hardlink"
+            except OSError:
+                _kernel_copy(src, tmp_dst)
+                method = "copy"
+        if method != "hardlink":
+            shutil.copystat(src, tmp_dst)
+        os.replace(tmp_dst, dst)
+    except OSError:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_dst)
+        raise
+    logger.debug("%s made available at %s using a %s", src, dst, method)
+    return method
+
+
+def link_or_copy_tree(src: str, dst: str) -> None:
+    """
+    Make the local file or directory tree ``src`` available at ``dst``, each file being
+    made available using :func:`link_or_copy`.
+
+    :param src: Path of the source file or directory.
+    :param dst: Path of the destination, which must not be an existing directory.
+    """
+    if os.path.isdir(src):
+        shutil.copytree(src, dst, copy_function=link_or_copy)
+    else:
+        link_or_copy(src, dst)
+
+
+def path_size(path: str) -> int:
+    """
+    Size in bytes of a file, or total size of the files of a directory tree.
+
+    Files of the tree that disappear while it is walked are ignored.
+
+    :param path: Path of the file or directory.
+    :returns: The size in bytes.
+    """
+    if not os.path.isdir(path):
+        return os.path.getsize(path)
+    size = 0
+    for dirpath, _, filenames in os.walk(path):
+        for filename in filenames:
+            with contextlib.suppress(OSError):
+                size += os.lstat(os.path.join(dirpath, filename)).st_size
+    return size
+
+
+def mmap_chunks(path: str, chunk_size: int = MMAP_CHUNK_SIZE) -> Iterator[memoryview]:
+    """
+    Chunks of a local file, read from a memory map of the file without copying them.
+
+    The file is mapped when the first chunk is requested. Chunks are views on the memory
+    map, which is closed when the iteration ends and no chunk is referenced anymore.
+
+    >>> import tempfile
+    >>> with tempfile.NamedTemporaryFile() as f:
+    ...     _ = f.write(b"abcdefg"); f.flush()
+    ...     [bytes(chunk) for chunk in mmap_chunks(f.name, chunk_size=3)]
+    [b'abc', b'def', b'g']
+
+    :param path: Path of the file.
+    :param chunk_size: (optional) Maximum size in bytes of the chunks.
+    :returns: The chunks of the file.
+    """
+    with open(path, "rb") as fd:
+        if os.fstat(fd.fileno()).st_size == 0:
+            return
+        mapped = mmap.mmap(fd.fileno(), 0, access=mmap.ACCESS_READ)
+    view = memoryview(mapped)
+    try:
+        for offset in range(0, view.nbytes, chunk_size):
+            yield view[offset : offset + chunk_size]
+    finally:
+        view.release()
+        try:
+            mapped.close()
+        except BufferError:
+            # chunks are still referenced, the map is closed when they are released
+            pass
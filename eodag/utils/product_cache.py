@@ -0,0 +1,273 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026, CS GROUP - France, https://www.csgroup.eu/
+#
+# This file is part of EODAG project
+#     https://www.github.com/CS-SI/EODAG
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Cache of downloaded products, shared between output directories, sessions and processes"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import shutil
+import sys
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Iterator, Optional
+
+from eodag.utils import DEFAULT_PRODUCTS_CACHE_MAX_SIZE
+from eodag.utils.checksum import parse_checksum
+from eodag.utils.files import link_or_copy_tree, path_size
+
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
+
+if TYPE_CHECKING:
+    from eodag.api.product import EOProduct
+
+logger = logging.getLogger("eodag.utils.product_cache")
+
+
+class _FileLock:
+    """Exclusive lock on a file, held against other threads and processes
+
+    The lock file is never removed, as removing it while another process waits for it
+    would let a third one lock a new file of the same name.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._fd: Optional[int] = None
+
+    def acquire(self, blocking: bool = True) -> bool:
+        """Acquire the lock
+
+        :param blocking: wait for the lock if it is held, instead of returning ``False``
+        :returns: whether the lock was acquired
+        """
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if sys.platform == "win32":
+                while True:
+                    try:
+                        msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+                        break
+                    except OSError:
+                        if not blocking:
+                            raise
+                        time.sleep(0.1)
+            else:
+                fcntl.flock(fd, fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB))
+        except OSError:
+            os.close(fd)
+            if blocking:
+                raise
+            return False
+        self._fd = fd
+        return True
+
+    def release(self) -> None:
+        """Release the lock if it is held"""
+        if self._fd is None:
+            return
+        fd, self._fd = self._fd, None
+        try:
+            if sys.platform == "win32":
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
+
+    def __enter__(self) -> _FileLock:
+        self.acquire()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.release()
+
+
+def _tmp_suffix() -> str:
+    return f".{os.getpid()}.{threading.get_ident()}.tmp"
+
+
+class ProductCache:
+    """
+    Content-addressed cache of downloaded products, shared between output directories,
+    sessions and processes.
+
+    Products are stored under a key built from their ``file:checksum`` if known, or from
+    their provider and identifier otherwise, and are materialized in output directories
+    as reflinks or hardlinks when the filesystem supports them, or as copies otherwise.
+    Entries are protected by file locks, and the least recently used ones are evicted
+    once the cache grows over ``max_size``.
+
+    Products materialized as hardlinks share their data with the cache, so they must not
+    be modified in place.
+
+    :param cache_dir: Directory of the cache.
+    :param max_size: Maximum size of the cache, in bytes.
+    """
+
+    def __init__(
+        self, cache_dir: str, max_size: int = DEFAULT_PRODUCTS_CACHE_MAX_SIZE
+    ) -> None:
+        self.cache_dir = os.path.abspath(cache_dir)
+        self.max_size = max_size
+        self._entries_dir = os.path.join(self.cache_dir, "entries")
+        self._locks_dir = os.path.join(self.cache_dir, "locks")
+
+    @staticmethod
+    def product_key(product: EOProduct, extract: bool = True) -> str:
+        """
+        Key of a product in the cache.
+
+        :param product: The product.
+        :param extract: If the product is cached extracted or as an archive.
+        :returns: The key, as a hexadecimal digest.
+        """
+        checksum = parse_checksum(product.properties.get("file:checksum"))
+        key: list[Any] = (
+            ["checksum", *checksum]
+            if checksum
+            else [product.provider, product.collection, product.properties.get("id")]
+        )
+        key.append("extracted" if extract else "archive")
+        return hashlib.sha256(json.dumps(key, default=str).encode("utf-8")).hexdigest()
+
+    @contextlib.contextmanager
+    def lock(self, key: str) -> Iterator[None]:
+        """
+        Exclusive access to a cache entry, against other threads and processes.
+
+        :param key: Key of the entry.
+        """
+        os.makedirs(self._locks_dir, exist_ok=True)
+        with _FileLock(self._lock_path(key)):
+            yield
+
+    def materialize(self, key: str, output_dir: str) -> Optional[str]:
+        """
+        Materialize a cached product in a directory. The entry must be locked using
+        :meth:`lock`.
+
+        :param key: Key of the product.
+        :param output_dir: Directory where the product is materialized.
+        :returns: The path of the materialized product, or ``None`` if it is not cached.
+        """
+        entry_dir = os.path.join(self._entries_dir, key)
+        try:
+            names = os.listdir(entry_dir)
+        except FileNotFoundError:
+            return None
+        if len(names) != 1:
+            return None
+        path = os.path.join(os.path.abspath(output_dir), names[0])
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = path + _tmp_suffix()
+            try:
+                link_or_copy_tree(os.path.join(entry_dir, names[0]), tmp_path)
+                os.replace(tmp_path, path)
+            finally:
+                if os.path.isdir(tmp_path):
+                    shutil.rmtree(tmp_path, ignore_errors=True)
+                elif os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+        # access time of the entry, used for LRU eviction
+        os.utime(entry_dir)
+        return path
+
+    def store(self, key: str, path: str) -> None:
+        """
+        Store a downloaded product in the cache, then evict the least recently used
+        entries if needed. The entry must be locked using :meth:`lock`.
+
+        :param key: Key of the product.
+        :param path: Path of the downloaded product file or directory.
+        """
+        entry_dir = os.path.join(self._entries_dir, key)
+        if os.path.isdir(entry_dir):
+            os.utime(entry_dir)
+            return
+        tmp_dir = entry_dir + _tmp_suffix()
+        try:
+            os.makedirs(tmp_dir)
+            path = os.path.normpath(path)
+            link_or_copy_tree(path, os.path.join(tmp_dir, os.path.basename(path)))
+            os.replace(tmp_dir, entry_dir)
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+        self.evict(keep=key)
+
+    def evict(self, keep: Optional[str] = None) -> None:
+        """
+        Remove the least recently used entries until the cache fits in ``max_size``.
+        Entries locked by other threads or processes are skipped.
+
+        :param keep: (optional) Key of an entry that must not be removed.
+        """
+        entries: list[tuple[float, str, int]] = []
+        total_size = 0
+        with os.scandir(self._entries_dir) as it:
+            for entry in it:
+                if not entry.is_dir(follow_symlinks=False) or entry.name.endswith(
+                    ".tmp"
+                ):
+                    continue
+                size = path_size(entry.path)
+                entries.append((entry.stat().st_mtime, entry.name, size))
+                total_size += size
+        for _, key, size in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            if key == keep:
+                continue
+            lock = _FileLock(self._lock_path(key))
+            if not lock.acquire(blocking=False):
+                continue
+            try:
+                logger.debug("Evicting %s from products cache", key)
+                shutil.rmtree(os.path.join(self._entries_dir, key), ignore_errors=True)
+            finally:
+                lock.release()
+            total_size -= size
+
+    def _lock_path(self, key: str) -> str:
+        return os.path.join(self._locks_dir, f"{key}.lock")
+
+
+def get_product_cache() -> Optional[ProductCache]:
+    """
+    Products cache configured using the ``EODAG_PRODUCTS_CACHE_DIR`` and
+    ``EODAG_PRODUCTS_CACHE_MAX_SIZE`` environment variables.
+
+    :returns: The cache, or ``None`` if ``EODAG_PRODUCTS_CACHE_DIR`` is not set.
+    """
+    cache_dir = os.getenv("EODAG_PRODUCTS_CACHE_DIR")
+    if not cache_dir:
+        return None
+    return ProductCache(
+        cache_dir,
+        int(
+            os.getenv("EODAG_PRODUCTS_CACHE_MAX_SIZE", DEFAULT_PRODUCTS_CACHE_MAX_SIZE)
+        ),
+    )
@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026, CS GROUP - France, https://www.csgroup.eu/
+#
+# This file is part of EODAG project
+#     https://www.github.com/CS-SI/EODAG
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Progress bars rendering for long running processes"""
+
+from __future__ import annotations
+
+import threading
+import time
+import weakref
+from collections import deque
+from typing import Any, Optional
+
+from tqdm.auto import tqdm
+
+from eodag.utils import DEFAULT_PROGRESS_FLUSH_INTERVAL
+from eodag.utils.logging import get_disable_tqdm
+
+
+class ProgressCallback(tqdm):
+    """A callable used to render progress to users for long running processes.
+
+    It inherits from :class:`tqdm.auto.tqdm`, and accepts the same arguments on
+    instantiation: ``iterable``, ``desc``, ``total``, ``leave``, ``file``, ``ncols``,
+    ``mininterval``, ``maxinterval``, ``miniters``, ``ascii``, ``disable``, ``unit``,
+    ``unit_scale``, ``dynamic_ncols``, ``smoothing``, ``bar_format``, ``initial``,
+    ``position``, ``postfix``, ``unit_divisor``.
+
+    It can be globally disabled using ``eodag.utils.logging.setup_logging(0)`` or
+    ``eodag.utils.logging.setup_logging(level, no_progress_bar=True)``, and
+    individually disabled using ``disable=True``.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        self.kwargs = kwargs.copy()
+        if "unit" not in kwargs:
+            kwargs["unit"] = "B"
+        if "unit_scale" not in kwargs:
+            kwargs["unit_scale"] = True
+        if "desc" not in kwargs:
+            kwargs["desc"] = ""
+        if "position" not in kwargs:
+            kwargs["position"] = 0
+        if "disable" not in kwargs:
+            kwargs["disable"] = get_disable_tqdm()
+        if "dynamic_ncols" not in kwargs:
+            kwargs["dynamic_ncols"] = True
+
+        super(ProgressCallback, self).__init__(*args, **kwargs)
+
+    def __call__(self, increment: int, total: Optional[int] = None) -> None:
+        """Update the progress bar.
+
+        :param increment: Amount of data already processed
+        :param total: (optional) Maximum amount of data to be processed
+        """
+        if total is not None and total != self.total:
+            self.reset(total=total)
+
+        self.update(increment)
+
+    def copy(self, *args: Any, **kwargs: Any) -> ProgressCallback:
+        """Returns another progress callback using the same initial
+        keyword-arguments.
+
+        Optional ``args`` and ``kwargs`` parameters will be used to create a
+        new :class:`~eodag.utils.ProgressCallback` instance, overriding initial
+        `kwargs`.
+        """
+
+        return ProgressCallback(*args, **dict(self.kwargs, **kwargs))
+
+
+def _flush_periodically(
+    ref: weakref.ReferenceType[AggregatedProgressCallback],
+    stopped: threading.Event,
+    interval: float,
+) -> None:
+    """Flush a progress callback every ``interval`` seconds until it is closed or garbage
+    collected"""
+    while not stopped.wait(interval):
+        callback = ref()
+        if callback is None:
+            return
+        callback.flush()
+        del callback
+
+
+class AggregatedProgressCallback(ProgressCallback):
+    """A :class:`~eodag.utils.ProgressCallback` cheap to call for each chunk of high-throughput
+    transfers, even from many threads.
+
+    Calls only queue their increment, and the queued increments are summed and reported to the
+    progress bar at a fixed rate by a background thread, so that the bar lock and rendering are
+    not hit for each chunk. The amount transferred and the transfer rate are also available as
+    :meth:`metrics`, e.g. to monitor headless transfers using ``disable=True``.
+
+    >>> callback = AggregatedProgressCallback(total=100, disable=True)
+    >>> for _ in range(10):
+    ...     callback(5)
+    >>> callback.metrics()["transferred"]
+    50
+    >>> callback.close()
+
+    :param flush_interval: (optional) Interval in seconds between two progress bar updates.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        flush_interval: float = DEFAULT_PROGRESS_FLUSH_INTERVAL,
+        **kwargs: Any,
+    ) -> None:
+        self.flush_interval = flush_interval
+        #: increments not reported yet, appended and popped atomically without lock
+        self._pending: deque[int] = deque()
+        self._flush_lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        #: total amount reported since the creation of the callback
+        self.transferred = 0
+        self._started = time.monotonic()
+        super().__init__(*args, **kwargs)
+
+    def __call__(self, increment: int, total: Optional[int] = None) -> None:
+        """Queue an increment of the progress bar.
+
+        :param increment: Amount of data already processed
+        :param total: (optional) Maximum amount of data to be processed
+        """
+        if total is not None and total != self.total:
+            self.reset(total=total)
+        self._pending.append(increment)
+        if self._flusher is None:
+            self._start_flusher()
+
+    def _start_flusher(self) -> None:
+        with self._flush_lock:
+            if self._flusher is not None or self._stopped.is_set():
+                return
+            self._flusher = threading.Thread(
+                target=_flush_periodically,
+                args=(weakref.ref(self), self._stopped, self.flush_interval),
+                name="eodag-progress-flush",
+                daemon=True,
+            )
+            self._flusher.start()
+
+    def flush(self) -> None:
+        """Report the queued increments to the progress bar"""
+        with self._flush_lock:
+            self._flush_pending()
+
+    def _flush_pending(self) -> None:
+        """Report the queued increments, holding the flush lock"""
+        amount = 0
+        while self._pending:
+            amount += self._pending.popleft()
+        if amount:
+            self.transferred += amount
+            self.update(amount)
+
+    def metrics(self) -> dict[str, float]:
+        """Transfer metrics since the creation of the callback.
+
+        :returns: The amount ``transferred``, the ``elapsed`` time in seconds and the mean
+                  transfer ``rate`` per second.
+        """
+        self.flush()
+        elapsed = time.monotonic() - self._started
+        return {
+            "transferred": self.transferred,
+            "elapsed": elapsed,
+            "rate": self.transferred / elapsed if elapsed > 0 else 0.0,
+        }
+
+    def reset(self, total: Optional[float] = None) -> None:
+        """Reset the progress bar, after reporting the queued increments to the metrics
+
+        :param total: (optional) New maximum amount of data to be processed
+        """
+        # not interleaved with an update of the background thread
+        with self._flush_lock:
+            self._flush_pending()
+            super().reset(total=total)
+
+    def close(self) -> None:
+        """Stop the background updates and report the queued increments, then close the
+        progress bar"""
+        self._stopped.set()
+        flusher = self._flusher
+        if flusher is not None and flusher is not threading.current_thread():
+            flusher.join()
+        self.flush()
+        super().close()
+
+    def copy(self, *args: Any, **kwargs: Any) -> AggregatedProgressCallback:
+        """Returns another aggregated progress callback using the same initial keyword-arguments
+        and flush interval, overridden by the given ``args`` and ``kwargs``.
+        """
+        kwargs.setdefault("flush_interval", self.flush_interval)
+        return AggregatedProgressCallback(*args, **dict(self.kwargs, **kwargs))
@@ -19,6 +19,8 @@ from __future__ import annotations
 
 import logging
 import os
+import time
+from email.utils import parsedate_to_datetime
 from typing import Any, Optional
 
 import requests
@@ -68,6 +70,33 @@ def fetch_json(
         return res.json()
 
 
+def retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """
+    Delay in seconds requested by a ``Retry-After`` HTTP header, given as a number of
+    seconds or as an HTTP date
+
+    >>> retry_after_seconds("120")
+    120.0
+    >>> retry_after_seconds("Wed, 21 Oct 2015 07:28:00 GMT")
+    0.0
+    >>> retry_after_seconds("soon") is None
+    True
+
+    :param value: value of the header
+    :returns: the delay, or ``None`` if the header is missing or invalid
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(date.timestamp() - time.time(), 0.0)
+
+
 class LocalFileAdapter(requests.adapters.BaseAdapter):
     """Protocol Adapter to allow Requests to GET file:// URLs inspired
     by https://stackoverflow.com/questions/10123929/fetch-a-file-from-a-local-url-with-python-requests/27786580
@@ -17,28 +17,36 @@
 # limitations under the License.
 from __future__ import annotations
 
+import hashlib
 import io
 import logging
 import os
+import threading
+import time
 import uuid
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple, cast
 from zipfile import ZIP_STORED, ZipFile
 
 import botocore
 import botocore.exceptions
-from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from zipstream import ZipStream
 
 from eodag.plugins.authentication.aws_auth import AwsAuth
 from eodag.utils import (
     DEFAULT_MIME,
+    DEFAULT_S3_LISTING_CACHE_TTL,
+    DEFAULT_UPLOAD_MAX_CONCURRENCY,
+    DEFAULT_UPLOAD_PART_SIZE,
     StreamResponse,
     get_bucket_name_and_prefix,
     guess_file_type,
     parse_le_uint16,
     parse_le_uint32,
 )
+from eodag.utils.cache import TTLCache
+from eodag.utils.checksum import ChecksumVerifier
 from eodag.utils.dates import to_iso_utc_string
 from eodag.utils.exceptions import (
     AuthenticationError,
@@ -47,17 +55,53 @@ from eodag.utils.exceptions import (
 )
 
 if TYPE_CHECKING:
-    from typing import Any, Iterable, Iterator, Literal, Optional
+    from typing import (
+        IO,
+        Any,
+        Callable,
+        Iterable,
+        Iterator,
+        Literal,
+        Optional,
+        TypeVar,
+        Union,
+    )
     from zipfile import ZipInfo
 
     from mypy_boto3_s3.client import S3Client
 
     from eodag.api.product import EOProduct  # type: ignore
 
+    T = TypeVar("T")
+
 logger = logging.getLogger("eodag.utils.s3")
 
 # Backpressure configuration
 BACKPRESSURE_DOWNLOAD_CHUNKS = 10  # Total chunks (downloading + buffered) per file
+BACKPRESSURE_DOWNLOAD_BYTES = 256 * 1024**2  # Total bytes (downloading + buffered)
+
+# Adaptive range size configuration
+MIN_RANGE_SIZE = 1024**2
+MAX_RANGE_SIZE = 32 * 1024**2
+RANGE_TARGET_DURATION = 1.0  # Targeted duration in seconds of each range request
+
+# ZIP central directories configuration
+ZIP_LOCAL_HEADER_FETCH_SIZE = 4096  # Bytes fetched to read a local file header
+ZIP_HEADERS_COALESCE_SIZE = (
+    1024**2
+)  # Max size of a request fetching several local headers
+
+# Multipart uploads configuration
+MIN_UPLOAD_PART_SIZE = 5 * 1024**2  # Minimal size of the parts but the last one
+MAX_UPLOAD_PARTS = 10000  # Maximal number of parts of a multipart upload
+
+#: Cache of S3 prefix listings, with keys starting with the provider name
+s3_listing_cache = TTLCache(
+    ttl=float(os.getenv("EODAG_S3_LISTING_CACHE_TTL", DEFAULT_S3_LISTING_CACHE_TTL)),
+    maxsize=1024,
+)
+#: Cache of the central directories of zipped S3 objects, keyed by bucket, key and ETag
+zip_directory_cache = TTLCache(ttl=86400, maxsize=128)
 
 
 def fetch_range(
@@ -97,6 +141,8 @@ class S3FileInfo:
     data_type: str = DEFAULT_MIME
     #: Relative path of the file, if applicable (e.g., inside a ZIP archive).
     rel_path: Optional[str] = None
+    #: Expected checksum of the whole object, verified when it is entirely streamed.
+    checksum: Optional[str] = None
 
     # These fields hold the state for downloading
     #: Offset in the logical (global) file stream where this file starts.
@@ -118,17 +164,30 @@ class S3FileInfo:
 
 def _prepare_file_in_zip(f_info: S3FileInfo, s3_client: S3Client):
     """Update file information with the offset and size of the file inside the zip archive"""
+    _prepare_files_in_zip([f_info], s3_client)
 
-    splitted_path = f_info.key.split(".zip!")
-    f_info.key = f"{splitted_path[0]}.zip"
-    f_info.zip_filepath = splitted_path[-1]  # file path inside the ZIP archive
 
-    f_info.data_start_offset, f_info.size = file_position_from_s3_zip(
-        f_info.bucket_name,
-        f_info.key,
-        s3_client,
-        f_info.zip_filepath,
-    )
+def _prepare_files_in_zip(files_info: list[S3FileInfo], s3_client: S3Client):
+    """Update files information with the offsets and sizes of the files inside zip archives,
+    locating the files of a same archive at once"""
+    files_by_archive: dict[tuple[str, str], list[S3FileInfo]] = {}
+    for f_info in files_info:
+        splitted_path = f_info.key.split(".zip!")
+        f_info.key = f"{splitted_path[0]}.zip"
+        f_info.zip_filepath = splitted_path[-1]  # file path inside the ZIP archive
+        files_by_archive.setdefault((f_info.bucket_name, f_info.key), []).append(f_info)
+
+    for (bucket_name, key), archive_files_info in files_by_archive.items():
+        positions = files_positions_from_s3_zip(
+            bucket_name,
+            key,
+            s3_client,
+            [cast(str, f_info.zip_filepath) for f_info in archive_files_info],
+        )
+        for f_info in archive_files_info:
+            f_info.data_start_offset, f_info.size = positions[
+                cast(str, f_info.zip_filepath)
+            ]
 
 
 def _compute_file_ranges(
@@ -183,75 +242,165 @@ def _compute_file_ranges(
     return ranges
 
 
+class _AdaptiveRangeSize:
+    """
+    Size of the ranges requested to S3, adapted to the measured duration of the requests.
+
+    The throughput of each request includes its latency, which is amortized by larger
+    ranges: the size grows until requests last about ``target_duration``, so that
+    high-latency connections use large ranges and slow ones keep small ranges, that
+    are buffered for a shorter time. The size at most doubles or halves at each
+    measurement, and stays between ``min_size`` and ``max_size``.
+
+    >>> fast = _AdaptiveRangeSize(8, min_size=4, max_size=64, target_duration=1.0)
+    >>> fast.record(8, duration=0.1)
+    >>> fast.size
+    16
+    >>> slow = _AdaptiveRangeSize(8, min_size=4, max_size=64, target_duration=1.0)
+    >>> slow.record(8, duration=4.0)
+    >>> slow.size
+    4
+    """
+
+    def __init__(
+        self,
+        size: int,
+        min_size: int,
+        max_size: int,
+        target_duration: float = RANGE_TARGET_DURATION,
+    ) -> None:
+        self.min_size = min_size
+        self.max_size = max(min_size, max_size)
+        self.size = min(max(size, self.min_size), self.max_size)
+        self.target_duration = target_duration
+        self._throughput: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def record(self, size: int, duration: float) -> None:
+        """Update the range size with the duration of a request of ``size`` bytes"""
+        if size <= 0 or duration <= 0 or self.min_size == self.max_size:
+            return
+        with self._lock:
+            throughput = size / duration
+            # exponentially weighted moving average of the throughput of requests
+            self._throughput = (
+                throughput
+                if self._throughput is None
+                else 0.7 * self._throughput + 0.3 * throughput
+            )
+            target = int(self._throughput * self.target_duration)
+            target = min(max(target, self.size // 2), self.size * 2)
+            self.size = min(max(target, self.min_size), self.max_size)
+
+
 def _chunks_from_s3_objects(
     s3_client: S3Client,
     files_info: list[S3FileInfo],
     byte_range: tuple[Optional[int], Optional[int]],
     range_size: int,
     executor: ThreadPoolExecutor,
+    adaptive_range_size: bool = False,
 ) -> Iterator[tuple[int, Iterator[bytes]]]:
-    """Download chunks from S3 objects in parallel, respecting byte ranges and file order."""
-    # Prepare ranges and futures per file
-    pending_chunks_count = 0
+    """Download chunks from S3 objects in parallel, respecting byte ranges and file order.
+
+    Chunks are requested in the order they are yielded, as long as the chunks being
+    downloaded or buffered do not exceed ``BACKPRESSURE_DOWNLOAD_CHUNKS`` chunks nor
+    ``BACKPRESSURE_DOWNLOAD_BYTES`` bytes. New chunks are only requested while the
+    chunks generators are consumed, so that memory usage stays bounded with slow readers.
+    If ``adaptive_range_size`` is set, ``range_size`` is the size of the first requested
+    ranges, which is then adapted to the measured duration of the requests (see
+    :class:`_AdaptiveRangeSize`).
+    """
+    max_range_size = min(
+        max(range_size, MAX_RANGE_SIZE) if adaptive_range_size else range_size,
+        BACKPRESSURE_DOWNLOAD_BYTES,
+    )
+    ranges_size = _AdaptiveRangeSize(
+        range_size,
+        min_size=min(range_size, MIN_RANGE_SIZE) if adaptive_range_size else range_size,
+        max_size=max_range_size,
+    )
+
+    # Prepare ranges per file, split to the current range size when they are requested
     for f_info in files_info:
-        ranges = _compute_file_ranges(f_info, byte_range, range_size)
+        ranges = _compute_file_ranges(f_info, byte_range, max_range_size)
 
         f_info.buffers = {}
         f_info.next_yield = 0
-
-        if not ranges:
-            # Mark as inactive
-            f_info.pending_ranges = []
-            continue
-
-        f_info.pending_ranges = ranges
-
-        pending_chunks_count += len(ranges)
+        f_info.pending_ranges = ranges or []
 
     # Keep only files that actually have something to download
     active_indices = [i for i, fi in enumerate(files_info) if fi.pending_ranges]
 
     # Combine all futures to wait on globally (initially empty)
-    all_futures = {}
+    all_futures: dict[Any, tuple[S3FileInfo, int, int]] = {}
 
-    # Track pending chunks and next file index
+    # Track pending chunks and bytes (downloading + buffered) and next file index
     total_pending_chunks = 0
+    total_pending_bytes = 0
     next_file_index = 0  # Track which file to submit from next
 
-    def submit_tasks_to_limit() -> bool:
-        """Submit S3 chunk download tasks up to the global backpressure limit, prioritizing files sequentially."""
-        nonlocal total_pending_chunks, next_file_index
+    def timed_fetch_range(
+        bucket_name: str, key_name: str, start: int, end: int
+    ) -> bytes:
+        started = time.monotonic()
+        data = fetch_range(bucket_name, key_name, start, end, s3_client)
+        ranges_size.record(len(data), time.monotonic() - started)
+        return data
+
+    def submit_tasks_to_limit() -> None:
+        """Submit S3 chunk download tasks up to the global backpressure limits, prioritizing files sequentially."""
+        nonlocal total_pending_chunks, total_pending_bytes, next_file_index
 
         while total_pending_chunks < BACKPRESSURE_DOWNLOAD_CHUNKS:
             if next_file_index >= len(files_info):
                 break  # No more files with pending ranges
 
             f_info = files_info[next_file_index]
-            if f_info.pending_ranges:
-                start, end = f_info.pending_ranges.pop(0)
-                future = executor.submit(
-                    fetch_range,
-                    f_info.bucket_name,
-                    f_info.key,
-                    start,
-                    end,
-                    s3_client,
-                )
-                all_futures[future] = (f_info, start, end)
-                total_pending_chunks += 1
+            if not f_info.pending_ranges:
+                next_file_index += 1  # Skip completed files
+                continue
 
-                if not f_info.pending_ranges:
-                    next_file_index += 1  # Move to next file when current is exhausted
+            start, end = f_info.pending_ranges[0]
+            end = min(end, start + ranges_size.size - 1)
+            size = end + 1 - start
+            # always allow a request when nothing is pending, to keep streaming
+            if (
+                total_pending_chunks
+                and total_pending_bytes + size > BACKPRESSURE_DOWNLOAD_BYTES
+            ):
+                break
+
+            if end < f_info.pending_ranges[0][1]:
+                f_info.pending_ranges[0] = (end + 1, f_info.pending_ranges[0][1])
             else:
-                next_file_index += 1  # Skip completed files
-                # If we reach here, no files have pending ranges
+                f_info.pending_ranges.pop(0)
+            future = executor.submit(
+                timed_fetch_range, f_info.bucket_name, f_info.key, start, end
+            )
+            all_futures[future] = (f_info, start, end)
+            total_pending_chunks += 1
+            total_pending_bytes += size
 
-        return False
+            if not f_info.pending_ranges:
+                next_file_index += 1  # Move to next file when current is exhausted
 
     def make_chunks_generator(target_info: S3FileInfo) -> Iterator[bytes]:
         """Create a generator bound to a specific file info (no late-binding bug)."""
         info = target_info  # bind
-        nonlocal total_pending_chunks, pending_chunks_count
+        nonlocal total_pending_chunks, total_pending_bytes
+        # only whole objects can be verified, not files inside zip archives or byte ranges
+        whole_object = info.zip_filepath is None and byte_range in (
+            (None, None),
+            (0, None),
+        )
+        verifier = (
+            ChecksumVerifier.from_checksums(
+                info.checksum, name=f"s3://{info.bucket_name}/{info.key}"
+            )
+            if whole_object
+            else None
+        )
         while info.next_yield < info.size:
             # First, try to flush anything already buffered for this file
             next_start = info.next_yield
@@ -263,36 +412,46 @@ def _chunks_from_s3_objects(
                         f"Expected bytes, got {type(chunk).__name__} in stream chunks: {chunk}"
                     )
                 chunk_len = len(chunk)
+                if verifier:
+                    verifier.update(chunk)
 
+                total_pending_chunks -= 1
+                total_pending_bytes -= chunk_len
                 yield chunk
                 next_start += chunk_len
                 info.next_yield = next_start
                 flushed = True
-                total_pending_chunks -= 1
-                pending_chunks_count -= 1
 
             if info.next_yield >= info.size:
                 break
 
             # If we flushed something, loop back to try again before waiting
             if flushed:
+                submit_tasks_to_limit()
                 continue
 
             # Nothing to flush for this file: wait for more futures to complete globally
-            if not pending_chunks_count:
-                # No more incoming data anywhere; stop to avoid waiting on an empty set
-                break
+            if not all_futures:
+                submit_tasks_to_limit()
+                if not all_futures:
+                    # No more incoming data anywhere; stop to avoid waiting on an empty set
+                    break
 
             done, _ = wait(all_futures.keys(), return_when=FIRST_COMPLETED)
             for fut in done:
                 f_info, start, end = all_futures.pop(fut)
                 data = fut.result()
+                # Count the actual size of the buffered data instead of the requested one
+                total_pending_bytes += len(data) - (end + 1 - start)
                 # Store buffer with a key relative to the start of the file data
                 rel_start = start - f_info.data_start_offset
                 f_info.buffers[rel_start] = data
 
             submit_tasks_to_limit()
 
+        if verifier and info.next_yield >= info.size:
+            verifier.verify()
+
     submit_tasks_to_limit()
 
     # Yield per-file generators with their original indices
@@ -409,6 +568,7 @@ def stream_download_from_s3(
     zip_filename: str = "archive",
     range_size: int = 1024**2 * 8,
     provider_max_workers: Optional[int] = None,
+    adaptive_range_size: bool = True,
 ) -> StreamResponse:
     """
     Stream data from one or more S3 objects in chunks, with support for global byte ranges.
@@ -420,7 +580,8 @@ def stream_download_from_s3(
     * Byte range requests for partial content
     * Files within ZIP archives (using ``.zip!`` notation)
     * Concurrent chunk downloading for improved performance
-    * Memory-efficient streaming without loading entire files
+    * Memory-efficient streaming without loading entire files, buffering at most
+      ``BACKPRESSURE_DOWNLOAD_BYTES`` bytes even with slow readers
 
     The response format depends on the compress parameter and number of files:
 
@@ -450,6 +611,9 @@ def stream_download_from_s3(
         request overhead but use more memory. Default: 8MB.
     :param provider_max_workers: (optional) Maximum number of concurrent download threads of the provider used.
         Higher values improve throughput for multiple ranges.
+    :param adaptive_range_size: Adapt the size of the requested ranges to the measured duration of the
+        requests, starting from ``range_size``: larger ranges amortize the latency of fast connections, and
+        smaller ones are buffered for a shorter time on slow connections. Default: True.
     :return: StreamResponse object containing:
 
         * ``content``: Iterator of bytes for the streaming response
@@ -500,11 +664,9 @@ def stream_download_from_s3(
     executor = ThreadPoolExecutor(max_workers=provider_max_workers)
 
     # Prepare all files
+    _prepare_files_in_zip([f for f in files_info if ".zip!" in f.key], s3_client)
     offset = 0
     for f_info in files_info:
-        if ".zip!" in f_info.key:
-            _prepare_file_in_zip(f_info, s3_client)
-
         f_info.file_start_offset = offset
         offset += f_info.size
 
@@ -513,7 +675,12 @@ def stream_download_from_s3(
 
     # Create the files iterator using the original approach
     files_iterator = _chunks_from_s3_objects(
-        s3_client, files_info, byte_range, range_size, executor
+        s3_client,
+        files_info,
+        byte_range,
+        range_size,
+        executor,
+        adaptive_range_size=adaptive_range_size,
     )
 
     # Use the existing _build_stream_response function with the additional parameters
@@ -526,6 +693,171 @@ def stream_download_from_s3(
     )
 
 
+# ----- Listing section -----
+
+
+def _list_s3_page(
+    s3_client: S3Client,
+    bucket: str,
+    prefix: str,
+    start_after: Optional[str],
+    params: dict[str, Any],
+) -> tuple[list[dict[str, Any]], bool]:
+    kwargs = dict(params, Bucket=bucket, Prefix=prefix)
+    if start_after:
+        kwargs["StartAfter"] = start_after
+    response = s3_client.list_objects_v2(**kwargs)
+    objects = cast("list[dict[str, Any]]", response.get("Contents", []))
+    return list(objects), bool(response.get("IsTruncated"))
+
+
+def s3_client_identity(s3_client: Any) -> tuple[Optional[str], Optional[str]]:
+    """Endpoint and credentials of a S3 client, identifying in cache keys what the
+    client is allowed to see. Credentials are hashed, not to keep them in keys.
+
+    :param s3_client: s3 client
+    :returns: endpoint URL and digest of the credentials, ``None`` if unknown or unsigned
+    """
+    endpoint_url = getattr(getattr(s3_client, "meta", None), "endpoint_url", None)
+    try:
+        credentials = s3_client._get_credentials()
+    except AttributeError:
+        credentials = None
+    if credentials is None:
+        return endpoint_url, None
+    frozen = credentials.get_frozen_credentials()
+    digest = hashlib.sha256(
+        f"{frozen.access_key}:{frozen.secret_key}:{frozen.token}".encode(),
+        usedforsecurity=False,
+    ).hexdigest()
+    return endpoint_url, digest
+
+
+def iter_s3_pages(
+    s3_client: S3Client,
+    bucket: str,
+    prefix: str,
+    namespace: Optional[str] = None,
+    **params: Any,
+) -> Iterator[list[dict[str, Any]]]:
+    """
+    Iterate over the pages of objects listed under a S3 prefix using ``list_objects_v2``.
+
+    Each page is requested after the last key of the previous one and is cached in
+    :data:`s3_listing_cache` for ``EODAG_S3_LISTING_CACHE_TTL`` seconds, so that pages
+    already listed are not requested again, even if a previous iteration stopped early.
+    Pages are cached for the endpoint and credentials of the client, see
+    :func:`s3_client_identity`.
+    Cached objects are shared, and must not be modified.
+
+    :param s3_client: s3 client used to list the objects
+    :param bucket: Bucket name
+    :param prefix: Prefix of the listed objects
+    :param namespace: (optional) Namespace of the cached pages, usually the provider name
+    :param params: Additional ``list_objects_v2`` parameters (e.g. ``RequestPayer``)
+    :returns: Lists of objects, as returned in ``list_objects_v2`` ``Contents``
+    """
+    endpoint_url, credentials_digest = s3_client_identity(s3_client)
+    start_after: Optional[str] = None
+    while True:
+        objects, truncated = s3_listing_cache.get_or_set(
+            (
+                namespace,
+                endpoint_url,
+                credentials_digest,
+                bucket,
+                prefix,
+                start_after,
+                *sorted(params.items()),
+            ),
+            lambda: _list_s3_page(s3_client, bucket, prefix, start_after, params),
+            copy_value=False,
+        )
+        yield objects
+        if not truncated or not objects:
+            return
+        start_after = objects[-1]["Key"]
+
+
+def list_s3_objects(
+    s3_client: S3Client,
+    bucket: str,
+    prefix: str,
+    namespace: Optional[str] = None,
+    **params: Any,
+) -> list[dict[str, Any]]:
+    """
+    List all the objects under a S3 prefix, using the cached pages of :func:`iter_s3_pages`.
+
+    :param s3_client: s3 client used to list the objects
+    :param bucket: Bucket name
+    :param prefix: Prefix of the listed objects
+    :param namespace: (optional) Namespace of the cached pages, usually the provider name
+    :param params: Additional ``list_objects_v2`` parameters (e.g. ``RequestPayer``)
+    :returns: The objects, as returned in ``list_objects_v2`` ``Contents``
+    """
+    return [
+        obj
+        for page in iter_s3_pages(s3_client, bucket, prefix, namespace, **params)
+        for obj in page
+    ]
+
+
+def list_s3_prefixes(
+    prefixes: Iterable[str],
+    list_prefix: Callable[[str], list[T]],
+    get_key: Callable[[T], str],
+    max_workers: Optional[int] = None,
+) -> dict[str, list[T]]:
+    """
+    List the objects under several prefixes of a bucket.
+
+    Only the smallest set of disjoint prefixes covering the requested ones is listed, in
+    parallel, and the objects of each requested prefix are then taken from the listing of
+    the prefix covering it.
+
+    >>> listings = list_s3_prefixes(
+    ...     ["a/b", "a/", "c/"],
+    ...     lambda prefix: [prefix + "1", prefix + "b2"],
+    ...     get_key=str,
+    ... )
+    >>> listings == {"a/": ["a/1", "a/b2"], "a/b": ["a/b2"], "c/": ["c/1", "c/b2"]}
+    True
+
+    :param prefixes: Prefixes of the listed objects
+    :param list_prefix: Callable listing the objects under a prefix
+    :param get_key: Callable returning the key of a listed object
+    :param max_workers: (optional) Maximum number of concurrent listings
+    :returns: The objects listed under each requested prefix
+    """
+    requested = sorted(set(prefixes))
+    # a prefix is sorted just after the prefixes it starts with
+    disjoint_prefixes: list[str] = []
+    for prefix in requested:
+        if not disjoint_prefixes or not prefix.startswith(disjoint_prefixes[-1]):
+            disjoint_prefixes.append(prefix)
+
+    if len(disjoint_prefixes) > 1:
+        with ThreadPoolExecutor(
+            max_workers=min(
+                len(disjoint_prefixes), max_workers or len(disjoint_prefixes)
+            )
+        ) as executor:
+            listed = dict(
+                zip(disjoint_prefixes, executor.map(list_prefix, disjoint_prefixes))
+            )
+    else:
+        listed = {prefix: list_prefix(prefix) for prefix in disjoint_prefixes}
+
+    listings: dict[str, list[T]] = {}
+    for prefix in requested:
+        covering_prefix = next(p for p in listed if prefix.startswith(p))
+        listings[prefix] = [
+            obj for obj in listed[covering_prefix] if get_key(obj).startswith(prefix)
+        ]
+    return listings
+
+
 def update_assets_from_s3(
     product: EOProduct,
     auth: AwsAuth,
@@ -578,10 +910,9 @@ def update_assets_from_s3(
                     }
         else:
             # List files in prefix
-            s3_objects = s3_client.list_objects(
-                Bucket=bucket, Prefix=prefix, MaxKeys=300
-            )
-            for item_s3 in s3_objects.get("Contents", []):
+            for item_s3 in list_s3_objects(
+                s3_client, bucket, prefix, namespace=product.provider
+            ):
 
                 url = "s3://{bucket}/{key}".format(bucket=bucket, key=item_s3["Key"])
                 key, roles = product.driver.guess_asset_key_and_roles(url, product)
@@ -630,33 +961,41 @@ def update_assets_from_s3(
 # ----- ZIP section -----
 
 
-def open_s3_zipped_object(
-    bucket_name: str,
-    key_name: str,
-    s3_client: S3Client,
-    zip_size: Optional[int] = None,
-    partial: bool = True,
-) -> tuple[ZipFile, bytes]:
-    """
-    Fetches the central directory and EOCD (End Of Central Directory) from an S3 object and opens a ZipFile in memory.
+class ZipMember(NamedTuple):
+    """Position of a member of a zipped S3 object, read from its central directory"""
 
-    This function retrieves the ZIP file's central directory and EOCD by performing range requests on the S3 object.
-    It supports partial fetching (only the central directory and EOCD) for efficiency, or full ZIP download if needed.
+    #: Offset of the local file header of the member in the archive
+    header_offset: int
+    #: Size of the member data in the archive
+    compress_size: int
+    #: Size of the uncompressed member
+    file_size: int
+    #: Compression method of the member (e.g. ``ZIP_STORED`` or ``ZIP_DEFLATED``)
+    compress_type: int
 
-    :param bucket_name: Name of the S3 bucket containing the ZIP file.
-    :param key_name: Key (path) of the ZIP file in the S3 bucket.
-    :param s3_client: S3 client instance used to perform range requests.
-    :param zip_size: Size of the ZIP file in bytes. If None, it will be determined via a HEAD request.
-    :param partial: If True, only fetch the central directory and EOCD. If False, fetch the entire ZIP file.
-    :return: Tuple containing the opened ZipFile object and the central directory bytes.
-    :raises InvalidDataError: If the EOCD signature is not found in the last 64KB of the file.
-    """
+
+@dataclass
+class _ZipDirectory:
+    """Central directory of a zipped S3 object"""
+
+    #: Size of the archive
+    zip_size: int
+    #: Central directory records
+    cd_data: bytes
+    #: End of central directory record
+    eocd: bytes
+    #: Members of the archive, with header offsets relative to the central directory
+    filelist: list[ZipInfo]
+    #: Index of the positions of the members in the archive, by name
+    members: dict[str, ZipMember]
+
+
+def _read_zip_directory(
+    bucket_name: str, key_name: str, s3_client: S3Client, zip_size: int
+) -> _ZipDirectory:
+    """Fetch and parse the central directory of a zipped S3 object"""
     # EOCD is at least 22 bytes, but can be longer if ZIP comment exists.
     # For simplicity, we fetch last 64KB max (max EOCD + comment length allowed by ZIP spec)
-    if zip_size is None:
-        response = s3_client.head_object(Bucket=bucket_name, Key=key_name)
-        zip_size = int(response["ContentLength"])
-
     fetch_size = min(65536, zip_size)
     eocd_search = fetch_range(
         bucket_name, key_name, zip_size - fetch_size, zip_size - 1, s3_client
@@ -678,13 +1017,80 @@ def open_s3_zipped_object(
         bucket_name, key_name, cd_start, cd_start + cd_size - 1, s3_client
     )
 
+    with ZipFile(io.BytesIO(cd_data + eocd)) as zipf:
+        filelist = zipf.filelist
+    # header offsets parsed without the data preceding the central directory are
+    # relative to its start
+    members = {
+        info.filename: ZipMember(
+            info.header_offset + cd_start,
+            info.compress_size,
+            info.file_size,
+            info.compress_type,
+        )
+        for info in filelist
+    }
+    return _ZipDirectory(zip_size, cd_data, eocd, filelist, members)
+
+
+def _get_zip_directory(
+    bucket_name: str,
+    key_name: str,
+    s3_client: S3Client,
+    zip_size: Optional[int] = None,
+) -> _ZipDirectory:
+    """
+    Central directory of a zipped S3 object, cached in :data:`zip_directory_cache` by
+    bucket, key and ETag. The directory is not cached if ``zip_size`` is given, as the
+    ETag of the object is then unknown.
+    """
+    if zip_size is not None:
+        return _read_zip_directory(bucket_name, key_name, s3_client, zip_size)
+
+    response = s3_client.head_object(Bucket=bucket_name, Key=key_name)
+    object_size = int(response["ContentLength"])
+    if not (etag := response.get("ETag")):
+        return _read_zip_directory(bucket_name, key_name, s3_client, object_size)
+
+    endpoint_url = getattr(getattr(s3_client, "meta", None), "endpoint_url", None)
+    return zip_directory_cache.get_or_set(
+        (bucket_name, key_name, etag, object_size, endpoint_url),
+        lambda: _read_zip_directory(bucket_name, key_name, s3_client, object_size),
+        copy_value=False,
+    )
+
+
+def open_s3_zipped_object(
+    bucket_name: str,
+    key_name: str,
+    s3_client: S3Client,
+    zip_size: Optional[int] = None,
+    partial: bool = True,
+) -> tuple[ZipFile, bytes]:
+    """
+    Fetches the central directory and EOCD (End Of Central Directory) from an S3 object and opens a ZipFile in memory.
+
+    This function retrieves the ZIP file's central directory and EOCD by performing range requests on the S3 object.
+    It supports partial fetching (only the central directory and EOCD) for efficiency, or full ZIP download if needed.
+    Central directories are cached by bucket, key and ETag, so that they are only fetched once per archive.
+
+    :param bucket_name: Name of the S3 bucket containing the ZIP file.
+    :param key_name: Key (path) of the ZIP file in the S3 bucket.
+    :param s3_client: S3 client instance used to perform range requests.
+    :param zip_size: Size of the ZIP file in bytes. If None, it will be determined via a HEAD request.
+    :param partial: If True, only fetch the central directory and EOCD. If False, fetch the entire ZIP file.
+    :return: Tuple containing the opened ZipFile object and the central directory bytes.
+    :raises InvalidDataError: If the EOCD signature is not found in the last 64KB of the file.
+    """
+    directory = _get_zip_directory(bucket_name, key_name, s3_client, zip_size)
+
     zip_data = (
-        cd_data + eocd
+        directory.cd_data + directory.eocd
         if partial
-        else fetch_range(bucket_name, key_name, 0, zip_size - 1, s3_client)
+        else fetch_range(bucket_name, key_name, 0, directory.zip_size - 1, s3_client)
     )
     zipf = ZipFile(io.BytesIO(zip_data))
-    return zipf, cd_data
+    return zipf, directory.cd_data
 
 
 def _parse_central_directory_entry(cd_data: bytes, offset: int) -> dict[str, int]:
@@ -728,6 +1134,78 @@ def _parse_local_file_header(local_header_bytes: bytes) -> int:
     return total_size
 
 
+def files_positions_from_s3_zip(
+    s3_bucket: str,
+    object_key: str,
+    s3_client: S3Client,
+    target_filepaths: Iterable[str],
+) -> dict[str, tuple[int, int]]:
+    """
+    Get the start positions and sizes of several files inside a ZIP archive stored in S3.
+    This function assumes the files are uncompressed (ZIP_STORED).
+
+    The central directory of the archive is cached (see :func:`open_s3_zipped_object`),
+    and the local file headers of files close to each other in the archive are fetched
+    using a single range request.
+
+    :param s3_bucket: The S3 bucket name.
+    :param object_key: The S3 object key for the ZIP file.
+    :param s3_client: The Boto3 S3 client.
+    :param target_filepaths: The file paths inside the ZIP archive to locate.
+    :return: A tuple (file_data_start, file_size) per file path
+    :raises FileNotFoundError: If a target file is not found in the ZIP archive.
+    :raises NotImplementedError: If a file is not uncompressed (ZIP_STORED)
+    """
+    directory = _get_zip_directory(s3_bucket, object_key, s3_client)
+
+    members: dict[str, ZipMember] = {}
+    for target_filepath in target_filepaths:
+        member = directory.members.get(target_filepath)
+        if member is None:
+            raise FileNotFoundError(f"File {target_filepath} not found in ZIP archive")
+        if member.compress_type != ZIP_STORED:
+            raise NotImplementedError(
+                "Only uncompressed files (ZIP_STORED) are supported."
+            )
+        members[target_filepath] = member
+
+    # Group local file headers that can be fetched together. We fetch 4 KB per header
+    # to cover large filenames/extra fields safely
+    groups: list[list[int]] = []
+    for offset in sorted({m.header_offset for m in members.values()}):
+        if (
+            groups
+            and offset + ZIP_LOCAL_HEADER_FETCH_SIZE - groups[-1][0]
+            <= ZIP_HEADERS_COALESCE_SIZE
+        ):
+            groups[-1].append(offset)
+        else:
+            groups.append([offset])
+
+    local_header_sizes: dict[int, int] = {}
+    for group in groups:
+        group_start = group[0]
+        headers_bytes = fetch_range(
+            s3_bucket,
+            object_key,
+            group_start,
+            group[-1] + ZIP_LOCAL_HEADER_FETCH_SIZE - 1,
+            s3_client,
+        )
+        for offset in group:
+            local_header_sizes[offset] = _parse_local_file_header(
+                headers_bytes[offset - group_start :]
+            )
+
+    return {
+        path: (
+            member.header_offset + local_header_sizes[member.header_offset],
+            member.file_size,
+        )
+        for path, member in members.items()
+    }
+
+
 def file_position_from_s3_zip(
     s3_bucket: str,
     object_key: str,
@@ -751,60 +1229,9 @@ def file_position_from_s3_zip(
     :raises FileNotFoundError: If the target file is not found in the ZIP archive.
     :raises NotImplementedError: If the file is not uncompressed (ZIP_STORED)
     """
-    zipf, cd_data = open_s3_zipped_object(s3_bucket, object_key, s3_client)
-
-    # Find file in zipf.filelist to get its index and f_info
-    target_info = None
-    cd_offset = 0
-    for fi in zipf.filelist:
-        if fi.filename == target_filepath:
-            target_info = fi
-            break
-        # 46 is the fixed size (in bytes) of the Central Directory File Header according to the ZIP spec
-        cd_entry_len = (
-            46 + len(fi.filename.encode("utf-8")) + len(fi.extra) + len(fi.comment)
-        )
-        cd_offset += cd_entry_len
-
-    zipf.close()
-
-    if target_info is None:
-        raise FileNotFoundError(f"File {target_filepath} not found in ZIP archive")
-
-    if target_info.compress_type != ZIP_STORED:
-        raise NotImplementedError("Only uncompressed files (ZIP_STORED) are supported.")
-
-    # Parse central directory entry to get relative local header offset
-    cd_entry = cd_data[
-        cd_offset : cd_offset
-        + (
-            46
-            + len(target_info.filename.encode("utf-8"))
-            + len(target_info.extra)
-            + len(target_info.comment)
-        )
-    ]
-    cd_entry_info = _parse_central_directory_entry(cd_entry, 0)
-
-    local_header_offset = cd_entry_info["relative_offset"]
-
-    # Fetch local file header from S3 (at least 30 bytes + filename + extra field)
-    # We'll fetch 4 KB max to cover large filenames/extra fields safely
-    local_header_fetch_size = 4096
-    local_header_bytes = fetch_range(
-        s3_bucket,
-        object_key,
-        local_header_offset,
-        local_header_offset + local_header_fetch_size - 1,
-        s3_client,
-    )
-
-    local_header_size = _parse_local_file_header(local_header_bytes)
-
-    # Calculate file data start and end offsets
-    file_data_start = local_header_offset + local_header_size
-
-    return file_data_start, target_info.file_size
+    return files_positions_from_s3_zip(
+        s3_bucket, object_key, s3_client, [target_filepath]
+    )[target_filepath]
 
 
 def list_files_in_s3_zipped_object(
@@ -821,7 +1248,203 @@ def list_files_in_s3_zipped_object(
     :param s3_resource: s3 resource used to fetch the object
     :returns: List of files in zip
     """
-    zip_file, _ = open_s3_zipped_object(bucket_name, key_name, s3_client)
-    with zip_file:
-        logger.debug("Found %s files in %s" % (len(zip_file.filelist), key_name))
-        return zip_file.filelist
+    filelist = _get_zip_directory(bucket_name, key_name, s3_client).filelist
+    logger.debug("Found %s files in %s" % (len(filelist), key_name))
+    return list(filelist)
+
+
+def parse_s3_url(url: str) -> tuple[str, str]:
+    """
+    Bucket and key of a ``s3://bucket/key`` URL.
+
+    >>> parse_s3_url("s3://my.bucket/some/prefix/")
+    ('my.bucket', 'some/prefix/')
+
+    :param url: The S3 URL.
+    :returns: The bucket name and the key, which may be empty.
+    :raises: :class:`ValueError` if the URL is not a S3 URL.
+    """
+    scheme, _, location = url.partition("://")
+    bucket, _, key = location.partition("/")
+    if scheme.lower() != "s3" or not bucket:
+        raise ValueError(f"{url} is not a s3://bucket/key URL")
+    return bucket, key
+
+
+def _read_part(stream: Union[IO[bytes], io.RawIOBase], size: int) -> bytearray:
+    """Read ``size`` bytes of a stream, or less only if it ends"""
+    part = bytearray(size)
+    filled = 0
+    with memoryview(part) as view:
+        while filled < size:
+            read = stream.readinto(view[filled:])  # type: ignore[union-attr]
+            if not read:
+                break
+            filled += read
+    del part[filled:]
+    return part
+
+
+# Multipart uploads started by this process and not completed, by S3 client identity,
+# bucket and key: only these uploads are resumed, not the ones of other writers
+_started_uploads: dict[tuple[Optional[str], ...], str] = {}
+_started_uploads_lock = threading.Lock()
+
+
+def _find_multipart_upload(
+    s3_client: S3Client, bucket: str, key: str
+) -> tuple[Optional[str], dict[int, str]]:
+    """Incomplete multipart upload of a key started by this process, with the ETags of
+    its uploaded parts. The upload is claimed, so that it is not resumed concurrently.
+    """
+    with _started_uploads_lock:
+        upload_id = _started_uploads.pop(
+            (*s3_client_identity(s3_client), bucket, key), None
+        )
+    if upload_id is None:
+        return None, {}
+    try:
+        parts = {
+            part["PartNumber"]: part["ETag"]
+            for page in s3_client.get_paginator("list_parts").paginate(
+                Bucket=bucket, Key=key, UploadId=upload_id
+            )
+            for part in page.get("Parts", [])
+        }
+    except botocore.exceptions.ClientError as e:
+        # aborted, or expired by a lifecycle rule of the bucket
+        logger.debug(
+            "Upload %s of s3://%s/%s not resumed: %s", upload_id, bucket, key, e
+        )
+        return None, {}
+    return upload_id, parts
+
+
+def upload_stream_to_s3(
+    stream: Union[IO[bytes], io.RawIOBase],
+    bucket: str,
+    key: str,
+    s3_client: S3Client,
+    part_size: int = DEFAULT_UPLOAD_PART_SIZE,
+    max_concurrency: int = DEFAULT_UPLOAD_MAX_CONCURRENCY,
+    content_type: Optional[str] = None,
+    progress_callback: Optional[Callable[[int], Any]] = None,
+    size: Optional[int] = None,
+) -> None:
+    """
+    Upload a binary stream to a S3 object without writing it on disk, using a multipart
+    upload whose parts are uploaded concurrently.
+
+    At most ``max_concurrency`` parts are uploaded at once while the next one is read, so
+    that the memory used is bounded by ``(max_concurrency + 1) * part_size``. A stream
+    shorter than a part is uploaded using a single request. If the size of the stream is
+    known, parts are enlarged so that the stream fits in :data:`MAX_UPLOAD_PARTS` parts;
+    otherwise streams larger than ``MAX_UPLOAD_PARTS * part_size`` cannot be uploaded.
+
+    An upload interrupted in the same process is resumed: the multipart upload it left
+    incomplete for the same key is reused, and the parts already uploaded with the same
+    content (having the MD5 digest of the new part as ETag) are not uploaded again. They
+    still have to be read from the stream. Incomplete multipart uploads of other writers
+    are never reused. Incomplete multipart uploads are not aborted, they should be cleaned
+    up by a lifecycle rule of the bucket.
+
+    :param stream: The binary stream, supporting ``readinto()``
+    :param bucket: Bucket of the uploaded object
+    :param key: Key of the uploaded object
+    :param s3_client: S3 client used to upload the object
+    :param part_size: (optional) Size in bytes of the parts of the upload
+    :param max_concurrency: (optional) Maximum number of parts uploaded concurrently
+    :param content_type: (optional) Content type of the uploaded object
+    :param progress_callback: (optional) Callable called with the size of each part read
+    :param size: (optional) Size in bytes of the stream
+    :raises: :class:`ValueError` if ``part_size`` is lower than
+             :data:`MIN_UPLOAD_PART_SIZE`
+    """
+    if part_size < MIN_UPLOAD_PART_SIZE:
+        raise ValueError(
+            f"Parts of multipart uploads must be at least {MIN_UPLOAD_PART_SIZE} bytes"
+        )
+    if size:
+        part_size = max(part_size, -(-size // MAX_UPLOAD_PARTS))
+    extra_args: dict[str, Any] = {"ContentType": content_type} if content_type else {}
+
+    part = _read_part(stream, part_size)
+    if len(part) < part_size:
+        # bytearray bodies are accepted by botocore, not copied to bytes
+        s3_client.put_object(
+            Bucket=bucket, Key=key, Body=cast(bytes, part), **extra_args
+        )
+        if progress_callback:
+            progress_callback(len(part))
+        return
+
+    upload_id, uploaded_etags = _find_multipart_upload(s3_client, bucket, key)
+    if upload_id is None:
+        upload_id = s3_client.create_multipart_upload(
+            Bucket=bucket, Key=key, **extra_args
+        )["UploadId"]
+    else:
+        logger.info(
+            "Resuming upload of s3://%s/%s, %s parts already uploaded",
+            bucket,
+            key,
+            len(uploaded_etags),
+        )
+    upload_key = (*s3_client_identity(s3_client), bucket, key)
+
+    etags: dict[int, str] = {}
+
+    def upload_part(part_number: int, data: bytearray) -> None:
+        response = s3_client.upload_part(
+            Bucket=bucket,
+            Key=key,
+            UploadId=upload_id,
+            PartNumber=part_number,
+            Body=cast(bytes, data),
+        )
+        etags[part_number] = response["ETag"]
+
+    try:
+        with ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="eodag-upload"
+        ) as executor:
+            running: set[Future[None]] = set()
+            part_number = 1
+            while part:
+                uploaded_etag = uploaded_etags.get(part_number, "").strip('"')
+                if (
+                    uploaded_etag
+                    == hashlib.md5(part, usedforsecurity=False).hexdigest()
+                ):
+                    etags[part_number] = uploaded_etags[part_number]
+                else:
+                    if len(running) >= max_concurrency:
+                        done, running = wait(running, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            future.result()
+                    running.add(executor.submit(upload_part, part_number, part))
+                if progress_callback:
+                    progress_callback(len(part))
+                if len(part) < part_size:
+                    break
+                part_number += 1
+                part = _read_part(stream, part_size)
+            for future in running:
+                future.result()
+    except BaseException:
+        # the upload can be resumed by the next try of this process
+        with _started_uploads_lock:
+            _started_uploads[upload_key] = upload_id
+        raise
+
+    s3_client.complete_multipart_upload(
+        Bucket=bucket,
+        Key=key,
+        UploadId=upload_id,
+        MultipartUpload={
+            "Parts": [
+                {"PartNumber": number, "ETag": etags[number]}
+                for number in sorted(etags)
+            ]
+        },
+    )
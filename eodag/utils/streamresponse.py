@@ -17,11 +17,13 @@
 # limitations under the License.
 from __future__ import annotations
 
+import io
 import os
 import signal
+import sys
 import threading
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Iterable, Iterator, Mapping, Optional, Union
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Mapping, Optional, Union
 
 if TYPE_CHECKING:
     from requests.structures import CaseInsensitiveDict
@@ -34,10 +36,26 @@ def _new_case_insensitive_dict(headers: Optional[Mapping[str, str]] = None):
     return CaseInsensitiveDict(headers) if headers else CaseInsensitiveDict()
 
 
-class StreamResponseContent(Iterable[bytes]):
+class StreamResponseContent(io.RawIOBase):
     """
-    ByteIO minimal compatibility, used by boto3.upload_fileobj that's
-    usually expect BytesIO object, not Iterable[bytes]
+    Iterable of bytes chunks, also readable as a raw binary stream (e.g. by
+    ``boto3.upload_fileobj`` that expects a file-like object).
+
+    Chunks may be ``bytes`` or views on buffers (e.g. :class:`memoryview` on a
+    memory-mapped file), which are iterated as they are.
+
+    Chunks are not copied to an intermediate buffer: :meth:`read` returns whole chunks
+    as they are when possible, and :meth:`readinto` copies data directly to the given
+    buffer. Reads of a given size only return less data at the end of the stream.
+
+    >>> content = StreamResponseContent([b"abc", b"def", b"gh"])
+    >>> content.read(2), content.read(4)
+    (b'ab', b'cdef')
+    >>> buffer = bytearray(4)
+    >>> content.readinto(buffer), bytes(buffer)
+    (2, b'gh\\x00\\x00')
+    >>> content.read()
+    b''
     """
 
     __initialized: bool = False
@@ -71,41 +89,83 @@ class StreamResponseContent(Iterable[bytes]):
         signal.signal(signal.SIGTERM, signal_handler)
         return True
 
-    def __init__(self, content: Union[Iterable[bytes], bytes]):
-        self.buffer: bytes = b""
+    def __init__(self, content: Union[Iterable[Union[bytes, memoryview]], bytes]):
+        super().__init__()
         self.interrupted: bool = False
         StreamResponseContent.__instances.append(self)
         if isinstance(content, bytes):
             content = [content]
-        self.iterator: Iterator[bytes] = iter(content)
+        self.iterator: Iterator[Union[bytes, memoryview]] = iter(content)
+        #: remaining data of the chunk being read
+        self._pending = memoryview(b"")
 
-    def __iter__(self) -> Iterator[bytes]:
-        return self.iterator
+    def __iter__(self) -> Iterator[Union[bytes, memoryview]]:  # type: ignore[override]
+        if self._pending:
+            pending, self._pending = self._pending, memoryview(b"")
+            yield self._to_bytes(pending)
+        yield from self.iterator
 
     def interrupt(self):
         if not self.interrupted:
             self.interrupted = True
 
-    def read(self, size=-1) -> bytes:
-
-        # Fill the buffer with enough bytes to fulfil the request.
-        while not self.interrupted and (size < 0 or len(self.buffer) < size):
-            try:
-                chunk = next(self.iterator)
-                self.buffer = self.buffer + bytes(chunk)
-            except StopIteration:
-                break
+    def readable(self) -> bool:
+        """The content is readable"""
+        return True
 
+    @staticmethod
+    def _to_bytes(view: memoryview) -> bytes:
+        """Bytes of a view, without copy if it covers a whole bytes chunk"""
+        if isinstance(view.obj, bytes) and view.nbytes == len(view.obj):
+            return view.obj
+        return view.tobytes()
+
+    def _next_view(self, size: int) -> memoryview:
+        """View of the next data of at most ``size`` bytes, empty at the end of the
+        content, consumed from the content"""
         if self.interrupted:
             raise InterruptedError()
-
-        result: bytes = b""
-        if size < 0:
-            result, self.buffer = self.buffer, b""
-        else:
-            result, self.buffer = self.buffer[:size], self.buffer[size:]
-
-        return bytes(result)
+        while not self._pending:
+            chunk = next(self.iterator, None)
+            if chunk is None:
+                return self._pending
+            self._pending = memoryview(chunk).cast("B")
+        view = self._pending[:size] if size < self._pending.nbytes else self._pending
+        self._pending = self._pending[view.nbytes :]
+        return view
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        """Read ``size`` bytes, or less at the end of the content, or the whole remaining
+        content if ``size`` is negative
+
+        :raises: :class:`InterruptedError` if the stream was interrupted
+        """
+        remaining = sys.maxsize if size is None or size < 0 else size
+        views: list[memoryview] = []
+        while remaining > 0 and (view := self._next_view(remaining)):
+            views.append(view)
+            remaining -= view.nbytes
+        if len(views) == 1:
+            return self._to_bytes(views[0])
+        return b"".join(views)
+
+    def readall(self) -> bytes:
+        """Read the whole remaining content"""
+        return self.read()
+
+    def readinto(self, buffer: Any) -> int:
+        """Read data into a pre-allocated writable bytes-like object, filling it unless the
+        end of the content is reached
+
+        :returns: the number of bytes read
+        :raises: :class:`InterruptedError` if the stream was interrupted
+        """
+        target = memoryview(buffer).cast("B")
+        size = 0
+        while size < target.nbytes and (view := self._next_view(target.nbytes - size)):
+            target[size : size + view.nbytes] = view
+            size += view.nbytes
+        return size
 
 
 @dataclass
@@ -124,7 +184,7 @@ class StreamResponse:
 
     def __init__(
         self,
-        content: Union[Iterable[bytes], bytes],
+        content: Union[Iterable[Union[bytes, memoryview]], bytes],
         filename: Optional[str] = None,
         size: Optional[int] = None,
         headers: Optional[Mapping[str, str]] = None,
@@ -61,7 +61,11 @@ from eodag.plugins.authentication.header import HeaderAuth
 from eodag.plugins.authentication.openid_connect import CodeAuthorizedAuth
 from eodag.plugins.authentication.header import HTTPHeaderAuth
 from eodag.plugins.authentication.qsauth import HttpQueryStringAuth
-from eodag.plugins.base import PluginTopic
+from eodag.plugins.base import (
+    PluginTopic,
+    _entry_points_cache,
+    get_plugins_entry_points,
+)
 from eodag.plugins.crunch.filter_date import FilterDate
 from eodag.plugins.crunch.filter_latest_tpl_name import FilterLatestByName
 from eodag.plugins.crunch.filter_property import FilterProperty
@@ -71,11 +75,14 @@ from eodag.plugins.download.base import (
     Download,
     DEFAULT_DOWNLOAD_WAIT,
 )
-from eodag.plugins.download.http import HTTPDownload
+from eodag.plugins.download.http import HTTPDownload, asset_headers_cache
 from eodag.plugins.manager import PluginManager
 from eodag.plugins.search import PreparedSearch
 from eodag.plugins.search.base import Search
-from eodag.plugins.search.build_search_result import ecmwf_temporal_to_eodag
+from eodag.plugins.search.build_search_result import (
+    ConstraintsIndex,
+    ecmwf_temporal_to_eodag,
+)
 from eodag.plugins.search.qssearch import QueryStringSearch
 from eodag.types import model_fields_to_annotated
 from eodag.types.queryables import CommonQueryables, Queryables, QueryablesDict
@@ -92,6 +99,7 @@ from eodag.utils import (
     merge_mappings,
     path_to_uri,
     ProgressCallback,
+    AggregatedProgressCallback,
     DownloadedCallback,
     uri_to_path,
     urlsplit,
@@ -104,6 +112,7 @@ from eodag.utils import (
     parse_header,
     get_ssl_context,
     StreamResponse,
+    StreamResponseContent,
     MockResponse,
 )
 from eodag.utils.yaml import cached_yaml_load_all
@@ -111,21 +120,31 @@ from eodag.utils.dates import get_timestamp, to_iso_utc_string
 from eodag.utils.env import is_env_var_true
 from eodag.utils.requests import fetch_json
 from eodag.utils.s3 import (
+    iter_s3_pages,
     list_files_in_s3_zipped_object,
+    list_s3_objects,
+    list_s3_prefixes,
+    s3_client_identity,
+    s3_listing_cache,
     update_assets_from_s3,
     open_s3_zipped_object,
     S3FileInfo,
+    fetch_range,
     file_position_from_s3_zip,
+    files_positions_from_s3_zip,
+    zip_directory_cache,
     _chunks_from_s3_objects,
     _prepare_file_in_zip,
     _compute_file_ranges,
     stream_download_from_s3,
+    upload_stream_to_s3,
 )
 
 
 from eodag.utils.exceptions import (
     AddressNotFound,
     AuthenticationError,
+    ChecksumError,
     DownloadError,
     MisconfiguredError,
     NoMatchingCollection,
@@ -16,16 +16,47 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import hashlib
+import io
+import json
 import os
 import subprocess
 import sys
-from tempfile import TemporaryDirectory
-
-from tests import EODagTestBase, test_cli
-from tests.context import EOProduct
+import threading
+import time
+import zipfile
+from contextlib import contextmanager
+from tempfile import TemporaryDirectory, mkdtemp
+
+import boto3
+import pytest
+from botocore.config import Config
+
+from eodag.utils.archives import extract_zip_members
+from tests import TEST_RESOURCES_PATH, EODagTestBase, test_cli
+from tests.context import (
+    AggregatedProgressCallback,
+    AwsDownload,
+    ConstraintsIndex,
+    EOProduct,
+    HTTPDownload,
+    PluginConfig,
+    PluginManager,
+    ProgressCallback,
+    ProvidersDict,
+    S3FileInfo,
+    StreamResponseContent,
+    deepcopy,
+    load_default_config,
+    stream_download_from_s3,
+)
 from tests.integration import test_core_search_results
 from tests.units import test_stac_reader
-from tests.utils import write_eodag_conf_with_fake_credentials
+from tests.utils import (
+    RangeRequestHandler,
+    range_http_server,
+    write_eodag_conf_with_fake_credentials,
+)
 
 
 def _prepare_isolated_test_env(tmp_home_dir):
@@ -50,6 +81,42 @@ def _run_subprocess(command, env):
     )
 
 
+#: ``import`` durations budgets (in microseconds), as measured with ``python -X importtime``
+IMPORT_TIME_BUDGETS_US = {
+    "eodag": 150_000,
+    "eodag.cli": 300_000,
+}
+
+
+def _import_time_us(module, env):
+    """Measure the cumulative import time of eodag modules needed by ``import module``."""
+    result = _run_subprocess(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"], env
+    )
+    assert result.returncode == 0, result.stderr
+    # lines format: "import time: self [us] | cumulative | imported package",
+    # with nested imports indented in the last column
+    import_time_us = 0
+    for line in result.stderr.splitlines():
+        columns = line.split("|")
+        if len(columns) != 3 or not columns[1].strip().isdigit():
+            continue
+        # top-level imports are separated by one space only
+        package = columns[2].rstrip()[1:]
+        if package.startswith("eodag"):
+            import_time_us += int(columns[1])
+    return import_time_us
+
+
+def _check_import_time_budget(module, env):
+    """Check that importing ``module`` in a fresh interpreter fits in its budget."""
+    import_time_us = _import_time_us(module, env)
+    assert import_time_us <= IMPORT_TIME_BUDGETS_US[module], (
+        f"import {module} took {import_time_us}us, "
+        f"budget is {IMPORT_TIME_BUDGETS_US[module]}us"
+    )
+
+
 def _run_unittest_method(test_case_cls, method_name):
     """Run one unittest test method with isolated setup/teardown."""
     test_case = test_case_cls(methodName=method_name)
@@ -82,6 +149,395 @@ def _instantiate_eodag_subprocess(env):
     assert result.returncode == 0, result.stderr
 
 
+def _large_ecmwf_constraints(size=5000):
+    """Build a CDS-like large constraints list from the recorded ``constraints.json``."""
+    with open(os.path.join(TEST_RESOURCES_PATH, "constraints.json")) as f:
+        recorded = json.load(f)
+    constraints = []
+    for i in range(size // len(recorded)):
+        for entry in recorded:
+            entry = deepcopy(entry)
+            entry["variable"] = [f"{v}_{i % 100}" for v in entry["variable"]]
+            entry["product_type"] = [f"{v}_{i // 100}" for v in entry["product_type"]]
+            constraints.append(entry)
+    return constraints
+
+
+def _ecmwf_search_plugin():
+    """Build a cop_cds search plugin"""
+    plugins_manager = PluginManager(ProvidersDict.from_configs(load_default_config()))
+    return next(plugins_manager.get_search_plugins(provider="cop_cds"))
+
+
+#: filters used in constraints benchmarks, matching a few large constraints entries
+ECMWF_CONSTRAINTS_FILTERS = {
+    "year": "2000",
+    "month": "01",
+    "variable": ["a_42", "b_42"],
+    "product_type": "reanalysis_3",
+    "time": "12:00",
+}
+
+
+def test_benchmark_ecmwf_constraints_filtering(benchmark):
+    constraints = _large_ecmwf_constraints()
+    search_plugin = _ecmwf_search_plugin()
+
+    available_values = benchmark(
+        search_plugin.available_values_from_constraints,
+        constraints,
+        ECMWF_CONSTRAINTS_FILTERS,
+        [],
+    )
+    assert sorted(available_values["variable"]) == ["a_42", "b_42", "c_42"]
+
+
+def test_benchmark_ecmwf_constraints_filtering_indexed(benchmark):
+    constraints_index = ConstraintsIndex(_large_ecmwf_constraints())
+    search_plugin = _ecmwf_search_plugin()
+
+    available_values = benchmark(
+        search_plugin.available_values_from_constraints,
+        constraints_index,
+        ECMWF_CONSTRAINTS_FILTERS,
+        [],
+    )
+    assert sorted(available_values["variable"]) == ["a_42", "b_42", "c_42"]
+
+
+def test_benchmark_search_plugin_validate(benchmark):
+    """Search parameters validation, done for every searched page"""
+    plugins_manager = PluginManager(ProvidersDict.from_configs(load_default_config()))
+    search_plugin = next(
+        plugins_manager.get_search_plugins(
+            collection="S2_MSI_L1C", provider="earth_search"
+        )
+    )
+    search_plugin.config.collection_config = {"collection": "S2_MSI_L1C"}
+    search_params = {"collection": "S2_MSI_L1C", "eo:cloud_cover": 10}
+
+    benchmark(search_plugin.validate, search_params, None)
+
+
+#: content served by the local download servers
+_CONTENT = os.urandom(16 * 1024 * 1024)
+
+
+@contextmanager
+def _range_http_server():
+    """Run a local HTTP server supporting byte ranges and return its url, adding a latency
+    to each request and limiting the bandwidth of each connection (~12 MB/s)"""
+    with range_http_server(_CONTENT, latency=0.05, chunk_delay=0.005) as server:
+        yield f"http://127.0.0.1:{server.server_port}/product.bin"
+
+
+def _http_download(url, output_dir, segments):
+    """Download the given url to a new directory using HTTPDownload"""
+    plugin = HTTPDownload(
+        "foo",
+        PluginConfig.from_mapping(
+            {
+                "type": "HTTPDownload",
+                "output_dir": mkdtemp(dir=output_dir),
+                "extract": False,
+                "download_segments": segments,
+                "download_segment_size": 1024 * 1024,
+            }
+        ),
+    )
+    product = EOProduct(
+        "foo", {"id": "foo", "title": "foo", "eodag:download_link": url}
+    )
+    path = plugin.download(product, progress_callback=ProgressCallback(disable=True))
+    # non-archive files are moved to a directory named after the product
+    path = os.path.join(path, os.listdir(path)[0])
+    with open(path, "rb") as fh:
+        assert fh.read() == _CONTENT
+
+
+@pytest.mark.enable_socket
+def test_benchmark_http_download_single_connection(benchmark):
+    with _range_http_server() as url, TemporaryDirectory() as output_dir:
+        benchmark.pedantic(_http_download, args=(url, output_dir, 1), rounds=3)
+
+
+@pytest.mark.enable_socket
+def test_benchmark_http_download_segmented(benchmark):
+    with _range_http_server() as url, TemporaryDirectory() as output_dir:
+        benchmark.pedantic(_http_download, args=(url, output_dir, 8), rounds=3)
+
+
+class _S3RequestHandler(RangeRequestHandler):
+    """Serves the ``content`` of its server as the object of any bucket and key, as a
+    local S3 stand-in"""
+
+    def do_HEAD(self):
+        time.sleep(self.server.latency)
+        self.send_response(200)
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("Content-Length", str(len(self.server.content)))
+        self.send_header("ETag", self.server.etag)
+        self.send_header("Last-Modified", "Thu, 01 Jan 2026 00:00:00 GMT")
+        self.end_headers()
+
+    def send_header(self, keyword, value):
+        super().send_header(keyword, value)
+        if keyword == "Content-Type":
+            super().send_header("ETag", self.server.etag)
+
+
+def _aws_download(endpoint_url, output_dir, segments):
+    """Download the object served at the given endpoint using AwsDownload transfer settings"""
+    plugin = AwsDownload(
+        "foo",
+        PluginConfig.from_mapping(
+            {
+                "type": "AwsDownload",
+                "download_segments": segments,
+                "download_segment_size": 1024 * 1024,
+            }
+        ),
+    )
+    s3 = boto3.resource(
+        "s3",
+        endpoint_url=endpoint_url,
+        aws_access_key_id="foo",
+        aws_secret_access_key="bar",
+        region_name="us-east-1",
+        config=Config(s3={"addressing_style": "path"}),
+    )
+    path = os.path.join(mkdtemp(dir=output_dir), "product.bin")
+    s3.Object("bucket", "product.bin").download_file(
+        path, Config=plugin._transfer_config(len(_CONTENT))
+    )
+    with open(path, "rb") as fh:
+        assert fh.read() == _CONTENT
+
+
+@contextmanager
+def _s3_server():
+    """Run a local S3 stand-in serving a single object and return its endpoint url"""
+    with range_http_server(
+        _CONTENT, _S3RequestHandler, latency=0.05, chunk_delay=0.005
+    ) as server:
+        server.etag = '"%s"' % hashlib.md5(_CONTENT).hexdigest()
+        yield f"http://127.0.0.1:{server.server_port}"
+
+
+@pytest.mark.enable_socket
+def test_benchmark_aws_download_single_request(benchmark):
+    with _s3_server() as endpoint_url, TemporaryDirectory() as output_dir:
+        benchmark.pedantic(_aws_download, args=(endpoint_url, output_dir, 1), rounds=3)
+
+
+@pytest.mark.enable_socket
+def test_benchmark_aws_download_multipart(benchmark):
+    with _s3_server() as endpoint_url, TemporaryDirectory() as output_dir:
+        benchmark.pedantic(_aws_download, args=(endpoint_url, output_dir, 8), rounds=3)
+
+
+def _rss():
+    """Current resident set size of the process in bytes, or ``None`` if unknown"""
+    try:
+        with open("/proc/self/statm") as fh:
+            return int(fh.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return None
+
+
+@contextmanager
+def _peak_rss_increase():
+    """Sample the resident set size of the process while the block runs, and return a
+    callable giving its peak increase in bytes"""
+    baseline = _rss()
+    peak = [baseline]
+    stop = threading.Event()
+
+    def sample():
+        while not stop.wait(0.005):
+            if (rss := _rss()) is not None:
+                peak[0] = max(peak[0], rss)
+
+    thread = threading.Thread(target=sample, daemon=True)
+    if baseline is not None:
+        thread.start()
+    try:
+        yield lambda: peak[0] - baseline if baseline is not None else None
+    finally:
+        stop.set()
+        if thread.is_alive():
+            thread.join()
+
+
+def _s3_stream(endpoint_url, nb_files, adaptive_range_size, stats):
+    """Stream a multi-file product from the given endpoint, recording its throughput and peak RSS"""
+    s3_client = boto3.client(
+        "s3",
+        endpoint_url=endpoint_url,
+        aws_access_key_id="foo",
+        aws_secret_access_key="bar",
+        region_name="us-east-1",
+        config=Config(s3={"addressing_style": "path"}),
+    )
+    files_info = [
+        S3FileInfo(
+            size=len(_CONTENT),
+            key=f"product/file{i}.bin",
+            bucket_name="bucket",
+        )
+        for i in range(nb_files)
+    ]
+    started = time.perf_counter()
+    with _peak_rss_increase() as peak_rss_increase:
+        response = stream_download_from_s3(
+            s3_client,
+            files_info,
+            compress="raw",
+            range_size=1024 * 1024,
+            provider_max_workers=8,
+            adaptive_range_size=adaptive_range_size,
+        )
+        size = sum(len(chunk) for chunk in response.content)
+    assert size >= nb_files * len(_CONTENT)
+    stats["throughput_mb_s"] = min(
+        stats.get("throughput_mb_s", float("inf")),
+        size / (time.perf_counter() - started) / 1e6,
+    )
+    if (rss_increase := peak_rss_increase()) is not None:
+        stats["peak_rss_increase_mb"] = max(
+            stats.get("peak_rss_increase_mb", 0), rss_increase / 1e6
+        )
+
+
+@pytest.mark.enable_socket
+def test_benchmark_s3_stream_fixed_range_size(benchmark):
+    with _s3_server() as endpoint_url:
+        benchmark.pedantic(
+            _s3_stream, args=(endpoint_url, 4, False, benchmark.extra_info), rounds=3
+        )
+
+
+@pytest.mark.enable_socket
+def test_benchmark_s3_stream_adaptive_range_size(benchmark):
+    with _s3_server() as endpoint_url:
+        benchmark.pedantic(
+            _s3_stream, args=(endpoint_url, 4, True, benchmark.extra_info), rounds=3
+        )
+
+
+#: chunks of 64 KiB of a 256 MiB stream content
+_STREAM_CHUNKS = [os.urandom(64 * 1024)] * 4096
+
+
+def _read_stream_content(read_size, use_readinto, stats):
+    """Read a whole stream content by blocks of the given size, recording its throughput"""
+    content = StreamResponseContent(iter(_STREAM_CHUNKS))
+    size = 0
+    started = time.perf_counter()
+    if use_readinto:
+        buffer = bytearray(read_size)
+        while read := content.readinto(buffer):
+            size += read
+    else:
+        while data := content.read(read_size):
+            size += len(data)
+    assert size == len(_STREAM_CHUNKS) * len(_STREAM_CHUNKS[0])
+    stats["throughput_mb_s"] = min(
+        stats.get("throughput_mb_s", float("inf")),
+        size / (time.perf_counter() - started) / 1e6,
+    )
+
+
+@pytest.mark.parametrize("read_size", [64 * 1024, 8 * 1024 * 1024], ids=["64k", "8m"])
+def test_benchmark_stream_response_content_read(benchmark, read_size):
+    benchmark.pedantic(
+        _read_stream_content,
+        args=(read_size, False, benchmark.extra_info),
+        rounds=5,
+    )
+
+
+@pytest.mark.parametrize("read_size", [64 * 1024, 8 * 1024 * 1024], ids=["64k", "8m"])
+def test_benchmark_stream_response_content_readinto(benchmark, read_size):
+    benchmark.pedantic(
+        _read_stream_content,
+        args=(read_size, True, benchmark.extra_info),
+        rounds=5,
+    )
+
+
+def _safe_like_zip(output_dir):
+    """Build a zip archive of 100 deflated members of 1 MiB"""
+    archive_path = os.path.join(output_dir, "product.zip")
+    with zipfile.ZipFile(archive_path, "w", zipfile.ZIP_DEFLATED) as zfile:
+        for i in range(100):
+            # half random, half compressible data
+            data = os.urandom(512 * 1024) + bytes(512 * 1024)
+            zfile.writestr(f"product.SAFE/GRANULE/IMG_DATA/B{i:03d}.jp2", data)
+    return archive_path
+
+
+def _extract_zip(archive_path, max_workers):
+    """Extract a zip archive to a new directory next to it"""
+    with zipfile.ZipFile(archive_path) as zfile:
+        members = zfile.infolist()
+    extract_zip_members(
+        archive_path,
+        members,
+        mkdtemp(dir=os.path.dirname(archive_path)),
+        max_workers=max_workers,
+    )
+
+
+def test_benchmark_zip_extraction_sequential(benchmark):
+    with TemporaryDirectory() as tmp_dir:
+        archive_path = _safe_like_zip(tmp_dir)
+        benchmark.pedantic(_extract_zip, args=(archive_path, 1), rounds=5)
+
+
+def test_benchmark_zip_extraction_parallel(benchmark):
+    with TemporaryDirectory() as tmp_dir:
+        archive_path = _safe_like_zip(tmp_dir)
+        benchmark.pedantic(_extract_zip, args=(archive_path, None), rounds=5)
+
+
+def _report_chunks_progress(callback_class, threads_count, extra_info):
+    """Report the progress of 64 KiB chunks transferred by several threads to a rendered bar"""
+    chunks_count = 20000
+    progress_callback = callback_class(
+        total=threads_count * chunks_count * 64 * 1024, file=io.StringIO()
+    )
+
+    def _transfer():
+        for _ in range(chunks_count):
+            progress_callback(64 * 1024)
+
+    threads = [threading.Thread(target=_transfer) for _ in range(threads_count)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    progress_callback.close()
+    extra_info["chunks_per_s"] = round(
+        threads_count * chunks_count / (time.perf_counter() - start)
+    )
+
+
+@pytest.mark.parametrize(
+    "callback_class",
+    [ProgressCallback, AggregatedProgressCallback],
+    ids=["direct", "aggregated"],
+)
+@pytest.mark.parametrize("threads_count", [1, 8])
+def test_benchmark_progress_callback(benchmark, callback_class, threads_count):
+    benchmark.pedantic(
+        _report_chunks_progress,
+        args=(callback_class, threads_count, benchmark.extra_info),
+        rounds=5,
+    )
+
+
 def test_benchmark_cli_without_args_subprocess(benchmark):
     with TemporaryDirectory() as tmp_home_dir:
         env = _prepare_isolated_test_env(tmp_home_dir)
@@ -94,6 +550,30 @@ def test_benchmark_cli_without_args_subprocess(benchmark):
         )
 
 
+def test_benchmark_import_eodag_importtime(benchmark):
+    with TemporaryDirectory() as tmp_home_dir:
+        env = _prepare_isolated_test_env(tmp_home_dir)
+
+        benchmark.pedantic(
+            _check_import_time_budget,
+            kwargs={"module": "eodag", "env": env},
+            rounds=10,
+            iterations=1,
+        )
+
+
+def test_benchmark_import_cli_importtime(benchmark):
+    with TemporaryDirectory() as tmp_home_dir:
+        env = _prepare_isolated_test_env(tmp_home_dir)
+
+        benchmark.pedantic(
+            _check_import_time_budget,
+            kwargs={"module": "eodag.cli", "env": env},
+            rounds=10,
+            iterations=1,
+        )
+
+
 def test_benchmark_eodag_instantiation_subprocess(benchmark):
     with TemporaryDirectory() as tmp_home_dir:
         env = _prepare_isolated_test_env(tmp_home_dir)
@@ -479,7 +479,7 @@ class TestEodagCli(unittest.TestCase):
                 count=False, limit=DEFAULT_LIMIT, page=1, **criteria
             )
             api_obj.download_all.assert_called_once_with(
-                search_results, output_dir=None, executor=mock.ANY
+                search_results, output_dir=None, executor=mock.ANY, journal=None
             )
 
     @mock.patch("eodag.api.core.EODataAccessGateway", autospec=True)
@@ -931,6 +931,16 @@ class TestEodagCli(unittest.TestCase):
             self.assertEqual(mock_discover_collections.call_count, 4)
             self.assertTrue(os.path.isfile(f"{other_file_path}.json"))
             os.remove(f"{other_file_path}.json")
+
+            # call with concurrency options
+            exit_code, output, error = self.eodag_command(
+                ["discover", "--max-workers", "2", "--timeout", "30"]
+            )
+            self.assertEqual(exit_code, 0)
+            mock_discover_collections.assert_called_with(
+                mock.ANY, max_workers=2, timeout=30.0
+            )
+            os.remove(default_output_path)
         finally:
             os.chdir(origin_dir)
 
@@ -1005,7 +1015,25 @@ class TestEodagCli(unittest.TestCase):
         self.assertIn("A file may have been downloaded but we cannot locate it", output)
 
         dag.return_value.download_all.assert_called_with(
-            mock.ANY, output_dir=output_dir, executor=mock.ANY
+            mock.ANY, output_dir=output_dir, executor=mock.ANY, journal=None
+        )
+
+        # Testing download journal
+        journal_path = os.path.join(self.tmp_home_dir.name, "journal.db")
+        exit_code, output, error = self.eodag_command(
+            [
+                "download",
+                "--search-results",
+                search_results_path,
+                "-f",
+                config_path,
+                "--journal",
+                journal_path,
+            ],
+        )
+        self.assertEqual(exit_code, 0)
+        dag.return_value.download_all.assert_called_with(
+            mock.ANY, output_dir=None, executor=mock.ANY, journal=journal_path
         )
 
     @mock.patch("eodag.api.core.EODataAccessGateway", autospec=True)
@@ -1054,7 +1082,7 @@ class TestEodagCli(unittest.TestCase):
                 ["foo", "bar"],
             )
             dag.return_value.download_all.assert_called_once_with(
-                fake_result, output_dir=None, executor=mock.ANY
+                fake_result, output_dir=None, executor=mock.ANY, journal=None
             )
 
     @mock.patch(
@@ -1178,7 +1206,14 @@ class TestEodagCli(unittest.TestCase):
         self.assertIsNone(error)
         self.assertIn("Downloaded", output)
 
-        mock_get_quicklook.assert_called_with(mock.ANY, output_dir=output_dir)
+        mock_get_quicklook.assert_called_with(
+            mock.ANY,
+            output_dir=output_dir,
+            progress_callback=mock.ANY,
+            cache_dir=None,
+            max_size=None,
+            session=mock.ANY,
+        )
 
         # Testing the case when no quicklook path is returned
         mock_get_quicklook.return_value = None
@@ -16,9 +16,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
 import subprocess
 import sys
 import unittest
+from tempfile import TemporaryDirectory
+
+from tests.utils import write_eodag_conf_with_fake_credentials
 
 
 class TestEodagInit(unittest.TestCase):
@@ -68,3 +72,64 @@ class TestEodagInit(unittest.TestCase):
         self.assertIsNotNone(eodag.EOProduct)
         self.assertIsNotNone(eodag.SearchResult)
         self.assertIsNotNone(eodag.setup_logging)
+
+    def test_eodag_import_does_not_load_heavy_dependencies(self):
+        """Test that importing eodag or its CLI does not load heavy dependencies"""
+        heavy_modules = [
+            "boto3",
+            "geojson",
+            "jsonpath_ng",
+            "pydantic",
+            "requests",
+            "shapely",
+            "tqdm",
+            "yaml",
+            "eodag.api.core",
+            "eodag.plugins",
+        ]
+        for module in ("eodag", "eodag.cli"):
+            with self.subTest(module=module):
+                result = subprocess.run(
+                    [
+                        sys.executable,
+                        "-c",
+                        f"import sys, {module}; "
+                        f"print(','.join(m for m in {heavy_modules} if m in sys.modules))",
+                    ],
+                    capture_output=True,
+                    text=True,
+                    check=False,
+                )
+                self.assertEqual(
+                    result.returncode,
+                    0,
+                    msg=f"Command failed with stderr: {result.stderr}",
+                )
+                self.assertEqual(result.stdout.strip(), "")
+
+    def test_eodag_gateway_does_not_load_plugins(self):
+        """Test that creating the gateway does not load plugins modules nor their dependencies"""
+        code = (
+            "import sys; from eodag import EODataAccessGateway; EODataAccessGateway(); "
+            "print(','.join(m for m in sys.modules if m == 'boto3' or m.startswith('eodag.plugins.') "
+            "and not m.endswith(('.base', '.manager')) and m.count('.') > 2))"
+        )
+        with TemporaryDirectory() as tmp_home_dir:
+            eodag_conf_dir = os.path.join(tmp_home_dir, ".config", "eodag")
+            os.makedirs(eodag_conf_dir)
+            write_eodag_conf_with_fake_credentials(
+                os.path.join(eodag_conf_dir, "eodag.yml")
+            )
+            result = subprocess.run(
+                [sys.executable, "-c", code],
+                capture_output=True,
+                text=True,
+                check=False,
+                env=dict(os.environ, HOME=tmp_home_dir),
+            )
+        self.assertEqual(
+            result.returncode,
+            0,
+            msg=f"Command failed with stderr: {result.stderr}",
+        )
+        self.assertEqual(result.stdout.strip(), "")
@@ -24,13 +24,14 @@ import logging
 import os
 import shutil
 import tempfile
+import threading
 import unittest
 from importlib.resources import files as res_files
 from tempfile import TemporaryDirectory
 
 import pytest
 import yaml
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Future, ThreadPoolExecutor
 from lxml import html
 from pydantic import ValidationError as PydanticValidationError
 from requests.exceptions import RequestException
@@ -57,7 +58,9 @@ from tests.context import (
     RequestError,
     SearchResult,
     UnsupportedProvider,
+    _entry_points_cache,
     get_geometry_from_various,
+    get_plugins_entry_points,
     load_default_config,
     makedirs,
     mock,
@@ -1389,6 +1392,52 @@ class TestCore(TestCoreBase):
             "Foo collection",
         )
 
+    def test_discover_collections_concurrently(self):
+        """Core api must fetch providers for collections concurrently and report partial results"""
+        barrier = threading.Barrier(2, timeout=5)
+        blocked = threading.Event()
+
+        def concurrent_discovery(**kwargs):
+            # fails with BrokenBarrierError if both discoveries do not run concurrently
+            barrier.wait()
+            return {"providers_config": {}, "collections_config": {}}
+
+        def failing_discovery(**kwargs):
+            raise RequestException("connection reset")
+
+        def blocking_discovery(**kwargs):
+            blocked.wait(5)
+            return {"providers_config": {}, "collections_config": {}}
+
+        discoveries = {
+            name: (mock.Mock(discover_collections=side_effect), {})
+            for name, side_effect in (
+                ("foo", concurrent_discovery),
+                ("bar", concurrent_discovery),
+                ("baz", failing_discovery),
+                ("qux", blocking_discovery),
+            )
+        }
+        try:
+            with self.assertLogs("eodag.core", level="WARNING") as cm:
+                results = self.dag._run_collections_discoveries(
+                    discoveries, max_workers=4, timeout=0.5
+                )
+        finally:
+            blocked.set()
+
+        self.assertDictEqual(
+            results,
+            {
+                "foo": {"providers_config": {}, "collections_config": {}},
+                "bar": {"providers_config": {}, "collections_config": {}},
+                "baz": None,
+                "qux": None,
+            },
+        )
+        self.assertIn("Collections discovery failed for baz", "".join(cm.output))
+        self.assertIn("Collections discovery timed out for qux", "".join(cm.output))
+
     def test_discover_collections_without_plugin(self):
         """Core api must not fetch providers without search and api plugins"""
         delattr(self.dag._providers["earth_search"].config, "search")
@@ -1402,8 +1451,15 @@ class TestCore(TestCoreBase):
     @mock.patch(
         "eodag.api.core.EODataAccessGateway.discover_collections", autospec=True
     )
+    @mock.patch(
+        "eodag.api.core.EODataAccessGateway._discover_providers_collections",
+        autospec=True,
+    )
     def test_fetch_collections_list(
-        self, mock_discover_collections, mock_get_ext_collections_conf
+        self,
+        mock_discover_providers_collections,
+        mock_discover_collections,
+        mock_get_ext_collections_conf,
     ):
         """Core api must fetch collections list and update if needed"""
         # check that no provider has already been fetched
@@ -1447,7 +1503,7 @@ class TestCore(TestCoreBase):
             Collection.create_with_dag(self.dag, id="foo", title="Foo collection"),
         )
 
-        # update existing provider conf and check that discover_collections() is launched for it
+        # update existing provider conf and check that collections discovery is launched for it
         self.assertEqual(mock_discover_collections.call_count, 0)
         self.dag.update_providers_config("""
             earth_search:
@@ -1456,12 +1512,12 @@ class TestCore(TestCoreBase):
                         fetch_url: 'http://new-endpoint'
             """)
         self.dag.fetch_collections_list()
-        mock_discover_collections.assert_called_once_with(
-            self.dag, provider="earth_search"
+        mock_discover_providers_collections.assert_called_once_with(
+            self.dag, [self.dag._providers["earth_search"]]
         )
 
-        # add new provider conf and check that discover_collections() is launched for it
-        self.assertEqual(mock_discover_collections.call_count, 1)
+        # add new provider conf and check that collections discovery is launched for it
+        mock_discover_providers_collections.reset_mock()
         self.dag.update_providers_config("""
             foo_provider:
                 search:
@@ -1472,16 +1528,18 @@ class TestCore(TestCoreBase):
                         _collection: '{collection}'
             """)
         self.dag.fetch_collections_list()
-        mock_discover_collections.assert_called_with(self.dag, provider="foo_provider")
-        # discover_collections() should have been called 2 more times
-        # (once per dynamically configured provider)
-        self.assertEqual(mock_discover_collections.call_count, 3)
+        # dynamically configured providers are discovered together
+        mock_discover_providers_collections.assert_called_once_with(
+            self.dag,
+            [self.dag._providers["earth_search"], self.dag._providers["foo_provider"]],
+        )
+        mock_discover_collections.assert_not_called()
 
         # now check that if provider is specified, only this one is fetched
-        mock_discover_collections.reset_mock()
+        mock_discover_providers_collections.reset_mock()
         self.dag.fetch_collections_list(provider="foo_provider")
-        mock_discover_collections.assert_called_once_with(
-            self.dag, provider="foo_provider"
+        mock_discover_providers_collections.assert_called_once_with(
+            self.dag, [self.dag._providers["foo_provider"]]
         )
 
     @mock.patch("eodag.api.core.get_ext_collections_conf", autospec=True)
@@ -1509,8 +1567,15 @@ class TestCore(TestCoreBase):
     @mock.patch(
         "eodag.api.core.EODataAccessGateway.discover_collections", autospec=True
     )
+    @mock.patch(
+        "eodag.api.core.EODataAccessGateway._discover_providers_collections",
+        autospec=True,
+    )
     def test_fetch_collections_list_updated_system_conf(
-        self, mock_discover_collections, mock_get_ext_collections_conf
+        self,
+        mock_discover_providers_collections,
+        mock_discover_collections,
+        mock_get_ext_collections_conf,
     ):
         """fetch_collections_list must launch collections discovery for new system-wide providers"""
         # add a new system-wide provider not listed in ext-conf
@@ -1540,14 +1605,20 @@ class TestCore(TestCoreBase):
                     mock_get_ext_collections_conf.return_value[provider] = {}
 
             self.dag.fetch_collections_list()
-            mock_discover_collections.assert_called_once_with(
-                self.dag, provider="new_provider"
+            mock_discover_providers_collections.assert_called_once_with(
+                self.dag, [self.dag._providers["new_provider"]]
             )
 
     @mock.patch(
         "eodag.api.core.EODataAccessGateway.discover_collections", autospec=True
     )
-    def test_fetch_collections_list_disabled(self, mock_discover_collections):
+    @mock.patch(
+        "eodag.api.core.EODataAccessGateway._discover_providers_collections",
+        autospec=True,
+    )
+    def test_fetch_collections_list_disabled(
+        self, mock_discover_providers_collections, mock_discover_collections
+    ):
         """fetch_collections_list must not launch collections discovery if disabled"""
 
         # disable collections discovery
@@ -1572,7 +1643,11 @@ class TestCore(TestCoreBase):
                         _collection: '{collection}'
             """)
         self.dag.fetch_collections_list()
-        self.assertEqual(mock_discover_collections.call_count, 2)
+        mock_discover_collections.assert_not_called()
+        mock_discover_providers_collections.assert_called_once_with(
+            self.dag,
+            [self.dag._providers["earth_search"], self.dag._providers["foo_provider"]],
+        )
 
     def test_core_object_set_default_locations_config(self):
         """The core object must set the default locations config on instantiation"""
@@ -1642,17 +1717,56 @@ class TestCore(TestCoreBase):
 
         def skip_qssearch(group):
             ep = mock.MagicMock()
+            ep.extras = []
             if group == "eodag.plugins.search":
                 ep.name = "QueryStringSearch"
-                ep.load = mock.MagicMock(side_effect=ModuleNotFoundError())
+                # plugin needing an extra whose requirements are not installed
+                ep.extras = ["foo"]
+                ep.dist.requires = ['not-installed-foo-lib; extra == "foo"']
             return [ep]
 
         mock_iter_ep.side_effect = skip_qssearch
 
-        dag = EODataAccessGateway(user_conf_file_path=empty_conf_file)
-        self.assertNotIn("sara", dag.providers.names)
-        self.assertEqual(dag._plugins_manager.skipped_plugins, ["QueryStringSearch"])
-        dag._plugins_manager.skipped_plugins = []
+        try:
+            dag = EODataAccessGateway(user_conf_file_path=empty_conf_file)
+            self.assertNotIn("sara", dag.providers.names)
+            self.assertEqual(
+                dag._plugins_manager.skipped_plugins, ["QueryStringSearch"]
+            )
+            # skipped plugins are not loaded
+            ep = get_plugins_entry_points("search")["QueryStringSearch"]
+            ep.load.assert_not_called()
+            dag._plugins_manager.skipped_plugins = []
+        finally:
+            # forget mocked entry points
+            _entry_points_cache.clear()
+
+    @mock.patch("eodag.plugins.base.get_plugins_entry_points", autospec=True)
+    def test_ensure_plugins_loaded_broken_plugin(self, mock_get_ep):
+        """Broken plugins must be reported when plugins of a topic are loaded"""
+        from eodag.plugins.crunch.base import Crunch
+
+        missing_extra_ep = mock.MagicMock(extras=["foo"])
+        missing_extra_ep.name = "MissingExtraCrunch"
+        missing_extra_ep.load.side_effect = ModuleNotFoundError("foo")
+        broken_ep = mock.MagicMock(extras=[])
+        broken_ep.name = "BrokenCrunch"
+        broken_ep.load.side_effect = ImportError("cannot import name 'bar'")
+        mock_get_ep.return_value = {
+            "MissingExtraCrunch": missing_extra_ep,
+            "BrokenCrunch": broken_ep,
+        }
+
+        plugins_loaded = getattr(Crunch, "_plugins_loaded", False)
+        Crunch._plugins_loaded = False
+        try:
+            with self.assertLogs("eodag.plugins.base", level="WARNING") as cm:
+                Crunch.ensure_plugins_loaded()
+        finally:
+            Crunch._plugins_loaded = plugins_loaded
+        self.assertIn("Unable to load plugin: BrokenCrunch.", str(cm.output))
+        self.assertIn("ImportError: cannot import name", str(cm.output))
+        self.assertNotIn("MissingExtraCrunch", str(cm.output))
 
     def test_prune_providers_list_for_search_without_auth(self):
         """Providers needing auth for search but without auth plugin must be pruned on init"""
@@ -2170,10 +2284,73 @@ class TestCore(TestCoreBase):
             additional_properties=True,
             additional_information="Mocked STAC queryables for dedl",
         )
+        # drop cached queryables to get the updated mock ones
+        self.dag._queryables_cache.invalidate()
         queryables = self.dag.list_queryables(collection="ERA5_SL")
 
         self.assertEqual(queryables.additional_properties, True)
 
+    @mock.patch(
+        "eodag.plugins.search.qssearch.StacSearch.list_queryables",
+        autospec=True,
+    )
+    @mock.patch(
+        "eodag.plugins.manager.PluginManager.get_auth_plugin",
+        autospec=True,
+    )
+    @mock.patch(
+        "eodag.api.core.EODataAccessGateway.fetch_collections_list", autospec=True
+    )
+    def test_list_queryables_cached(
+        self,
+        mock_fetch_collections_list: mock.Mock,
+        mock_get_auth_plugin: mock.Mock,
+        mock_stac_list_queryables: mock.Mock,
+    ):
+        """list_queryables must cache queryables per provider, collection and filters"""
+        mock_stac_list_queryables.return_value = QueryablesDict(
+            additional_properties=False, foo="bar"
+        )
+
+        queryables = self.dag.list_queryables(provider="dedl", collection="S2_MSI_L1C")
+        self.assertIn("foo", queryables)
+        # returned queryables are copies
+        queryables.pop("foo")
+        queryables = self.dag.list_queryables(provider="dedl", collection="S2_MSI_L1C")
+        self.assertIn("foo", queryables)
+        self.assertEqual(mock_stac_list_queryables.call_count, 1)
+
+        # other filters are not cached yet
+        self.dag.list_queryables(
+            provider="dedl", collection="S2_MSI_L1C", cloudCover=10
+        )
+        self.assertEqual(mock_stac_list_queryables.call_count, 2)
+
+        # provider configuration update invalidates its cached queryables and models
+        with (
+            mock.patch(
+                "eodag.api.core.QueryablesDict.clear_models_cache"
+            ) as mock_clear_models_cache,
+            mock.patch(
+                "eodag.api.core.clear_stac_metadata_models_cache"
+            ) as mock_clear_stac_metadata_models_cache,
+        ):
+            self.dag.update_providers_config(dict_conf={"dedl": {"priority": 2}})
+            mock_clear_models_cache.assert_called_once_with()
+            mock_clear_stac_metadata_models_cache.assert_called_once_with()
+            self.dag.add_provider("foo_provider", "https://foo.bar/search")
+            self.assertEqual(mock_clear_models_cache.call_count, 2)
+            self.assertEqual(mock_clear_stac_metadata_models_cache.call_count, 2)
+        self.dag.list_queryables(provider="dedl", collection="S2_MSI_L1C")
+        self.assertEqual(mock_stac_list_queryables.call_count, 3)
+
+        # cache can be disabled
+        with mock.patch.dict(os.environ, {"EODAG_QUERYABLES_CACHE_TTL": "0"}):
+            dag = EODataAccessGateway()
+        dag.list_queryables(provider="dedl", collection="S2_MSI_L1C")
+        dag.list_queryables(provider="dedl", collection="S2_MSI_L1C")
+        self.assertEqual(mock_stac_list_queryables.call_count, 5)
+
     @mock.patch(
         "eodag.plugins.manager.PluginManager.get_auth_plugin",
         autospec=True,
@@ -4502,14 +4679,20 @@ class TestCoreDownload(TestCoreBase):
             self.dag.download(product)
             self.assertIn("Local product detected. Download skipped", str(cm.output))
 
-    @mock.patch("eodag.plugins.download.base.as_completed")
+    @staticmethod
+    def _done_future(*args, **kwargs):
+        future = Future()
+        future.set_result("/some/path")
+        return future
+
     @mock.patch(
         "eodag.plugins.download.base.ThreadPoolExecutor", spec=ThreadPoolExecutor
     )
-    def test_download_all_no_executor(self, mock_executor_class, mock_as_completed):
+    def test_download_all_no_executor(self, mock_executor_class):
         """download_all must create its own ThreadPoolExecutor if no executor is provided"""
         mock_executor_instance = mock.Mock(spec=ThreadPoolExecutor)
         mock_executor_instance._max_workers = 5
+        mock_executor_instance.submit.side_effect = self._done_future
         mock_executor_class.return_value = mock_executor_instance
 
         search_result = SearchResult(
@@ -4533,7 +4716,7 @@ class TestCoreDownload(TestCoreBase):
             ]
         )
 
-        self.dag.download_all(search_result, wait=-1, timeout=-1)
+        paths = self.dag.download_all(search_result, wait=-1, timeout=-1)
 
         mock_executor_class.assert_called_once()
         self.assertEqual(mock_executor_instance.submit.call_count, 2)
@@ -4544,13 +4727,13 @@ class TestCoreDownload(TestCoreBase):
             wait=-1,
             timeout=-1,
         )
-        mock_as_completed.assert_called_once()
+        self.assertListEqual(paths, ["/some/path", "/some/path"])
 
-    @mock.patch("eodag.plugins.download.base.as_completed")
-    def test_download_all_with_executor(self, mock_as_completed):
+    def test_download_all_with_executor(self):
         """download_all must use the provided ThreadPoolExecutor if any"""
         mock_executor = mock.Mock(spec=ThreadPoolExecutor)
         mock_executor._max_workers = 5
+        mock_executor.submit.side_effect = self._done_future
 
         search_result = SearchResult(
             [
@@ -4573,7 +4756,7 @@ class TestCoreDownload(TestCoreBase):
             ]
         )
 
-        self.dag.download_all(
+        paths = self.dag.download_all(
             search_result, executor=mock_executor, wait=-1, timeout=-1
         )
 
@@ -4585,7 +4768,7 @@ class TestCoreDownload(TestCoreBase):
             wait=-1,
             timeout=-1,
         )
-        mock_as_completed.assert_called_once()
+        self.assertListEqual(paths, ["/some/path", "/some/path"])
 
 
 class TestCoreProductAlias(TestCoreBase):
@@ -4683,8 +4866,15 @@ class TestCoreProviderGroup(TestCoreBase):
     @mock.patch(
         "eodag.api.core.EODataAccessGateway.discover_collections", autospec=True
     )
+    @mock.patch(
+        "eodag.api.core.EODataAccessGateway._discover_providers_collections",
+        autospec=True,
+    )
     def test_fetch_collections_list_grouped_providers(
-        self, mock_discover_collections, mock_get_ext_collections_conf
+        self,
+        mock_discover_providers_collections,
+        mock_discover_collections,
+        mock_get_ext_collections_conf,
     ):
         """Core api must fetch collections list and update if needed"""
         # store providers
@@ -4721,8 +4911,10 @@ class TestCoreProviderGroup(TestCoreBase):
 
         self.dag.fetch_collections_list(provider=self.group_name)
 
-        # discover_collections() should have been called one time per each provider of the group
-        # which has collection discovery mechanism. dag configuration of these providers should have been updated
+        # collections should have been discovered once for all the providers of the group
+        # which have collection discovery mechanism. dag configuration of these providers should have been updated
+        mock_discover_providers_collections.assert_called_once()
+        discovered_providers = mock_discover_providers_collections.call_args.args[1]
         for name in self.group:
             if self.dag._providers[name].fetchable:
                 self.assertTrue(self.dag._providers[name].collections_fetched)
@@ -4730,7 +4922,7 @@ class TestCoreProviderGroup(TestCoreBase):
                     self.dag._providers[name].collections_config["foo"],
                     {"_collection": "foo"},
                 )
-                mock_discover_collections.assert_called_with(self.dag, provider=name)
+                self.assertIn(self.dag._providers[name], discovered_providers)
             else:
                 self.assertFalse(self.dag._providers[name].collections_fetched)
                 self.assertNotIn(
@@ -17,28 +17,45 @@
 # limitations under the License.
 import hashlib
 import io
+import json
 import os
 import shutil
 import stat
 import tarfile
+import threading
+import time
 import unittest
 import zipfile
 from pathlib import Path
 from tempfile import NamedTemporaryFile, TemporaryDirectory, gettempdir
+from types import SimpleNamespace
 from typing import Any
 from unittest import mock
 
+import pytest
 import responses
+from boto3.s3.transfer import TransferConfig
+from concurrent.futures import ThreadPoolExecutor
+from requests.auth import HTTPBasicAuth
 from requests.structures import CaseInsensitiveDict
 
+from eodag.plugins.download.base import (
+    _BandwidthLimiter,
+    _ConnectionsBudget,
+    _OrderPoller,
+)
 from eodag.utils import MockResponse, ProgressCallback
+from eodag.utils.archives import NotStreamableArchiveError
+from eodag.utils.download_journal import DownloadJournal
 from eodag.utils.exceptions import (
+    AuthenticationError,
     DownloadError,
     MisconfiguredError,
     NoMatchingCollection,
     QuotaExceededError,
     ValidationError,
 )
+from eodag.utils.files import mmap_chunks
 from tests import TEST_RESOURCES_PATH
 from tests.context import (
     DEFAULT_STREAM_REQUESTS_TIMEOUT,
@@ -46,16 +63,22 @@ from tests.context import (
     NOT_AVAILABLE,
     OFFLINE_STATUS,
     USER_AGENT,
+    Asset,
+    ChecksumError,
     EOProduct,
     HTTPDownload,
     NotAvailableError,
     PluginConfig,
     PluginManager,
     ProvidersDict,
+    SearchResult,
+    asset_headers_cache,
     load_default_config,
     path_to_uri,
+    s3_listing_cache,
     uri_to_path,
 )
+from tests.utils import range_http_server
 
 
 class BaseDownloadPluginTest(unittest.TestCase):
@@ -85,6 +108,7 @@ class BaseDownloadPluginTest(unittest.TestCase):
 
     def setUp(self):
         super(BaseDownloadPluginTest, self).setUp()
+        asset_headers_cache.invalidate()
         self.product = EOProduct(
             "sara",
             dict(
@@ -295,6 +319,364 @@ class TestDownloadPluginBase(BaseDownloadPluginTest):
             self.assertFalse(arch_path.exists())
             self.assertTrue(os.path.isfile(Path(output_dir) / "FOO" / "FOO.bar"))
 
+    def test_plugins_download_base_finalize_extract_zip_asset_filter(self):
+        """Download._finalize must only extract zip members matching the asset filter"""
+        plugin = self.get_download_plugin(self.product)
+
+        with TemporaryDirectory() as output_dir:
+            arch_path = Path(output_dir) / "FOO.zip"
+            with zipfile.ZipFile(arch_path, "w", zipfile.ZIP_DEFLATED) as zfile:
+                for i in range(20):
+                    zfile.writestr(f"FOO/IMG_DATA/B{i:02d}.jp2", os.urandom(1000 * i))
+                zfile.writestr("FOO/MTD.xml", b"<foo/>")
+            download_kwargs = dict(
+                output_dir=output_dir, extract=True, delete_archive=False
+            )
+
+            with self.assertLogs(level="INFO") as cm:
+                product_path = plugin._finalize(
+                    str(arch_path), asset=r"B0[0-4]\.jp2", **download_kwargs
+                )
+                self.assertIn("Extracted FOO.zip in", str(cm.output))
+            self.assertListEqual(
+                sorted(p.name for p in Path(product_path).glob("**/*") if p.is_file()),
+                [f"B0{i}.jp2" for i in range(5)],
+            )
+
+            # no matching member
+            shutil.rmtree(product_path)
+            with self.assertRaises(NotAvailableError):
+                plugin._finalize(str(arch_path), asset="foo", **download_kwargs)
+
+    def _scheduled_products(self, provider_max_workers=None):
+        products = SearchResult(
+            [
+                EOProduct(
+                    "sara",
+                    dict(geometry="POINT (0 0)", title=f"product_{i}", id=f"p{i}"),
+                )
+                for i in range(3)
+            ]
+        )
+        for product in products:
+            product.downloader = SimpleNamespace(
+                config=SimpleNamespace(
+                    type="HTTPDownload", max_workers=provider_max_workers
+                )
+            )
+        return products
+
+    def test_plugins_download_base_download_all_no_batch(self):
+        """Download.download_all must start a product download as soon as a worker is free"""
+        plugin = self.get_download_plugin(self.product)
+        products = self._scheduled_products()
+        last_started = threading.Event()
+
+        # the first download only ends once the last one has started
+        products[0].download = mock.Mock(
+            side_effect=lambda **kw: last_started.wait(5) and "path_0"
+        )
+        products[1].download = mock.Mock(return_value="path_1")
+        products[2].download = mock.Mock(
+            side_effect=lambda **kw: last_started.set() or "path_2"
+        )
+
+        paths = plugin.download_all(
+            products, executor=ThreadPoolExecutor(max_workers=2)
+        )
+        # the first product ends after the second one, and concurrently with the last one
+        self.assertEqual(paths[0], "path_1")
+        self.assertCountEqual(paths, ["path_0", "path_1", "path_2"])
+
+    def test_plugins_download_base_download_all_provider_limit(self):
+        """Download.download_all must respect the provider concurrent downloads limit"""
+        plugin = self.get_download_plugin(self.product)
+        products = self._scheduled_products(provider_max_workers=1)
+        running = []
+        max_running = []
+        lock = threading.Lock()
+
+        def download(**kwargs):
+            with lock:
+                running.append(1)
+                max_running.append(len(running))
+            time.sleep(0.05)
+            with lock:
+                running.pop()
+            return "path"
+
+        for product in products:
+            product.download = mock.Mock(side_effect=download)
+
+        paths = plugin.download_all(
+            products, executor=ThreadPoolExecutor(max_workers=4)
+        )
+        self.assertEqual(len(paths), 3)
+        self.assertEqual(max(max_running), 1)
+
+    @mock.patch("eodag.plugins.download.base.sleep", autospec=True)
+    def test_plugins_download_base_download_all_retry(self, mock_sleep):
+        """Download.download_all must retry products not available yet"""
+        plugin = self.get_download_plugin(self.product)
+        products = self._scheduled_products()[:1]
+        products[0].download = mock.Mock(
+            side_effect=[NotAvailableError("not yet"), "path"]
+        )
+
+        paths = plugin.download_all(
+            products, executor=ThreadPoolExecutor(max_workers=2), wait=0, timeout=1
+        )
+        self.assertListEqual(paths, ["path"])
+        self.assertEqual(products[0].download.call_count, 2)
+
+    def test_plugins_download_base_download_all_journal(self):
+        """Download.download_all must record downloads in the journal and resume them"""
+        plugin = self.get_download_plugin(self.product)
+        journal_path = os.path.join(self.output_dir, "journal.db")
+        product_paths = []
+        for i in range(3):
+            product_paths.append(os.path.join(self.output_dir, f"product_{i}"))
+            with open(product_paths[-1], "wb") as fh:
+                fh.write(b"x" * (i + 1))
+
+        products = self._scheduled_products()
+        products[0].download = mock.Mock(return_value=product_paths[0])
+        products[1].download = mock.Mock(side_effect=Exception("boom"))
+        products[2].download = mock.Mock(return_value=product_paths[2])
+        paths = plugin.download_all(
+            products, executor=ThreadPoolExecutor(max_workers=2), journal=journal_path
+        )
+        self.assertCountEqual(paths, [product_paths[0], product_paths[2]])
+
+        entries = DownloadJournal(journal_path).entries()
+        self.assertListEqual(
+            [(e["product_id"], e["state"], e["bytes"]) for e in entries],
+            [("p0", "done", 1), ("p1", "failed", 0), ("p2", "done", 3)],
+        )
+        self.assertEqual(entries[1]["error"], "boom")
+
+        # resumed batch: only the failed product is downloaded again
+        products = self._scheduled_products()
+        for product, path in zip(products, product_paths):
+            product.download = mock.Mock(return_value=path)
+        paths = plugin.download_all(
+            products, executor=ThreadPoolExecutor(max_workers=2), journal=journal_path
+        )
+        self.assertCountEqual(paths, product_paths)
+        products[0].download.assert_not_called()
+        products[1].download.assert_called_once()
+        products[2].download.assert_not_called()
+        self.assertEqual(products[0].location, f"file://{product_paths[0]}")
+        self.assertEqual(DownloadJournal(journal_path).get(products[1])["attempts"], 2)
+
+    def test_plugins_download_base_download_all_interrupted(self):
+        """Download.download_all must release its order poller and journal claims when interrupted"""
+        plugin = self.get_download_plugin(self.product)
+        journal_path = os.path.join(self.output_dir, "journal.db")
+        products = self._scheduled_products()[:2]
+        started = threading.Event()
+
+        def slow_download(**kwargs):
+            started.set()
+            time.sleep(0.2)
+            return "path_1"
+
+        def failing_download(**kwargs):
+            started.wait()
+            raise AuthenticationError("bad credentials")
+
+        products[0].download = mock.Mock(side_effect=failing_download)
+        products[1].download = mock.Mock(side_effect=slow_download)
+        with (
+            mock.patch(
+                "eodag.plugins.download.base._OrderPoller.shutdown", autospec=True
+            ) as mock_shutdown,
+            self.assertRaises(AuthenticationError),
+        ):
+            plugin.download_all(
+                products,
+                executor=ThreadPoolExecutor(max_workers=2),
+                journal=journal_path,
+            )
+        mock_shutdown.assert_called_once()
+        entries = DownloadJournal(journal_path).entries()
+        self.assertListEqual(
+            [(e["product_id"], e["state"], e["error"]) for e in entries],
+            [
+                ("p0", "failed", "bad credentials"),
+                ("p1", "failed", "interrupted"),
+            ],
+        )
+
+    @mock.patch("eodag.plugins.download.base.sleep", autospec=True)
+    def test_plugins_download_base_download_all_journal_claimed(self, mock_sleep):
+        """Download.download_all must not download products claimed by another process"""
+        plugin = self.get_download_plugin(self.product)
+        journal_path = os.path.join(self.output_dir, "journal.db")
+        products = self._scheduled_products()[:2]
+        other_journal = DownloadJournal(journal_path)
+        other_journal.claim(products[0])
+
+        def other_process_download(seconds):
+            # the other process finishes its download while this one waits for it
+            other_journal.set_state(
+                products[0], DownloadJournal.DONE, path=self.output_dir
+            )
+
+        mock_sleep.side_effect = other_process_download
+        products[0].download = mock.Mock(return_value="path_0")
+        products[1].download = mock.Mock(return_value="path_1")
+
+        paths = plugin.download_all(
+            products,
+            executor=ThreadPoolExecutor(max_workers=2),
+            journal=DownloadJournal(journal_path, lease=1),
+        )
+        self.assertListEqual(paths, ["path_1", self.output_dir])
+        products[0].download.assert_not_called()
+
+        # products already transferred to S3 keep their location
+        other_journal.claim(products[1])
+        other_journal.set_state(
+            products[1], DownloadJournal.DONE, path="s3://bucket/p1"
+        )
+        location = products[1].location
+        paths = plugin.download_all(
+            products[1:],
+            executor=ThreadPoolExecutor(max_workers=2),
+            journal=DownloadJournal(journal_path, lease=1),
+        )
+        self.assertListEqual(paths, ["s3://bucket/p1"])
+        self.assertEqual(products[1].location, location)
+
+    def test_plugins_download_base_download_all_target(self):
+        """Download.download_all must transfer products to the target instead of downloading them"""
+        plugin = self.get_download_plugin(self.product)
+        journal_path = os.path.join(self.output_dir, "journal.db")
+        products = self._scheduled_products()
+        for product in products:
+            product.download = mock.Mock()
+            product.transfer_to = mock.Mock(
+                side_effect=lambda url, **kwargs: f"{url}{kwargs['part_size']}"
+            )
+
+        paths = plugin.download_all(
+            products,
+            executor=ThreadPoolExecutor(max_workers=2),
+            journal=journal_path,
+            target="s3://bucket/prefix",
+            part_size=123,
+        )
+        self.assertCountEqual(paths, ["s3://bucket/prefix/123"] * 3)
+        for product in products:
+            product.download.assert_not_called()
+            product.transfer_to.assert_called_once_with(
+                "s3://bucket/prefix/",
+                progress_callback=mock.ANY,
+                executor=mock.ANY,
+                wait=mock.ANY,
+                timeout=-1,
+                part_size=123,
+            )
+
+        # transferred products are not transferred again
+        for product in products:
+            product.transfer_to.reset_mock()
+        paths = plugin.download_all(
+            products,
+            executor=ThreadPoolExecutor(max_workers=2),
+            journal=journal_path,
+            target="s3://bucket/prefix",
+        )
+        self.assertCountEqual(paths, ["s3://bucket/prefix/123"] * 3)
+        for product in products:
+            product.transfer_to.assert_not_called()
+
+        with self.assertRaises(ValueError):
+            plugin.download_all(products, target="/local/path")
+
+    def test_plugins_download_base_download_all_order_poller(self):
+        """Download.download_all must check pending orders with a shared poller"""
+        plugin = self.get_download_plugin(self.product)
+        products = self._scheduled_products()
+        checks = []
+
+        def order(product, auth, timeout):
+            checks.append((product.properties["id"], time.monotonic()))
+            if len([c for c in checks if c[0] == product.properties["id"]]) == 2:
+                product.properties["order:status"] = "succeeded"
+            else:
+                product.retry_after = 0.2
+                raise NotAvailableError("not ready")
+
+        def download(product):
+            if product.properties.get("order:status") != "succeeded":
+                product.properties["order:status"] = "ordered"
+                raise NotAvailableError("ordered")
+            return f"path_{product.properties['id']}"
+
+        for product in products:
+            product.properties["eodag:status_link"] = "http://status"
+            product.downloader.order = order
+            product.download = mock.Mock(
+                side_effect=lambda product=product, **kwargs: download(product)
+            )
+
+        sleeping_threads = set()
+
+        def sleep(seconds):
+            sleeping_threads.add(threading.current_thread())
+            time.sleep(seconds)
+
+        with mock.patch("eodag.plugins.download.base.sleep", side_effect=sleep):
+            paths = plugin.download_all(
+                products, executor=ThreadPoolExecutor(max_workers=2), wait=0, timeout=1
+            )
+        self.assertCountEqual(paths, ["path_p0", "path_p1", "path_p2"])
+        for product in products:
+            # ordered once, then downloaded once its order is ready
+            self.assertEqual(product.download.call_count, 2)
+            times = [
+                t for product_id, t in checks if product_id == product.properties["id"]
+            ]
+            self.assertEqual(len(times), 2)
+            # Retry-After is honored
+            self.assertGreaterEqual(times[1] - times[0], 0.2)
+        # only the scheduler waits for orders, not the download workers
+        self.assertLessEqual(sleeping_threads, {threading.current_thread()})
+
+    def test_plugins_download_base_order_poller_backoff(self):
+        """_OrderPoller must space the status checks of a product with a jittered backoff"""
+        poller = _OrderPoller(10)
+        product = self._scheduled_products()[0]
+        product.properties["eodag:status_link"] = "http://status"
+        product.downloader.order = mock.Mock()
+        self.assertTrue(_OrderPoller.supports(product))
+        delays = []
+        for _ in range(12):
+            poller.add(product)
+            delays.append(poller.next_check())
+            poller._queue.clear()
+        for checks, delay in enumerate(delays):
+            expected = min(10 * _OrderPoller.backoff_factor**checks, 600)
+            self.assertGreaterEqual(delay, expected / 2 - 1)
+            self.assertLessEqual(delay, expected)
+
+        product.retry_after = 1000
+        poller.add(product)
+        self.assertGreaterEqual(poller.next_check(), 999)
+
+        product.properties["order:status"] = "succeeded"
+        self.assertFalse(_OrderPoller.supports(product))
+
+    def test_plugins_download_base_bandwidth_limiter(self):
+        """_BandwidthLimiter must limit the rate of consumed data"""
+        limiter = _BandwidthLimiter(10000)
+        start = time.monotonic()
+        for _ in range(3):
+            limiter.consume(1000)
+        self.assertGreaterEqual(time.monotonic() - start, 0.19)
+
 
 class TestDownloadPluginHttp(BaseDownloadPluginTest):
     def _dummy_product(
@@ -403,6 +785,452 @@ class TestDownloadPluginHttp(BaseDownloadPluginTest):
         self.assertEqual(responses.calls[0].request.url, download_url)
         self.assertIn("get", responses.calls[0].request.method.lower())
 
+    @responses.activate
+    def test_plugins_download_http_segmented(self):
+        """HTTPDownload.download() must download large files by ranges when supported by the server"""
+        download_url = "https://foo.bar/product.zip"
+        with open(
+            os.path.join(
+                TEST_RESOURCES_PATH,
+                "products",
+                "as_archive",
+                "S2A_MSIL1C_20180101T105441_N0206_R051_T31TDH_20180101T124911.zip",
+            ),
+            "rb",
+        ) as fh:
+            archive_content = fh.read()
+        segment_size = len(archive_content) // 4 + 1
+
+        def range_callback(request):
+            headers = {"Accept-Ranges": "bytes", "Content-Type": "application/zip"}
+            if "Range" not in request.headers:
+                headers["Content-Length"] = str(len(archive_content))
+                return 200, headers, archive_content
+            start, end = map(int, request.headers["Range"][6:].split("-"))
+            headers["Content-Range"] = f"bytes {start}-{end}/{len(archive_content)}"
+            return 206, headers, archive_content[start : end + 1]
+
+        responses.add_callback(responses.GET, download_url, callback=range_callback)
+
+        product = self._dummy_downloadable_product(
+            "foo",
+            {"id": "dummy", "title": "dummy", "eodag:download_link": download_url},
+            "S2_MSI_L1C",
+        )
+        product.downloader.config.download_segments = 3
+        product.downloader.config.download_segment_size = segment_size
+        product.properties["file:checksum"] = hashlib.md5(archive_content).hexdigest()
+        path = product.download()
+
+        with open(path, "rb") as fh:
+            self.assertEqual(fh.read(), archive_content)
+        # first range read from the initial request, then 3 ranges requests
+        self.assertEqual(len(responses.calls), 4)
+        self.assertNotIn("Range", responses.calls[0].request.headers)
+        self.assertSetEqual(
+            {call.request.headers["Range"] for call in responses.calls[1:]},
+            {
+                f"bytes={segment_size}-{2 * segment_size - 1}",
+                f"bytes={2 * segment_size}-{3 * segment_size - 1}",
+                f"bytes={3 * segment_size}-{len(archive_content) - 1}",
+            },
+        )
+
+        # files downloaded by ranges are verified
+        product.location = product.remote_location
+        os.remove(path)
+        shutil.rmtree(os.path.join(self.output_dir, ".downloaded"))
+        product.properties["file:checksum"] = hashlib.md5(b"other").hexdigest()
+        product.downloader.config.checksum_retries = 0
+        with self.assertRaises(ChecksumError):
+            product.download()
+        self.assertFalse(os.path.exists(path))
+        del product.properties["file:checksum"]
+
+        # ranges not satisfied by the server
+        responses.replace(
+            responses.GET,
+            download_url,
+            body=archive_content,
+            headers={"Accept-Ranges": "bytes"},
+            content_type="application/zip",
+            auto_calculate_content_length=True,
+        )
+        with self.assertRaisesRegex(DownloadError, "Range request not satisfied"):
+            product.download(wait=0.001, timeout=0)
+
+    def _zip_members_archive(self) -> tuple[bytes, dict[str, bytes]]:
+        """Archive with a large member and small stored and deflated members"""
+        members = {
+            "product/large.bin": os.urandom(1024 * 1024),
+            "product/GRANULE/B04.jp2": b"deflated band " * 1000,
+            "product/GRANULE/B08.jp2": b"stored band",
+        }
+        archive = io.BytesIO()
+        with zipfile.ZipFile(archive, "w") as zf:
+            zf.writestr("product/large.bin", members["product/large.bin"])
+            zf.writestr(
+                "product/GRANULE/B04.jp2",
+                members["product/GRANULE/B04.jp2"],
+                compress_type=zipfile.ZIP_DEFLATED,
+            )
+            zf.writestr("product/GRANULE/B08.jp2", members["product/GRANULE/B08.jp2"])
+        return archive.getvalue(), members
+
+    @pytest.mark.enable_socket
+    def test_plugins_download_http_zip_members_by_ranges(self):
+        """HTTPDownload.download() must only fetch the zip members selected by the asset filter"""
+        archive, members = self._zip_members_archive()
+        with range_http_server(archive, content_type="application/zip") as server:
+            product = self._dummy_downloadable_product(
+                "foo",
+                {
+                    "id": "dummy",
+                    "title": "dummy",
+                    "eodag:download_link": f"http://127.0.0.1:{server.server_port}/dummy.zip",
+                },
+                "S2_MSI_L1C",
+            )
+            path = product.download(asset=r"B0[48]\.jp2", extract=True)
+
+        self.assertEqual(path, os.path.join(self.output_dir, "dummy"))
+        for name in ("B04.jp2", "B08.jp2"):
+            with open(os.path.join(path, "product", "GRANULE", name), "rb") as fh:
+                self.assertEqual(fh.read(), members[f"product/GRANULE/{name}"])
+        self.assertFalse(os.path.exists(os.path.join(path, "product", "large.bin")))
+        # the partial download is neither recorded nor set as product location
+        self.assertEqual(product.location, product.remote_location)
+        self.assertListEqual(
+            os.listdir(os.path.join(self.output_dir, ".downloaded")), []
+        )
+        # probe, central directory, then local header and data of each member,
+        # without requesting the whole archive
+        self.assertEqual(server.methods[0], "HEAD")
+        self.assertNotIn(None, server.ranges)
+        self.assertEqual(len(server.ranges), 5)
+        fetched_size = sum(
+            int(end) + 1 - int(start)
+            for start, end in (r[len("bytes=") :].split("-") for r in server.ranges)
+        )
+        self.assertLess(fetched_size, 64 * 1024 + 22 + 20000)
+
+    @pytest.mark.enable_socket
+    def test_plugins_download_http_stream_zip_members_by_ranges(self):
+        """HTTPDownload.stream_download() must only stream the zip members selected by the asset filter"""
+        archive, members = self._zip_members_archive()
+        with range_http_server(archive, content_type="application/zip") as server:
+            product = self._dummy_downloadable_product(
+                "foo",
+                {
+                    "id": "dummy",
+                    "title": "dummy",
+                    "eodag:download_link": f"http://127.0.0.1:{server.server_port}/dummy.zip",
+                },
+                "S2_MSI_L1C",
+            )
+            plugin = product.downloader
+
+            # single member
+            response = plugin.stream_download(product, asset=r"B04\.jp2")
+            self.assertEqual(response.filename, "B04.jp2")
+            self.assertEqual(response.size, len(members["product/GRANULE/B04.jp2"]))
+            self.assertEqual(
+                b"".join(response.content), members["product/GRANULE/B04.jp2"]
+            )
+
+            # several members, streamed as a zip archive
+            response = plugin.stream_download(product, asset=r"B0[48]\.jp2")
+            self.assertEqual(response.media_type, "application/zip")
+            content = b"".join(response.content)
+            self.assertEqual(response.size, len(content))
+            with zipfile.ZipFile(io.BytesIO(content)) as zf:
+                self.assertListEqual(
+                    zf.namelist(),
+                    ["product/GRANULE/B04.jp2", "product/GRANULE/B08.jp2"],
+                )
+                for name in zf.namelist():
+                    self.assertEqual(zf.read(name), members[name])
+
+            # no matching member
+            with self.assertRaises(NotAvailableError):
+                plugin.stream_download(product, asset=r"B12\.jp2")
+
+        self.assertNotIn(
+            f"bytes=0-{len(archive) - 1}", [r for r in server.ranges if r is not None]
+        )
+
+    @responses.activate
+    def test_plugins_download_http_resume(self):
+        """HTTPDownload.download() must resume partial downloads if validators match"""
+        download_url = "https://foo.bar/product.zip"
+        with open(
+            os.path.join(
+                TEST_RESOURCES_PATH,
+                "products",
+                "as_archive",
+                "S2A_MSIL1C_20180101T105441_N0206_R051_T31TDH_20180101T124911.zip",
+            ),
+            "rb",
+        ) as fh:
+            archive_content = fh.read()
+        size = len(archive_content)
+
+        def range_callback(request):
+            headers = {
+                "Accept-Ranges": "bytes",
+                "Content-Type": "application/zip",
+                "ETag": '"abc"',
+            }
+            if "Range" not in request.headers:
+                headers["Content-Length"] = str(size)
+                return 200, headers, archive_content
+            start, end = request.headers["Range"][6:].split("-")
+            end = int(end) if end else size - 1
+            headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+            return 206, headers, archive_content[int(start) : end + 1]
+
+        responses.add_callback(responses.GET, download_url, callback=range_callback)
+
+        product = self._dummy_downloadable_product(
+            "foo",
+            {"id": "dummy", "title": "dummy", "eodag:download_link": download_url},
+            "S2_MSI_L1C",
+        )
+        product.downloader.config.download_segments = 1
+        path = os.path.join(self.output_dir, "dummy.zip")
+        sidecar = {
+            "url": download_url,
+            "size": size,
+            "etag": '"abc"',
+            "last_modified": None,
+        }
+
+        def write_partial(content, sidecar):
+            with open(f"{path}.part", "wb") as fh:
+                fh.write(content)
+            with open(f"{path}.part.json", "w") as fh:
+                json.dump(sidecar, fh)
+
+        def download():
+            responses.calls.reset()
+            product.location = product.remote_location
+            shutil.rmtree(os.path.join(self.output_dir, ".downloaded"), True)
+            self.assertEqual(product.download(), path)
+            with open(path, "rb") as fh:
+                self.assertEqual(fh.read(), archive_content)
+            self.assertListEqual(
+                sorted(os.listdir(self.output_dir)), [".downloaded", "dummy.zip"]
+            )
+            os.remove(path)
+
+        # resumed from partial file
+        write_partial(archive_content[:1000], sidecar)
+        download()
+        self.assertEqual(len(responses.calls), 2)
+        self.assertEqual(responses.calls[1].request.headers["Range"], "bytes=1000-")
+        self.assertEqual(responses.calls[1].request.headers["If-Range"], '"abc"')
+
+        # validators do not match: downloaded from scratch
+        write_partial(b"foo", dict(sidecar, etag='"def"'))
+        download()
+        self.assertEqual(len(responses.calls), 1)
+
+        # segmented download resumed from downloaded ranges
+        product.downloader.config.download_segments = 2
+        product.downloader.config.download_segment_size = size // 4 + 1
+        segment_size = size // 4 + 1
+        partial_content = bytearray(size)
+        partial_content[segment_size : 2 * segment_size] = archive_content[
+            segment_size : 2 * segment_size
+        ]
+        write_partial(
+            partial_content,
+            dict(sidecar, ranges=[[segment_size, 2 * segment_size - 1]]),
+        )
+        download()
+        self.assertEqual(len(responses.calls), 3)
+        self.assertSetEqual(
+            {call.request.headers.get("Range") for call in responses.calls},
+            {
+                None,
+                f"bytes={2 * segment_size}-{3 * segment_size - 1}",
+                f"bytes={3 * segment_size}-{size - 1}",
+            },
+        )
+
+    @responses.activate
+    def test_plugins_download_http_checksum(self):
+        """HTTPDownload.download() must verify the product checksum and retry on mismatch"""
+        download_url = "https://foo.bar/product.zip"
+        content = b"some product content"
+        for body in (b"corrupted content", content):
+            responses.add(
+                responses.GET,
+                download_url,
+                body=body,
+                content_type="application/zip",
+                auto_calculate_content_length=True,
+            )
+        product = self._dummy_downloadable_product(
+            "foo",
+            {
+                "id": "dummy",
+                "title": "dummy",
+                "eodag:download_link": download_url,
+                "file:checksum": "d50110" + hashlib.md5(content).hexdigest(),
+            },
+            "S2_MSI_L1C",
+        )
+        path = os.path.join(self.output_dir, "dummy.zip")
+
+        # downloaded again after a checksum mismatch
+        with self.assertLogs("eodag.download.http", "WARNING") as logs:
+            product.download()
+        self.assertIn("md5 checksum mismatch for product dummy", logs.output[0])
+        self.assertEqual(len(responses.calls), 2)
+        self.assertListEqual(
+            sorted(os.listdir(self.output_dir)), [".downloaded", "dummy"]
+        )
+        with open(os.path.join(self.output_dir, "dummy", "dummy.zip"), "rb") as fh:
+            self.assertEqual(fh.read(), content)
+
+        # always mismatching: error raised once retries are exhausted
+        shutil.rmtree(self.output_dir)
+        responses.calls.reset()
+        product.location = product.remote_location
+        product.properties["file:checksum"] = hashlib.md5(b"other").hexdigest()
+        product.downloader.config.checksum_retries = 1
+        with self.assertRaises(ChecksumError):
+            product.download()
+        self.assertEqual(len(responses.calls), 2)
+        self.assertFalse(os.path.exists(path))
+        self.assertFalse(os.path.exists(f"{path}.part"))
+
+        # verification disabled
+        product.downloader.config.verify_checksum = False
+        product.download()
+        self.assertEqual(len(responses.calls), 3)
+
+    @responses.activate
+    def test_plugins_download_http_assets_checksum(self):
+        """HTTPDownload.download() must verify assets checksums and retry on mismatch"""
+        asset_url = "https://foo.bar/asset.tif"
+        content = b"some asset content"
+        for body in (b"corrupted content!", content):
+            responses.add(
+                responses.GET,
+                asset_url,
+                body=body,
+                auto_calculate_content_length=True,
+            )
+        product = self._dummy_downloadable_product(
+            "foo",
+            {"id": "dummy", "title": "dummy", "eodag:download_link": "https://foo.bar"},
+            "S2_MSI_L1C",
+        )
+        product.assets.update(
+            {
+                "data": {
+                    "href": asset_url,
+                    "file:size": len(content),
+                    "file:checksum": hashlib.md5(content).hexdigest(),
+                }
+            }
+        )
+
+        with self.assertLogs("eodag.download.http", "WARNING") as logs:
+            path = product.download()
+        self.assertIn("md5 checksum mismatch for asset data", logs.output[0])
+        self.assertEqual(len(responses.calls), 2)
+        with open(os.path.join(path, "asset.tif"), "rb") as fh:
+            self.assertEqual(fh.read(), content)
+        self.assertListEqual(os.listdir(path), ["asset.tif"])
+
+    @responses.activate
+    def test_plugins_download_http_stream_extract(self):
+        """HTTPDownload.download() must extract archives while downloading them if configured"""
+        download_url = "https://foo.bar/product.zip"
+        with open(
+            os.path.join(
+                TEST_RESOURCES_PATH,
+                "products",
+                "as_archive",
+                "S2A_MSIL1C_20180101T105441_N0206_R051_T31TDH_20180101T124911.zip",
+            ),
+            "rb",
+        ) as fh:
+            archive_content = fh.read()
+        with zipfile.ZipFile(io.BytesIO(archive_content)) as zfile:
+            expected_files = sorted(
+                info.filename for info in zfile.infolist() if not info.is_dir()
+            )
+
+        responses.add(
+            responses.GET,
+            download_url,
+            body=archive_content,
+            content_type="application/zip",
+            auto_calculate_content_length=True,
+        )
+        product = self._dummy_downloadable_product(
+            "foo",
+            {"id": "dummy", "title": "dummy", "eodag:download_link": download_url},
+            "S2_MSI_L1C",
+        )
+        product.downloader.config.extract = True
+        product.downloader.config.delete_archive = True
+
+        with mock.patch(
+            "eodag.plugins.download.base.Download._finalize", autospec=True
+        ) as mock_finalize:
+            path = product.download(stream_extract=True)
+        mock_finalize.assert_not_called()
+
+        self.assertEqual(path, os.path.join(self.output_dir, "dummy"))
+        self.assertListEqual(
+            sorted(
+                os.path.relpath(os.path.join(root, name), path)
+                for root, _, files in os.walk(path)
+                for name in files
+            ),
+            expected_files,
+        )
+        # archive is not written, and extraction directory is removed
+        self.assertListEqual(
+            sorted(os.listdir(self.output_dir)), [".downloaded", "dummy"]
+        )
+        self.assertEqual(len(responses.calls), 1)
+
+        # not streamable archive: downloaded then extracted
+        shutil.rmtree(self.output_dir)
+        product.location = product.remote_location
+
+        def not_streamable(chunks, *args):
+            next(chunks)
+            raise NotStreamableArchiveError("foo")
+
+        progress_callback = ProgressCallback(disable=False, file=io.StringIO())
+        # downloaded bytes, before progress is reset for the extraction
+        counts_on_reset = []
+        reset = progress_callback.reset
+        progress_callback.reset = lambda *args, **kwargs: (
+            counts_on_reset.append(progress_callback.n),
+            reset(*args, **kwargs),
+        )
+        with mock.patch(
+            "eodag.plugins.download.http.extract_archive_stream",
+            autospec=True,
+            side_effect=not_streamable,
+        ):
+            path = product.download(
+                stream_extract=True, progress_callback=progress_callback
+            )
+        self.assertEqual(path, os.path.join(self.output_dir, "dummy"))
+        self.assertSetEqual(set(os.listdir(path)), {"GRANULE", "MTD_MSIL1C.xml"})
+        self.assertEqual(len(responses.calls), 3)
+        # bytes received before the fallback are not counted twice
+        self.assertEqual(counts_on_reset[-1], len(archive_content))
+
     @mock.patch(
         "eodag.plugins.download.http.HTTPDownload._raw_stream_download", autospec=True
     )
@@ -511,7 +1339,7 @@ class TestDownloadPluginHttp(BaseDownloadPluginTest):
         "eodag.plugins.download.http.HTTPDownload._raw_stream_download", autospec=True
     )
     @mock.patch("eodag.api.product._product.EOProduct._stream", create=True)
-    @mock.patch("eodag.plugins.download.http.requests.head", autospec=True)
+    @mock.patch("eodag.plugins.download.http.requests.Session.head")
     @mock.patch("eodag.plugins.download.http.requests.get", autospec=True)
     def test_plugins_download_http_ignore_assets(
         self, mock_requests_get, mock_requests_head, mock_stream, mock_stream_download
@@ -576,7 +1404,7 @@ class TestDownloadPluginHttp(BaseDownloadPluginTest):
         )
         mock_stream_download.assert_not_called()
 
-    @mock.patch("eodag.plugins.download.http.requests.head", autospec=True)
+    @mock.patch("eodag.plugins.download.http.requests.Session.head")
     @mock.patch("eodag.plugins.download.http.requests.get", autospec=True)
     def test_plugins_download_http_ignore_assets_without_ssl(
         self, mock_requests_get, mock_requests_head
@@ -692,7 +1520,7 @@ class TestDownloadPluginHttp(BaseDownloadPluginTest):
         mock_download_assets.assert_called_once()
         mock_stream_download.assert_not_called()
 
-    @mock.patch("eodag.plugins.download.http.requests.head", autospec=True)
+    @mock.patch("eodag.plugins.download.http.requests.Session.head")
     @mock.patch("eodag.plugins.download.http.requests.get", autospec=True)
     def test_plugins_download_http_assets_filename_from_href(
         self, mock_requests_get, mock_requests_head
@@ -745,7 +1573,7 @@ class TestDownloadPluginHttp(BaseDownloadPluginTest):
             verify=True,
         )
 
-    @mock.patch("eodag.plugins.download.http.requests.head", autospec=True)
+    @mock.patch("eodag.plugins.download.http.requests.Session.head")
     @mock.patch("eodag.plugins.download.http.requests.get", autospec=True)
     def test_plugins_download_http_assets_filename_from_get(
         self, mock_requests_get, mock_requests_head
@@ -777,8 +1605,126 @@ class TestDownloadPluginHttp(BaseDownloadPluginTest):
             )
         )
 
+    @mock.patch("eodag.plugins.download.http.requests.Session.head")
+    @mock.patch("eodag.plugins.download.http.requests.get", autospec=True)
+    def test_plugins_download_http_local_assets(
+        self, mock_requests_get, mock_requests_head
+    ):
+        """HTTPDownload must link local assets instead of copying their data"""
+        plugin = self.get_download_plugin(self.product)
+        self.product.location = self.product.remote_location = "http://somewhere"
+        local_dir = os.path.join(self.output_dir, "local")
+        os.makedirs(local_dir)
+        local_file = os.path.join(local_dir, "local.txt")
+        with open(local_file, "wb") as fd:
+            fd.write(b"local content")
+        self.product.assets.clear()
+        self.product.assets.update(
+            {
+                "local": {"href": Path(local_file).as_uri()},
+                "remote": {"href": "http://somewhere/remote.txt"},
+            }
+        )
+        mock_requests_head.return_value.headers = CaseInsensitiveDict(
+            {"Content-Length": "14"}
+        )
+        mock_requests_get.return_value.__enter__.return_value.iter_content.return_value = [
+            b"remote content"
+        ]
+        mock_requests_get.return_value.__enter__.return_value.headers = (
+            CaseInsensitiveDict()
+        )
+
+        # mixed assets: the local one is linked in the product directory
+        path = plugin.download(
+            self.product, output_dir=os.path.join(self.output_dir, "out")
+        )
+        self.assertTrue(os.path.isfile(os.path.join(path, "remote.txt")))
+        linked_file = os.path.join(path, self.product.assets["local"].rel_path)
+        self.assertTrue(os.path.samefile(linked_file, local_file))
+        mock_requests_get.assert_called_once()
+
+        # streamed local assets are read from memory maps
+        self.product.assets.pop("remote")
+        with mock.patch(
+            "eodag.plugins.download.http.mmap_chunks", wraps=mmap_chunks
+        ) as mock_mmap_chunks:
+            stream = plugin.stream_download(self.product)
+            chunks = list(stream.content)
+            self.assertEqual(b"".join(chunks), b"local content")
+            # chunks are views on the memory map, not copies
+            self.assertTrue(all(isinstance(chunk, memoryview) for chunk in chunks))
+            # and the content is still readable as bytes
+            self.assertEqual(
+                plugin.stream_download(self.product).content.read(), b"local content"
+            )
+        mock_mmap_chunks.assert_any_call(local_file)
+        self.assertEqual(stream.size, len(b"local content"))
+
+        # only local assets: the local path is returned
+        self.product.location = self.product.remote_location
+        mock_requests_get.reset_mock()
+        path = plugin.download(
+            self.product, output_dir=os.path.join(self.output_dir, "out2")
+        )
+        self.assertEqual(path, local_file)
+        mock_requests_get.assert_not_called()
+
+    @mock.patch("eodag.plugins.download.http.requests.Session.head")
+    def test_plugins_download_http_assets_headers_cached(self, mock_requests_head):
+        """HTTPDownload assets HEAD requests must share a session and be cached"""
+        plugin = self.get_download_plugin(self.product)
+        mock_requests_head.return_value.headers = CaseInsensitiveDict(
+            {"Content-Length": "12", "Content-Type": "text/plain"}
+        )
+        assets = [
+            Asset(self.product, "foo", {"href": "http://somewhere/something"}),
+            Asset(self.product, "bar", {"href": "http://somewhere/anotherthing"}),
+        ]
+        with ThreadPoolExecutor() as executor:
+            self.assertEqual(plugin._get_asset_sizes(assets, executor, None, None), 24)
+            # same assets of another product: sizes come from the cache
+            other_assets = [
+                Asset(self.product, asset.key, {"href": asset["href"]})
+                for asset in assets
+            ]
+            self.assertEqual(
+                plugin._get_asset_sizes(other_assets, executor, None, None), 24
+            )
+        self.assertEqual(mock_requests_head.call_count, 2)
+        # the pool of the session is sized for the executor threads
+        session = plugin._get_probe_session(4)
+        self.assertIs(session, plugin._get_probe_session(2))
+        self.assertEqual(
+            session.get_adapter("http://somewhere")._pool_maxsize,
+            executor._max_workers,
+        )
+        plugin._get_probe_session(executor._max_workers + 1)
+        self.assertEqual(
+            session.get_adapter("http://somewhere")._pool_maxsize,
+            executor._max_workers + 1,
+        )
+        # only the useful headers are cached
+        self.assertNotIn(
+            "Content-Type",
+            plugin._probe_asset_headers("http://somewhere/something", None, None, 1),
+        )
+        # headers are not shared between different credentials
+        plugin._probe_asset_headers(
+            "http://somewhere/something", HTTPBasicAuth("foo", "bar"), None, 1
+        )
+        self.assertEqual(mock_requests_head.call_count, 3)
+        plugin._probe_asset_headers(
+            "http://somewhere/something", HTTPBasicAuth("foo", "bar"), None, 1
+        )
+        self.assertEqual(mock_requests_head.call_count, 3)
+        plugin._probe_asset_headers(
+            "http://somewhere/something", HTTPBasicAuth("foo", "baz"), None, 1
+        )
+        self.assertEqual(mock_requests_head.call_count, 4)
+
     @mock.patch("eodag.plugins.download.http.HTTPDownload._get_asset_sizes")
-    @mock.patch("eodag.plugins.download.http.requests.head", autospec=True)
+    @mock.patch("eodag.plugins.download.http.requests.Session.head")
     @mock.patch("eodag.plugins.download.http.requests.get", autospec=True)
     def test_plugins_download_http_assets_error(
         self, mock_requests_get, mock_requests_head, mock_asset_size
@@ -803,7 +1749,7 @@ class TestDownloadPluginHttp(BaseDownloadPluginTest):
         "eodag.plugins.download.http.ProgressCallback.__call__",
         autospec=True,
     )
-    @mock.patch("eodag.plugins.download.http.requests.head", autospec=True)
+    @mock.patch("eodag.plugins.download.http.requests.Session.head")
     @mock.patch("eodag.plugins.download.http.requests.get", autospec=True)
     def test_plugins_download_http_assets_interrupt(
         self, mock_requests_get, mock_requests_head, mock_progress_callback
@@ -858,7 +1804,7 @@ class TestDownloadPluginHttp(BaseDownloadPluginTest):
         "eodag.plugins.download.http.ProgressCallback.__call__",
         autospec=True,
     )
-    @mock.patch("eodag.plugins.download.http.requests.head", autospec=True)
+    @mock.patch("eodag.plugins.download.http.requests.Session.head")
     @mock.patch("eodag.plugins.download.http.requests.get", autospec=True)
     def test_plugins_download_http_assets_stream_zip_interrupt(
         self, mock_requests_get, mock_requests_head, mock_progress_callback
@@ -889,7 +1835,7 @@ class TestDownloadPluginHttp(BaseDownloadPluginTest):
         self.assertEqual(self.product.remote_location, "http://somewhere")
 
     @mock.patch("eodag.plugins.download.http.HTTPDownload._get_asset_sizes")
-    @mock.patch("eodag.plugins.download.http.requests.head", autospec=True)
+    @mock.patch("eodag.plugins.download.http.requests.Session.head")
     @mock.patch("eodag.plugins.download.http.requests.get", autospec=True)
     def test_plugins_download_http_assets_too_many_requests_error(
         self, mock_requests_get, mock_requests_head, mock_asset_size
@@ -1076,7 +2022,7 @@ class TestDownloadPluginHttp(BaseDownloadPluginTest):
 
         self.assertIn(self.product.properties.get("id", ""), str(cm.exception))
 
-    @mock.patch("eodag.plugins.download.http.requests.head", autospec=True)
+    @mock.patch("eodag.plugins.download.http.requests.Session.head")
     @mock.patch("eodag.plugins.download.http.requests.get", autospec=True)
     def test_plugins_download_http_assets_resume(
         self, mock_requests_get, mock_requests_head
@@ -1121,7 +2067,7 @@ class TestDownloadPluginHttp(BaseDownloadPluginTest):
             )
         )
 
-    @mock.patch("eodag.plugins.download.http.requests.head", autospec=True)
+    @mock.patch("eodag.plugins.download.http.requests.Session.head")
     @mock.patch("eodag.plugins.download.http.requests.get", autospec=True)
     def test_plugins_download_http_asset_filter(
         self, mock_requests_get, mock_requests_head
@@ -1162,7 +2108,7 @@ class TestDownloadPluginHttp(BaseDownloadPluginTest):
         plugin.download(self.product, output_dir=self.output_dir)
         self.assertEqual(6, mock_requests_get.call_count)
 
-    @mock.patch("eodag.plugins.download.http.requests.head", autospec=True)
+    @mock.patch("eodag.plugins.download.http.requests.Session.head")
     @mock.patch("eodag.plugins.download.http.requests.get", autospec=True)
     def test_plugins_download_http_assets_filename_from_head(
         self, mock_requests_get, mock_requests_head
@@ -1195,7 +2141,7 @@ class TestDownloadPluginHttp(BaseDownloadPluginTest):
         )
 
     @mock.patch("eodag.utils.ProgressCallback.reset", autospec=True)
-    @mock.patch("eodag.plugins.download.http.requests.head", autospec=True)
+    @mock.patch("eodag.plugins.download.http.requests.Session.head")
     @mock.patch("eodag.plugins.download.http.requests.get", autospec=True)
     def test_plugins_download_http_assets_size(
         self, mock_requests_get, mock_requests_head, mock_progress_callback_reset
@@ -1237,6 +2183,7 @@ class TestDownloadPluginHttp(BaseDownloadPluginTest):
 
         # size from HEAD / Content-Disposition
         mock_requests_head.return_value.headers.pop("Content-Length")
+        asset_headers_cache.invalidate()
         mock_progress_callback_reset.reset_mock()
         self.product.location = "http://somewhere"
         self.product.assets.clear()
@@ -1252,6 +2199,7 @@ class TestDownloadPluginHttp(BaseDownloadPluginTest):
 
         # size from GET / Content-Length
         mock_requests_head.return_value.headers.pop("Content-Disposition")
+        asset_headers_cache.invalidate()
         mock_progress_callback_reset.reset_mock()
         self.product.location = "http://somewhere"
         self.product.assets.clear()
@@ -1272,6 +2220,7 @@ class TestDownloadPluginHttp(BaseDownloadPluginTest):
         mock_requests_get.return_value.__enter__.return_value.headers.pop(
             "Content-Length"
         )
+        asset_headers_cache.invalidate()
         mock_progress_callback_reset.reset_mock()
         self.product.location = "http://somewhere"
         self.product.assets.clear()
@@ -1289,6 +2238,7 @@ class TestDownloadPluginHttp(BaseDownloadPluginTest):
         mock_requests_get.return_value.__enter__.return_value.headers.pop(
             "Content-Disposition"
         )
+        asset_headers_cache.invalidate()
         mock_progress_callback_reset.reset_mock()
         self.product.location = "http://somewhere"
         self.product.assets.clear()
@@ -1652,6 +2602,7 @@ class TestDownloadPluginHttp(BaseDownloadPluginTest):
                 url,
                 status=200,
                 json={"progress_percentage": 50, "that": "failed"},
+                headers={"Retry-After": "30"},
             )
 
             with self.assertRaises(DownloadError):
@@ -1661,6 +2612,8 @@ class TestDownloadPluginHttp(BaseDownloadPluginTest):
                 list(USER_AGENT.items())[0], responses.calls[0].request.headers.items()
             )
             self.assertEqual(len(responses.calls), 1)
+            # delay requested before the next status check
+            self.assertEqual(self.product.retry_after, 30)
 
         run()
 
@@ -2044,6 +2997,7 @@ class TestDownloadPluginHttpRetry(BaseDownloadPluginTest):
 class TestDownloadPluginAws(BaseDownloadPluginTest):
     def setUp(self):
         super(TestDownloadPluginAws, self).setUp()
+        s3_listing_cache.invalidate()
         self.product = EOProduct(
             "aws_eos",
             dict(
@@ -2058,6 +3012,166 @@ class TestDownloadPluginAws(BaseDownloadPluginTest):
             "http://somebucket.somehost.com/path/to/some/product"
         )
 
+    def test_plugins_download_aws_verified_object(self):
+        """AwsDownload must verify objects checksums while downloading them"""
+        plugin = self.get_download_plugin(self.product)
+        content = b"some object content"
+        obj = mock.Mock(bucket_name="somebucket", key="path/to/object")
+        obj.get.return_value = {"Body": mock.Mock()}
+        obj.get.return_value["Body"].iter_chunks.return_value = [
+            content[:4],
+            content[4:],
+        ]
+        path = os.path.join(self.output_dir, "object")
+        os.makedirs(self.output_dir, exist_ok=True)
+
+        # asset file:checksum first, then ETag
+        obj.e_tag = f'"{hashlib.md5(b"other").hexdigest()}"'
+        self.product.assets.update(
+            {
+                "obj": {
+                    "href": "s3://somebucket/path/to/object",
+                    "file:checksum": "1220" + hashlib.sha256(content).hexdigest(),
+                }
+            }
+        )
+        verifier = plugin._object_checksum_verifier(self.product, obj)
+        self.assertEqual(verifier.algorithm, "sha256")
+        self.product.assets.clear()
+        self.assertEqual(
+            plugin._object_checksum_verifier(self.product, obj).algorithm, "md5"
+        )
+        # multipart upload ETag cannot be verified
+        obj.e_tag = f'"{hashlib.md5(b"other").hexdigest()}-2"'
+        self.assertIsNone(plugin._object_checksum_verifier(self.product, obj))
+
+        progress_callback = mock.Mock()
+        plugin._download_verified_object(
+            obj, path, {"RequestPayer": "requester"}, progress_callback, verifier
+        )
+        obj.get.assert_called_once_with(RequestPayer="requester")
+        with open(path, "rb") as fh:
+            self.assertEqual(fh.read(), content)
+        self.assertEqual(progress_callback.call_count, 2)
+        os.remove(path)
+
+        obj.e_tag = f'"{hashlib.md5(b"other").hexdigest()}"'
+        with self.assertRaises(ChecksumError):
+            plugin._download_verified_object(
+                obj,
+                path,
+                {},
+                progress_callback,
+                plugin._object_checksum_verifier(self.product, obj),
+            )
+        self.assertListEqual(os.listdir(self.output_dir), [])
+
+        # large objects whose asset checksum is known are verified using a single stream
+        multipart_config = TransferConfig(use_threads=True)
+        self.product.assets.update(
+            {
+                "obj": {
+                    "href": "s3://somebucket/path/to/object",
+                    "file:checksum": "1220" + hashlib.sha256(content).hexdigest(),
+                }
+            }
+        )
+        self.assertTrue(plugin._asset_checksum_verified(self.product, obj))
+        with mock.patch.object(
+            plugin, "_download_verified_object", autospec=True
+        ) as mock_verified:
+            plugin._download_object(
+                self.product, obj, path, {}, progress_callback, multipart_config
+            )
+            mock_verified.assert_called_once()
+            obj.Bucket.return_value.download_file.assert_not_called()
+            # objects only verifiable by their ETag are downloaded by parts
+            self.product.assets.clear()
+            self.assertFalse(plugin._asset_checksum_verified(self.product, obj))
+            plugin._download_object(
+                self.product, obj, path, {}, progress_callback, multipart_config
+            )
+            mock_verified.assert_called_once()
+            obj.Bucket.return_value.download_file.assert_called_once()
+
+    def test_plugins_download_aws_transfer_config(self):
+        """AwsDownload must download large objects by concurrent parts"""
+        plugin = self.get_download_plugin(self.product)
+        plugin.config.download_segments = 3
+        plugin.config.download_segment_size = 1024
+        self.addCleanup(delattr, plugin.config, "download_segments")
+        self.addCleanup(delattr, plugin.config, "download_segment_size")
+
+        self.assertFalse(plugin._transfer_config(2047).use_threads)
+        self.assertFalse(plugin._transfer_config(None).use_threads)
+        config = plugin._transfer_config(2048)
+        self.assertTrue(config.use_threads)
+        self.assertEqual(config.max_request_concurrency, 3)
+        self.assertEqual(config.multipart_chunksize, 1024)
+        self.assertEqual(config.multipart_threshold, 2048)
+
+        # concurrency limited by the connections left by other transfers
+        self.assertEqual(plugin._transfer_config(2048, 2).max_request_concurrency, 2)
+        self.assertFalse(plugin._transfer_config(2048, 1).use_threads)
+
+        plugin.config.download_segments = 1
+        self.assertFalse(plugin._transfer_config(10 * 1024).use_threads)
+
+    def test_plugins_download_aws_connections_budget(self):
+        """Transfers of an executor must share the connections of its workers"""
+        executor = ThreadPoolExecutor(max_workers=6)
+        self.addCleanup(executor.shutdown)
+        budget = _ConnectionsBudget.of(executor)
+        self.assertIs(_ConnectionsBudget.of(executor), budget)
+        self.assertEqual(budget.size, 6)
+
+        self.assertEqual(budget.acquire(4), 4)
+        self.assertEqual(budget.acquire(4), 2)
+        # a worker always gets its own connection
+        self.assertEqual(budget.acquire(4), 1)
+        budget.release(1)
+        budget.release(4)
+        self.assertEqual(budget.acquire(4), 4)
+
+    def test_plugins_download_aws_verified_object_etag(self):
+        """AwsDownload must not verify objects against ETags that are not MD5 digests"""
+        plugin = self.get_download_plugin(self.product)
+        content = b"some object content"
+        etag = f'"{hashlib.md5(b"other").hexdigest()}"'
+        obj = mock.Mock(bucket_name="somebucket", key="path/to/object", e_tag=etag)
+        obj.get.return_value = {
+            "Body": mock.Mock(),
+            "ETag": etag,
+            "ServerSideEncryption": "aws:kms",
+        }
+        obj.get.return_value["Body"].iter_chunks.return_value = [content]
+        path = os.path.join(self.output_dir, "object")
+        os.makedirs(self.output_dir, exist_ok=True)
+
+        # encryption is unknown before the object is requested
+        verifier = plugin._object_checksum_verifier(self.product, obj)
+        self.assertEqual(verifier.algorithm, "md5")
+        plugin._download_verified_object(obj, path, {}, mock.Mock(), verifier)
+        with open(path, "rb") as fh:
+            self.assertEqual(fh.read(), content)
+        os.remove(path)
+
+        obj.server_side_encryption = "aws:kms"
+        self.assertIsNone(plugin._object_checksum_verifier(self.product, obj))
+
+        # a checksum that is not the ETag is still verified
+        with self.assertRaises(ChecksumError):
+            plugin._download_verified_object(
+                obj,
+                path,
+                {},
+                mock.Mock(),
+                plugin._checksum_verifier(
+                    hashlib.md5(b"another").hexdigest(), name="obj"
+                ),
+            )
+        self.assertListEqual(os.listdir(self.output_dir), [])
+
     def test_plugins_download_aws_get_bucket_prefix(self):
         """AwsDownload.get_product_bucket_name_and_prefix() must extract bucket & prefix from location"""
 
@@ -16,6 +16,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import io
 import logging
 import os
 import pathlib
@@ -26,9 +27,11 @@ import tempfile
 import time
 import zipfile
 
+import boto3
 import geojson
 import responses
 from lxml import html
+from moto import mock_aws
 from pystac import Item
 from shapely import geometry
 
@@ -310,6 +313,78 @@ class TestEOProduct(EODagTestBase):
         os.remove(existing_quicklook_file_path)
         os.rmdir(quicklook_dir)
 
+    @responses.activate
+    def test_eoproduct_get_quicklook_cache_dir(self):
+        """EOProduct.get_quicklook must only download again cached quicklooks that were modified"""  # noqa
+        product = self._dummy_product()
+        product.properties["eodag:quicklook"] = "https://fake.url.to/quicklook"
+        product.register_downloader(self.get_mock_downloader(), None)
+        cache_dir = os.path.join(self.output_dir, "cache")
+        responses.add(
+            responses.GET,
+            "https://fake.url.to/quicklook",
+            body=b"Quicklook content",
+            headers={"ETag": '"v1"'},
+        )
+        responses.add(
+            responses.GET,
+            "https://fake.url.to/quicklook",
+            status=304,
+            headers={"Cache-Control": "max-age=3600"},
+            match=[responses.matchers.header_matcher({"If-None-Match": '"v1"'})],
+        )
+
+        quicklook_file_path = product.get_quicklook(cache_dir=cache_dir)
+        with open(quicklook_file_path, "rb") as fd:
+            self.assertEqual(fd.read(), b"Quicklook content")
+
+        # cached quicklook validated by the server is linked to another output directory
+        other_output_dir = os.path.join(self.output_dir, "other")
+        other_quicklook_file_path = product.get_quicklook(
+            output_dir=other_output_dir, cache_dir=cache_dir
+        )
+        responses.assert_call_count("https://fake.url.to/quicklook", 2)
+        self.assertEqual(
+            other_quicklook_file_path,
+            os.path.join(other_output_dir, product.properties["id"]),
+        )
+        with open(other_quicklook_file_path, "rb") as fd:
+            self.assertEqual(fd.read(), b"Quicklook content")
+
+        # no request until the cached validators expire
+        product.get_quicklook(cache_dir=cache_dir)
+        responses.assert_call_count("https://fake.url.to/quicklook", 2)
+        # no temporary file left in the cache
+        self.assertEqual(len(os.listdir(cache_dir)), 2)
+
+    @responses.activate
+    def test_eoproduct_get_quicklook_max_size_not_downsized(self):
+        """EOProduct.get_quicklook must keep quicklooks that cannot be downsized"""
+        product = self._dummy_product()
+        product.properties["eodag:quicklook"] = "https://fake.url.to/quicklook"
+        product.register_downloader(self.get_mock_downloader(), None)
+        responses.add(
+            responses.GET, "https://fake.url.to/quicklook", body=b"Quicklook content"
+        )
+        # without Pillow
+        with (
+            mock.patch.dict("sys.modules", {"PIL": None}),
+            self.assertLogs("eodag.product", "WARNING") as cm,
+        ):
+            quicklook_file_path = product.get_quicklook(max_size=64)
+        self.assertIn("eodag[quicklooks]", cm.output[0])
+        with open(quicklook_file_path, "rb") as fd:
+            self.assertEqual(fd.read(), b"Quicklook content")
+
+        # not an image
+        with self.assertLogs("eodag.product", "WARNING") as cm:
+            quicklook_file_path = product.get_quicklook(
+                output_dir=os.path.join(self.output_dir, "other"), max_size=64
+            )
+        self.assertIn("Could not downsize", cm.output[0])
+        with open(quicklook_file_path, "rb") as fd:
+            self.assertEqual(fd.read(), b"Quicklook content")
+
     @responses.activate
     def test_eoproduct_download_http_default(self):
         """eoproduct.download must save the product at output_dir and create a .downloaded dir"""  # noqa
@@ -442,6 +517,38 @@ class TestEOProduct(EODagTestBase):
         self.assertTrue(assert2)
         self.assertTrue(assert3)
 
+    @responses.activate
+    def test_eoproduct_download_products_cache(self):
+        """eoproduct.download must materialize products from the products cache in other output dirs"""
+        cache_dir = tempfile.mkdtemp()
+        other_output_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        self.addCleanup(shutil.rmtree, other_output_dir)
+
+        with mock.patch.dict(os.environ, {"EODAG_PRODUCTS_CACHE_DIR": cache_dir}):
+            product = self._dummy_downloadable_product(extract=True)
+            product_dir_path = product.download()
+            responses.assert_call_count(product.properties["eodag:download_link"], 1)
+
+            other_product = self._dummy_downloadable_product(
+                output_dir=other_output_dir, extract=True
+            )
+            with self.assertLogs(level="INFO") as cm:
+                other_product_dir_path = other_product.download()
+            self.assertIn("Product materialized from products cache", str(cm.output))
+
+        # not downloaded again
+        responses.assert_call_count(product.properties["eodag:download_link"], 1)
+        self.assertEqual(os.path.dirname(other_product_dir_path), other_output_dir)
+        self.assertEqual(
+            sorted(os.listdir(other_product_dir_path)),
+            sorted(os.listdir(product_dir_path)),
+        )
+        self.assertEqual(other_product.location, f"file://{other_product_dir_path}")
+        self.assertEqual(
+            len(os.listdir(os.path.join(other_output_dir, ".downloaded"))), 1
+        )
+
     # Stream download
 
     @responses.activate
@@ -514,6 +621,52 @@ class TestEOProduct(EODagTestBase):
         stat = os.stat(filepath)
         self.assertEqual(stat.st_size, 2488555)
 
+    @mock_aws
+    @responses.activate
+    def test_eoproduct_transfer_to(self):
+        """eoproduct.transfer_to must upload the product stream to S3 without writing it on disk"""  # noqa
+        product = self._dummy_downloadable_product(
+            assets={
+                f"asset{i}": {
+                    "href": f"http://example.com/asset{i}.jp2",
+                    "type": "image/jp2",
+                }
+                for i in range(3)
+            },
+            extract=False,
+        )
+        s3_client = boto3.client("s3", region_name="us-east-1")
+        s3_client.create_bucket(Bucket="mybucket")
+
+        # on the fly zip of the assets, uploaded in several parts
+        url = product.transfer_to(
+            "s3://mybucket/transfers/",
+            s3_client=s3_client,
+            part_size=5 * 1024**2,
+            max_concurrency=2,
+        )
+        key = f"transfers/{product.properties['title']}.zip"
+        self.assertEqual(url, f"s3://mybucket/{key}")
+        obj = s3_client.get_object(Bucket="mybucket", Key=key)
+        self.assertEqual(obj["ContentType"], "application/zip")
+        self.assertGreater(obj["ContentLength"], 5 * 1024**2)
+        with zipfile.ZipFile(io.BytesIO(obj["Body"].read())) as zf:
+            self.assertCountEqual(zf.namelist(), [f"asset{i}.jp2" for i in range(3)])
+            with open(self.local_asset_path, "rb") as fh:
+                self.assertEqual(zf.read("asset0.jp2"), fh.read())
+
+        # a single asset is uploaded as is, to the given key
+        url = product.transfer_to(
+            "s3://mybucket/foo.jp2", s3_client=s3_client, asset="asset1"
+        )
+        self.assertEqual(url, "s3://mybucket/foo.jp2")
+        obj = s3_client.get_object(Bucket="mybucket", Key="foo.jp2")
+        self.assertEqual(obj["ContentLength"], 2488555)
+        self.assertListEqual(os.listdir(self.output_dir), [])
+
+        with self.assertRaises(ValueError):
+            product.transfer_to("http://example.com/foo")
+
     # TODO: add a test on tarfiles extraction
 
     @responses.activate
@@ -880,7 +1033,7 @@ class TestEOProduct(EODagTestBase):
             },
         )
 
-    @mock.patch("eodag.api.product._product.ServiceResource", new=object)
+    @mock.patch("boto3.resources.base.ServiceResource", new=object)
     def test_get_storage_options_s3_credentials_endpoint(self):
         """get_storage_options should be adapted to the provider config using s3 credentials and endpoint"""
         product = EOProduct(
@@ -921,7 +1074,7 @@ class TestEOProduct(EODagTestBase):
             },
         )
 
-    @mock.patch("eodag.api.product._product.ServiceResource", new=object)
+    @mock.patch("boto3.resources.base.ServiceResource", new=object)
     def test_get_storage_options_s3_credentials(self):
         """get_storage_options should be adapted to the provider config using s3 credentials"""
         product = EOProduct(
@@ -958,7 +1111,7 @@ class TestEOProduct(EODagTestBase):
             },
         )
 
-    @mock.patch("eodag.api.product._product.ServiceResource", new=object)
+    @mock.patch("boto3.resources.base.ServiceResource", new=object)
     def test_get_storage_options_s3_anon(self):
         """get_storage_options should be adapted to the provider config using anonymous s3 access"""
         product = EOProduct(
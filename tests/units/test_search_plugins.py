@@ -66,6 +66,7 @@ from tests.context import (
     TEST_RESOURCES_PATH,
     USER_AGENT,
     AuthenticationError,
+    ConstraintsIndex,
     EOProduct,
     MisconfiguredError,
     NotAvailableError,
@@ -80,12 +81,14 @@ from tests.context import (
     ecmwf_temporal_to_eodag,
     get_geometry_from_various,
     load_default_config,
+    s3_listing_cache,
 )
 
 
 class BaseSearchPluginTest(unittest.TestCase):
     def setUp(self):
         super(BaseSearchPluginTest, self).setUp()
+        s3_listing_cache.invalidate()
         providers = ProvidersDict.from_configs(load_default_config())
         self.plugins_manager = PluginManager(providers)
         self.collection = "S2_MSI_L1C"
@@ -684,6 +687,50 @@ class TestSearchPluginQueryStringSearch(BaseSearchPluginTest):
         # restore configuration
         search_plugin.config.discover_collections = discover_collections_conf
 
+    def test_plugins_search_querystringsearch_discover_collections_concurrent_pages(
+        self,
+    ):
+        """QueryStringSearch.discover_collections must fetch pages concurrently if configured"""
+        provider = "earth_search"
+        search_plugin = self.get_search_plugin(self.collection, provider)
+
+        discover_collections_conf = copy_deepcopy(
+            search_plugin.config.discover_collections
+        )
+        search_plugin.config.discover_collections["fetch_url"] = (
+            "https://foo.bar/collections"
+        )
+        search_plugin.config.discover_collections["next_page_url_tpl"] = (
+            "{url}?page={page}"
+        )
+        search_plugin.config.discover_collections["start_page"] = 0
+        search_plugin.config.discover_collections["concurrent_pages"] = 2
+
+        with responses.RequestsMock(
+            assert_all_requests_are_fired=True
+        ) as mock_requests_get:
+            for page, collection_id in enumerate(["foo", "bar", "baz"]):
+                mock_requests_get.add(
+                    responses.GET,
+                    f"https://foo.bar/collections?page={page}",
+                    json={"collections": [{"id": f"{collection_id}_collection"}]},
+                )
+            # empty page 3 is requested in the same window as page 2
+            mock_requests_get.add(
+                responses.GET,
+                "https://foo.bar/collections?page=3",
+                json={"collections": []},
+            )
+            conf_update_dict = search_plugin.discover_collections()
+
+        self.assertCountEqual(
+            conf_update_dict["providers_config"].keys(),
+            ["foo_collection", "bar_collection", "baz_collection"],
+        )
+
+        # restore configuration
+        search_plugin.config.discover_collections = discover_collections_conf
+
     def test_plugins_search_querystringsearch_discover_collections_without_fetch_url(
         self,
     ):
@@ -3141,7 +3188,7 @@ class TestSearchPluginCreodiasS3Search(BaseSearchPluginTest):
         for product in res.data:
             download_plugin = self.plugins_manager.get_download_plugin(product)
             auth_plugin = self.plugins_manager.get_auth_plugin(download_plugin, product)
-            stubber.add_response("list_objects", list_objects_response)
+            stubber.add_response("list_objects_v2", list_objects_response)
             stubber.activate()
             # fails if credentials are missing
             auth_plugin.config.credentials = {
@@ -3166,7 +3213,8 @@ class TestSearchPluginCreodiasS3Search(BaseSearchPluginTest):
 
         # no occur should occur and assets should be empty if list_objects does not have content
         # (this situation will occur if the product does not have assets but is a tar file)
-        stubber.add_response("list_objects", {})
+        s3_listing_cache.invalidate()
+        stubber.add_response("list_objects_v2", {})
         download_plugin = self.plugins_manager.get_download_plugin(res.data[0])
         auth_plugin = self.plugins_manager.get_auth_plugin(download_plugin, res.data[0])
         res.data[0].driver = None
@@ -3208,7 +3256,7 @@ class TestSearchPluginCreodiasS3Search(BaseSearchPluginTest):
                     "aws_access_key_id": "foo",
                     "aws_secret_access_key": "bar",
                 }
-                stubber.add_client_error("list_objects")
+                stubber.add_client_error("list_objects_v2")
                 stubber.activate()
                 product.register_downloader(download_plugin, auth_plugin)
 
@@ -3223,6 +3271,8 @@ class TestSearchPluginECMWFSearch(unittest.TestCase):
     def setUp(self):
         self.provider = "cop_ads"
         self.search_plugin = self.get_search_plugin(provider=self.provider)
+        # drop queryables cached by previous tests using other mocked data
+        self.search_plugin.queryables_cache = None
         self.query_dates = {
             "start_datetime": "2020-01-01",
             "end_datetime": "2020-01-02",
@@ -3717,6 +3767,51 @@ class TestSearchPluginECMWFSearch(unittest.TestCase):
         self.assertListEqual(["a", "b"], available_values["variable"])
         self.assertIn("date", available_values)
 
+    def test_plugins_search_ecmwfsearch_constraints_index(self):
+        """ECMWFSearch constraints index must give the same available values as the constraints list"""
+        constraints = [
+            {"date": ["2025-01-01/2025-06-01", "2023-06-27"], "variable": ["a", "b"]},
+            {"date": ["2024-01-01/2024-12-01"], "variable": ["a", "c"], "level": ["1"]},
+        ]
+        index = ConstraintsIndex(constraints)
+        self.assertEqual(["date", "variable", "level"], index.keywords)
+        self.assertSetEqual({"date", "variable"}, index.required_keywords)
+        self.assertEqual(0b11, index.entries["variable"]["a"])
+        self.assertEqual(0b10, index.entries["variable"]["c"])
+        self.assertDictEqual(
+            {"2025-01-01/2025-06-01": 0b01, "2024-01-01/2024-12-01": 0b10},
+            index.date_intervals,
+        )
+        self.assertSetEqual({"b", "a"}, index.values("variable", 0b01))
+
+        for input_keywords in (
+            {"variable": "c"},
+            {"date": "2023-06-27"},
+            {"date": "2024-02-01/2024-03-01", "variable": "a"},
+        ):
+            from_list = self.search_plugin.available_values_from_constraints(
+                constraints, input_keywords, []
+            )
+            from_index = self.search_plugin.available_values_from_constraints(
+                index, input_keywords, []
+            )
+            self.assertDictEqual(
+                {k: sorted(v) for k, v in from_list.items()},
+                {k: sorted(v) for k, v in from_index.items()},
+            )
+
+        available_values = self.search_plugin.available_values_from_constraints(
+            index, {"date": "2024-02-01/2024-03-01", "variable": "a"}, []
+        )
+        self.assertListEqual(["a", "c"], sorted(available_values["variable"]))
+        self.assertListEqual(["1"], available_values["level"])
+
+        with self.assertRaises(ValidationError) as ex:
+            self.search_plugin.available_values_from_constraints(
+                index, {"variable": "c", "date": "2023-06-27"}, []
+            )
+        self.assertIn("ecmwf:variable=c is not available", ex.exception.message)
+
     def test_plugins_search_ecmwfsearch_get_available_values_from_contraints_with_keyword_required_by_form(
         self,
     ):
@@ -3957,7 +4052,7 @@ class TestSearchPluginECMWFSearch(unittest.TestCase):
 
         # reset mock
         mock__fetch_data.reset_mock()
-        mock__fetch_data.side_effect = [constraints, form]
+        mock__fetch_data.side_effect = [form]
         # with additional param
         params = deepcopy(default_values)
         params["collection"] = "CAMS_EU_AIR_QUALITY_RE"
@@ -3965,20 +4060,11 @@ class TestSearchPluginECMWFSearch(unittest.TestCase):
         queryables = self.search_plugin.discover_queryables(**params)
         self.assertIsNotNone(queryables)
 
-        # cached values are not used to make the set of unit tests work then the mock is called again
-        mock__fetch_data.assert_has_calls(
-            [
-                call(
-                    mock.ANY,
-                    "https://ads.atmosphere.copernicus.eu/api/catalogue/v1/collections/"
-                    "cams-europe-air-quality-reanalyses/constraints.json",
-                ),
-                call(
-                    mock.ANY,
-                    "https://ads.atmosphere.copernicus.eu/api/catalogue/v1/collections/"
-                    "cams-europe-air-quality-reanalyses/form.json",
-                ),
-            ]
+        # constraints index is cached, only the form is fetched again (mocked, not cached)
+        mock__fetch_data.assert_called_once_with(
+            mock.ANY,
+            "https://ads.atmosphere.copernicus.eu/api/catalogue/v1/collections/"
+            "cams-europe-air-quality-reanalyses/form.json",
         )
 
         self.assertEqual(12, len(queryables))
@@ -4748,19 +4834,21 @@ class TestSearchPluginCopMarineSearch(BaseSearchPluginTest):
             s3_stub.return_value = self.s3
             stubber = Stubber(self.s3)
             stubber.add_response(
-                "list_objects",
+                "list_objects_v2",
                 self.list_objects_response1,
                 {
                     "Bucket": "bucket1",
                     "Prefix": "native/PRODUCT_A/dataset-number-one",
+                    "FetchOwner": True,
                 },
             )
             stubber.add_response(
-                "list_objects",
+                "list_objects_v2",
                 self.list_objects_response2,
                 {
                     "Bucket": "bucket1",
                     "Prefix": "native/PRODUCT_A/dataset-number-two",
+                    "FetchOwner": True,
                 },
             )
             stubber.activate()
@@ -4827,22 +4915,21 @@ class TestSearchPluginCopMarineSearch(BaseSearchPluginTest):
             s3_stub.return_value = self.s3
             stubber = Stubber(self.s3)
             stubber.add_response(
-                "list_objects",
+                "list_objects_v2",
                 self.list_objects_response1,
-                {"Bucket": "bucket1", "Prefix": "native/PRODUCT_A/dataset-number-one"},
+                {
+                    "Bucket": "bucket1",
+                    "Prefix": "native/PRODUCT_A/dataset-number-one",
+                    "FetchOwner": True,
+                },
             )
             stubber.add_response(
-                "list_objects",
+                "list_objects_v2",
                 self.list_objects_response3,
-                {"Bucket": "bucket1", "Prefix": "native/PRODUCT_A/dataset-number-two"},
-            )
-            stubber.add_response(
-                "list_objects",
-                {},
                 {
                     "Bucket": "bucket1",
                     "Prefix": "native/PRODUCT_A/dataset-number-two",
-                    "Marker": "native/PRODUCT_A/dataset-number-two/item_846282_niznjvnqkrf.nc",
+                    "FetchOwner": True,
                 },
             )
             stubber.activate()
@@ -4903,35 +4990,25 @@ class TestSearchPluginCopMarineSearch(BaseSearchPluginTest):
         with mock.patch("eodag.plugins.search.cop_marine._get_s3_client") as s3_stub:
             s3_stub.return_value = self.s3
             stubber = Stubber(self.s3)
-            for i in [
-                0,
-                1,
-            ]:  # add responses twice because 2 search requests will be executed
-                stubber.add_response(
-                    "list_objects",
-                    self.list_objects_response1,
-                    {
-                        "Bucket": "bucket1",
-                        "Prefix": "native/PRODUCT_A/dataset-number-one",
-                    },
-                )
-                stubber.add_response(
-                    "list_objects",
-                    {},
-                    {
-                        "Bucket": "bucket1",
-                        "Marker": "native/PRODUCT_A/dataset-number-one/item_20200302_20200303_hdkIFEKFNEDN_20210101.nc",
-                        "Prefix": "native/PRODUCT_A/dataset-number-one",
-                    },
-                )
-                stubber.add_response(
-                    "list_objects",
-                    self.list_objects_response2,
-                    {
-                        "Bucket": "bucket1",
-                        "Prefix": "native/PRODUCT_A/dataset-number-two",
-                    },
-                )
+            # responses are added once as listings are cached between searches
+            stubber.add_response(
+                "list_objects_v2",
+                self.list_objects_response1,
+                {
+                    "Bucket": "bucket1",
+                    "Prefix": "native/PRODUCT_A/dataset-number-one",
+                    "FetchOwner": True,
+                },
+            )
+            stubber.add_response(
+                "list_objects_v2",
+                self.list_objects_response2,
+                {
+                    "Bucket": "bucket1",
+                    "Prefix": "native/PRODUCT_A/dataset-number-two",
+                    "FetchOwner": True,
+                },
+            )
             stubber.activate()
             result = search_plugin.query(
                 collection="PRODUCT_A",
@@ -4951,6 +5028,7 @@ class TestSearchPluginCopMarineSearch(BaseSearchPluginTest):
                 "item_20200102_20200103_hdkIFE.KFNEDNF_20210101",
                 result.data[0].properties["id"],
             )
+            stubber.assert_no_pending_responses()
 
     @mock.patch("eodag.plugins.search.cop_marine.requests.get")
     def test_plugins_search_cop_marine_search_by_id_no_dates_in_id(
@@ -4974,31 +5052,21 @@ class TestSearchPluginCopMarineSearch(BaseSearchPluginTest):
             s3_stub.return_value = self.s3
             stubber = Stubber(self.s3)
             stubber.add_response(
-                "list_objects",
+                "list_objects_v2",
                 self.list_objects_response1,
-                {"Bucket": "bucket1", "Prefix": "native/PRODUCT_A/dataset-number-one"},
-            )
-            stubber.add_response(
-                "list_objects",
-                {},
                 {
                     "Bucket": "bucket1",
-                    "Marker": "native/PRODUCT_A/dataset-number-one/item_20200302_20200303_hdkIFEKFNEDN_20210101.nc",
                     "Prefix": "native/PRODUCT_A/dataset-number-one",
+                    "FetchOwner": True,
                 },
             )
             stubber.add_response(
-                "list_objects",
+                "list_objects_v2",
                 self.list_objects_response3,
-                {"Bucket": "bucket1", "Prefix": "native/PRODUCT_A/dataset-number-two"},
-            )
-            stubber.add_response(
-                "list_objects",
-                {},
                 {
                     "Bucket": "bucket1",
                     "Prefix": "native/PRODUCT_A/dataset-number-two",
-                    "Marker": "native/PRODUCT_A/dataset-number-two/item_846282_niznjvnqkrf.nc",
+                    "FetchOwner": True,
                 },
             )
             stubber.activate()
@@ -5109,12 +5177,12 @@ class TestSearchPluginCopMarineSearch(BaseSearchPluginTest):
         asset_filename = "20200115_dm-metno-MODEL-topaz5_ecosmo-ARC-b20200115-fv02.0.nc"
 
         def mock_s3_list_objects(self, operation_name, *args, **kwargs):
-            if operation_name != "ListObjects":
+            if operation_name != "ListObjectsV2":
                 raise NotImplementedError()
             params = {**args[0], **kwargs}
             prefix = params.get("Prefix", "")
             if prefix == "native/PRODUCT_A/dataset-number-one" and not params.get(
-                "Marker"
+                "StartAfter"
             ):
                 contents = [
                     {
@@ -16,10 +16,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
 import unittest
 from collections import UserList
+from tempfile import TemporaryDirectory
+from unittest import mock
 
 import geojson
+import requests
+import responses
 from lxml import html
 from pystac import ItemCollection
 from shapely.geometry.collection import GeometryCollection
@@ -108,3 +113,46 @@ class TestSearchResult(unittest.TestCase):
         self.search_result.errors.append(["bar", Exception("2nd exception")])
         self.assertEqual(len(self.search_result.errors), 2)
         self.assertEqual(SearchResult([]).errors, [])
+
+    @responses.activate
+    def test_search_result_get_quicklooks(self):
+        """SearchResult.get_quicklooks must fetch the quicklooks of products concurrently"""
+        for idx, product in enumerate(self.search_result2):
+            product.properties["id"] = f"product_{idx}"
+            product.properties["eodag:quicklook"] = f"https://fake.url.to/ql_{idx}"
+            responses.add(
+                responses.GET,
+                f"https://fake.url.to/ql_{idx}",
+                body=f"quicklook {idx}".encode(),
+            )
+        # a product without quicklook
+        self.search_result2.append(
+            EOProduct(provider=None, properties={"geometry": "POINT (0 0)", "id": "x"})
+        )
+
+        with (
+            TemporaryDirectory() as output_dir,
+            mock.patch(
+                "eodag.api.product._product.EOProduct._download_quicklook",
+                side_effect=EOProduct._download_quicklook,
+                autospec=True,
+            ) as mock_download_quicklook,
+        ):
+            paths = self.search_result2.get_quicklooks(
+                output_dir=output_dir, max_workers=2
+            )
+            self.assertEqual(
+                paths,
+                [
+                    os.path.join(output_dir, "product_0"),
+                    os.path.join(output_dir, "product_1"),
+                    "",
+                ],
+            )
+            for idx, path in enumerate(paths[:2]):
+                with open(path, "rb") as fd:
+                    self.assertEqual(fd.read(), f"quicklook {idx}".encode())
+        # quicklooks are fetched using the same session
+        sessions = {call.args[5] for call in mock_download_quicklook.call_args_list}
+        self.assertEqual(len(sessions), 1)
+        self.assertIsInstance(sessions.pop(), requests.Session)
@@ -17,9 +17,11 @@
 # limitations under the License.
 
 import unittest
-from typing import Literal
+from typing import Annotated, Literal
+from unittest import mock
 
-from pydantic import AliasChoices, ValidationError, create_model
+from concurrent.futures import ThreadPoolExecutor
+from pydantic import AliasChoices, Field, ValidationError, create_model
 from pydantic_core import PydanticUndefined
 from typing_extensions import get_args, get_origin
 
@@ -251,6 +253,56 @@ class TestQueryables(unittest.TestCase):
             self.assertIsInstance(field.validation_alias, AliasChoices)
             self.assertEqual(field.validation_alias.choices, [prefixed, unprefixed])
 
+    def test_queryables_models_cached(self):
+        """Queryables models must be cached until explicitly invalidated"""
+        from eodag.types.stac_metadata import clear_stac_metadata_models_cache
+
+        stac_queryables = queryables.Queryables.from_stac_models()
+        self.assertIs(stac_queryables, queryables.Queryables.from_stac_models())
+        clear_stac_metadata_models_cache()
+        self.assertIsNot(stac_queryables, queryables.Queryables.from_stac_models())
+
+        queryables_dict = queryables.QueryablesDict(
+            foo=Annotated[str, Field(None)], bar=Annotated[int, Field(1)]
+        )
+        model = queryables_dict.get_model()
+        # same queryables definitions in other objects give the same model
+        self.assertIs(
+            model,
+            queryables.QueryablesDict(
+                bar=Annotated[int, Field(1)], foo=Annotated[str, Field(None)]
+            ).get_model(),
+        )
+        # queryables definitions or model name changes give another model
+        self.assertIsNot(model, queryables_dict.get_model("OtherQueryables"))
+        queryables_dict["bar"] = Annotated[int, Field(2)]
+        other_model = queryables_dict.get_model()
+        self.assertIsNot(model, other_model)
+        self.assertEqual(
+            2, other_model.model_validate({"collection": "a", "foo": "b"}).bar
+        )
+
+        queryables.QueryablesDict.clear_models_cache()
+        self.assertIsNot(other_model, queryables_dict.get_model())
+
+    def test_queryables_models_cache_threads(self):
+        """Queryables models cache must be usable concurrently while entries are evicted"""
+        queryables_dicts = [
+            queryables.QueryablesDict(foo=Annotated[int, Field(i)]) for i in range(4)
+        ]
+
+        def get_models(start: int) -> None:
+            for i in range(100):
+                queryables_dicts[(start + i) % 4].get_model()
+
+        with (
+            mock.patch.object(queryables, "QUERYABLES_MODELS_CACHE_SIZE", 2),
+            ThreadPoolExecutor(max_workers=4) as executor,
+        ):
+            for future in [executor.submit(get_models, i) for i in range(4)]:
+                future.result()
+        self.assertLessEqual(len(queryables._queryables_models), 2)
+
 
 class TestFieldDefinition(unittest.TestCase):
     def test_json_field_definition_to_python(self):
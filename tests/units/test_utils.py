@@ -22,6 +22,8 @@ import logging
 import os
 import ssl
 import sys
+import threading
+import time
 import unittest
 from contextlib import closing
 from io import StringIO
@@ -38,6 +40,7 @@ from eodag.utils.logging import TqdmLoggingHandler
 from tests.context import (
     HTTP_REQ_TIMEOUT,
     USER_AGENT,
+    AggregatedProgressCallback,
     DownloadedCallback,
     ProgressCallback,
     RequestError,
@@ -204,6 +207,61 @@ class TestUtils(unittest.TestCase):
                 bar(1)
             self.assertEqual(tqdm_out.getvalue(), "")
 
+    def test_aggregated_progresscallback(self):
+        """Test AggregatedProgressCallback updates its bar with the sum of queued increments"""
+        with closing(StringIO()) as tqdm_out:
+            bar = AggregatedProgressCallback(
+                total=100, file=tqdm_out, flush_interval=3600
+            )
+            with mock.patch.object(bar, "update", wraps=bar.update) as mock_update:
+                for _ in range(20):
+                    bar(5)
+                # increments are only queued until the bar is flushed
+                self.assertEqual(bar.n, 0)
+                bar.close()
+            mock_update.assert_called_once_with(100)
+            self.assertEqual(bar.n, 100)
+            self.assertIn("100%", tqdm_out.getvalue())
+            self.assertFalse(bar._flusher.is_alive())
+
+    def test_aggregated_progresscallback_threads(self):
+        """Test AggregatedProgressCallback can be called from many threads and gives metrics"""
+        bar = AggregatedProgressCallback(disable=True, flush_interval=0.01)
+
+        def transfer():
+            for _ in range(1000):
+                bar(3)
+
+        threads = [threading.Thread(target=transfer) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        # the background thread flushes the queued increments
+        for _ in range(100):
+            if not bar._pending:
+                break
+            time.sleep(0.01)
+        self.assertEqual(len(bar._pending), 0)
+
+        metrics = bar.metrics()
+        self.assertEqual(metrics["transferred"], 8 * 1000 * 3)
+        self.assertGreater(metrics["rate"], 0)
+
+        # a reset waits for the flush of the background thread
+        with bar._flush_lock:
+            reset = threading.Thread(target=bar.reset, kwargs={"total": 10})
+            reset.start()
+            reset.join(0.1)
+            self.assertTrue(reset.is_alive())
+        reset.join()
+        self.assertEqual(bar.total, 10)
+        bar.close()
+
+        with bar.copy(desc="foo") as another_bar:
+            self.assertIsInstance(another_bar, AggregatedProgressCallback)
+            self.assertEqual(another_bar.flush_interval, 0.01)
+
     @mock.patch("tqdm.auto.tqdm.write")
     def test_tqdm_logging_handler_uses_tqdm_write(self, tqdm_write):
         """Test logging through tqdm preserves the progress bar output."""
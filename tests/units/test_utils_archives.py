@@ -0,0 +1,259 @@
+# -*- coding: utf-8 -*-
+# Copyright 2025, CS GROUP - France, https://www.cs-soprasteria.com/
+#
+# This file is part of EODAG project
+#     https://www.github.com/CS-SI/EODAG
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import io
+import os
+import tarfile
+import tempfile
+import unittest
+import zipfile
+
+from eodag.utils.archives import (
+    ChunksReader,
+    NotStreamableArchiveError,
+    archive_members_filter,
+    extract_archive_stream,
+    extract_remote_zip_members,
+    extract_zip_members,
+    iter_remote_zip_member,
+    read_remote_zip_members,
+)
+
+
+class _UnseekableWriter(io.RawIOBase):
+    """Unseekable file object, making zipfile write data descriptors"""
+
+    def __init__(self):
+        self.data = bytearray()
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.data += data
+        return len(data)
+
+
+class TestArchivesStreamExtraction(unittest.TestCase):
+    members = {
+        "product/a.txt": b"a" * 100000,
+        "product/sub/b.bin": os.urandom(200000),
+        "product/empty": b"",
+    }
+
+    def setUp(self):
+        super().setUp()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+
+    @staticmethod
+    def chunks(data, size=1000):
+        return (data[i : i + size] for i in range(0, len(data), size))
+
+    def assert_extracted(self, data, filename):
+        dest_dir = os.path.join(self.tmp_dir.name, filename)
+        extract_archive_stream(self.chunks(data), dest_dir, filename)
+        for name, content in self.members.items():
+            with open(os.path.join(dest_dir, name), "rb") as fh:
+                self.assertEqual(fh.read(), content, name)
+
+    def test_chunks_reader(self):
+        reader = ChunksReader(self.chunks(b"0123456789", 3))
+        self.assertEqual(reader.read(2), b"01")
+        self.assertEqual(reader.read_exactly(5), b"23456")
+        reader.unread(b"56")
+        self.assertEqual(reader.read(), b"56789")
+        with self.assertRaises(EOFError):
+            reader.read_exactly(1)
+
+    def test_extract_zip_stream(self):
+        for compression in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED):
+            buffer = io.BytesIO()
+            with zipfile.ZipFile(buffer, "w", compression) as zfile:
+                zfile.writestr("product/", b"")
+                for name, content in self.members.items():
+                    zfile.writestr(name, content)
+            self.assert_extracted(buffer.getvalue(), f"{compression}.zip")
+
+    def test_extract_zip_stream_data_descriptors(self):
+        # deflated entries followed by data descriptors
+        writer = _UnseekableWriter()
+        with zipfile.ZipFile(writer, "w", zipfile.ZIP_DEFLATED) as zfile:
+            for name, content in self.members.items():
+                with zfile.open(name, "w", force_zip64=True) as fh:
+                    fh.write(content)
+        self.assert_extracted(bytes(writer.data), "descriptors.zip")
+
+        # stored entries size is only known from data descriptors
+        writer = _UnseekableWriter()
+        with zipfile.ZipFile(writer, "w", zipfile.ZIP_STORED) as zfile:
+            for name, content in self.members.items():
+                with zfile.open(name, "w") as fh:
+                    fh.write(content)
+        with self.assertRaises(NotStreamableArchiveError):
+            extract_archive_stream(
+                self.chunks(bytes(writer.data)), self.tmp_dir.name, "stored.zip"
+            )
+
+    def test_extract_zip_stream_bad_crc(self):
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_STORED) as zfile:
+            zfile.writestr("a.txt", b"abcdef")
+        data = buffer.getvalue().replace(b"abcdef", b"abcdeg")
+        with self.assertRaisesRegex(zipfile.BadZipFile, "CRC"):
+            extract_archive_stream(self.chunks(data), self.tmp_dir.name, "a.zip")
+
+    def test_extract_zip_stream_member_path(self):
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w") as zfile:
+            zfile.writestr("../../outside.txt", b"foo")
+        dest_dir = os.path.join(self.tmp_dir.name, "dest")
+        extract_archive_stream(self.chunks(buffer.getvalue()), dest_dir, "a.zip")
+        self.assertListEqual(os.listdir(dest_dir), ["outside.txt"])
+
+    def test_extract_tar_stream(self):
+        for mode, filename in (("w", "a.tar"), ("w:gz", "a.tar.gz")):
+            buffer = io.BytesIO()
+            with tarfile.open(fileobj=buffer, mode=mode) as tar:
+                for name, content in self.members.items():
+                    tarinfo = tarfile.TarInfo(name)
+                    tarinfo.size = len(content)
+                    tar.addfile(tarinfo, io.BytesIO(content))
+            self.assert_extracted(buffer.getvalue(), filename)
+
+    def test_extract_archive_stream_unsupported(self):
+        with self.assertRaises(NotStreamableArchiveError):
+            extract_archive_stream(iter([b"foo"]), self.tmp_dir.name, "a.7z")
+
+
+class TestZipMembersExtraction(unittest.TestCase):
+    def test_extract_zip_members(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            archive_path = os.path.join(tmp_dir, "a.zip")
+            members = {f"a/{i % 3}/{i}.bin": os.urandom(i * 100) for i in range(50)}
+            with zipfile.ZipFile(archive_path, "w", zipfile.ZIP_DEFLATED) as zfile:
+                for name, content in members.items():
+                    zfile.writestr(name, content)
+                infos = zfile.infolist()
+
+            extracted = []
+            extract_zip_members(
+                archive_path,
+                infos,
+                os.path.join(tmp_dir, "dest"),
+                max_workers=4,
+                callback=extracted.append,
+            )
+            self.assertCountEqual(extracted, infos)
+            for name, content in members.items():
+                with open(os.path.join(tmp_dir, "dest", name), "rb") as fh:
+                    self.assertEqual(fh.read(), content)
+
+    def test_archive_members_filter(self):
+        self.assertTrue(archive_members_filter(None)("foo/bar"))
+        select = archive_members_filter(r"B0[1-2]\.jp2|foo/.*")
+        self.assertTrue(select("GRANULE/IMG_DATA/B01.jp2"))
+        self.assertTrue(select("foo/bar.xml"))
+        self.assertFalse(select("GRANULE/IMG_DATA/B03.jp2"))
+        self.assertFalse(select("bar/foo/baz.xml"))
+
+
+class TestRemoteZipMembers(unittest.TestCase):
+    @staticmethod
+    def fetcher(data, requests):
+        def fetch_range(start, end):
+            requests.append((start, end))
+            return (
+                data[i : min(i + 1000, end + 1)] for i in range(start, end + 1, 1000)
+            )
+
+        return fetch_range
+
+    def test_read_remote_zip_members(self):
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w") as zfile:
+            zfile.writestr("large.bin", os.urandom(200000))
+            zfile.writestr("a.txt", b"a" * 1000, compress_type=zipfile.ZIP_DEFLATED)
+            zfile.comment = b"comment"
+        data = buffer.getvalue()
+
+        requests = []
+        members = read_remote_zip_members(self.fetcher(data, requests), len(data))
+        self.assertListEqual([m.filename for m in members], ["large.bin", "a.txt"])
+        # only the end of the archive, containing its central directory, is fetched
+        self.assertEqual(len(requests), 1)
+        self.assertEqual(requests[0][1], len(data) - 1)
+        self.assertEqual(requests[0][0], len(data) - 64 * 1024 - 22)
+
+        requests.clear()
+        content = b"".join(
+            iter_remote_zip_member(self.fetcher(data, requests), members[1])
+        )
+        self.assertEqual(content, b"a" * 1000)
+        # local header, then data
+        self.assertEqual(len(requests), 2)
+        self.assertEqual(requests[1][1] + 1 - requests[1][0], members[1].compress_size)
+
+    def test_read_remote_zip_members_zip64(self):
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w") as zfile:
+            # more members than the zip end of central directory record can count
+            for i in range(0x10000):
+                zfile.writestr(f"{i}", b"")
+            zfile.writestr("last.txt", b"last")
+        data = buffer.getvalue()
+
+        fetch_range = self.fetcher(data, [])
+        members = read_remote_zip_members(fetch_range, len(data))
+        self.assertEqual(len(members), 0x10001)
+        self.assertEqual(
+            b"".join(iter_remote_zip_member(fetch_range, members[-1])), b"last"
+        )
+
+    def test_read_remote_zip_members_invalid(self):
+        with self.assertRaises(zipfile.BadZipFile):
+            read_remote_zip_members(self.fetcher(b"not a zip", []), 9)
+
+    def test_iter_remote_zip_member_bad_crc(self):
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w") as zfile:
+            zfile.writestr("a.txt", b"abcdef")
+        data = buffer.getvalue()
+        members = read_remote_zip_members(self.fetcher(data, []), len(data))
+        data = data.replace(b"abcdef", b"abcdeg")
+        with self.assertRaisesRegex(zipfile.BadZipFile, "CRC"):
+            b"".join(iter_remote_zip_member(self.fetcher(data, []), members[0]))
+
+    def test_extract_remote_zip_members(self):
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zfile:
+            zfile.writestr("a/", b"")
+            zfile.writestr("a/b.txt", b"b" * 5000)
+            zfile.writestr("c.txt", b"c")
+        data = buffer.getvalue()
+        fetch_range = self.fetcher(data, [])
+        members = read_remote_zip_members(fetch_range, len(data))
+
+        extracted_sizes = []
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            extract_remote_zip_members(
+                fetch_range, members[:2], tmp_dir, extracted_sizes.append
+            )
+            self.assertListEqual(os.listdir(tmp_dir), ["a"])
+            with open(os.path.join(tmp_dir, "a", "b.txt"), "rb") as fh:
+                self.assertEqual(fh.read(), b"b" * 5000)
+        self.assertEqual(sum(extracted_sizes), 5000)
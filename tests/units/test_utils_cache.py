@@ -15,9 +15,13 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import os
+import tempfile
+import threading
 import unittest
+from unittest import mock
 
-from eodag.utils.cache import instance_cached_method
+from eodag.utils.cache import TTLCache, instance_cached_method
 
 
 class TestCachedMethodDecorator(unittest.TestCase):
@@ -81,3 +85,98 @@ class TestCachedMethodDecorator(unittest.TestCase):
         # Calling with 1 again is a cache miss (evicted), so call_count increments
         obj.method(1)
         self.assertEqual(obj.call_count, 4)
+
+
+class TestTTLCache(unittest.TestCase):
+    def test_ttl_cache_hit_and_expiry(self):
+        cache = TTLCache(ttl=10)
+        compute = mock.Mock(side_effect=[{"a": 1}, {"a": 2}])
+
+        with mock.patch("eodag.utils.cache.time.time", return_value=100):
+            self.assertEqual(cache.get_or_set(("foo", "bar"), compute), {"a": 1})
+            # returned values are copies
+            cache.get_or_set(("foo", "bar"), compute)["a"] = 3
+            self.assertEqual(cache.get_or_set(("foo", "bar"), compute), {"a": 1})
+        self.assertEqual(compute.call_count, 1)
+
+        # expired entry is computed again
+        with mock.patch("eodag.utils.cache.time.time", return_value=111):
+            self.assertEqual(cache.get_or_set(("foo", "bar"), compute), {"a": 2})
+        self.assertEqual(compute.call_count, 2)
+
+    def test_ttl_cache_disabled(self):
+        cache = TTLCache(ttl=0)
+        compute = mock.Mock(return_value="value")
+        cache.get_or_set(("foo",), compute)
+        cache.get_or_set(("foo",), compute)
+        self.assertEqual(compute.call_count, 2)
+
+    def test_ttl_cache_errors_not_cached(self):
+        cache = TTLCache(ttl=10)
+        compute = mock.Mock(side_effect=[ValueError("boom"), "value"])
+        with self.assertRaises(ValueError):
+            cache.get_or_set(("foo",), compute)
+        self.assertEqual(cache.get_or_set(("foo",), compute), "value")
+
+    def test_ttl_cache_stale_while_revalidate(self):
+        cache = TTLCache(ttl=10, stale_ttl=100)
+        refreshed = threading.Event()
+
+        def compute_new():
+            refreshed.set()
+            return "new"
+
+        with mock.patch("eodag.utils.cache.time.time", return_value=100):
+            cache.get_or_set(("foo",), lambda: "old")
+
+        # stale value is returned while being refreshed in background
+        with mock.patch("eodag.utils.cache.time.time", return_value=150):
+            self.assertEqual(cache.get_or_set(("foo",), compute_new), "old")
+            self.assertTrue(refreshed.wait(5))
+            for thread in threading.enumerate():
+                if thread.name == "eodag-cache-refresh":
+                    thread.join(5)
+            self.assertEqual(cache.get_or_set(("foo",), mock.Mock()), "new")
+
+        # too old value is computed again synchronously
+        with mock.patch("eodag.utils.cache.time.time", return_value=500):
+            self.assertEqual(cache.get_or_set(("foo",), lambda: "newer"), "newer")
+
+    def test_ttl_cache_maxsize(self):
+        cache = TTLCache(ttl=10, maxsize=2)
+        compute = mock.Mock(side_effect=lambda: compute.call_count)
+        cache.get_or_set(("a",), compute)
+        cache.get_or_set(("b",), compute)
+        cache.get_or_set(("c",), compute)
+        self.assertEqual(compute.call_count, 3)
+        # oldest entry was evicted
+        cache.get_or_set(("a",), compute)
+        self.assertEqual(compute.call_count, 4)
+
+    def test_ttl_cache_disk_tier_and_invalidate(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            TTLCache(ttl=10, cache_dir=cache_dir).get_or_set(
+                ("foo", "url"), lambda: {"a": [1, 2]}, persist=True
+            )
+            # not persisted entries are only kept in memory
+            TTLCache(ttl=10, cache_dir=cache_dir).get_or_set(
+                ("bar", "url"), lambda: {"b": 1}
+            )
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+
+            # entry is read from disk by a new cache instance
+            cache = TTLCache(ttl=10, cache_dir=cache_dir)
+            compute = mock.Mock(return_value={"a": [3]})
+            self.assertEqual(
+                cache.get_or_set(("foo", "url"), compute, persist=True),
+                {"a": [1, 2]},
+            )
+            compute.assert_not_called()
+
+            # invalidate namespace entries from both tiers
+            cache.invalidate("foo")
+            self.assertEqual(os.listdir(cache_dir), [])
+            self.assertEqual(
+                cache.get_or_set(("foo", "url"), compute, persist=True), {"a": [3]}
+            )
+            compute.assert_called_once()
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026, CS GROUP - France, https://www.csgroup.eu/
+#
+# This file is part of EODAG project
+#     https://www.github.com/CS-SI/EODAG
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import base64
+import hashlib
+import os
+import tempfile
+import unittest
+
+from eodag.utils.checksum import (
+    ChecksumVerifier,
+    content_md5_checksum,
+    parse_checksum,
+    s3_etag_checksum,
+)
+from eodag.utils.exceptions import ChecksumError
+
+DATA = b"some downloaded data"
+
+
+class TestChecksum(unittest.TestCase):
+    def test_parse_checksum(self):
+        """parse_checksum must support multihashes and plain hexadecimal digests"""
+        for algorithm, prefix in (
+            ("md5", "d50110"),
+            ("sha1", "1114"),
+            ("sha256", "1220"),
+            ("sha512", "1340"),
+        ):
+            digest = hashlib.new(algorithm, DATA).hexdigest()
+            self.assertEqual(parse_checksum(prefix + digest), (algorithm, digest))
+            self.assertEqual(parse_checksum(digest.upper()), (algorithm, digest))
+        # S3 ETag
+        md5 = hashlib.md5(DATA).hexdigest()
+        self.assertEqual(parse_checksum(f'"{md5}"'), ("md5", md5))
+        # unsupported checksums
+        for value in (None, 123, "", "abc", f"{md5}-3", "1220abcd", "z" * 32):
+            self.assertIsNone(parse_checksum(value), value)
+
+    def test_content_md5_checksum(self):
+        """content_md5_checksum must decode base64 MD5 digests"""
+        digest = hashlib.md5(DATA)
+        self.assertEqual(
+            content_md5_checksum(base64.b64encode(digest.digest()).decode()),
+            digest.hexdigest(),
+        )
+        self.assertIsNone(content_md5_checksum("not base64!"))
+        self.assertIsNone(content_md5_checksum(base64.b64encode(b"foo").decode()))
+        self.assertIsNone(content_md5_checksum(None))
+
+    def test_s3_etag_checksum(self):
+        """s3_etag_checksum must only return ETags that are MD5 digests"""
+        md5 = hashlib.md5(DATA).hexdigest()
+        self.assertEqual(s3_etag_checksum(f'"{md5.upper()}"'), md5)
+        self.assertEqual(s3_etag_checksum(f'"{md5}"', "AES256"), md5)
+        # objects uploaded by parts
+        self.assertIsNone(s3_etag_checksum(f'"{md5}-3"'))
+        # objects encrypted with SSE-KMS or SSE-C keys
+        self.assertIsNone(s3_etag_checksum(f'"{md5}"', "aws:kms"))
+        self.assertIsNone(s3_etag_checksum(f'"{md5}"', "aws:kms:dsse"))
+        self.assertIsNone(s3_etag_checksum(f'"{md5}"', None, "AES256"))
+        for value in (None, "", "z" * 32, hashlib.sha256(DATA).hexdigest()):
+            self.assertIsNone(s3_etag_checksum(value), value)
+
+    def test_checksum_verifier(self):
+        """ChecksumVerifier must hash data incrementally and check it at the end"""
+        sha256 = "1220" + hashlib.sha256(DATA).hexdigest()
+
+        verifier = ChecksumVerifier(sha256, "data")
+        self.assertEqual(b"".join(verifier.wrap([DATA[:5], DATA[5:]])), DATA)
+
+        verifier = ChecksumVerifier(sha256, "data")
+        verifier.update(DATA[:5])
+        with self.assertRaisesRegex(ChecksumError, "sha256 checksum mismatch for data"):
+            verifier.verify()
+
+        with self.assertRaises(ChecksumError):
+            list(ChecksumVerifier(sha256, "data").wrap([DATA, b"more"]))
+
+        with self.assertRaises(ValueError):
+            ChecksumVerifier("foo", "data")
+
+    def test_checksum_verifier_from_checksums(self):
+        """ChecksumVerifier.from_checksums must use the first supported checksum"""
+        md5 = hashlib.md5(DATA).hexdigest()
+        verifier = ChecksumVerifier.from_checksums(None, "foo", md5, name="data")
+        self.assertEqual((verifier.algorithm, verifier.expected), ("md5", md5))
+        self.assertIsNone(ChecksumVerifier.from_checksums(None, "foo", name="data"))
+
+    def test_checksum_verifier_update_from_file(self):
+        """ChecksumVerifier must hash the already downloaded part of a file"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "data.part")
+            with open(path, "wb") as fh:
+                fh.write(DATA[:10] + b"garbage")
+            verifier = ChecksumVerifier(hashlib.md5(DATA).hexdigest(), "data")
+            verifier.update_from_file(path, 10)
+            verifier.update(DATA[10:])
+            verifier.verify()
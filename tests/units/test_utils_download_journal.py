@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026, CS GROUP - France, https://www.csgroup.eu/
+#
+# This file is part of EODAG project
+#     https://www.github.com/CS-SI/EODAG
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from eodag.utils.download_journal import DownloadJournal
+
+
+class TestDownloadJournal(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.journal_path = os.path.join(self.tmp_dir.name, "journal", "journal.db")
+        self.product = mock.Mock(
+            provider="foo", properties={"id": "bar", "title": "baz"}
+        )
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_download_journal_enqueue(self):
+        """Products must be queued once in the journal"""
+        journal = DownloadJournal(self.journal_path)
+        journal.enqueue([self.product])
+        journal.set_state(self.product, DownloadJournal.ORDERED)
+        journal.enqueue([self.product])
+
+        entries = journal.entries()
+        self.assertEqual(len(entries), 1)
+        self.assertEqual(entries[0]["provider"], "foo")
+        self.assertEqual(entries[0]["product_id"], "bar")
+        self.assertEqual(entries[0]["title"], "baz")
+        self.assertEqual(entries[0]["state"], DownloadJournal.ORDERED)
+        self.assertEqual(journal.entries(DownloadJournal.QUEUED), [])
+
+    def test_download_journal_claim(self):
+        """Products must be claimed by only one journal until their claim expires"""
+        journal = DownloadJournal(self.journal_path)
+        other_journal = DownloadJournal(self.journal_path)
+
+        self.assertTrue(journal.claim(self.product))
+        self.assertFalse(other_journal.claim(self.product))
+        # claims can be renewed by their owner
+        self.assertTrue(journal.claim(self.product))
+        self.assertEqual(journal.get(self.product)["attempts"], 2)
+        # ordered products stay claimed by their owner
+        journal.set_state(self.product, DownloadJournal.ORDERED)
+        self.assertFalse(other_journal.claim(self.product))
+        self.assertTrue(journal.claim(self.product))
+
+        # expired claims can be taken over
+        other_journal.lease = 0
+        self.assertTrue(other_journal.claim(self.product))
+        self.assertEqual(journal.get(self.product)["owner"], other_journal.owner)
+
+        # failed downloads can be claimed again
+        other_journal.set_state(self.product, DownloadJournal.FAILED, error="boom")
+        self.assertEqual(journal.get(self.product)["error"], "boom")
+        self.assertTrue(journal.claim(self.product))
+        self.assertIsNone(journal.get(self.product)["error"])
+
+    def test_download_journal_done(self):
+        """Downloaded products must not be claimed while their path exists"""
+        product_path = os.path.join(self.tmp_dir.name, "product")
+        os.makedirs(os.path.join(product_path, "sub"))
+        with open(os.path.join(product_path, "sub", "data"), "wb") as fh:
+            fh.write(b"x" * 10)
+
+        journal = DownloadJournal(self.journal_path)
+        journal.claim(self.product)
+        journal.set_state(self.product, DownloadJournal.DONE, path=product_path)
+        entry = journal.get(self.product)
+        self.assertEqual(entry["state"], DownloadJournal.DONE)
+        self.assertEqual(entry["path"], product_path)
+        self.assertEqual(entry["bytes"], 10)
+
+        self.assertFalse(DownloadJournal(self.journal_path).claim(self.product))
+        os.remove(os.path.join(product_path, "sub", "data"))
+        os.removedirs(os.path.join(product_path, "sub"))
+        self.assertTrue(DownloadJournal(self.journal_path).claim(self.product))
+
+    def test_download_journal_heartbeat(self):
+        """Claims must be refreshed by heartbeats"""
+        journal = DownloadJournal(self.journal_path)
+        journal.claim(self.product)
+        updated = journal.get(self.product)["updated"]
+        with mock.patch(
+            "eodag.utils.download_journal.time.time", return_value=updated + 100
+        ):
+            journal.heartbeat()
+        self.assertEqual(journal.get(self.product)["updated"], updated + 100)
+        # as well as the claims of ordered products
+        journal.set_state(self.product, DownloadJournal.ORDERED)
+        with mock.patch(
+            "eodag.utils.download_journal.time.time", return_value=updated + 200
+        ):
+            journal.heartbeat()
+        self.assertEqual(journal.get(self.product)["updated"], updated + 200)
+        self.assertIsNone(
+            DownloadJournal(self.journal_path).get(
+                mock.Mock(provider="foo", properties={"id": "other"})
+            )
+        )
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026, CS GROUP - France, https://www.csgroup.eu/
+#
+# This file is part of EODAG project
+#     https://www.github.com/CS-SI/EODAG
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from eodag.utils.files import link_or_copy, link_or_copy_tree, mmap_chunks, path_size
+
+
+class TestUtilsFiles(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.src = os.path.join(self.tmp_dir.name, "src.bin")
+        with open(self.src, "wb") as fd:
+            fd.write(b"some content")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    @mock.patch("eodag.utils.files._reflink", autospec=True, side_effect=OSError)
+    def test_utils_files_link_or_copy_hardlink(self, mock_reflink):
+        """link_or_copy must hard link files that cannot be cloned, replacing the destination"""
+        dst = os.path.join(self.tmp_dir.name, "dst.bin")
+        with open(dst, "wb") as fd:
+            fd.write(b"old content")
+
+        self.assertEqual(link_or_copy(self.src, dst), "hardlink")
+        self.assertTrue(os.path.samefile(self.src, dst))
+        self.assertEqual(os.listdir(self.tmp_dir.name).count("dst.bin"), 1)
+        self.assertEqual(len(os.listdir(self.tmp_dir.name)), 2)
+
+    @mock.patch("eodag.utils.files._reflink", autospec=True, side_effect=OSError)
+    @mock.patch("eodag.utils.files.os.link", autospec=True, side_effect=OSError)
+    def test_utils_files_link_or_copy_fallback(self, mock_link, mock_reflink):
+        """link_or_copy must copy files that cannot be linked nor cloned"""
+        dst = os.path.join(self.tmp_dir.name, "dst.bin")
+
+        self.assertEqual(link_or_copy(self.src, dst), "copy")
+        mock_reflink.assert_called_once()
+        mock_link.assert_called_once()
+        self.assertFalse(os.path.samefile(self.src, dst))
+        with open(dst, "rb") as fd:
+            self.assertEqual(fd.read(), b"some content")
+
+    def test_utils_files_mmap_chunks(self):
+        """mmap_chunks must give views of the file data"""
+        chunks = list(mmap_chunks(self.src, chunk_size=5))
+        self.assertTrue(all(isinstance(chunk, memoryview) for chunk in chunks))
+        self.assertEqual(
+            [bytes(chunk) for chunk in chunks], [b"some ", b"conte", b"nt"]
+        )
+
+        empty = os.path.join(self.tmp_dir.name, "empty.bin")
+        open(empty, "wb").close()
+        self.assertEqual(list(mmap_chunks(empty)), [])
+
+    def test_utils_files_link_or_copy_tree(self):
+        """link_or_copy_tree must make files of a directory tree available and size them"""
+        src_dir = os.path.join(self.tmp_dir.name, "src_dir")
+        os.makedirs(os.path.join(src_dir, "sub"))
+        os.link(self.src, os.path.join(src_dir, "sub", "a.bin"))
+        with open(os.path.join(src_dir, "b.bin"), "wb") as fd:
+            fd.write(b"other")
+        dst_dir = os.path.join(self.tmp_dir.name, "dst_dir")
+
+        link_or_copy_tree(src_dir, dst_dir)
+        with open(os.path.join(dst_dir, "sub", "a.bin"), "rb") as fd:
+            self.assertEqual(fd.read(), b"some content")
+        self.assertEqual(path_size(dst_dir), len(b"some content") + len(b"other"))
+        self.assertEqual(path_size(self.src), len(b"some content"))
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026, CS GROUP - France, https://www.csgroup.eu/
+#
+# This file is part of EODAG project
+#     https://www.github.com/CS-SI/EODAG
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from eodag.utils.product_cache import ProductCache, _FileLock, get_product_cache
+
+
+class TestProductCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache = ProductCache(os.path.join(self.tmp_dir.name, "cache"))
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _make_product(self, name, size=10):
+        product_dir = os.path.join(self.tmp_dir.name, "downloads", name)
+        os.makedirs(os.path.join(product_dir, "sub"))
+        with open(os.path.join(product_dir, "sub", "data.bin"), "wb") as fh:
+            fh.write(b"x" * size)
+        return product_dir
+
+    def test_product_cache_product_key(self):
+        """Products are cached by checksum if known, else by provider and id"""
+        product = mock.Mock(provider="foo", collection="bar", properties={"id": "baz"})
+        key = ProductCache.product_key(product)
+        self.assertEqual(key, ProductCache.product_key(product, extract=True))
+        self.assertNotEqual(key, ProductCache.product_key(product, extract=False))
+
+        product.properties["file:checksum"] = "1220" + "ab" * 32
+        checksum_key = ProductCache.product_key(product)
+        self.assertNotEqual(key, checksum_key)
+        other_product = mock.Mock(
+            provider="other",
+            collection="other",
+            properties={"id": "other", "file:checksum": "ab" * 32},
+        )
+        self.assertEqual(checksum_key, ProductCache.product_key(other_product))
+
+    def test_product_cache_store_materialize(self):
+        """Cached products must be materialized in other directories"""
+        product_dir = self._make_product("product")
+        output_dir = os.path.join(self.tmp_dir.name, "output")
+
+        with self.cache.lock("key"):
+            self.assertIsNone(self.cache.materialize("key", output_dir))
+            self.cache.store("key", product_dir)
+            path = self.cache.materialize("key", output_dir)
+
+        self.assertEqual(path, os.path.join(output_dir, "product"))
+        with open(os.path.join(path, "sub", "data.bin"), "rb") as fh:
+            self.assertEqual(fh.read(), b"x" * 10)
+        self.assertEqual(os.listdir(output_dir), ["product"])
+
+        # the cached copy is kept when the downloaded product is removed
+        os.remove(os.path.join(product_dir, "sub", "data.bin"))
+        other_output_dir = os.path.join(self.tmp_dir.name, "other")
+        with self.cache.lock("key"):
+            path = self.cache.materialize("key", other_output_dir)
+        self.assertTrue(os.path.isfile(os.path.join(path, "sub", "data.bin")))
+
+    def test_product_cache_evict(self):
+        """Least recently used entries must be evicted once the cache is full"""
+        self.cache.max_size = 25
+        for i, key in enumerate(["a", "b", "c"]):
+            with self.cache.lock(key):
+                self.cache.store(key, self._make_product(key))
+            entry_dir = os.path.join(self.cache.cache_dir, "entries", key)
+            os.utime(entry_dir, (i, i))
+            if key == "b":
+                # "a" is used again, "b" becomes the least recently used entry
+                os.utime(os.path.join(self.cache.cache_dir, "entries", "a"), (5, 5))
+
+        self.assertEqual(
+            sorted(os.listdir(os.path.join(self.cache.cache_dir, "entries"))),
+            ["a", "c"],
+        )
+
+        # locked entries are not evicted
+        self.cache.max_size = 0
+        with self.cache.lock("a"):
+            self.cache.evict()
+        self.assertEqual(
+            os.listdir(os.path.join(self.cache.cache_dir, "entries")), ["a"]
+        )
+
+    def test_product_cache_file_lock(self):
+        """File locks must be exclusive"""
+        lock_path = os.path.join(self.tmp_dir.name, "test.lock")
+        with _FileLock(lock_path):
+            self.assertFalse(_FileLock(lock_path).acquire(blocking=False))
+        lock = _FileLock(lock_path)
+        self.assertTrue(lock.acquire(blocking=False))
+        lock.release()
+
+    def test_get_product_cache(self):
+        """The products cache must be enabled using environment variables"""
+        with mock.patch.dict(os.environ, {}, clear=True):
+            self.assertIsNone(get_product_cache())
+        with mock.patch.dict(
+            os.environ,
+            {
+                "EODAG_PRODUCTS_CACHE_DIR": self.tmp_dir.name,
+                "EODAG_PRODUCTS_CACHE_MAX_SIZE": "1000",
+            },
+        ):
+            cache = get_product_cache()
+        self.assertEqual(cache.cache_dir, self.tmp_dir.name)
+        self.assertEqual(cache.max_size, 1000)
@@ -1,9 +1,11 @@
+import hashlib
 import io
 import os
 import re
+import time
 import zipfile
 from unittest import TestCase
-from unittest.mock import call, patch
+from unittest.mock import Mock, call, patch
 
 import boto3
 from concurrent.futures import Future, ThreadPoolExecutor
@@ -12,6 +14,7 @@ from moto import mock_aws
 from tests import TEST_RESOURCES_PATH
 from tests.context import (
     AwsAuth,
+    ChecksumError,
     EOProduct,
     InvalidDataError,
     PluginConfig,
@@ -20,12 +23,21 @@ from tests.context import (
     _chunks_from_s3_objects,
     _compute_file_ranges,
     _prepare_file_in_zip,
+    fetch_range,
     file_position_from_s3_zip,
+    files_positions_from_s3_zip,
+    iter_s3_pages,
     list_files_in_s3_zipped_object,
+    list_s3_objects,
+    list_s3_prefixes,
     open_s3_zipped_object,
+    s3_client_identity,
+    s3_listing_cache,
     stream_download_from_s3,
     to_iso_utc_string,
     update_assets_from_s3,
+    upload_stream_to_s3,
+    zip_directory_cache,
 )
 
 
@@ -89,6 +101,7 @@ class TestUtilsS3(TestCase):
         cls.mock_aws.stop()
 
     def setUp(self):
+        zip_directory_cache.invalidate()
         self.prod = EOProduct("dummy", dict(geometry="POINT (0 0)", id="foo"))
         self.auth_plugin = AwsAuth(
             "dummy",
@@ -266,6 +279,95 @@ class TestUtilsS3(TestCase):
             with self.subTest(asset=asset_name):
                 self.assertDictEqual(self.prod.assets[asset_name].data, expected)
 
+    def test_utils_s3_iter_s3_pages(self):
+        """iter_s3_pages must list objects page by page and cache the listed pages"""
+        s3_listing_cache.invalidate()
+        prefix = "path/to/pages/"
+        for i in range(5):
+            self.s3_client.put_object(Bucket="mybucket", Key=f"{prefix}{i}", Body=b"")
+
+        with patch.object(
+            self.s3_client, "list_objects_v2", wraps=self.s3_client.list_objects_v2
+        ) as mock_list:
+            pages = list(
+                iter_s3_pages(self.s3_client, "mybucket", prefix, "foo", MaxKeys=2)
+            )
+            self.assertListEqual(
+                [[obj["Key"] for obj in page] for page in pages],
+                [
+                    [f"{prefix}0", f"{prefix}1"],
+                    [f"{prefix}2", f"{prefix}3"],
+                    [f"{prefix}4"],
+                ],
+            )
+            self.assertEqual(mock_list.call_count, 3)
+            mock_list.assert_called_with(
+                Bucket="mybucket", Prefix=prefix, MaxKeys=2, StartAfter=f"{prefix}3"
+            )
+
+            # listed pages are cached
+            objects = list_s3_objects(
+                self.s3_client, "mybucket", prefix, "foo", MaxKeys=2
+            )
+            self.assertEqual(len(objects), 5)
+            self.assertEqual(mock_list.call_count, 3)
+
+            # pages of an iteration stopped early are cached and the next ones listed later
+            s3_listing_cache.invalidate("foo")
+            next(iter_s3_pages(self.s3_client, "mybucket", prefix, "foo", MaxKeys=2))
+            self.assertEqual(mock_list.call_count, 4)
+            list_s3_objects(self.s3_client, "mybucket", prefix, "foo", MaxKeys=2)
+            self.assertEqual(mock_list.call_count, 6)
+
+            # listings of other namespaces are not shared
+            list_s3_objects(self.s3_client, "mybucket", prefix, "bar", MaxKeys=2)
+            self.assertEqual(mock_list.call_count, 9)
+
+        # listings made with other credentials are not shared
+        other_client = boto3.client(
+            "s3",
+            region_name="us-east-1",
+            aws_access_key_id="other",
+            aws_secret_access_key="other",
+        )
+        self.assertNotEqual(
+            s3_client_identity(other_client), s3_client_identity(self.s3_client)
+        )
+        with patch.object(
+            other_client, "list_objects_v2", wraps=other_client.list_objects_v2
+        ) as mock_other_list:
+            list_s3_objects(other_client, "mybucket", prefix, "foo", MaxKeys=2)
+            self.assertEqual(mock_other_list.call_count, 3)
+
+    def test_utils_s3_list_s3_prefixes(self):
+        """list_s3_prefixes must only list the disjoint prefixes covering the requested ones"""
+        keys = ["a/1", "a/b/2", "a/b/3", "ab/4", "c/5"]
+
+        def list_prefix(prefix):
+            return [key for key in keys if key.startswith(prefix)]
+
+        mock_list_prefix = Mock(side_effect=list_prefix)
+        listings = list_s3_prefixes(
+            ["a/b/", "a/", "c/", "a/b/"], mock_list_prefix, get_key=str, max_workers=2
+        )
+        self.assertDictEqual(
+            listings,
+            {
+                "a/": ["a/1", "a/b/2", "a/b/3"],
+                "a/b/": ["a/b/2", "a/b/3"],
+                "c/": ["c/5"],
+            },
+        )
+        self.assertEqual(mock_list_prefix.call_count, 2)
+        mock_list_prefix.assert_has_calls([call("a/"), call("c/")], any_order=True)
+
+        # an empty prefix covers all the others
+        mock_list_prefix.reset_mock()
+        listings = list_s3_prefixes(["", "a/b/"], mock_list_prefix, get_key=str)
+        self.assertListEqual(listings[""], keys)
+        self.assertListEqual(listings["a/b/"], ["a/b/2", "a/b/3"])
+        mock_list_prefix.assert_called_once_with("")
+
     def test_utils_s3_file_position_from_s3_zip(self):
         # Prepare a zip with both uncompressed and compressed files
         zip_bytes = io.BytesIO()
@@ -340,6 +442,84 @@ class TestUtilsS3(TestCase):
                     self.assertEqual(start, case["expected_start"])
                     self.assertEqual(size, case["expected_size"])
 
+    def test_utils_s3_zip_directory_cache(self):
+        """The central directory of a zipped S3 object must be fetched once per ETag"""
+        zip_bytes = io.BytesIO()
+        with zipfile.ZipFile(zip_bytes, "w", compression=zipfile.ZIP_STORED) as zf:
+            zf.writestr("a.txt", "first")
+        self.s3_client.put_object(
+            Bucket="mybucket", Key="cached.zip", Body=zip_bytes.getvalue()
+        )
+
+        with patch("eodag.utils.s3.fetch_range", wraps=fetch_range) as mock_fetch_range:
+            for _ in range(2):
+                self.assertListEqual(
+                    [
+                        z.filename
+                        for z in list_files_in_s3_zipped_object(
+                            "mybucket", "cached.zip", self.s3_client
+                        )
+                    ],
+                    ["a.txt"],
+                )
+            zip_file, _ = open_s3_zipped_object(
+                "mybucket", "cached.zip", self.s3_client
+            )
+            self.assertListEqual(zip_file.namelist(), ["a.txt"])
+            # EOCD and central directory fetched once
+            self.assertEqual(mock_fetch_range.call_count, 2)
+
+            # a new version of the object is detected with its ETag
+            zip_bytes = io.BytesIO()
+            with zipfile.ZipFile(zip_bytes, "w", compression=zipfile.ZIP_STORED) as zf:
+                zf.writestr("b.txt", "second")
+            self.s3_client.put_object(
+                Bucket="mybucket", Key="cached.zip", Body=zip_bytes.getvalue()
+            )
+            self.assertListEqual(
+                [
+                    z.filename
+                    for z in list_files_in_s3_zipped_object(
+                        "mybucket", "cached.zip", self.s3_client
+                    )
+                ],
+                ["b.txt"],
+            )
+            self.assertEqual(mock_fetch_range.call_count, 4)
+
+    def test_utils_s3_files_positions_from_s3_zip(self):
+        """files_positions_from_s3_zip must fetch close local headers in a single request"""
+        contents = {f"file{i}.txt": f"content of file {i}".encode() for i in range(5)}
+        zip_bytes = io.BytesIO()
+        with zipfile.ZipFile(zip_bytes, "w", compression=zipfile.ZIP_STORED) as zf:
+            for name, content in contents.items():
+                zf.writestr(name, content)
+        zip_data = zip_bytes.getvalue()
+        self.s3_client.put_object(Bucket="mybucket", Key="multi.zip", Body=zip_data)
+
+        with patch("eodag.utils.s3.fetch_range", wraps=fetch_range) as mock_fetch_range:
+            positions = files_positions_from_s3_zip(
+                "mybucket", "multi.zip", self.s3_client, ["file3.txt", "file1.txt"]
+            )
+            # EOCD, central directory and a single request for both local headers
+            self.assertEqual(mock_fetch_range.call_count, 3)
+
+        self.assertListEqual(sorted(positions), ["file1.txt", "file3.txt"])
+        for name, (start, size) in positions.items():
+            self.assertEqual(zip_data[start : start + size], contents[name])
+
+        # local headers too far from each other are fetched separately
+        with (
+            patch("eodag.utils.s3.ZIP_HEADERS_COALESCE_SIZE", 4096),
+            patch("eodag.utils.s3.fetch_range", wraps=fetch_range) as mock_fetch_range,
+        ):
+            positions = files_positions_from_s3_zip(
+                "mybucket", "multi.zip", self.s3_client, ["file3.txt", "file1.txt"]
+            )
+            self.assertEqual(mock_fetch_range.call_count, 2)
+        for name, (start, size) in positions.items():
+            self.assertEqual(zip_data[start : start + size], contents[name])
+
     def test_utils_s3_open_s3_zipped_object_invalid(self):
         """Test a corrupted ZIP file to ensure you raise properly on bad EOCD."""
         self.s3_client.put_object(
@@ -382,6 +562,29 @@ class TestUtilsS3(TestCase):
             self.assertEqual(idx, 0)
             self.assertEqual(chunks, data)
 
+    def test_chunks_from_s3_objects_checksum(self):
+        """_chunks_from_s3_objects must verify the checksum of entirely streamed objects"""
+
+        data = b"ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+        self.s3_client.put_object(Bucket="mybucket", Key="alpha", Body=data)
+
+        def stream(checksum, byte_range=(None, None)):
+            fi = make_mock_fileinfo("alpha", len(data))
+            fi.checksum = checksum
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                _, gen = next(
+                    _chunks_from_s3_objects(
+                        self.s3_client, [fi], byte_range, 10, executor
+                    )
+                )
+                return b"".join(gen)
+
+        self.assertEqual(stream(hashlib.md5(data).hexdigest()), data)
+        with self.assertRaises(ChecksumError):
+            stream(hashlib.md5(b"other").hexdigest())
+        # partial content cannot be verified
+        self.assertEqual(stream(hashlib.md5(b"other").hexdigest(), (0, 9)), data[:10])
+
     def test_chunks_from_s3_objects_chunk_count_and_worker_usage(self):
         """Test that correct number of chunks are requested and workers are used efficiently."""
 
@@ -464,6 +667,78 @@ class TestUtilsS3(TestCase):
 
             self.assertEqual(mock_fetch.call_count, 5)
 
+    def test_chunks_from_s3_objects_respects_backpressure_download_bytes(self):
+        """Chunk submissions must be capped by BACKPRESSURE_DOWNLOAD_BYTES."""
+
+        range_size = 10
+        fi = make_mock_fileinfo("file1", 50)
+
+        class ImmediateExecutor:
+            def submit(self, fn, *args, **kwargs):
+                fut = Future()
+                fut.set_result(fn(*args, **kwargs))
+                return fut
+
+        with (
+            patch("eodag.utils.s3.BACKPRESSURE_DOWNLOAD_BYTES", 25),
+            patch(
+                "eodag.utils.s3.fetch_range", return_value=b"X" * range_size
+            ) as mock_fetch,
+        ):
+            result = _chunks_from_s3_objects(
+                self.s3_client,
+                [fi],
+                byte_range=(None, None),
+                range_size=range_size,
+                executor=ImmediateExecutor(),
+            )
+
+            # a third chunk would exceed the bytes budget
+            _, gen = next(result)
+            self.assertEqual(mock_fetch.call_count, 2)
+
+            # no more chunk is downloaded until the reader asks for more data
+            next(gen)
+            self.assertEqual(mock_fetch.call_count, 2)
+
+            self.assertEqual(b"X" * range_size + b"".join(gen), b"X" * fi.size)
+            self.assertEqual(mock_fetch.call_count, 5)
+
+    def test_chunks_from_s3_objects_adaptive_range_size(self):
+        """Requested ranges must grow while requests are fast, up to MAX_RANGE_SIZE"""
+
+        data = bytes(range(100))
+        fi = make_mock_fileinfo("file1", len(data))
+
+        def fetch_range(bucket_name, key_name, start, end, client_s3):
+            time.sleep(0.001)
+            return data[start : end + 1]
+
+        # one request at a time, each one being sized after the previous ones
+        with (
+            patch("eodag.utils.s3.BACKPRESSURE_DOWNLOAD_CHUNKS", 1),
+            patch("eodag.utils.s3.MAX_RANGE_SIZE", 40),
+            patch("eodag.utils.s3.fetch_range", side_effect=fetch_range) as mock_fetch,
+        ):
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                _, gen = next(
+                    _chunks_from_s3_objects(
+                        self.s3_client,
+                        [fi],
+                        (None, None),
+                        10,
+                        executor,
+                        adaptive_range_size=True,
+                    )
+                )
+                self.assertEqual(b"".join(gen), data)
+
+        sizes = [c.args[3] + 1 - c.args[2] for c in mock_fetch.call_args_list]
+        self.assertEqual(sum(sizes), len(data))
+        self.assertEqual(sizes[0], 10)
+        self.assertGreater(max(sizes), 10)
+        self.assertLessEqual(max(sizes), 40)
+
     def test_prepare_file_in_zip(self):
         """Test _prepare_file_in_zip to ensure it sets the correct attributes for retrieving a file inside a ZIP."""
 
@@ -626,3 +901,141 @@ class TestUtilsS3(TestCase):
                     expected_content=case.get("expected_content"),
                     expected_files=case.get("expected_files"),
                 )
+
+    def test_utils_s3_upload_stream_to_s3(self):
+        """upload_stream_to_s3 must upload streams using concurrent multipart uploads"""
+        part_size = 5 * 1024**2
+        data = os.urandom(3 * part_size + 10)
+        # short streams are uploaded using a single request
+        upload_stream_to_s3(
+            io.BytesIO(b"abc"), "mybucket", "upload/small", self.s3_client, part_size
+        )
+        obj = self.s3_client.get_object(Bucket="mybucket", Key="upload/small")
+        self.assertEqual(obj["Body"].read(), b"abc")
+
+        running = []
+        max_running = []
+        upload_part = self.s3_client.upload_part
+
+        def tracked_upload_part(**kwargs):
+            running.append(1)
+            max_running.append(len(running))
+            time.sleep(0.05)
+            try:
+                return upload_part(**kwargs)
+            finally:
+                running.pop()
+
+        progress = Mock()
+        with patch.object(
+            self.s3_client, "upload_part", side_effect=tracked_upload_part
+        ) as mock_upload_part:
+            upload_stream_to_s3(
+                StreamResponse(
+                    content=(data[i : i + 1000] for i in range(0, len(data), 1000))
+                ).content,
+                "mybucket",
+                "upload/large",
+                self.s3_client,
+                part_size=part_size,
+                max_concurrency=2,
+                content_type="application/zip",
+                progress_callback=progress,
+            )
+        self.assertEqual(mock_upload_part.call_count, 4)
+        self.assertLessEqual(max(max_running), 2)
+        self.assertEqual(sum(c.args[0] for c in progress.call_args_list), len(data))
+        obj = self.s3_client.get_object(Bucket="mybucket", Key="upload/large")
+        self.assertEqual(obj["ContentType"], "application/zip")
+        self.assertEqual(obj["Body"].read(), data)
+
+        # parts of streams of known size are enlarged to fit in the maximum parts number
+        with (
+            patch("eodag.utils.s3.MAX_UPLOAD_PARTS", 2),
+            patch.object(
+                self.s3_client, "upload_part", wraps=self.s3_client.upload_part
+            ) as mock_upload_part,
+        ):
+            upload_stream_to_s3(
+                io.BytesIO(data),
+                "mybucket",
+                "upload/enlarged",
+                self.s3_client,
+                part_size=part_size,
+                size=len(data),
+            )
+        self.assertEqual(mock_upload_part.call_count, 2)
+        obj = self.s3_client.get_object(Bucket="mybucket", Key="upload/enlarged")
+        self.assertEqual(obj["Body"].read(), data)
+
+        with self.assertRaises(ValueError):
+            upload_stream_to_s3(
+                io.BytesIO(data), "mybucket", "upload/large", self.s3_client, 1024
+            )
+
+    def test_utils_s3_upload_stream_to_s3_resume(self):
+        """upload_stream_to_s3 must resume its interrupted uploads without uploading parts again"""
+        part_size = 5 * 1024**2
+        data = os.urandom(3 * part_size)
+        # incomplete upload of another writer, never resumed
+        other_upload_id = self.s3_client.create_multipart_upload(
+            Bucket="mybucket", Key="upload/resumed"
+        )["UploadId"]
+        self.s3_client.upload_part(
+            Bucket="mybucket",
+            Key="upload/resumed",
+            UploadId=other_upload_id,
+            PartNumber=1,
+            Body=data[:part_size],
+        )
+        upload_part = self.s3_client.upload_part
+
+        def failing_upload_part(**kwargs):
+            if kwargs["PartNumber"] == 3:
+                raise ConnectionError("interrupted")
+            return upload_part(**kwargs)
+
+        with patch.object(
+            self.s3_client, "upload_part", side_effect=failing_upload_part
+        ) as mock_upload_part:
+            with self.assertRaises(ConnectionError):
+                upload_stream_to_s3(
+                    io.BytesIO(data),
+                    "mybucket",
+                    "upload/resumed",
+                    self.s3_client,
+                    part_size,
+                    max_concurrency=1,
+                )
+        upload_ids = {c.kwargs["UploadId"] for c in mock_upload_part.call_args_list}
+        self.assertEqual(len(upload_ids), 1)
+        self.assertNotIn(other_upload_id, upload_ids)
+
+        with patch.object(
+            self.s3_client, "upload_part", wraps=self.s3_client.upload_part
+        ) as mock_upload_part:
+            upload_stream_to_s3(
+                io.BytesIO(data),
+                "mybucket",
+                "upload/resumed",
+                self.s3_client,
+                part_size,
+            )
+        self.assertListEqual(
+            [c.kwargs["PartNumber"] for c in mock_upload_part.call_args_list], [3]
+        )
+        self.assertEqual(
+            {c.kwargs["UploadId"] for c in mock_upload_part.call_args_list},
+            upload_ids,
+        )
+        obj = self.s3_client.get_object(Bucket="mybucket", Key="upload/resumed")
+        self.assertEqual(obj["Body"].read(), data)
+        self.assertListEqual(
+            [
+                upload["UploadId"]
+                for upload in self.s3_client.list_multipart_uploads(Bucket="mybucket")[
+                    "Uploads"
+                ]
+            ],
+            [other_upload_id],
+        )
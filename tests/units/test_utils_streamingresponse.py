@@ -1,3 +1,4 @@
+import io
 import os
 import shutil
 import signal
@@ -148,6 +149,43 @@ class StreamResponseTest(unittest.TestCase):
         except InterruptedError:
             pass
 
+    def test_streamresponse_content_read_sizes(self):
+        """Reads must return the requested size across chunks, without copying whole chunks"""
+        chunks = [b"abc", b"defgh", b"", b"ij"]
+        content = StreamResponseContent(iter(chunks))
+        self.assertEqual(content.read(2), b"ab")
+        self.assertEqual(content.read(4), b"cdef")
+        self.assertEqual(content.read(0), b"")
+        self.assertEqual(content.read(10), b"ghij")
+        self.assertEqual(content.read(10), b"")
+
+        content = StreamResponseContent(iter(chunks))
+        self.assertIs(content.read(3), chunks[0])
+        self.assertEqual(content.read(), b"defghij")
+
+    def test_streamresponse_content_readinto(self):
+        """readinto must fill the given buffer until the end of the content"""
+        content = StreamResponseContent(iter([b"abc", b"defgh", b"ij"]))
+        buffer = bytearray(4)
+        self.assertEqual(content.readinto(memoryview(buffer)), 4)
+        self.assertEqual(buffer, b"abcd")
+        self.assertEqual(content.readinto(buffer), 4)
+        self.assertEqual(buffer, b"efgh")
+        self.assertEqual(content.readinto(buffer), 2)
+        self.assertEqual(buffer[:2], b"ij")
+        self.assertEqual(content.readinto(buffer), 0)
+
+        # usable as a raw stream of buffered readers
+        reader = io.BufferedReader(StreamResponseContent(iter([b"abc", b"def"])))
+        self.assertEqual(reader.read(4), b"abcd")
+        self.assertEqual(reader.read(), b"ef")
+
+    def test_streamresponse_content_iter_after_read(self):
+        """Iterating over the content must yield the data remaining after reads"""
+        content = StreamResponseContent(iter([b"abc", b"def"]))
+        self.assertEqual(content.read(1), b"a")
+        self.assertListEqual(list(content), [b"bc", b"def"])
+
 
 class StreamResponseSignalHandlersTest(unittest.TestCase):
     """Signal handlers must only be installed explicitly, on the main thread."""
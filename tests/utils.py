@@ -16,6 +16,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import os
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from importlib.resources import files as res_files
 
 import yaml
@@ -51,3 +55,83 @@ def write_eodag_conf_with_fake_credentials(config_file):
                 conf[auth_plugin_key]["credentials"][cred_key] = "foo"
     with open(config_file, mode="w") as fh:
         yaml.dump(was_empty_conf, fh, default_flow_style=False)
+
+
+class RangeRequestHandler(BaseHTTPRequestHandler):
+    """Serves the ``content`` of its server with byte ranges support, recording the
+    requested ranges of ``GET`` requests in its ``ranges`` list and the methods of all
+    requests in its ``methods`` list.
+
+    The server ``latency`` is waited before answering a request, and its ``chunk_delay``
+    after each sent chunk of 64 KiB to limit the bandwidth of each connection.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def do_HEAD(self):
+        self.server.methods.append("HEAD")
+        time.sleep(self.server.latency)
+        self.send_response(200)
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("Content-Type", self.server.content_type)
+        self.send_header("Content-Length", str(len(self.server.content)))
+        self.end_headers()
+
+    def do_GET(self):
+        content = self.server.content
+        start, end = 0, len(content) - 1
+        range_header = self.headers.get("Range")
+        self.server.methods.append("GET")
+        self.server.ranges.append(range_header)
+        if range_header:
+            first, last = range_header[len("bytes=") :].split("-")
+            start, end = int(first), min(int(last), end) if last else end
+        time.sleep(self.server.latency)
+        self.send_response(206 if range_header else 200)
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("Content-Type", self.server.content_type)
+        self.send_header("Content-Length", str(end + 1 - start))
+        self.end_headers()
+        try:
+            for offset in range(start, end + 1, 64 * 1024):
+                self.wfile.write(content[offset : min(offset + 64 * 1024, end + 1)])
+                time.sleep(self.server.chunk_delay)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def log_message(self, *args):
+        pass
+
+
+@contextmanager
+def range_http_server(
+    content,
+    handler_class=RangeRequestHandler,
+    content_type="application/octet-stream",
+    latency=0.0,
+    chunk_delay=0.0,
+):
+    """Run a local HTTP server serving ``content`` with byte ranges support
+
+    :param content: the served bytes
+    :param handler_class: (optional) request handler, a :class:`RangeRequestHandler`
+    :param content_type: (optional) ``Content-Type`` of the responses
+    :param latency: (optional) seconds waited before answering a request
+    :param chunk_delay: (optional) seconds waited after each sent chunk of 64 KiB
+    :returns: the running server
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler_class)
+    server.daemon_threads = True
+    server.content = content
+    server.content_type = content_type
+    server.latency = latency
+    server.chunk_delay = chunk_delay
+    server.ranges = []
+    server.methods = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()